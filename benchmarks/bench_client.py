@@ -0,0 +1,226 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# Measure client throughput, latency percentiles, CPU and memory of
+# representative Orchestrator and EdgeConnect methods against the local
+# HTTPS mock server in mock_server.py, no appliance required:
+#
+#   python benchmarks/bench_client.py --calls 200 --concurrency 4
+#
+# The mock server runs in a separate process so CPU time reported is
+# spent by the client alone. Save results with --output and compare
+# releases with --baseline.
+import argparse
+import json
+import multiprocessing
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from mock_server import EPOCH, start_server
+
+from pyedgeconnect import EdgeConnect, Orchestrator
+
+# Parse runtime arguments
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "-c",
+    "--calls",
+    help="number of timed calls per method",
+    type=int,
+    default=200,
+)
+parser.add_argument(
+    "-t",
+    "--concurrency",
+    help="number of threads making calls",
+    type=int,
+    default=1,
+)
+parser.add_argument(
+    "-s",
+    "--scale",
+    help="number of appliances, stats rows and csv rows served",
+    type=int,
+    default=2000,
+)
+parser.add_argument(
+    "-k",
+    "--only",
+    help="only run benchmarks whose name contains this text",
+    default="",
+)
+parser.add_argument(
+    "-o",
+    "--output",
+    help="write results as JSON to this file",
+)
+parser.add_argument(
+    "-b",
+    "--baseline",
+    help="JSON results of a previous run to compare against",
+)
+
+
+def _serve(scale: int, ready):
+    """Run mock server until the parent process ends"""
+    server = start_server(scale=scale)
+    ready.put(server.server_address[1])
+    threading.Event().wait()
+
+
+def percentile(values: list, percent: float) -> float:
+    """Percentile of sorted values"""
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def benchmarks(orch: Orchestrator, ec: EdgeConnect) -> dict:
+    """Representative calls by benchmark name"""
+    calls = {
+        "orch.get_appliances": orch.get_appliances,
+        "orch.get_timeseries_stats_appliances": lambda: (
+            orch.get_timeseries_stats_appliances(
+                EPOCH, EPOCH + 86400, "minute"
+            )
+        ),
+        "ecos.get_appliance_stats_minute_file": lambda: (
+            ec.get_appliance_stats_minute_file(f"st2-{EPOCH}.tgz").content
+        ),
+        "ecos.iter_minute_stats": lambda: sum(
+            1 for _ in ec.iter_minute_stats(EPOCH)
+        ),
+    }
+    try:
+        import numpy
+    except ImportError:
+        pass
+    else:
+
+        def columnar():
+            result = orch.get_timeseries_stats_appliances(
+                EPOCH, EPOCH + 86400, "minute", columnar=True
+            )
+            # a payload decode_columnar does not recognise is returned
+            # unchanged, which would measure a no-op
+            if (
+                not result
+                or "COLUMN_DEF" in result
+                or not all(
+                    isinstance(columns["TIMESTAMP"], numpy.ndarray)
+                    for columns in result.values()
+                )
+            ):
+                raise RuntimeError("Columnar decoding produced no arrays")
+            return result
+
+        calls["orch.get_timeseries_stats_appliances columnar"] = columnar
+    return calls
+
+
+def measure(call, calls: int, concurrency: int) -> dict:
+    """Time ``calls`` calls on ``concurrency`` threads, then measure
+    peak memory allocated by one more call
+    """
+    if not call():
+        raise RuntimeError("Benchmark call failed, check mock server")
+
+    def timed(_):
+        start = time.perf_counter()
+        call()
+        return time.perf_counter() - start
+
+    cpu = time.process_time()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        latencies = sorted(executor.map(timed, range(calls)))
+    wall = time.perf_counter() - start
+    cpu = time.process_time() - cpu
+
+    tracemalloc.start()
+    call()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "calls_per_second": round(calls / wall, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p90_ms": round(percentile(latencies, 90) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "cpu_ms_per_call": round(cpu / calls * 1000, 3),
+        "peak_mb_per_call": round(peak / 1e6, 3),
+    }
+
+
+def main():
+    args = parser.parse_args()
+    ready = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=_serve, args=(args.scale, ready), daemon=True
+    )
+    server.start()
+    url = f"127.0.0.1:{ready.get(timeout=60)}"
+    options = {"verify_ssl": False, "pool_maxsize": args.concurrency}
+    orch = Orchestrator(url, api_key="benchmark", **options)
+    ec = EdgeConnect(url, **options)
+    # EdgeConnect always connects to port 443, point it at the mock
+    ec.url_prefix = f"https://{url}/rest/json"
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+
+    print(
+        f"calls: {args.calls}, concurrency: {args.concurrency}, "
+        f"scale: {args.scale}"
+    )
+    print(
+        "{:<48} {:>9} {:>9} {:>9} {:>9} {:>9} {:>9}".format(
+            "benchmark",
+            "calls/s",
+            "p50 ms",
+            "p90 ms",
+            "p99 ms",
+            "cpu ms",
+            "peak MB",
+        )
+    )
+    results = {}
+    for name, call in benchmarks(orch, ec).items():
+        if args.only not in name:
+            continue
+        result = measure(call, args.calls, args.concurrency)
+        results[name] = result
+        line = "{:<48} {:>9} {:>9} {:>9} {:>9} {:>9} {:>9}".format(
+            name, *result.values()
+        )
+        if name in baseline:
+            previous = baseline[name]["calls_per_second"]
+            line += "  {:+.1f}%".format(
+                (result["calls_per_second"] / previous - 1) * 100
+            )
+        print(line)
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"client max RSS: {max_rss / 1024:.1f} MB")
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(
+                {
+                    "python": sys.version.split()[0],
+                    "calls": args.calls,
+                    "concurrency": args.concurrency,
+                    "scale": args.scale,
+                    "max_rss_mb": round(max_rss / 1024, 1),
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# Compare JSON codecs encoding a bulk request body and decoding a
+# large response through EdgeConnect response handling, no appliance
+# or network required:
+#
+#   python benchmarks/bench_json_codec.py --rows 50000
+import argparse
+import time
+
+import requests
+
+from pyedgeconnect import EdgeConnect
+from pyedgeconnect._codec import JsonCodec, OrjsonCodec, orjson
+
+# Parse runtime arguments
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "-r",
+    "--rows",
+    help="number of flows in response and addresses in request body",
+    type=int,
+    default=50000,
+)
+parser.add_argument(
+    "-n",
+    "--repeat",
+    help="number of timed runs, the fastest is reported",
+    type=int,
+    default=5,
+)
+args = parser.parse_args()
+
+
+def flows_response(rows: int) -> dict:
+    """Build a response shaped like ``get_appliance_flows``"""
+    return {
+        "active": {"total_flows": rows},
+        "flows": [
+            {
+                "id": i,
+                "ip1": "10.{}.{}.{}".format(
+                    i >> 16 & 255, i >> 8 & 255, i & 255
+                ),
+                "port1": 1024 + i % 60000,
+                "ip2": "192.168.{}.{}".format(i >> 8 & 255, i & 255),
+                "port2": 443,
+                "protocol": "TCP",
+                "application": "https",
+                "inbound_bytes": i * 1500,
+                "outbound_bytes": i * 900,
+                "duration": i % 3600,
+                "tunnel": "to_site_{}".format(i % 200),
+                "reduction": 0.42,
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+def address_group_body(rows: int) -> list:
+    """Build a body shaped like ``bulk_upload_address_group``"""
+    return [
+        {
+            "name": "GROUP_{}".format(i // 100),
+            "type": "AG",
+            "rules": [
+                {
+                    "includedIPs": [
+                        "10.{}.{}.0/24".format(i >> 8 & 255, i & 255)
+                    ],
+                    "excludedIPs": [],
+                    "comment": "bulk import",
+                }
+            ],
+        }
+        for i in range(rows)
+    ]
+
+
+def best_time(function, repeat: int) -> float:
+    """Fastest of ``repeat`` runs of function in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def fake_response(content: bytes) -> requests.Response:
+    """Build a successful response carrying ``content``"""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    response.request = requests.Request(
+        "GET", "https://ec/rest/json"
+    ).prepare()
+    return response
+
+
+codecs = [JsonCodec()]
+if orjson is not None:
+    codecs.append(OrjsonCodec())
+else:
+    print("orjson is not installed, only measuring json")
+
+body = address_group_body(args.rows)
+content = JsonCodec().dumps(flows_response(args.rows))
+print(
+    "rows: {}, response: {:.1f} MB, request body: {:.1f} MB".format(
+        args.rows,
+        len(content) / 1e6,
+        len(JsonCodec().dumps(body)) / 1e6,
+    )
+)
+
+results = {}
+for codec in codecs:
+    ec = EdgeConnect("ec", json_codec=codec)
+    encode = best_time(lambda: codec.dumps(body), args.repeat)
+    decode = best_time(
+        lambda: ec._handle_response(
+            "/flow", fake_response(content), [200], "json"
+        ),
+        args.repeat,
+    )
+    results[codec.name] = (encode, decode)
+    print(
+        "{:>7}  encode {:8.1f} ms  decode {:8.1f} ms".format(
+            codec.name, encode * 1000, decode * 1000
+        )
+    )
+
+if "orjson" in results:
+    print(
+        "orjson speedup  encode {:.1f}x  decode {:.1f}x".format(
+            results["json"][0] / results["orjson"][0],
+            results["json"][1] / results["orjson"][1],
+        )
+    )
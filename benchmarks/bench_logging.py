@@ -0,0 +1,101 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# Measure per-call overhead of response logging in _handle_response
+# with logging off, sampled, and logging whole or truncated response
+# bodies, no appliance or network required:
+#
+#   python benchmarks/bench_logging.py --calls 20000 --body-kb 512
+import argparse
+import logging
+import time
+
+import requests
+
+from pyedgeconnect import EdgeConnect
+
+# Parse runtime arguments
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "-c",
+    "--calls",
+    help="number of responses handled per timed run",
+    type=int,
+    default=20000,
+)
+parser.add_argument(
+    "-b",
+    "--body-kb",
+    help="size of each response body in kilobytes",
+    type=int,
+    default=512,
+)
+parser.add_argument(
+    "-n",
+    "--repeat",
+    help="number of timed runs, the fastest is reported",
+    type=int,
+    default=3,
+)
+args = parser.parse_args()
+
+
+class NullHandler(logging.Handler):
+    """Format records like a file handler without writing them"""
+
+    def emit(self, record):
+        self.format(record)
+
+
+def fake_response(content: bytes) -> requests.Response:
+    """Build a successful response carrying ``content``"""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    response.encoding = "utf-8"
+    response.request = requests.Request(
+        "GET", "https://ec/rest/json/flow"
+    ).prepare()
+    return response
+
+
+def per_call(ec: EdgeConnect, response, calls: int, repeat: int) -> float:
+    """Fastest of ``repeat`` runs, in microseconds per handled call"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            ec._handle_response("/flow", response, [200], "bool")
+        times.append(time.perf_counter() - start)
+    return min(times) / calls * 1e6
+
+
+body = b'{"flows": "' + b"x" * (args.body_kb * 1024) + b'"}'
+response = fake_response(body)
+
+scenarios = [
+    ("logging off", {}, False),
+    ("info, body omitted", {}, True),
+    ("info, 1% sampled", {"log_sample_rate": 0.01}, True),
+    (
+        "log_success, 4 KB body",
+        {"log_success": True, "log_body_max": 4096},
+        True,
+    ),
+    (
+        "log_success, whole body",
+        {"log_success": True, "log_body_max": None},
+        True,
+    ),
+]
+
+print(f"calls: {args.calls}, response body: {args.body_kb} KB")
+for index, (name, kwargs, handler) in enumerate(scenarios):
+    ec = EdgeConnect(f"bench_{index}", **kwargs)
+    if handler:
+        ec.logger.addHandler(NullHandler())
+    ec.logger.propagate = False
+    # formatting whole bodies is slow, time fewer calls
+    calls = args.calls if kwargs.get("log_body_max", 1) else args.calls // 100
+    usec = per_call(ec, response, max(calls, 1), args.repeat)
+    print(f"{name:>24}  {usec:10.2f} us/call")
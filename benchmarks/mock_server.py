@@ -0,0 +1,272 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# Local HTTPS stand-in for Orchestrator ``/gms/rest`` and EdgeConnect
+# ``/rest/json`` APIs serving large canned payloads, used by
+# bench_client.py. Can also be run on its own to point scripts at:
+#
+#   python benchmarks/mock_server.py --port 8443 --scale 2000
+#
+# A self-signed certificate is generated with the openssl command line
+# tool, connect with verify_ssl=False.
+import argparse
+import gzip
+import io
+import json
+import os
+import ssl
+import subprocess
+import tarfile
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+# fixed epoch of canned stats so payloads are identical between runs
+EPOCH = 1672531200
+
+
+def appliances(scale: int) -> list:
+    """Build a response shaped like Orchestrator ``get_appliances``"""
+    return [
+        {
+            "id": f"{i}.NE",
+            "nePk": f"{i}.NE",
+            "uuid": f"00000000-0000-4000-8000-{i:012d}",
+            "hostName": f"edge-{i:05d}",
+            "site": f"site-{i // 4:05d}",
+            "groupId": f"{i % 50 + 3}.Network",
+            "IP": "10.{}.{}.1".format(i >> 8 & 255, i & 255),
+            "model": "EC-S-P",
+            "mode": "inline",
+            "softwareVersion": "9.1.3.0_92612",
+            "state": 1,
+            "reachabilityStatus": 1,
+            "serial": f"00-1B-BC-{i:08X}",
+            "platform": "VMware",
+            "hasUnsavedChanges": False,
+            "webProtocolType": 2,
+        }
+        for i in range(scale)
+    ]
+
+
+def timeseries(scale: int) -> dict:
+    """Build a response shaped like ``get_timeseries_stats_appliances``
+    with one COLUMN_DEF and DATA rows keyed by appliance, ``scale``
+    minutes of rows in total
+    """
+    columns = [
+        "TIMESTAMP",
+        "LAN_RX_BYTES",
+        "LAN_TX_BYTES",
+        "WAN_RX_BYTES",
+        "WAN_TX_BYTES",
+        "LAN_RX_PKTS",
+        "LAN_TX_PKTS",
+        "WAN_RX_PKTS",
+        "WAN_TX_PKTS",
+        "FLOWS_CREATED",
+        "FLOWS_DELETED",
+    ]
+    appliance_count = max(1, scale // 500)
+    rows = max(1, scale // appliance_count)
+    return {
+        "COLUMN_DEF": columns,
+        "DATA": {
+            f"{n}.NE": [
+                [EPOCH + minute * 60]
+                + [(minute * 7919 + col * 104729) % 10**9 for col in range(10)]
+                for minute in range(rows)
+            ]
+            for n in range(appliance_count)
+        },
+    }
+
+
+def minute_stats_tgz(scale: int) -> bytes:
+    """Build a minute statistics archive shaped like
+    ``get_appliance_stats_minute_file``, headerless v2 tables with
+    ``scale`` rows each and a name in the second column
+    """
+    tables = {"tunnel_v2": 72, "interface_v2": 31}
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w:gz") as tar:
+        for table, columns in tables.items():
+            lines = []
+            for i in range(scale):
+                lines.append(
+                    f"{i},{table}_{i},"
+                    + ",".join(
+                        str((i * 31 + col * 17) % 100000)
+                        for col in range(columns - 3)
+                    )
+                    + f",{EPOCH}"
+                )
+            content = ("\n".join(lines) + "\n").encode("utf-8")
+            member = tarfile.TarInfo(f"st2/{table}.txt")
+            member.size = len(content)
+            member.mtime = EPOCH
+            tar.addfile(member, io.BytesIO(content))
+    return archive.getvalue()
+
+
+def build_routes(scale: int) -> dict:
+    """Canned responses by path, without query string
+
+    :param scale: Number of appliances, stats rows and csv rows
+    :type scale: int
+    :return: Dictionary of path to tuple of content type and body
+    :rtype: dict
+    """
+    json_type = "application/json"
+    tgz = minute_stats_tgz(scale)
+    return {
+        "/gms/rest/appliance": (
+            json_type,
+            json.dumps(appliances(scale)).encode("utf-8"),
+        ),
+        "/gms/rest/stats/timeseries/appliance": (
+            json_type,
+            json.dumps(timeseries(scale)).encode("utf-8"),
+        ),
+        "/gms/rest/gmsserver/hello": (
+            json_type,
+            json.dumps({"message": "hello"}).encode("utf-8"),
+        ),
+        "/rest/json/stats/minuteRange": (
+            json_type,
+            json.dumps({"oldest": EPOCH, "newest": EPOCH}).encode("utf-8"),
+        ),
+        f"/rest/json/stats/minuteStats/st2-{EPOCH}.tgz": (
+            "application/octet-stream",
+            tgz,
+        ),
+    }
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Serve canned responses from ``server.routes``, 404 otherwise"""
+
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, avoid delayed ACK stalls
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        path = urlsplit(self.path).path
+        route = self.server.routes.get(path)
+        if route is None:
+            content_type = "application/json"
+            body = json.dumps({"error": f"No route {path}"}).encode("utf-8")
+            self.send_response(404)
+        else:
+            content_type, body = route
+            self.send_response(200)
+            if (
+                content_type == "application/json"
+                and "gzip" in self.headers.get("Accept-Encoding", "")
+                and path in self.server.gzip_routes
+            ):
+                body = self.server.gzip_routes[path]
+                self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+
+def _self_signed_context(directory: str) -> ssl.SSLContext:
+    """Create TLS context with a new self-signed certificate"""
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=localhost",
+            "-keyout",
+            key,
+            "-out",
+            cert,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    return context
+
+
+def start_server(
+    port: int = 0,
+    scale: int = 2000,
+    tls: bool = True,
+) -> ThreadingHTTPServer:
+    """Start mock server on a background thread
+
+    :param port: Port to listen on, defaults to 0 for any free port
+    :type port: int, optional
+    :param scale: Number of appliances, stats rows and csv rows in
+        canned payloads, defaults to 2000
+    :type scale: int, optional
+    :param tls: Serve HTTPS with a self-signed certificate, defaults to
+        True
+    :type tls: bool, optional
+    :return: Running server, ``server.server_address`` holds the port
+    :rtype: ThreadingHTTPServer
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), MockHandler)
+    server.daemon_threads = True
+    server.routes = build_routes(scale)
+    server.gzip_routes = {
+        path: gzip.compress(body, 1)
+        for path, (content_type, body) in server.routes.items()
+        if content_type == "application/json"
+    }
+    if tls:
+        with tempfile.TemporaryDirectory() as directory:
+            context = _self_signed_context(directory)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-p", "--port", help="port to listen on", type=int, default=8443
+    )
+    parser.add_argument(
+        "-s",
+        "--scale",
+        help="number of appliances, stats rows and csv rows",
+        type=int,
+        default=2000,
+    )
+    parser.add_argument(
+        "--no-tls", help="serve plain HTTP", action="store_true"
+    )
+    args = parser.parse_args()
+    server = start_server(args.port, args.scale, not args.no_tls)
+    print("Serving on port {}".format(server.server_address[1]))
+    for path, (_, body) in server.routes.items():
+        print("  {:<48} {:>10,} bytes".format(path, len(body)))
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
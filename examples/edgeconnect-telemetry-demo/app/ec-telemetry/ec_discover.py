@@ -24,7 +24,7 @@ from influxdb_client import InfluxDBClient
 from rq import Queue
 from rq.registry import FailedJobRegistry, ScheduledJobRegistry
 
-from pyedgeconnect import Orchestrator
+from pyedgeconnect import Orchestrator, request_failed
 
 # Define Redis instance and Queue to connect to
 r = redis.Redis(host="redis", port=6379)
@@ -131,32 +131,24 @@ while True:
     # begin telemetry collection
     if ready_to_retrieve:
 
-        # Get appliances and determine reachability
-        logger.debug(f"Retrieving appliance data from Orchestrator")
-        appliances = orch.get_appliances()
+        # Get appliances, appliance licensing, interface labels and
+        # overlays from Orchestrator in one indexed inventory snapshot,
+        # interface labels and overlay ids are mapped to their names
+        logger.debug(f"Retrieving appliance inventory from Orchestrator")
+        fleet = orch.inventory()
+        # If the appliances could not be retrieved, skip this cycle and
+        # try again in 3 seconds
+        if request_failed(fleet):
+            logger.critical(
+                "ORCH APPLIANCE INVENTORY FAILED -- NO DATA RETRIEVED/PROCESSED"
+            )
+            logger.error(fleet)
+            time.sleep(3)
+            continue
+        appliances = fleet.appliances
         appliance_state_time = int(time.time())
-
-        # Get interface labels from Orchestrator and map the interface
-        # labels into a flat dictionary
-        logger.debug(f"Retrieving interface label data from Orchestrator")
-        orch_int_labels = orch.get_all_interface_labels()
-        interface_labels = {}
-        for label in orch_int_labels["wan"]:
-            interface_labels[label] = orch_int_labels["wan"][label]["name"]
-        for label in orch_int_labels["lan"]:
-            interface_labels[label] = orch_int_labels["lan"][label]["name"]
-
-        # Get overlay ids from Orchestrator and map the overlay ids into
-        # a flat dictionary
-        logger.debug(f"Retrieving overlay data from Orchestrator")
-        overlays = orch.get_all_overlays_config()
-        overlay_ids = {}
-        for overlay in overlays:
-            overlay_ids[str(overlay["id"])] = overlay["name"]
-
-        # Get appliance licensing information from Orchestrator
-        logger.debug(f"Retrieving appliance licensing data from Orchestrator")
-        licensing = orch.get_portal_licensed_appliances()
+        interface_labels = fleet.interface_labels
+        overlay_ids = fleet.overlays
 
         # Limit appliances to submit to job queue if any are specified
         # in the limit_appliances.json file
@@ -164,23 +156,18 @@ while True:
         with open(limit_filename) as limit_file:
             appliance_subset = json.load(limit_file)["appliance_subset"]
 
-        # Create flat list of all appliance hostnames in Orchestrator
-        # to reverse check against appliances listed in
-        # limit_appliances.json file to log error if appliance
-        # referenced that does not exist
-        all_appliance_hostnames = []
-        for appliance in appliances:
-            all_appliance_hostnames.append(appliance["hostName"])
-
         appliance_set = []
         # If appliances are listed in the limit file, filter only
-        # appliances with matching hostnames to job queue.
+        # appliances with matching hostnames to job queue, log error if
+        # an appliance referenced does not exist
         if len(appliance_subset) > 0:
+            limit_hostnames = set(appliance_subset)
             for appliance in appliances:
-                if appliance["hostName"] in appliance_subset:
+                if appliance["hostName"] in limit_hostnames:
                     appliance_set.append(appliance)
+            found_hostnames = {appliance["hostName"] for appliance in appliance_set}
             for appliance in appliance_subset:
-                if appliance not in all_appliance_hostnames:
+                if appliance not in found_hostnames:
                     logger.error(
                         f"No appliance with hostname {appliance} found in Orchestrator, please update limit_appliances.json contents"
                     )
@@ -232,16 +219,19 @@ while True:
                 )
 
         if len(appliance_set) > 0:
-            # Append licensing information into appliance list
+            # Copy appliance records so the inventory snapshot is not
+            # modified, then append licensing information into
+            # appliance list
+            appliance_set = [dict(appliance) for appliance in appliance_set]
             for appliance in appliance_set:
-                for license_item in licensing:
-                    if license_item["applianceId"] == appliance["id"]:
-                        appliance["license_display"] = license_item["licenses"]["fx"][
-                            "tier"
-                        ]["display"]
-                        appliance["license_bw"] = license_item["licenses"]["fx"][
-                            "tier"
-                        ]["bandwidth"]
+                license_item = appliance.pop("license", None)
+                if license_item is not None:
+                    appliance["license_display"] = license_item["licenses"]["fx"][
+                        "tier"
+                    ]["display"]
+                    appliance["license_bw"] = license_item["licenses"]["fx"][
+                        "tier"
+                    ]["bandwidth"]
 
             # Append interface mapping and overlay mapping to appliance list
             # before submitting appliances to job queue
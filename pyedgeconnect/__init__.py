@@ -1,18 +1,405 @@
 # MIT License
 # (C) Copyright 2021 Hewlett Packard Enterprise Development LP.
 
+import importlib
 import logging
 import os
+import random
 import sys
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
 
 import requests
 from urllib3.exceptions import InsecureRequestWarning
 
+from ._cache import ResponseCache
+from ._cassette import CassetteAdapter
+from ._codec import get_codec
+from ._download import Download
+from ._governor import RequestGovernor
+from ._log import BodyPreview, log_enabled, request_label
+from ._metrics import EndpointMetrics
+from ._results import PageRequestError, request_failed
+from ._transport import TransportAdapter
 
-class HttpCommon:
+
+class _SyncOnlyError(AttributeError):
+    """Method of the synchronous classes accessed on a subclass that
+    does not support it
+    """
+
+    def __init__(self, cls: type, name: str):
+        super().__init__(
+            f"'{cls.__name__}' object has no attribute '{name}', it is "
+            "only supported by the synchronous classes"
+        )
+
+
+class _SyncOnlyMethod:
+    """Descriptor hiding an inherited method from a subclass, raising
+    :class:`_SyncOnlyError` on access so ``hasattr`` is False
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        raise _SyncOnlyError(owner, self.name)
+
+
+class _LazyMethodLoader(type):
+    """Metaclass loading API methods from their modules on first use.
+
+    Classes list the methods of each ``orch`` or ``ecos`` module in a
+    ``_method_modules`` dictionary of module name to method names. The
+    first access of any listed method imports its module and sets all
+    of the module's methods on the class, so later calls have no extra
+    overhead. Listed methods are included in ``dir()`` before loading
+    so autocomplete and documentation tools see the full API.
+
+    Subclasses list inherited methods they do not support in
+    ``_sync_only_methods``, these raise ``AttributeError`` on access
+    and are left out of ``dir()``.
+    """
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        for method in namespace.get("_sync_only_methods", ()):
+            setattr(cls, method, _SyncOnlyMethod(method))
+
+    def __getattr__(cls, name: str):
+        if name in cls._sync_only_names():
+            # hidden by a _SyncOnlyMethod, do not load the inherited one
+            raise _SyncOnlyError(cls, name)
+        for klass in cls.__mro__:
+            method_modules = vars(klass).get("_method_modules", {})
+            for module_name, methods in method_modules.items():
+                if name in methods:
+                    module = importlib.import_module(
+                        f".{module_name}", __name__
+                    )
+                    for method in methods:
+                        setattr(klass, method, getattr(module, method))
+                    return vars(klass)[name]
+        raise AttributeError(
+            f"type object '{cls.__name__}' has no attribute '{name}'"
+        )
+
+    def __dir__(cls) -> list:
+        names = set(super().__dir__()) | cls._lazy_method_names()
+        return sorted(names - cls._sync_only_names())
+
+    def _lazy_method_names(cls) -> set:
+        names = set()
+        for klass in cls.__mro__:
+            for methods in vars(klass).get("_method_modules", {}).values():
+                names.update(methods)
+        return names - cls._sync_only_names()
+
+    def _sync_only_names(cls) -> set:
+        names = set()
+        for klass in cls.__mro__:
+            names.update(vars(klass).get("_sync_only_methods", ()))
+        return names
+
+
+class HttpCommon(metaclass=_LazyMethodLoader):
     """Class to leverage common HTTP functions and handling responses"""
 
+    def __getattr__(self, name: str):
+        # only called when normal lookup fails, load method onto class
+        try:
+            getattr(type(self), name)
+        except _SyncOnlyError:
+            raise
+        except AttributeError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+        return object.__getattribute__(self, name)
+
+    def __dir__(self) -> list:
+        cls = type(self)
+        names = set(super().__dir__()) | cls._lazy_method_names()
+        return sorted(names - cls._sync_only_names())
+
+    def _require_sync(self, name: str):
+        """Check a helper that blocks on requests is used with a
+        synchronous client
+
+        :param name: Name of helper for the error message
+        :type name: str
+        :raises TypeError: If this is an asyncio client
+        """
+
+    # TRANSPORT
+
+    def _mount_transport(
+        self,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        keep_alive: float,
+        idle_timeout: float,
+    ):
+        """Mount connection pooling transport adapter on the session
+
+        :param pool_connections: Number of host connection pools to keep
+        :type pool_connections: int
+        :param pool_maxsize: Maximum number of connections kept per host
+        :type pool_maxsize: int
+        :param pool_block: Wait for a free connection when pool is full
+        :type pool_block: bool
+        :param keep_alive: Seconds idle before TCP keep-alive probes
+        :type keep_alive: float
+        :param idle_timeout: Seconds idle before pooled connections are
+            closed instead of reused
+        :type idle_timeout: float
+        """
+        self.transport = TransportAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            idle_timeout=idle_timeout,
+        )
+        self.session.mount("https://", self.transport)
+        self.session.mount("http://", self.transport)
+
+    def pool_stats(self) -> dict:
+        """Report connection pool usage per host. A growing
+        ``saturated`` count means requests found every pooled connection
+        in use, consider raising ``pool_maxsize``.
+
+        :return: Dictionary keyed by ``host:port`` \n
+            * keyword **maxsize** (`int`): Connections kept in the pool
+            * keyword **in_use** (`int`): Connections currently checked
+              out for requests
+            * keyword **idle** (`int`): Open connections waiting in the
+              pool for reuse
+            * keyword **peak_in_use** (`int`): Highest ``in_use`` seen
+            * keyword **saturated** (`int`): Number of requests that
+              found every pooled connection in use
+            * keyword **wait_seconds** (`float`): Total time requests
+              spent waiting for a connection
+            * keyword **connections_opened** (`int`): Connections opened
+            * keyword **idle_closed** (`int`): Connections closed for
+              exceeding ``idle_timeout``
+            * keyword **requests** (`int`): Requests sent through pool
+        :rtype: dict
+        """
+        return self.transport.pool_stats()
+
+    def use_cassette(
+        self,
+        path: str,
+        mode: str = "replay",
+        latency=None,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int = None,
+        redact: bool = True,
+    ) -> CassetteAdapter:
+        """Record requests and responses to a cassette file, or replay
+        a recorded cassette instead of sending requests. Replays need no
+        network access, and can add latency and fail requests to
+        load-test concurrency, caching and retries repeatably. Call
+        :meth:`eject_cassette` to finish recording or replaying.
+
+        .. code:: python
+
+            orch.use_cassette("collection.jsonl.gz", mode="record")
+            collect(orch)
+            orch.eject_cassette()
+
+            orch.use_cassette(
+                "collection.jsonl.gz",
+                latency="recorded",
+                error_rate=0.02,
+                seed=1,
+            )
+            collect(orch)
+
+        .. note::
+            Only the synchronous classes send requests through the
+            session, the asynchronous classes are not recorded or
+            replayed.
+
+        :param path: File path of the cassette
+        :type path: str
+        :param mode: ``record`` to send requests and write each
+            exchange to a new cassette, ``replay`` to answer requests
+            from the cassette, defaults to "replay"
+        :type mode: str, optional
+        :param latency: ``recorded`` to wait the recorded response time
+            of each exchange, or seconds to wait for every replayed
+            response, defaults to None for no delay
+        :type latency: str or float, optional
+        :param error_rate: Share of replayed requests to fail, from 0.0
+            to 1.0, defaults to 0.0
+        :type error_rate: float, optional
+        :param error_status: HTTP status of failed requests, or None to
+            raise connection errors instead, defaults to 503
+        :type error_status: int, optional
+        :param seed: Seed of the random generator failing requests,
+            defaults to None
+        :type seed: int, optional
+        :param redact: Replace cookie values and credential headers,
+            and leave out body digests of requests with credentials,
+            when recording, defaults to True
+        :type redact: bool, optional
+        :return: Cassette adapter mounted on the session, see
+            :meth:`pyedgeconnect._cassette.CassetteAdapter.stats`
+        :rtype: CassetteAdapter
+        """
+        self.eject_cassette()
+        self.cassette = CassetteAdapter(
+            path,
+            mode=mode,
+            transport=self.transport,
+            latency=latency,
+            error_rate=error_rate,
+            error_status=error_status,
+            seed=seed,
+            redact=redact,
+        )
+        self.session.mount("https://", self.cassette)
+        self.session.mount("http://", self.cassette)
+        return self.cassette
+
+    def eject_cassette(self):
+        """Stop recording or replaying a cassette and send requests
+        through the network again
+        """
+        cassette = getattr(self, "cassette", None)
+        if cassette is None:
+            return
+        cassette.close()
+        self.cassette = None
+        self.session.mount("https://", self.transport)
+        self.session.mount("http://", self.transport)
+
+    # REQUEST GOVERNOR
+
+    def _send(self, method: str, api_path: str, request, *args):
+        """Send request through the rate limit of the request governor,
+        retrying failed attempts it allows, see
+        :class:`pyedgeconnect._governor.RequestGovernor`, and record
+        each attempt in the endpoint metrics
+
+        :param method: HTTP method, e.g. ``GET``
+        :type method: str
+        :param api_path: API path to append to url_prefix
+        :type api_path: str
+        :param request: ``_req_*`` method sending the request
+        :type request: Callable
+        :param args: Additional arguments for ``request`` after the API
+            path
+        :return: Requests Response object of the last attempt
+        :rtype: requests.Response
+        """
+        governor = self.governor
+        metrics = self.endpoint_metrics
+        if governor is None and metrics is None:
+            return request(api_path, *args)
+        attempt = 0
+        while True:
+            if governor is not None:
+                wait = governor.reserve(api_path)
+                if wait > 0:
+                    time.sleep(wait)
+            start = time.perf_counter()
+            try:
+                response = request(api_path, *args)
+            except Exception as ex:
+                if metrics is not None:
+                    metrics.record(
+                        method,
+                        api_path,
+                        type(ex).__name__,
+                        time.perf_counter() - start,
+                    )
+                if governor is None or not isinstance(
+                    ex,
+                    (
+                        requests.exceptions.ConnectionError,
+                        requests.exceptions.Timeout,
+                    ),
+                ):
+                    raise
+                error = (
+                    "connect"
+                    if isinstance(ex, requests.exceptions.ConnectTimeout)
+                    else "read"
+                )
+                delay = governor.retry_delay(
+                    method, api_path, attempt, error=error
+                )
+                if delay is None:
+                    raise
+                reason = type(ex).__name__
+            else:
+                if metrics is not None:
+                    metrics.record_response(
+                        method, api_path, response, time.perf_counter() - start
+                    )
+                if governor is None:
+                    return response
+                delay = governor.retry_delay(
+                    method,
+                    api_path,
+                    attempt,
+                    status_code=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                reason = f"HTTP {response.status_code}"
+                response.close()
+            attempt += 1
+            self.logger.warning(
+                f"{method} {api_path} | {reason} | Retry {attempt} of "
+                f"{governor.retries} in {delay:.2f} seconds"
+            )
+            time.sleep(delay)
+
+    # METRICS
+
+    def metrics(self, data_format: str = None):
+        """Report latency and throughput of requests per endpoint,
+        recorded since the instance was created with
+        ``collect_metrics=True``. Ids in API paths are replaced by
+        ``{id}`` so calls to the same endpoint are counted together,
+        e.g. ``/appliance/{id}/tunnels``.
+
+        .. code:: python
+
+            for endpoint in orch.metrics()[:10]:
+                print(endpoint["method"], endpoint["path"])
+
+            with open("metrics.prom", "w") as file:
+                file.write(orch.metrics(data_format="prometheus"))
+
+        :param data_format: ``prometheus`` for Prometheus text format or
+            ``json`` for a JSON document, defaults to None to return a
+            list of dictionaries
+        :type data_format: str, optional
+        :return: Metrics per HTTP method, path template and status,
+            slowest endpoints by total time first, see
+            :meth:`pyedgeconnect._metrics.EndpointMetrics.snapshot`
+        :rtype: list or str
+        """
+        metrics = self.endpoint_metrics
+        if metrics is None:
+            metrics = EndpointMetrics()
+        if data_format == "prometheus":
+            return metrics.to_prometheus()
+        if data_format == "json":
+            return metrics.to_json()
+        return metrics.snapshot()
+
     # BASE HTTP REQUESTS
 
     def _req_post(
@@ -31,23 +418,35 @@ class HttpCommon:
         :rtype: requests.Response
         """
         apiSrcStr = self.apiSrcId if ("?" not in url) else self.apiSrcId2
+        if files:
+            # multipart form, requests ignores the JSON body
+            return self.session.post(
+                self.url_prefix + url + apiSrcStr,
+                json=data,
+                files=files,
+                verify=self.verify,
+                timeout=self.timeout,
+                headers=self.headers,
+            )
         return self.session.post(
             self.url_prefix + url + apiSrcStr,
-            json=data,
-            files=files,
             verify=self.verify,
             timeout=self.timeout,
-            headers=self.headers,
+            **self._json_body(data),
         )
 
     def _req_get(
         self,
         url: str,
+        stream: bool = False,
     ) -> requests.Response:
         """Assemble and send Requests request for HTTP GET method
 
         :param url: Full URL to use in HTTP request
         :type url: str
+        :param stream: Defer downloading the response body until it is
+            read, defaults to False
+        :type stream: bool, optional
         :return: Requests Response object
         :rtype: requests.Response
         """
@@ -57,6 +456,7 @@ class HttpCommon:
             verify=self.verify,
             timeout=self.timeout,
             headers=self.headers,
+            stream=stream,
         )
 
     def _req_delete(
@@ -95,12 +495,28 @@ class HttpCommon:
         apiSrcStr = self.apiSrcId if ("?" not in url) else self.apiSrcId2
         return self.session.put(
             self.url_prefix + url + apiSrcStr,
-            json=data,
             verify=self.verify,
             timeout=self.timeout,
-            headers=self.headers,
+            **self._json_body(data),
         )
 
+    def _json_body(self, data) -> dict:
+        """Encode request body with the JSON codec
+
+        :param data: Data to pass in request body, None to send no body
+        :type data: str, list, dict
+        :return: Keyword arguments ``headers`` and, unless ``data`` is
+            None, ``data`` for the request
+        :rtype: dict
+        """
+        if data is None:
+            # no body, as requests sends for json=None
+            return {"headers": self.headers}
+        return {
+            "data": self.json_codec.dumps(data),
+            "headers": {**self.headers, "Content-Type": "application/json"},
+        }
+
     # HTTP RESPONSE HANDLER
 
     def _handle_response(
@@ -126,15 +542,20 @@ class HttpCommon:
         :return: Requests Response object
         :rtype: requests.Response
         """
-        response_method = (
-            str(response.request)
-            .replace("<PreparedRequest ", "")
-            .replace(">", "")
-        )
-        if response.status_code not in expected_status:
+        status_code = response.status_code
+        if status_code not in expected_status:
+            response_method = request_label(response)
             self.logger.error(
-                f"{response_method} {api_path} | Received HTTP "
-                f"{response.status_code} | Response text: {response.text}"
+                "%s %s | Received HTTP %s | Response text: %s",
+                response_method,
+                api_path,
+                status_code,
+                BodyPreview(response, self.log_body_max),
+                extra={
+                    "api_method": response_method,
+                    "api_path": api_path,
+                    "status_code": status_code,
+                },
             )
             # return formatted data for the source method
             # for JSON data, return a dictionary with the details of
@@ -143,7 +564,7 @@ class HttpCommon:
                 return {
                     "request": response_method,
                     "api_path": api_path,
-                    "status_code": response.status_code,
+                    "status_code": status_code,
                     "text": response.text,
                 }
             elif return_type == "text":
@@ -153,26 +574,45 @@ class HttpCommon:
             elif return_type == "full_response":
                 return response
 
-        # If Orchestrator set with log_success == True, include response
-        # text in log messages. Default behavior is to omit response
-        # text from log messages for successful API calls.
-        if self.log_success:
-            self.logger.info(
-                f"{response_method} {api_path} | Received HTTP "
-                f"{response.status_code} | Response text: {response.text}"
-            )
-        else:
-            # Log successful call, omit response text in case sensitive
-            # data in response text
-            self.logger.info(
-                f"{response_method} {api_path} | Received HTTP "
-                f"{response.status_code} "
-                "| Response omitted to avoid logging sensitive data"
-            )
+        # Only build success records when a handler would emit them,
+        # and only for the sampled share of successful calls
+        if log_enabled(self.logger, logging.INFO) and (
+            self.log_sample_rate >= 1 or random.random() < self.log_sample_rate
+        ):
+            response_method = request_label(response)
+            extra = {
+                "api_method": response_method,
+                "api_path": api_path,
+                "status_code": status_code,
+            }
+            # If Orchestrator set with log_success == True, include
+            # response text in log messages. Default behavior is to
+            # omit response text from log messages for successful API
+            # calls.
+            if self.log_success:
+                self.logger.info(
+                    "%s %s | Received HTTP %s | Response text: %s",
+                    response_method,
+                    api_path,
+                    status_code,
+                    BodyPreview(response, self.log_body_max),
+                    extra=extra,
+                )
+            else:
+                # Log successful call, omit response text in case
+                # sensitive data in response text
+                self.logger.info(
+                    "%s %s | Received HTTP %s "
+                    "| Response omitted to avoid logging sensitive data",
+                    response_method,
+                    api_path,
+                    status_code,
+                    extra=extra,
+                )
 
         # return formatted data for the source method
         if return_type == "json":
-            return response.json()
+            return self.json_codec.loads(response.content)
         elif return_type == "text":
             return response.text
         elif return_type == "bool":
@@ -216,7 +656,11 @@ class HttpCommon:
                 )
             )
         try:
-            response = self._req_post(api_path, data, files)
+            response = self._send(
+                "POST", api_path, self._req_post, data, files
+            )
+            if self.cache is not None:
+                self.cache.invalidate(api_path)
             return self._handle_response(
                 api_path, response, expected_status, return_type
             )
@@ -263,8 +707,20 @@ class HttpCommon:
                     api_path, return_type
                 )
             )
+        if self.cache is not None:
+            response = self.cache.get(api_path)
+            if response is not None:
+                return self._handle_response(
+                    api_path, response, expected_status, return_type
+                )
+            generation = self.cache.generation
         try:
-            response = self._req_get(api_path)
+            response = self._send("GET", api_path, self._req_get)
+            if (
+                self.cache is not None
+                and response.status_code in expected_status
+            ):
+                self.cache.put(api_path, response, generation)
             return self._handle_response(
                 api_path, response, expected_status, return_type
             )
@@ -281,6 +737,62 @@ class HttpCommon:
             )
             return False
 
+    def _download(
+        self,
+        api_path: str,
+        destination=None,
+        chunk_size: int = 65536,
+        expected_status: list = [200],
+    ):
+        """Setup streamed HTTP GET request for downloading files. The
+        response body is read in chunks as it is consumed instead of
+        being held in memory. Catches Exceptions and logs to log file
+
+        :param api_path: API path to append to url_prefix
+        :type api_path: str
+        :param destination: File path or binary file object to write the
+            response body to. If None, return a :class:`Download` to
+            iterate the body in chunks, defaults to None
+        :type destination: str, os.PathLike, or file object, optional
+        :param chunk_size: Number of bytes per chunk read from the
+            response, defaults to 65536
+        :type chunk_size: int, optional
+        :param expected_status: List of expected HTTP status codes of
+            response, defaults to [200]
+        :type expected_status: list, optional
+        :return: Returns False on exceptions or unexpected status.
+            Otherwise dictionary of transfer statistics if
+            ``destination`` was provided, or :class:`Download` iterable
+            of chunks
+        :rtype: bool, dict, Download
+        """  # noqa RST304
+        try:
+            response = self._send("GET", api_path, self._req_get, True)
+            if response.status_code not in expected_status:
+                return self._handle_response(
+                    api_path, response, expected_status, "bool"
+                )
+            self.logger.info(
+                f"[GET] {api_path} | Received HTTP "
+                f"{response.status_code} | Streaming response"
+            )
+            download = Download(response, chunk_size)
+            if destination is None:
+                return download
+            return download.save(destination)
+        except requests.exceptions.ConnectTimeout:
+            self.logger.error(
+                f"GET {api_path} | Request Timed Out - "
+                f"Timeout values (connect/read): {self.timeout}"
+            )
+        except Exception as ex:
+            self.logger.error(
+                "Exception {} when calling GET {}. Traceback: {}".format(
+                    type(ex), api_path, traceback.format_exc()
+                )
+            )
+            return False
+
     def _delete(
         self,
         api_path: str,
@@ -311,7 +823,9 @@ class HttpCommon:
                 )
             )
         try:
-            response = self._req_delete(api_path)
+            response = self._send("DELETE", api_path, self._req_delete)
+            if self.cache is not None:
+                self.cache.invalidate(api_path)
             return self._handle_response(
                 api_path, response, expected_status, return_type
             )
@@ -361,7 +875,9 @@ class HttpCommon:
                 )
             )
         try:
-            response = self._req_put(api_path, data)
+            response = self._send("PUT", api_path, self._req_put, data)
+            if self.cache is not None:
+                self.cache.invalidate(api_path)
             return self._handle_response(
                 api_path, response, expected_status, return_type
             )
@@ -378,6 +894,92 @@ class HttpCommon:
             )
             return False
 
+    # RESPONSE DECODERS
+
+    def _columnar(self, result):
+        """Decode result of a timeseries request into one NumPy array
+        per column, see :func:`pyedgeconnect._columnar.decode_columnar`
+
+        :param result: Return value of ``_get`` or ``_post``
+        :return: Dictionary of column arrays, or ``result`` unchanged
+            if it has no ``COLUMN_DEF`` and ``DATA``
+        :rtype: dict
+        """
+        from ._columnar import decode_columnar
+
+        return decode_columnar(result)
+
+    # CONCURRENT REQUESTS
+
+    def _gather(self, calls: list, concurrency: int, combine):
+        """Run calls on a bounded worker pool and combine their results
+
+        :param calls: Functions without arguments, each sending one
+            request
+        :type calls: list
+        :param concurrency: Maximum number of calls running at once
+        :type concurrency: int
+        :param combine: Function taking the list of call results, in
+            order of ``calls``, and returning the combined result
+        :type combine: Callable
+        :return: Return value of ``combine``
+        """
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            results = [future.result() for future in futures]
+        return combine(results)
+
+    # PAGINATION
+
+    def _paginate(self, fetch, cursor, advance, prefetch: bool = False):
+        """Yield items of a paged endpoint one page at a time, holding
+        at most the current page, and the next page if ``prefetch``, in
+        memory
+
+        :param fetch: Function requesting the page at a cursor
+        :type fetch: Callable
+        :param cursor: Cursor of the first page
+        :param advance: Function taking the cursor and page, returning
+            a tuple of the items to yield and the cursor of the next
+            page, or None after the last page
+        :type advance: Callable
+        :param prefetch: Request the next page in a background thread
+            while items of the current page are consumed, defaults to
+            False
+        :type prefetch: bool, optional
+        :raises PageRequestError: If a page request fails, after the
+            items of earlier pages were yielded
+        :return: Generator of items across all pages
+        :rtype: Iterator
+        """  # noqa RST304
+        if not prefetch:
+            while cursor is not None:
+                page = fetch(cursor)
+                if request_failed(page):
+                    raise PageRequestError(page)
+                items, cursor = advance(cursor, page)
+                yield from items
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(fetch, cursor) if cursor is not None else None
+        try:
+            while future is not None:
+                page = future.result()
+                if request_failed(page):
+                    raise PageRequestError(page)
+                items, cursor = advance(cursor, page)
+                future = (
+                    executor.submit(fetch, cursor)
+                    if cursor is not None
+                    else None
+                )
+                yield from items
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
 
 # Aruba Orchestrator
 class Orchestrator(HttpCommon):
@@ -393,8 +995,24 @@ class Orchestrator(HttpCommon):
         log_file: bool = False,
         log_console: bool = False,
         log_success: bool = False,
+        log_sample_rate: float = 1.0,
+        log_body_max: int = None,
         verify_ssl: bool = True,
         timeout: tuple = (9.15, 12),
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: float = None,
+        idle_timeout: float = None,
+        cache_ttl: Union[float, dict] = None,
+        cache_maxsize: int = 1024,
+        json_codec=None,
+        rate_limit: float = None,
+        endpoint_rate_limits: dict = None,
+        retries: int = 0,
+        retry_backoff: float = 0.5,
+        retry_backoff_max: float = 30.0,
+        collect_metrics: bool = False,
     ):
         """Setup Orchestrator instance
 
@@ -424,6 +1042,13 @@ class Orchestrator(HttpCommon):
             raise awareness that sensitive data may be stored in the log
             file.
         :type log_success: bool, optional
+        :param log_sample_rate: Share of successful API calls to log,
+            from 0.0 to 1.0, errors are always logged, defaults to 1.0
+        :type log_sample_rate: float, optional
+        :param log_body_max: Maximum number of response bytes included
+            in log messages, longer responses are truncated, defaults to
+            None to log whole responses
+        :type log_body_max: int, optional
         :param verify_ssl: Set to ``False`` to ignore certificate
             warnings within requests, defaults to ``True``
         :type verify_ssl: bool, optional
@@ -432,6 +1057,69 @@ class Orchestrator(HttpCommon):
             timeouts. Defaults to ``(9.15, 12)``, 9.15 seconds for
             connection, 12 seconds for server data response.
         :type timeout: tuple, optional
+        :param pool_connections: Number of host connection pools to
+            keep, defaults to 10
+        :type pool_connections: int, optional
+        :param pool_maxsize: Maximum number of connections to keep open
+            per host for reuse. Increase when sharing one instance
+            across many threads, defaults to 10
+        :type pool_maxsize: int, optional
+        :param pool_block: Set to ``True`` to have requests wait for a
+            free connection when ``pool_maxsize`` connections are in use
+            rather than opening extra connections that are discarded
+            after use, defaults to ``False``
+        :type pool_block: bool, optional
+        :param keep_alive: Enable TCP keep-alive probes on connections
+            idle for this many seconds, defaults to None to use the
+            operating system setting
+        :type keep_alive: float, optional
+        :param idle_timeout: Close pooled connections idle for longer
+            than this many seconds instead of reusing them, e.g. to stay
+            under a server or firewall idle timeout, defaults to None
+        :type idle_timeout: float, optional
+        :param cache_ttl: Enable caching of successful GET responses.
+            Seconds to cache every GET, or dictionary of API path to
+            seconds to cache only matching endpoints, a path ending in
+            ``*`` matches all paths starting with it. Any POST, PUT or
+            DELETE to an overlapping path removes cached responses.
+            Defaults to None for no caching
+        :type cache_ttl: float or dict, optional
+        :param cache_maxsize: Maximum number of GET responses to cache,
+            defaults to 1024
+        :type cache_maxsize: int, optional
+        :param json_codec: JSON codec for request bodies and responses,
+            ``"orjson"``, ``"json"`` for the standard library, or an
+            object with ``dumps`` returning bytes and ``loads`` methods.
+            Defaults to None to use ``orjson`` if installed and ``json``
+            otherwise
+        :type json_codec: str or object, optional
+        :param rate_limit: Maximum requests per second sent by this
+            instance, shared by all threads, defaults to None for no
+            limit
+        :type rate_limit: float, optional
+        :param endpoint_rate_limits: Dictionary of API path to maximum
+            requests per second, applied in addition to ``rate_limit``.
+            A path ending in ``*`` matches all paths starting with it,
+            each path is limited separately, e.g.
+            ``{"/stats*": 2}``, defaults to None
+        :type endpoint_rate_limits: dict, optional
+        :param retries: Maximum number of times to retry a request after
+            a connection error, timeout, or HTTP 429, 502, 503 or 504.
+            ``POST`` is only retried on connect timeouts and HTTP 429.
+            Defaults to 0
+        :type retries: int, optional
+        :param retry_backoff: Seconds of backoff before the first retry,
+            doubling with each further retry and randomized with jitter.
+            A ``Retry-After`` response header is used instead when
+            present, defaults to 0.5
+        :type retry_backoff: float, optional
+        :param retry_backoff_max: Maximum seconds to wait before a
+            retry, defaults to 30.0
+        :type retry_backoff_max: float, optional
+        :param collect_metrics: Record latency and bytes of every
+            request per endpoint, reported by :meth:`metrics`, defaults
+            to False
+        :type collect_metrics: bool, optional
         :raises ValueError: If Orchestrator auth_mode specified not in
             supported_auth_modes
         """
@@ -445,6 +1133,29 @@ class Orchestrator(HttpCommon):
         self.url_prefix = "https://" + url + "/gms/rest"
         self.timeout = timeout
         self.session = requests.Session()
+        self._mount_transport(
+            pool_connections,
+            pool_maxsize,
+            pool_block,
+            keep_alive,
+            idle_timeout,
+        )
+        self.cache = (
+            ResponseCache(cache_ttl, cache_maxsize) if cache_ttl else None
+        )
+        self.json_codec = get_codec(json_codec)
+        self.governor = (
+            RequestGovernor(
+                rate_limit,
+                endpoint_rate_limits,
+                retries,
+                retry_backoff,
+                retry_backoff_max,
+            )
+            if rate_limit or endpoint_rate_limits or retries
+            else None
+        )
+        self.endpoint_metrics = EndpointMetrics() if collect_metrics else None
         if api_key != "":
             self.headers = {"X-Auth-Token": api_key}
         else:
@@ -471,6 +1182,8 @@ class Orchestrator(HttpCommon):
         # is set to True, warn user if logging to local file is also
         # enabled
         self.log_success = log_success
+        self.log_sample_rate = log_sample_rate
+        self.log_body_max = log_body_max
         if self.log_success and log_file:
             print(
                 """
@@ -507,741 +1220,788 @@ class Orchestrator(HttpCommon):
             self.logger.setLevel(logging.DEBUG)
             self.logger.addHandler(self.console_handler)
 
-    # Imported methods
-    from .orch._acls import get_appliance_acls
-    from .orch._action_log import (
-        cancel_audit_log_task,
-        get_audit_log,
-        get_audit_log_task_status,
-    )
-    from .orch._active_sessions import get_active_sessions_orchestrator
-    from .orch._admin_distance import get_appliance_admin_distance
-    from .orch._advanced_properties import (
-        get_orchestrator_advanced_properties,
-        get_orchestrator_advanced_properties_metadata,
-        update_orchestrator_advanced_properties,
-    )
-    from .orch._aggregate_stats import (
-        get_aggregate_stats_active_flows,
-        get_aggregate_stats_appliances,
-        get_aggregate_stats_appliances_ne_pk_list,
-        get_aggregate_stats_appliances_single_appliance,
-        get_aggregate_stats_application2_ne_pk_tunnels,
-        get_aggregate_stats_application_ne_pk_tunnels,
-        get_aggregate_stats_applications,
-        get_aggregate_stats_applications_ne_pk_list,
-        get_aggregate_stats_applications_single_appliance,
-        get_aggregate_stats_boost_ne_pk_list,
-        get_aggregate_stats_boost_single_appliance,
-        get_aggregate_stats_dns_ne_pk_list,
-        get_aggregate_stats_dns_ne_pk_tunnels,
-        get_aggregate_stats_dns_single_appliance,
-        get_aggregate_stats_drc,
-        get_aggregate_stats_drc_ne_pk_list,
-        get_aggregate_stats_drc_single_appliance,
-        get_aggregate_stats_dscp,
-        get_aggregate_stats_dscp_ne_pk_list,
-        get_aggregate_stats_dscp_single_appliance,
-        get_aggregate_stats_flows,
-        get_aggregate_stats_flows_ne_pk_list,
-        get_aggregate_stats_flows_single_appliance,
-        get_aggregate_stats_interface,
-        get_aggregate_stats_interface_ne_pk_list,
-        get_aggregate_stats_interface_overlay_transport_ne_pk_list,
-        get_aggregate_stats_interface_overlay_transport_ne_pk_tunnels,
-        get_aggregate_stats_jitter,
-        get_aggregate_stats_jitter_ne_pk_list,
-        get_aggregate_stats_jitter_single_appliance,
-        get_aggregate_stats_mos_ne_pk_list,
-        get_aggregate_stats_mos_ne_pk_tunnels,
-        get_aggregate_stats_mos_single_appliance,
-        get_aggregate_stats_overlay_bandwidth_ne_pk_tunnels,
-        get_aggregate_stats_ports,
-        get_aggregate_stats_ports_ne_pk_list,
-        get_aggregate_stats_ports_ne_pk_tunnels,
-        get_aggregate_stats_ports_single_appliance,
-        get_aggregate_stats_security_policy_ne_pk_list,
-        get_aggregate_stats_security_policy_single_appliance,
-        get_aggregate_stats_shaper_ne_pk_list,
-        get_aggregate_stats_top_talkers,
-        get_aggregate_stats_top_talkers_ne_pk_list,
-        get_aggregate_stats_top_talkers_ne_pk_tunnels,
-        get_aggregate_stats_top_talkers_single_appliance,
-        get_aggregate_stats_top_talkers_split_single_appliance,
-        get_aggregate_stats_traffic_behavior,
-        get_aggregate_stats_traffic_behavior_ne_pk_list,
-        get_aggregate_stats_traffic_behavior_single_appliance,
-        get_aggregate_stats_traffic_class,
-        get_aggregate_stats_traffic_class_ne_pk_list,
-        get_aggregate_stats_traffic_class_single_appliance,
-        get_aggregate_stats_tunnels,
-        get_aggregate_stats_tunnels_ne_pk_list,
-        get_aggregate_stats_tunnels_ne_pk_tunnels,
-        get_aggregate_stats_tunnels_single_appliance,
-    )
-    from .orch._alarm import (
-        acknolwedge_alarms_from_appliance,
-        acknowledge_alarms_from_orchestrator,
-        add_note_to_appliance_alarm,
-        clear_alarms_from_appliance,
-        clear_alarms_from_orchestrator,
-        delete_alarm_email_delay,
-        delete_all_customized_alarm_severity,
-        delete_customized_alarm_severity_for_type,
-        delete_supressed_alarms,
-        get_alarm_count_all_appliances,
-        get_alarm_count_from_appliance,
-        get_alarm_count_orchestrator_and_appliances,
-        get_alarm_count_orchestrator_or_appliances,
-        get_alarm_descriptions,
-        get_alarm_email_delay,
-        get_alarm_notification_status,
-        get_alarms_from_appliances,
-        get_alarms_from_orchestrator,
-        get_customized_alarm_severity,
-        get_customized_alarm_severity_for_type,
-        get_supressed_alarms,
-        set_alarm_email_delay,
-        set_alarm_notification_status,
-        set_customized_alarm_severity,
-        set_supressed_alarms,
-        update_alarm_email_delay,
-        update_customized_alarm_severity,
-    )
-    from .orch._api_key import (
-        add_api_key,
-        delete_api_key,
-        get_api_key,
-        get_api_keys,
-        update_api_key,
-    )
-    from .orch._app_system_deploy_info import (
-        get_appliance_system_deployment_info,
-        get_discovered_appliance_system_deployment_info,
-    )
-    from .orch._app_system_state_info import get_appliance_system_state_info
-    from .orch._appliance import (
-        add_and_approve_discovered_appliances,
-        add_discovered_appliances,
-        appliance_delete_api,
-        appliance_get_api,
-        appliance_post_api,
-        change_appliance_credentials,
-        change_appliance_group,
-        default_appliance_stats_config,
-        delete_appliance,
-        delete_appliance_for_rediscovery,
-        delete_denied_appliances,
-        deny_appliance,
-        get_all_approved,
-        get_all_denied_appliances,
-        get_all_discovered,
-        get_appliance_dns_cache_config,
-        get_appliance_info,
-        get_appliance_stats_config,
-        get_appliances,
-        get_appliances_queued_for_deletion,
-        modify_appliance,
-        modify_appliance_stats_config,
-        rediscover_denied_appliance,
-        update_discovered_appliances,
-    )
-    from .orch._appliance_backup import (
-        backup_appliance_config,
-        delete_appliance_backup,
-        get_appliance_backup_history,
-        restore_appliance_from_backup,
-    )
-    from .orch._appliance_crash_history import appliance_crash_history
-    from .orch._appliance_extra_info import (
-        delete_appliance_extra_info,
-        get_appliance_extra_info,
-        set_appliance_extra_info,
-    )
-    from .orch._appliance_preconfig import (
-        apply_preconfig_to_existing,
-        approve_and_apply_preconfig,
-        create_preconfig,
-        delete_preconfig,
-        find_matching_preconfig,
-        get_all_preconfig,
-        get_apply_preconfig_status,
-        get_default_preconfig,
-        get_preconfig,
-        modify_preconfig,
-        validate_preconfig,
-    )
-    from .orch._appliance_reboot_history import get_appliance_reboot_history
-    from .orch._appliance_resync import appliance_resync
-    from .orch._appliance_upgrade import delete_ecos_image, get_ecos_images
-    from .orch._appliances_software_versions import (
-        get_appliance_software_version,
-    )
-    from .orch._application_definition import (
-        delete_user_defined_app_address_map,
-        delete_user_defined_app_dns_classification,
-        delete_user_defined_app_port_protocol,
-        get_application_modification_times,
-        get_user_defined_app_address_map,
-        get_user_defined_app_dns_classification,
-        get_user_defined_app_groups,
-        get_user_defined_app_port_protocol,
-        post_user_defined_app_address_map,
-        update_user_defined_app_dns_classification,
-        update_user_defined_app_groups,
-        update_user_defined_app_port_protocol,
-    )
-    from .orch._authentication import get_appliance_auth_information
-    from .orch._avc_mode import get_avc_mode
-    from .orch._banners import get_appliance_login_banners
-    from .orch._bgp import (
-        get_appliance_bgp_config,
-        get_appliance_bgp_config_all_vrfs,
-        get_appliance_bgp_neighbors,
-        get_appliance_bgp_neighbors_all_vrfs,
-        get_appliance_bgp_state,
-        get_appliance_bgp_state_all_vrfs,
-    )
-    from .orch._bonded_tunnels_configuration import (
-        get_bonded_tunnel_details,
-        get_bonded_tunnel_details_for_appliance,
-        get_bonded_tunnel_details_for_appliance_tunnel,
-        get_bonded_tunnels_for_physical_tunnel,
-        get_bonded_tunnels_state,
-    )
-    from .orch._bridge_interface_state import (
-        get_appliance_bridge_interface_state,
-    )
-    from .orch._broadcast_cli import broadcast_cli
-    from .orch._built_in_policies import get_built_in_policies
-    from .orch._custom_appliance_tags import get_custom_appliance_tags
-    from .orch._custom_certs import (
-        check_custom_certs_appliances_to_portal,
-        check_custom_certs_orchestrator_to_portal,
-        delete_custom_cert,
-        get_custom_certs,
-        get_custom_certs_enabled,
-        set_custom_certs_enabled,
-        update_custom_certs,
-        verify_custom_cert,
-    )
-    from .orch._db_partition import delete_db_partition, get_db_partition
-    from .orch._debug_files import (
-        cancel_debug_file_download,
-        delete_debug_file_from_appliance,
-        delete_debug_file_from_orchestrator,
-        generate_appliance_sysdump,
-        get_debug_file_proxy_settings,
-        get_debug_files_from_appliance,
-        set_debug_file_proxy_settings,
-        upload_appliance_debug_files_to_orchestrator,
-        upload_appliance_debug_files_to_support,
-    )
-    from .orch._deployment import (
-        get_all_appliance_deployment,
-        get_appliance_deployment,
-        get_single_appliance_deployment,
-    )
-    from .orch._discovery import (
-        get_appliance_discovery_emails,
-        set_appliance_discovery_emails,
-    )
-    from .orch._disks import get_appliance_disk_information
-    from .orch._dns import get_appliance_dns
-    from .orch._dns_proxy import get_dns_proxy
-    from .orch._exception import (
-        create_tunnel_exceptions,
-        delete_all_tunnel_exceptions,
-        delete_single_tunnel_exception,
-        delete_tunnel_exceptions_list,
-        get_tunnel_exceptions,
-        update_single_tunnel_exception,
-        update_tunnel_exceptions,
-    )
-    from .orch._flow import (
-        get_appliance_flow_bandwidth_stats,
-        get_appliance_flow_details,
-        get_appliance_flow_details_verbose,
-        get_appliance_flows,
-        reclassify_flows,
-        reset_flows,
-    )
-    from .orch._gms_backup import (
-        add_or_update_orchestrator_backup_config,
-        create_orchestrator_blueprint_template,
-        get_orchestrator_backup_config,
-        test_orchestrator_backup_config,
-    )
-    from .orch._gms_notification import (
-        delete_gms_notification,
-        get_gms_notification,
-        update_gms_notification,
-    )
-    from .orch._gms_registration import (
-        get_orchestrator_registration_setting,
-        set_orchestrator_registration_setting,
-    )
-    from .orch._gms_server import (
-        get_orchestrator_hello,
-        get_orchestrator_server_brief,
-        get_orchestrator_server_info,
-        get_orchestrator_server_os,
-        get_orchestrator_server_ping,
-        get_orchestrator_server_versions,
-    )
-    from .orch._gms_smtp import (
-        delete_gms_smtp_settings,
-        delete_unverified_email_addresses,
-        get_gms_smtp_settings,
-        get_unverified_email_addresses,
-        send_verification_email,
-        set_gms_smtp_settings,
-        test_gms_smtp_settings,
-        verify_email_address,
-    )
-    from .orch._gms_stats_collection import (
-        get_gms_stats_collection,
-        get_gms_stats_collection_defaults,
-        update_gms_stats_collection,
-    )
-    from .orch._group import (
-        add_gms_group,
-        delete_gms_group,
-        get_all_appliance_locations,
-        get_appliance_location,
-        get_gms_group,
-        get_gms_groups,
-        get_root_gms_group,
-        update_appliance_location_grnodepk,
-        update_appliance_location_nepk,
-        update_gms_group,
-    )
-    from .orch._ha_groups import get_ha_groups, modify_ha_groups
-    from .orch._hostname import get_orchestrator_hostname
-    from .orch._idle_time import clear_idle_time, increment_idle_time
-    from .orch._ikeless import (
-        get_ipsec_udp_key_config,
-        get_ipsec_udp_key_history,
-        get_ipsec_udp_key_status,
-        update_ipsec_udp_key_config,
-    )
-    from .orch._inbound_shaper import get_appliance_inbound_shaper
-    from .orch._interface_labels import (
-        get_all_interface_labels,
-        get_interface_labels_by_type,
-        push_interface_labels_to_appliance,
-        update_interface_labels,
-    )
-    from .orch._interface_state import get_appliance_interface_state
-    from .orch._internal_subnets import (
-        get_internal_subnets,
-        update_internal_subnets,
-    )
-    from .orch._ip_allow_list import (
-        get_ip_allow_list,
-        get_ip_allow_list_drops,
-        update_ip_allow_list,
-    )
-    from .orch._ip_objects import (
-        bulk_upload_address_group,
-        bulk_upload_service_group,
-        create_address_group,
-        create_service_group,
-        delete_address_group,
-        delete_service_group,
-        get_address_group,
-        get_all_address_groups,
-        get_all_service_groups,
-        get_service_group,
-        merge_address_groups,
-        merge_service_groups,
-        update_address_group,
-        update_service_group,
-    )
-    from .orch._license import (
-        change_appliance_license,
-        delete_appliance_license_token,
-        get_nx_licensed_appliances,
-        get_portal_licensed_appliances,
-        get_portal_licensed_summary,
-        get_vx_licensed_appliances,
-        grant_appliance_base_license,
-        revoke_appliance_base_license,
-    )
-    from .orch._link_aggregation import get_link_aggregation_data
-    from .orch._link_integrity import (
-        get_link_integrity_test_result,
-        link_integrity_test,
-    )
-    from .orch._location import get_location_coordinates_from_address
-    from .orch._logging import get_appliance_syslog_config
-    from .orch._login import login, logout, send_mfa
-    from .orch._loopback import get_loopback_interfaes
-    from .orch._loopback_orch import (
-        get_deleted_loopback_orchestration_ips,
-        get_loopback_orchestration,
-        get_loopback_orchestration_pool_detail,
-        reclaim_delete_loopback_orchestration_ips,
-        reclaim_single_deleted_loopback_orchestration_ip,
-        set_loopback_orchestration,
-    )
-    from .orch._maintenance_mode import (
-        get_maintenance_mode_appliances,
-        update_maintenance_mode_appliances,
-    )
-    from .orch._mgmt_services import get_mgmt_services
-    from .orch._multicast import (
-        get_appliance_multicast_config,
-        get_appliance_multicast_enabled,
-        get_appliance_multicast_interfaces,
-        get_appliance_multicast_neighbors,
-        get_appliance_multicast_routes,
-    )
-    from .orch._nat import (
-        get_appliance_nat_config,
-        get_appliance_nat_maps,
-        get_appliance_nat_pools,
-    )
-    from .orch._nat_policy import (
-        get_nat_policy,
-        get_nat_policy_dynamic,
-        get_nat_policy_inbound_outbound,
-    )
-    from .orch._net_flow import get_net_flow_configuration
-    from .orch._network_memory import erase_appliance_network_memory
-    from .orch._network_role_and_site import (
-        get_appliance_network_role_and_site,
-        update_appliance_network_role_and_site,
-    )
-    from .orch._optimization_policy import get_optimization_policy
-    from .orch._ospf import (
-        get_appliance_ospf_config,
-        get_appliance_ospf_interfaces_config,
-        get_appliance_ospf_interfaces_state,
-        get_appliance_ospf_neighbors_state,
-        get_appliance_ospf_state,
-    )
-    from .orch._overlay_association import (
-        add_appliance_overlay_association,
-        get_all_appliance_overlay_association,
-        get_appliance_overlay_association,
-        remove_appliance_overlay_association,
-        remove_single_appliance_overlay_association,
-    )
-    from .orch._overlays import (
-        configure_new_overlay,
-        configure_regionalized_overlay,
-        delete_overlay,
-        get_all_overlays_config,
-        get_all_overlays_config_keyed,
-        get_appliance_overlays_association,
-        get_max_overlays,
-        get_overlay_config,
-        get_overlay_config_for_region,
-        get_overlays_priorities,
-        modify_overlay_config,
-        modify_overlay_config_for_region,
-        modify_regionalized_overlay,
-        set_overlays_priorities,
-    )
-    from .orch._pause_orchestration import (
-        get_pause_orchestration,
-        set_pause_orchestration,
-    )
-    from .orch._peer_priority import get_peer_priority_configuration
-    from .orch._port_forwarding import get_appliance_port_fowarding
-    from .orch._qos_policy import get_qos_policy
-    from .orch._rbac_appliance_access_group import (
-        delete_appliance_access_group,
-        get_all_appliance_access_groups,
-        get_appliance_access_group,
-        update_appliance_access_group,
-    )
-    from .orch._rbac_assignment import (
-        delete_rbac_user_assignment,
-        get_rbac_assignments,
-        get_rbac_user_assignment,
-        update_rbac_assignment,
-    )
-    from .orch._rbac_role import (
-        delete_rbac_role,
-        get_all_rbac_roles,
-        get_rbac_role,
-        get_rbac_role_assigned,
-        update_rbac_role,
-    )
-    from .orch._reachability import (
-        get_reachability_status_appliance,
-        get_reachability_status_orchestrator,
-    )
-    from .orch._realtime_stats import get_realtime_stats
-    from .orch._regions import (
-        create_region,
-        delete_region,
-        get_all_regions,
-        get_region,
-        get_region_appliance_association,
-        get_region_appliance_association_by_nepk,
-        get_region_appliance_association_by_region_id,
-        set_region_appliance_association,
-        update_region_appliance_association,
-        update_region_name,
-    )
-    from .orch._releases import (
-        delay_release_notification,
-        dismiss_release_notification,
-        get_releases_for_orchestrator_and_ecos,
-        get_releases_notifications,
-    )
-    from .orch._rest_api_config import get_rest_api_config, set_rest_api_config
-    from .orch._rest_request_time_stats import (
-        get_appliance_rest_stats,
-        get_appliance_rest_stats_by_method,
-    )
-    from .orch._route_policy import get_route_policy
-    from .orch._save_changes import (
-        save_changes_ne_pk_list,
-        save_changes_single_appliance,
-    )
-    from .orch._schedule_timezone import (
-        get_schedule_timezone,
-        set_schedule_timezone,
-    )
-    from .orch._security_maps import get_appliance_security_maps
-    from .orch._security_settings import (
-        get_security_settings,
-        set_security_settings,
-    )
-    from .orch._services import (
-        get_gms_internet_policy_services,
-        get_gms_third_party_services,
-        update_gms_internet_policy_services,
-    )
-    from .orch._session import get_orchestrator_sessions
-    from .orch._session_timeout import (
-        get_orch_session_timeout,
-        set_orch_session_timeout,
-    )
-    from .orch._shaper import get_appliance_shaper
-    from .orch._shell import get_shell_access_setting, set_shell_access_setting
-    from .orch._snmp import get_appliance_snmp
-    from .orch._sp_portal import (
-        assign_account_license_ecsp,
-        create_case_with_portal,
-        delete_old_account_key,
-        geo_locate_multiple_ips,
-        geo_locate_single_ip,
-        get_account_key_change_count,
-        get_account_key_change_status,
-        get_account_license_ecsp_status,
-        get_account_license_feature,
-        get_account_license_type,
-        get_all_saas_apps,
-        get_app_definition_data,
-        get_app_definition_total,
-        get_app_groups,
-        get_app_groups_hash,
-        get_appliance_orch_portal_status,
-        get_cloud_portal_broadcast_message,
-        get_compound_classification,
-        get_compound_classification_hash,
-        get_count_of_saas_apps,
-        get_dns_classification,
-        get_dns_classification_hash,
-        get_flow_classification,
-        get_flow_classification_hash,
-        get_ip_protocol_numbers,
-        get_orchestrator_to_cloud_portal_status,
-        get_port_protocol_classification,
-        get_port_protocol_classification_hash,
-        get_portal_registration_config,
-        get_portal_registration_status,
-        get_portal_services_status,
-        get_portal_top_sites,
-        get_saas_classification,
-        get_saas_classification_hash,
-        get_service_id_to_country_mapping,
-        get_service_id_to_service_mapping,
-        get_tcp_udp_port_data,
-        get_traffic_behavior,
-        get_traffic_behavior_hash,
-        get_update_time_for_app_definitions,
-        request_new_account_key,
-        search_app_definition_data,
-        unassign_account_license_ecsp,
-        update_portal_registration_config,
-        update_portal_registration_status,
-    )
-    from .orch._ssl import get_appliance_ssl_certs
-    from .orch._ssl_substitute_cert import (
-        get_appliance_ssl_substitute_certs,
-        validate_ssl_substitute_cert,
-    )
-    from .orch._stats_retention import (
-        get_all_nonstats_retention,
-        get_all_stats_collection,
-        get_all_stats_retention,
-        get_stats_approximate_disk_space,
-        update_nonstats_retention,
-        update_stats_collection,
-        update_stats_retention,
-    )
-    from .orch._subnets import (
-        get_appliance_subnets,
-        get_discovered_appliance_subnets,
-        set_appliance_subnet_sharing_options,
-    )
-    from .orch._tca import get_appliance_tca, get_appliance_tunnel_tca
-    from .orch._tcpdump import (
-        tcpdump_run,
-        tcpdump_status_all,
-        tcpdump_status_appliance,
-    )
-    from .orch._template import (
-        associate_template_group_to_appliance,
-        create_template_group,
-        delete_template_group,
-        get_all_template_groups,
-        get_appliance_applied_template_goups,
-        get_appliance_template_groups_association,
-        get_appliance_template_history,
-        get_selected_templates_in_template_group,
-        get_template_group,
-        get_template_group_association_all_appliances,
-        get_template_groups_priorities,
-        post_template_group,
-        select_templates_for_template_group,
-        set_template_groups_priorities,
-    )
-    from .orch._third_party_services import (
-        central_add_subscription,
-        central_assign_appliance_to_site,
-        central_delete_subscription,
-        central_get_site_mapping,
-        central_get_subscription,
-        clearpass_add_account,
-        clearpass_delete_account,
-        clearpass_filter_events,
-        clearpass_get_configured_account,
-        clearpass_get_configured_account_details,
-        clearpass_get_configured_accounts,
-        clearpass_get_connectivity,
-        clearpass_get_pause_orchestration_status,
-        clearpass_get_service_endpoint_status,
-        clearpass_get_user_roles_for_ip,
-        clearpass_pause_individual_orchestration,
-        clearpass_post_login_event,
-        clearpass_post_logout_event,
-        clearpass_reset_service_endpoint,
-        clearpass_set_pause_orchestration_status,
-        clearpass_update_account,
-    )
-    from .orch._third_party_tunnels_configuration import (
-        get_passthrough_tunnel_details,
-        get_passthrough_tunnel_details_for_appliance,
-        get_passthrough_tunnel_details_for_appliance_tunnel,
-        get_passthrough_tunnels_state,
-    )
-    from .orch._timeseries_stats import (
-        get_timeseries_stats_appliance_process_state,
-        get_timeseries_stats_appliances,
-        get_timeseries_stats_appliances_ne_pk_list,
-        get_timeseries_stats_appliances_single_appliance,
-        get_timeseries_stats_application,
-        get_timeseries_stats_application_ne_pk_list,
-        get_timeseries_stats_application_single_appliance,
-        get_timeseries_stats_boost_single_appliance,
-        get_timeseries_stats_drc,
-        get_timeseries_stats_drc_ne_pk_list,
-        get_timeseries_stats_drc_single_appliance,
-        get_timeseries_stats_dscp,
-        get_timeseries_stats_dscp_ne_pk_list,
-        get_timeseries_stats_dscp_single_appliance,
-        get_timeseries_stats_flow,
-        get_timeseries_stats_flow_ne_pk_list,
-        get_timeseries_stats_flow_single_appliance,
-        get_timeseries_stats_interface_overlay_single_appliance,
-        get_timeseries_stats_interface_single_appliance,
-        get_timeseries_stats_internal_drops_single_appliance,
-        get_timeseries_stats_jitter_single_appliance,
-        get_timeseries_stats_mos_single_appliance,
-        get_timeseries_stats_orchestrator_memory,
-        get_timeseries_stats_security_policy_single_appliance,
-        get_timeseries_stats_shaper,
-        get_timeseries_stats_shaper_ne_pk_list,
-        get_timeseries_stats_traffic_class,
-        get_timeseries_stats_traffic_class_ne_pk_list,
-        get_timeseries_stats_traffic_class_single_appliance,
-        get_timeseries_stats_tunnel_single_appliance,
-    )
-    from .orch._tunnels_configuration import (
-        get_appliance_tunnel_ids,
-        get_batch_appliance_tunnels_config,
-        get_batch_appliance_tunnels_state,
-        get_physical_tunnel_details,
-        get_physical_tunnel_details_for_appliance,
-        get_physical_tunnel_details_for_appliance_tunnel,
-        get_total_tunnel_count,
-        get_tunnel_count_for_appliances,
-        get_tunnel_traceroute,
-        get_tunnels_between_appliances,
-        get_tunnels_between_appliances_config_data,
-        initiate_tunnel_traceroute,
-    )
-    from .orch._ui_usage_stats import add_ui_usage_count
-    from .orch._upgrade_appliances import (
-        upgrade_appliances,
-        validate_appliance_upgrade,
-    )
-    from .orch._user import (
-        change_user_password,
-        create_or_update_user,
-        delete_user,
-        get_all_users,
-        get_new_two_factor_key,
-        get_user,
-        reset_user_password,
-        user_forgot_password,
-    )
-    from .orch._user_account import get_appliance_user_accounts
-    from .orch._vrf import (
-        add_routing_segmentation_segment,
-        delete_routing_segmentation_maps_from_source_segment,
-        delete_routing_segmentation_segment_by_id,
-        get_routing_segmentation_enable_status,
-        get_routing_segmentation_list_of_security_maps,
-        get_routing_segmentation_maps,
-        get_routing_segmentation_maps_from_source_segment,
-        get_routing_segmentation_security_policy,
-        get_routing_segmentation_segment_by_id,
-        get_routing_segmentation_segments,
-        get_routing_segmentation_snat_maps,
-        update_routing_segmentation_enable_status,
-        update_routing_segmentation_maps_from_source_segment,
-        update_routing_segmentation_security_policy,
-        update_routing_segmentation_segment_by_id,
-        update_routing_segmentation_snat_maps,
-    )
-    from .orch._vrf_dnat_maps import get_dnat_maps
-    from .orch._vrf_snat_maps import get_snat_maps
-    from .orch._vrrp import get_vrrp_interfaes
-    from .orch._vti import get_vti_interfaes
-    from .orch._vxoa_hostname import update_appliance_hostname
-    from .orch._wan_next_hop_health import get_wan_next_hop_health_config
-    from .orch._wccp import (
-        get_wccp_service_group_settings,
-        get_wccp_state,
-        get_wccp_system_settings,
-    )
-    from .orch._zones import (
-        get_zone_next_id,
-        get_zones,
-        get_zones_end_to_end_state,
-        get_zones_vrf_mapping,
-        set_zone_next_id,
-        update_zones,
-        update_zones_end_to_end_state,
-    )
+    # Methods are loaded from these modules on first use, see
+    # :class:`_LazyMethodLoader`
+    _method_modules = {
+        "orch._acls": ("get_appliance_acls",),
+        "orch._action_log": (
+            "cancel_audit_log_task",
+            "get_audit_log",
+            "get_audit_log_task_status",
+        ),
+        "orch._active_sessions": ("get_active_sessions_orchestrator",),
+        "orch._admin_distance": ("get_appliance_admin_distance",),
+        "orch._advanced_properties": (
+            "get_orchestrator_advanced_properties",
+            "get_orchestrator_advanced_properties_metadata",
+            "update_orchestrator_advanced_properties",
+        ),
+        "orch._aggregate_stats": (
+            "get_aggregate_stats_active_flows",
+            "get_aggregate_stats_appliances",
+            "get_aggregate_stats_appliances_ne_pk_list",
+            "get_aggregate_stats_appliances_single_appliance",
+            "get_aggregate_stats_application2_ne_pk_tunnels",
+            "get_aggregate_stats_application_ne_pk_tunnels",
+            "get_aggregate_stats_applications",
+            "get_aggregate_stats_applications_ne_pk_list",
+            "get_aggregate_stats_applications_single_appliance",
+            "get_aggregate_stats_boost_ne_pk_list",
+            "get_aggregate_stats_boost_single_appliance",
+            "get_aggregate_stats_dns_ne_pk_list",
+            "get_aggregate_stats_dns_ne_pk_tunnels",
+            "get_aggregate_stats_dns_single_appliance",
+            "get_aggregate_stats_drc",
+            "get_aggregate_stats_drc_ne_pk_list",
+            "get_aggregate_stats_drc_single_appliance",
+            "get_aggregate_stats_dscp",
+            "get_aggregate_stats_dscp_ne_pk_list",
+            "get_aggregate_stats_dscp_single_appliance",
+            "get_aggregate_stats_flows",
+            "get_aggregate_stats_flows_ne_pk_list",
+            "get_aggregate_stats_flows_single_appliance",
+            "get_aggregate_stats_interface",
+            "get_aggregate_stats_interface_ne_pk_list",
+            "get_aggregate_stats_interface_overlay_transport_ne_pk_list",
+            "get_aggregate_stats_interface_overlay_transport_ne_pk_tunnels",
+            "get_aggregate_stats_jitter",
+            "get_aggregate_stats_jitter_ne_pk_list",
+            "get_aggregate_stats_jitter_single_appliance",
+            "get_aggregate_stats_mos_ne_pk_list",
+            "get_aggregate_stats_mos_ne_pk_tunnels",
+            "get_aggregate_stats_mos_single_appliance",
+            "get_aggregate_stats_overlay_bandwidth_ne_pk_tunnels",
+            "get_aggregate_stats_ports",
+            "get_aggregate_stats_ports_ne_pk_list",
+            "get_aggregate_stats_ports_ne_pk_tunnels",
+            "get_aggregate_stats_ports_single_appliance",
+            "get_aggregate_stats_security_policy_ne_pk_list",
+            "get_aggregate_stats_security_policy_single_appliance",
+            "get_aggregate_stats_shaper_ne_pk_list",
+            "get_aggregate_stats_top_talkers",
+            "get_aggregate_stats_top_talkers_ne_pk_list",
+            "get_aggregate_stats_top_talkers_ne_pk_tunnels",
+            "get_aggregate_stats_top_talkers_single_appliance",
+            "get_aggregate_stats_top_talkers_split_single_appliance",
+            "get_aggregate_stats_traffic_behavior",
+            "get_aggregate_stats_traffic_behavior_ne_pk_list",
+            "get_aggregate_stats_traffic_behavior_single_appliance",
+            "get_aggregate_stats_traffic_class",
+            "get_aggregate_stats_traffic_class_ne_pk_list",
+            "get_aggregate_stats_traffic_class_single_appliance",
+            "get_aggregate_stats_tunnels",
+            "get_aggregate_stats_tunnels_ne_pk_list",
+            "get_aggregate_stats_tunnels_ne_pk_tunnels",
+            "get_aggregate_stats_tunnels_single_appliance",
+        ),
+        "orch._alarm": (
+            "acknolwedge_alarms_from_appliance",
+            "acknowledge_alarms_from_orchestrator",
+            "add_note_to_appliance_alarm",
+            "alarm_feed",
+            "clear_alarms_from_appliance",
+            "clear_alarms_from_orchestrator",
+            "delete_alarm_email_delay",
+            "delete_all_customized_alarm_severity",
+            "delete_customized_alarm_severity_for_type",
+            "delete_supressed_alarms",
+            "get_alarm_count_all_appliances",
+            "get_alarm_count_from_appliance",
+            "get_alarm_count_orchestrator_and_appliances",
+            "get_alarm_count_orchestrator_or_appliances",
+            "get_alarm_descriptions",
+            "get_alarm_email_delay",
+            "get_alarm_notification_status",
+            "get_alarms_from_appliances",
+            "get_alarms_from_orchestrator",
+            "get_customized_alarm_severity",
+            "get_customized_alarm_severity_for_type",
+            "get_supressed_alarms",
+            "set_alarm_email_delay",
+            "set_alarm_notification_status",
+            "set_customized_alarm_severity",
+            "set_supressed_alarms",
+            "update_alarm_email_delay",
+            "update_customized_alarm_severity",
+        ),
+        "orch._api_key": (
+            "add_api_key",
+            "delete_api_key",
+            "get_api_key",
+            "get_api_keys",
+            "update_api_key",
+        ),
+        "orch._app_system_deploy_info": (
+            "get_appliance_system_deployment_info",
+            "get_discovered_appliance_system_deployment_info",
+        ),
+        "orch._app_system_state_info": ("get_appliance_system_state_info",),
+        "orch._appliance": (
+            "add_and_approve_discovered_appliances",
+            "add_discovered_appliances",
+            "appliance_delete_api",
+            "appliance_get_api",
+            "appliance_post_api",
+            "change_appliance_credentials",
+            "change_appliance_group",
+            "default_appliance_stats_config",
+            "delete_appliance",
+            "delete_appliance_for_rediscovery",
+            "delete_denied_appliances",
+            "deny_appliance",
+            "get_all_approved",
+            "get_all_denied_appliances",
+            "get_all_discovered",
+            "get_appliance_dns_cache_config",
+            "get_appliance_info",
+            "get_appliance_stats_config",
+            "get_appliances",
+            "get_appliances_queued_for_deletion",
+            "modify_appliance",
+            "modify_appliance_stats_config",
+            "rediscover_denied_appliance",
+            "update_discovered_appliances",
+        ),
+        "orch._appliance_backup": (
+            "backup_appliance_config",
+            "delete_appliance_backup",
+            "get_appliance_backup_history",
+            "restore_appliance_from_backup",
+        ),
+        "orch._appliance_crash_history": ("appliance_crash_history",),
+        "orch._appliance_extra_info": (
+            "delete_appliance_extra_info",
+            "get_appliance_extra_info",
+            "set_appliance_extra_info",
+        ),
+        "orch._appliance_preconfig": (
+            "apply_preconfig_to_existing",
+            "approve_and_apply_preconfig",
+            "create_preconfig",
+            "delete_preconfig",
+            "find_matching_preconfig",
+            "get_all_preconfig",
+            "get_apply_preconfig_status",
+            "get_default_preconfig",
+            "get_preconfig",
+            "modify_preconfig",
+            "validate_preconfig",
+        ),
+        "orch._appliance_reboot_history": ("get_appliance_reboot_history",),
+        "orch._appliance_resync": ("appliance_resync",),
+        "orch._appliance_upgrade": (
+            "delete_ecos_image",
+            "get_ecos_images",
+        ),
+        "orch._appliances_software_versions": (
+            "get_appliance_software_version",
+        ),
+        "orch._application_definition": (
+            "delete_user_defined_app_address_map",
+            "delete_user_defined_app_dns_classification",
+            "delete_user_defined_app_port_protocol",
+            "get_application_modification_times",
+            "get_user_defined_app_address_map",
+            "get_user_defined_app_dns_classification",
+            "get_user_defined_app_groups",
+            "get_user_defined_app_port_protocol",
+            "post_user_defined_app_address_map",
+            "update_user_defined_app_dns_classification",
+            "update_user_defined_app_groups",
+            "update_user_defined_app_port_protocol",
+        ),
+        "orch._authentication": ("get_appliance_auth_information",),
+        "orch._avc_mode": ("get_avc_mode",),
+        "orch._banners": ("get_appliance_login_banners",),
+        "orch._bgp": (
+            "get_appliance_bgp_config",
+            "get_appliance_bgp_config_all_vrfs",
+            "get_appliance_bgp_neighbors",
+            "get_appliance_bgp_neighbors_all_vrfs",
+            "get_appliance_bgp_state",
+            "get_appliance_bgp_state_all_vrfs",
+        ),
+        "orch._bonded_tunnels_configuration": (
+            "get_bonded_tunnel_details",
+            "get_bonded_tunnel_details_for_appliance",
+            "get_bonded_tunnel_details_for_appliance_tunnel",
+            "get_bonded_tunnels_for_physical_tunnel",
+            "get_bonded_tunnels_state",
+        ),
+        "orch._bridge_interface_state": (
+            "get_appliance_bridge_interface_state",
+        ),
+        "orch._broadcast_cli": ("broadcast_cli",),
+        "orch._built_in_policies": ("get_built_in_policies",),
+        "orch._custom_appliance_tags": ("get_custom_appliance_tags",),
+        "orch._custom_certs": (
+            "check_custom_certs_appliances_to_portal",
+            "check_custom_certs_orchestrator_to_portal",
+            "delete_custom_cert",
+            "get_custom_certs",
+            "get_custom_certs_enabled",
+            "set_custom_certs_enabled",
+            "update_custom_certs",
+            "verify_custom_cert",
+        ),
+        "orch._db_partition": (
+            "delete_db_partition",
+            "get_db_partition",
+        ),
+        "orch._debug_files": (
+            "cancel_debug_file_download",
+            "delete_debug_file_from_appliance",
+            "delete_debug_file_from_orchestrator",
+            "generate_appliance_sysdump",
+            "get_debug_file_proxy_settings",
+            "get_debug_files_from_appliance",
+            "set_debug_file_proxy_settings",
+            "upload_appliance_debug_files_to_orchestrator",
+            "upload_appliance_debug_files_to_support",
+        ),
+        "orch._deployment": (
+            "get_all_appliance_deployment",
+            "get_appliance_deployment",
+            "get_single_appliance_deployment",
+        ),
+        "orch._discovery": (
+            "get_appliance_discovery_emails",
+            "set_appliance_discovery_emails",
+        ),
+        "orch._disks": ("get_appliance_disk_information",),
+        "orch._dns": ("get_appliance_dns",),
+        "orch._dns_proxy": ("get_dns_proxy",),
+        "orch._exception": (
+            "create_tunnel_exceptions",
+            "delete_all_tunnel_exceptions",
+            "delete_single_tunnel_exception",
+            "delete_tunnel_exceptions_list",
+            "get_tunnel_exceptions",
+            "update_single_tunnel_exception",
+            "update_tunnel_exceptions",
+        ),
+        "orch._fleet": ("for_each_appliance",),
+        "orch._flow": (
+            "get_appliance_flow_bandwidth_stats",
+            "get_appliance_flow_details",
+            "get_appliance_flow_details_verbose",
+            "get_appliance_flow_table",
+            "get_appliance_flows",
+            "iter_appliance_flow_details",
+            "reclassify_flows",
+            "reset_flows",
+        ),
+        "orch._gms_backup": (
+            "add_or_update_orchestrator_backup_config",
+            "create_orchestrator_blueprint_template",
+            "get_orchestrator_backup_config",
+            "test_orchestrator_backup_config",
+        ),
+        "orch._gms_notification": (
+            "delete_gms_notification",
+            "get_gms_notification",
+            "update_gms_notification",
+        ),
+        "orch._gms_registration": (
+            "get_orchestrator_registration_setting",
+            "set_orchestrator_registration_setting",
+        ),
+        "orch._gms_server": (
+            "get_orchestrator_hello",
+            "get_orchestrator_server_brief",
+            "get_orchestrator_server_info",
+            "get_orchestrator_server_os",
+            "get_orchestrator_server_ping",
+            "get_orchestrator_server_versions",
+        ),
+        "orch._gms_smtp": (
+            "delete_gms_smtp_settings",
+            "delete_unverified_email_addresses",
+            "get_gms_smtp_settings",
+            "get_unverified_email_addresses",
+            "send_verification_email",
+            "set_gms_smtp_settings",
+            "test_gms_smtp_settings",
+            "verify_email_address",
+        ),
+        "orch._gms_stats_collection": (
+            "get_gms_stats_collection",
+            "get_gms_stats_collection_defaults",
+            "update_gms_stats_collection",
+        ),
+        "orch._group": (
+            "add_gms_group",
+            "delete_gms_group",
+            "get_all_appliance_locations",
+            "get_appliance_location",
+            "get_gms_group",
+            "get_gms_groups",
+            "get_root_gms_group",
+            "update_appliance_location_grnodepk",
+            "update_appliance_location_nepk",
+            "update_gms_group",
+        ),
+        "orch._ha_groups": (
+            "get_ha_groups",
+            "modify_ha_groups",
+        ),
+        "orch._hostname": ("get_orchestrator_hostname",),
+        "orch._idle_time": (
+            "clear_idle_time",
+            "increment_idle_time",
+        ),
+        "orch._ikeless": (
+            "get_ipsec_udp_key_config",
+            "get_ipsec_udp_key_history",
+            "get_ipsec_udp_key_status",
+            "update_ipsec_udp_key_config",
+        ),
+        "orch._inbound_shaper": ("get_appliance_inbound_shaper",),
+        "orch._interface_labels": (
+            "get_all_interface_labels",
+            "get_interface_labels_by_type",
+            "push_interface_labels_to_appliance",
+            "update_interface_labels",
+        ),
+        "orch._interface_state": ("get_appliance_interface_state",),
+        "orch._internal_subnets": (
+            "get_internal_subnets",
+            "update_internal_subnets",
+        ),
+        "orch._inventory": ("inventory",),
+        "orch._ip_allow_list": (
+            "get_ip_allow_list",
+            "get_ip_allow_list_drops",
+            "update_ip_allow_list",
+        ),
+        "orch._ip_objects": (
+            "bulk_upload_address_group",
+            "bulk_upload_service_group",
+            "create_address_group",
+            "create_service_group",
+            "delete_address_group",
+            "delete_service_group",
+            "get_address_group",
+            "get_all_address_groups",
+            "get_all_service_groups",
+            "get_service_group",
+            "merge_address_groups",
+            "merge_service_groups",
+            "update_address_group",
+            "update_service_group",
+        ),
+        "orch._license": (
+            "change_appliance_license",
+            "delete_appliance_license_token",
+            "get_nx_licensed_appliances",
+            "get_portal_licensed_appliances",
+            "get_portal_licensed_summary",
+            "get_vx_licensed_appliances",
+            "grant_appliance_base_license",
+            "revoke_appliance_base_license",
+        ),
+        "orch._link_aggregation": ("get_link_aggregation_data",),
+        "orch._link_integrity": (
+            "get_link_integrity_test_result",
+            "link_integrity_test",
+        ),
+        "orch._location": ("get_location_coordinates_from_address",),
+        "orch._logging": ("get_appliance_syslog_config",),
+        "orch._login": (
+            "login",
+            "logout",
+            "send_mfa",
+        ),
+        "orch._loopback": ("get_loopback_interfaes",),
+        "orch._loopback_orch": (
+            "get_deleted_loopback_orchestration_ips",
+            "get_loopback_orchestration",
+            "get_loopback_orchestration_pool_detail",
+            "reclaim_delete_loopback_orchestration_ips",
+            "reclaim_single_deleted_loopback_orchestration_ip",
+            "set_loopback_orchestration",
+        ),
+        "orch._maintenance_mode": (
+            "get_maintenance_mode_appliances",
+            "update_maintenance_mode_appliances",
+        ),
+        "orch._mgmt_services": ("get_mgmt_services",),
+        "orch._multicast": (
+            "get_appliance_multicast_config",
+            "get_appliance_multicast_enabled",
+            "get_appliance_multicast_interfaces",
+            "get_appliance_multicast_neighbors",
+            "get_appliance_multicast_routes",
+        ),
+        "orch._nat": (
+            "get_appliance_nat_config",
+            "get_appliance_nat_maps",
+            "get_appliance_nat_pools",
+        ),
+        "orch._nat_policy": (
+            "get_nat_policy",
+            "get_nat_policy_dynamic",
+            "get_nat_policy_inbound_outbound",
+        ),
+        "orch._net_flow": ("get_net_flow_configuration",),
+        "orch._network_memory": ("erase_appliance_network_memory",),
+        "orch._network_role_and_site": (
+            "get_appliance_network_role_and_site",
+            "update_appliance_network_role_and_site",
+        ),
+        "orch._optimization_policy": ("get_optimization_policy",),
+        "orch._ospf": (
+            "get_appliance_ospf_config",
+            "get_appliance_ospf_interfaces_config",
+            "get_appliance_ospf_interfaces_state",
+            "get_appliance_ospf_neighbors_state",
+            "get_appliance_ospf_state",
+        ),
+        "orch._overlay_association": (
+            "add_appliance_overlay_association",
+            "get_all_appliance_overlay_association",
+            "get_appliance_overlay_association",
+            "remove_appliance_overlay_association",
+            "remove_single_appliance_overlay_association",
+        ),
+        "orch._overlays": (
+            "configure_new_overlay",
+            "configure_regionalized_overlay",
+            "delete_overlay",
+            "get_all_overlays_config",
+            "get_all_overlays_config_keyed",
+            "get_appliance_overlays_association",
+            "get_max_overlays",
+            "get_overlay_config",
+            "get_overlay_config_for_region",
+            "get_overlays_priorities",
+            "modify_overlay_config",
+            "modify_overlay_config_for_region",
+            "modify_regionalized_overlay",
+            "set_overlays_priorities",
+        ),
+        "orch._pagination": (
+            "iter_app_definition_data",
+            "iter_audit_log",
+            "iter_physical_tunnel_details",
+            "iter_timeseries_stats",
+            "iter_tunnels_between_appliances",
+        ),
+        "orch._pause_orchestration": (
+            "get_pause_orchestration",
+            "set_pause_orchestration",
+        ),
+        "orch._peer_priority": ("get_peer_priority_configuration",),
+        "orch._port_forwarding": ("get_appliance_port_fowarding",),
+        "orch._qos_policy": ("get_qos_policy",),
+        "orch._rbac_appliance_access_group": (
+            "delete_appliance_access_group",
+            "get_all_appliance_access_groups",
+            "get_appliance_access_group",
+            "update_appliance_access_group",
+        ),
+        "orch._rbac_assignment": (
+            "delete_rbac_user_assignment",
+            "get_rbac_assignments",
+            "get_rbac_user_assignment",
+            "update_rbac_assignment",
+        ),
+        "orch._rbac_role": (
+            "delete_rbac_role",
+            "get_all_rbac_roles",
+            "get_rbac_role",
+            "get_rbac_role_assigned",
+            "update_rbac_role",
+        ),
+        "orch._reachability": (
+            "get_reachability_status_appliance",
+            "get_reachability_status_orchestrator",
+        ),
+        "orch._realtime_stats": (
+            "get_realtime_stats",
+            "realtime_stats_scheduler",
+        ),
+        "orch._regions": (
+            "create_region",
+            "delete_region",
+            "get_all_regions",
+            "get_region",
+            "get_region_appliance_association",
+            "get_region_appliance_association_by_nepk",
+            "get_region_appliance_association_by_region_id",
+            "set_region_appliance_association",
+            "update_region_appliance_association",
+            "update_region_name",
+        ),
+        "orch._releases": (
+            "delay_release_notification",
+            "dismiss_release_notification",
+            "get_releases_for_orchestrator_and_ecos",
+            "get_releases_notifications",
+        ),
+        "orch._rest_api_config": (
+            "get_rest_api_config",
+            "set_rest_api_config",
+        ),
+        "orch._rest_request_time_stats": (
+            "get_appliance_rest_stats",
+            "get_appliance_rest_stats_by_method",
+        ),
+        "orch._route_policy": ("get_route_policy",),
+        "orch._save_changes": (
+            "save_changes_ne_pk_list",
+            "save_changes_single_appliance",
+        ),
+        "orch._schedule_timezone": (
+            "get_schedule_timezone",
+            "set_schedule_timezone",
+        ),
+        "orch._security_maps": ("get_appliance_security_maps",),
+        "orch._security_settings": (
+            "get_security_settings",
+            "set_security_settings",
+        ),
+        "orch._services": (
+            "get_gms_internet_policy_services",
+            "get_gms_third_party_services",
+            "update_gms_internet_policy_services",
+        ),
+        "orch._session": ("get_orchestrator_sessions",),
+        "orch._session_timeout": (
+            "get_orch_session_timeout",
+            "set_orch_session_timeout",
+        ),
+        "orch._shaper": ("get_appliance_shaper",),
+        "orch._shell": (
+            "get_shell_access_setting",
+            "set_shell_access_setting",
+        ),
+        "orch._snmp": ("get_appliance_snmp",),
+        "orch._sp_portal": (
+            "assign_account_license_ecsp",
+            "classification_sync",
+            "create_case_with_portal",
+            "delete_old_account_key",
+            "geo_locate_multiple_ips",
+            "geo_locate_single_ip",
+            "geo_locator",
+            "get_account_key_change_count",
+            "get_account_key_change_status",
+            "get_account_license_ecsp_status",
+            "get_account_license_feature",
+            "get_account_license_type",
+            "get_all_saas_apps",
+            "get_app_definition_data",
+            "get_app_definition_total",
+            "get_app_groups",
+            "get_app_groups_hash",
+            "get_appliance_orch_portal_status",
+            "get_cloud_portal_broadcast_message",
+            "get_compound_classification",
+            "get_compound_classification_hash",
+            "get_count_of_saas_apps",
+            "get_dns_classification",
+            "get_dns_classification_hash",
+            "get_flow_classification",
+            "get_flow_classification_hash",
+            "get_ip_protocol_numbers",
+            "get_orchestrator_to_cloud_portal_status",
+            "get_port_protocol_classification",
+            "get_port_protocol_classification_hash",
+            "get_portal_registration_config",
+            "get_portal_registration_status",
+            "get_portal_services_status",
+            "get_portal_top_sites",
+            "get_saas_classification",
+            "get_saas_classification_hash",
+            "get_service_id_to_country_mapping",
+            "get_service_id_to_service_mapping",
+            "get_tcp_udp_port_data",
+            "get_traffic_behavior",
+            "get_traffic_behavior_hash",
+            "get_update_time_for_app_definitions",
+            "ip_intelligence_index",
+            "request_new_account_key",
+            "search_app_definition_data",
+            "unassign_account_license_ecsp",
+            "update_portal_registration_config",
+            "update_portal_registration_status",
+        ),
+        "orch._ssl": ("get_appliance_ssl_certs",),
+        "orch._ssl_substitute_cert": (
+            "get_appliance_ssl_substitute_certs",
+            "validate_ssl_substitute_cert",
+        ),
+        "orch._stats_retention": (
+            "get_all_nonstats_retention",
+            "get_all_stats_collection",
+            "get_all_stats_retention",
+            "get_stats_approximate_disk_space",
+            "update_nonstats_retention",
+            "update_stats_collection",
+            "update_stats_retention",
+        ),
+        "orch._subnets": (
+            "appliance_route_table",
+            "get_appliance_subnets",
+            "get_discovered_appliance_subnets",
+            "set_appliance_subnet_sharing_options",
+        ),
+        "orch._tca": (
+            "get_appliance_tca",
+            "get_appliance_tunnel_tca",
+        ),
+        "orch._tcpdump": (
+            "tcpdump_run",
+            "tcpdump_status_all",
+            "tcpdump_status_appliance",
+        ),
+        "orch._template": (
+            "associate_template_group_to_appliance",
+            "create_template_group",
+            "delete_template_group",
+            "get_all_template_groups",
+            "get_appliance_applied_template_goups",
+            "get_appliance_template_groups_association",
+            "get_appliance_template_history",
+            "get_selected_templates_in_template_group",
+            "get_template_group",
+            "get_template_group_association_all_appliances",
+            "get_template_groups_priorities",
+            "post_template_group",
+            "select_templates_for_template_group",
+            "set_template_groups_priorities",
+        ),
+        "orch._third_party_services": (
+            "central_add_subscription",
+            "central_assign_appliance_to_site",
+            "central_delete_subscription",
+            "central_get_site_mapping",
+            "central_get_subscription",
+            "clearpass_add_account",
+            "clearpass_delete_account",
+            "clearpass_filter_events",
+            "clearpass_get_configured_account",
+            "clearpass_get_configured_account_details",
+            "clearpass_get_configured_accounts",
+            "clearpass_get_connectivity",
+            "clearpass_get_pause_orchestration_status",
+            "clearpass_get_service_endpoint_status",
+            "clearpass_get_user_roles_for_ip",
+            "clearpass_pause_individual_orchestration",
+            "clearpass_post_login_event",
+            "clearpass_post_logout_event",
+            "clearpass_reset_service_endpoint",
+            "clearpass_set_pause_orchestration_status",
+            "clearpass_update_account",
+        ),
+        "orch._third_party_tunnels_configuration": (
+            "get_passthrough_tunnel_details",
+            "get_passthrough_tunnel_details_for_appliance",
+            "get_passthrough_tunnel_details_for_appliance_tunnel",
+            "get_passthrough_tunnels_state",
+        ),
+        "orch._timeseries_stats": (
+            "get_timeseries_stats_appliance_process_state",
+            "get_timeseries_stats_appliances",
+            "get_timeseries_stats_appliances_ne_pk_list",
+            "get_timeseries_stats_appliances_single_appliance",
+            "get_timeseries_stats_application",
+            "get_timeseries_stats_application_ne_pk_list",
+            "get_timeseries_stats_application_single_appliance",
+            "get_timeseries_stats_boost_single_appliance",
+            "get_timeseries_stats_drc",
+            "get_timeseries_stats_drc_ne_pk_list",
+            "get_timeseries_stats_drc_single_appliance",
+            "get_timeseries_stats_dscp",
+            "get_timeseries_stats_dscp_ne_pk_list",
+            "get_timeseries_stats_dscp_single_appliance",
+            "get_timeseries_stats_flow",
+            "get_timeseries_stats_flow_ne_pk_list",
+            "get_timeseries_stats_flow_single_appliance",
+            "get_timeseries_stats_interface_overlay_single_appliance",
+            "get_timeseries_stats_interface_single_appliance",
+            "get_timeseries_stats_internal_drops_single_appliance",
+            "get_timeseries_stats_jitter_single_appliance",
+            "get_timeseries_stats_mos_single_appliance",
+            "get_timeseries_stats_orchestrator_memory",
+            "get_timeseries_stats_security_policy_single_appliance",
+            "get_timeseries_stats_shaper",
+            "get_timeseries_stats_shaper_ne_pk_list",
+            "get_timeseries_stats_traffic_class",
+            "get_timeseries_stats_traffic_class_ne_pk_list",
+            "get_timeseries_stats_traffic_class_single_appliance",
+            "get_timeseries_stats_tunnel_single_appliance",
+        ),
+        "orch._tunnels_configuration": (
+            "get_appliance_tunnel_ids",
+            "get_batch_appliance_tunnels_config",
+            "get_batch_appliance_tunnels_state",
+            "get_physical_tunnel_details",
+            "get_physical_tunnel_details_for_appliance",
+            "get_physical_tunnel_details_for_appliance_tunnel",
+            "get_total_tunnel_count",
+            "get_tunnel_count_for_appliances",
+            "get_tunnel_traceroute",
+            "get_tunnels_between_appliances",
+            "get_tunnels_between_appliances_config_data",
+            "initiate_tunnel_traceroute",
+        ),
+        "orch._ui_usage_stats": ("add_ui_usage_count",),
+        "orch._upgrade_appliances": (
+            "upgrade_appliances",
+            "validate_appliance_upgrade",
+        ),
+        "orch._user": (
+            "change_user_password",
+            "create_or_update_user",
+            "delete_user",
+            "get_all_users",
+            "get_new_two_factor_key",
+            "get_user",
+            "reset_user_password",
+            "user_forgot_password",
+        ),
+        "orch._user_account": ("get_appliance_user_accounts",),
+        "orch._vrf": (
+            "add_routing_segmentation_segment",
+            "delete_routing_segmentation_maps_from_source_segment",
+            "delete_routing_segmentation_segment_by_id",
+            "get_routing_segmentation_enable_status",
+            "get_routing_segmentation_list_of_security_maps",
+            "get_routing_segmentation_maps",
+            "get_routing_segmentation_maps_from_source_segment",
+            "get_routing_segmentation_security_policy",
+            "get_routing_segmentation_segment_by_id",
+            "get_routing_segmentation_segments",
+            "get_routing_segmentation_snat_maps",
+            "update_routing_segmentation_enable_status",
+            "update_routing_segmentation_maps_from_source_segment",
+            "update_routing_segmentation_security_policy",
+            "update_routing_segmentation_segment_by_id",
+            "update_routing_segmentation_snat_maps",
+        ),
+        "orch._vrf_dnat_maps": ("get_dnat_maps",),
+        "orch._vrf_snat_maps": ("get_snat_maps",),
+        "orch._vrrp": ("get_vrrp_interfaes",),
+        "orch._vti": ("get_vti_interfaes",),
+        "orch._vxoa_hostname": ("update_appliance_hostname",),
+        "orch._wan_next_hop_health": ("get_wan_next_hop_health_config",),
+        "orch._wccp": (
+            "get_wccp_service_group_settings",
+            "get_wccp_state",
+            "get_wccp_system_settings",
+        ),
+        "orch._zones": (
+            "get_zone_next_id",
+            "get_zones",
+            "get_zones_end_to_end_state",
+            "get_zones_vrf_mapping",
+            "set_zone_next_id",
+            "update_zones",
+            "update_zones_end_to_end_state",
+        ),
+    }
 
 
 # Aruba Edge Connect
@@ -1256,8 +2016,24 @@ class EdgeConnect(HttpCommon):
         log_file: bool = False,
         log_console: bool = False,
         log_success: bool = False,
+        log_sample_rate: float = 1.0,
+        log_body_max: int = None,
         verify_ssl: bool = True,
         timeout: tuple = (9.15, 12),
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: float = None,
+        idle_timeout: float = None,
+        cache_ttl: Union[float, dict] = None,
+        cache_maxsize: int = 1024,
+        json_codec=None,
+        rate_limit: float = None,
+        endpoint_rate_limits: dict = None,
+        retries: int = 0,
+        retry_backoff: float = 0.5,
+        retry_backoff_max: float = 30.0,
+        collect_metrics: bool = False,
     ):
         """Setup Edge Connect instance
 
@@ -1287,6 +2063,13 @@ class EdgeConnect(HttpCommon):
             raise awareness that sensitive data may be stored in the log
             file.
         :type log_success: bool, optional
+        :param log_sample_rate: Share of successful API calls to log,
+            from 0.0 to 1.0, errors are always logged, defaults to 1.0
+        :type log_sample_rate: float, optional
+        :param log_body_max: Maximum number of response bytes included
+            in log messages, longer responses are truncated, defaults to
+            None to log whole responses
+        :type log_body_max: int, optional
         :param verify_ssl: Set to ``False`` to ignore certificate
             warnings within requests, defaults to ``True``
         :param timeout: Timeout values (in seconds) for requests, first
@@ -1295,10 +2078,96 @@ class EdgeConnect(HttpCommon):
             connection, 12 seconds for server data response.
         :type timeout: tuple, optional
         :type verify_ssl: bool, optional
+        :param pool_connections: Number of host connection pools to
+            keep, defaults to 10
+        :type pool_connections: int, optional
+        :param pool_maxsize: Maximum number of connections to keep open
+            per host for reuse. Increase when sharing one instance
+            across many threads, defaults to 10
+        :type pool_maxsize: int, optional
+        :param pool_block: Set to ``True`` to have requests wait for a
+            free connection when ``pool_maxsize`` connections are in use
+            rather than opening extra connections that are discarded
+            after use, defaults to ``False``
+        :type pool_block: bool, optional
+        :param keep_alive: Enable TCP keep-alive probes on connections
+            idle for this many seconds, defaults to None to use the
+            operating system setting
+        :type keep_alive: float, optional
+        :param idle_timeout: Close pooled connections idle for longer
+            than this many seconds instead of reusing them, e.g. to stay
+            under a server or firewall idle timeout, defaults to None
+        :type idle_timeout: float, optional
+        :param cache_ttl: Enable caching of successful GET responses.
+            Seconds to cache every GET, or dictionary of API path to
+            seconds to cache only matching endpoints, a path ending in
+            ``*`` matches all paths starting with it. Any POST, PUT or
+            DELETE to an overlapping path removes cached responses.
+            Defaults to None for no caching
+        :type cache_ttl: float or dict, optional
+        :param cache_maxsize: Maximum number of GET responses to cache,
+            defaults to 1024
+        :type cache_maxsize: int, optional
+        :param json_codec: JSON codec for request bodies and responses,
+            ``"orjson"``, ``"json"`` for the standard library, or an
+            object with ``dumps`` returning bytes and ``loads`` methods.
+            Defaults to None to use ``orjson`` if installed and ``json``
+            otherwise
+        :type json_codec: str or object, optional
+        :param rate_limit: Maximum requests per second sent by this
+            instance, shared by all threads, defaults to None for no
+            limit
+        :type rate_limit: float, optional
+        :param endpoint_rate_limits: Dictionary of API path to maximum
+            requests per second, applied in addition to ``rate_limit``.
+            A path ending in ``*`` matches all paths starting with it,
+            each path is limited separately, e.g.
+            ``{"/stats*": 2}``, defaults to None
+        :type endpoint_rate_limits: dict, optional
+        :param retries: Maximum number of times to retry a request after
+            a connection error, timeout, or HTTP 429, 502, 503 or 504.
+            ``POST`` is only retried on connect timeouts and HTTP 429.
+            Defaults to 0
+        :type retries: int, optional
+        :param retry_backoff: Seconds of backoff before the first retry,
+            doubling with each further retry and randomized with jitter.
+            A ``Retry-After`` response header is used instead when
+            present, defaults to 0.5
+        :type retry_backoff: float, optional
+        :param retry_backoff_max: Maximum seconds to wait before a
+            retry, defaults to 30.0
+        :type retry_backoff_max: float, optional
+        :param collect_metrics: Record latency and bytes of every
+            request per endpoint, reported by :meth:`metrics`, defaults
+            to False
+        :type collect_metrics: bool, optional
         """
         self.url_prefix = "https://" + url + ":443/rest/json"
         self.timeout = timeout
         self.session = requests.Session()
+        self._mount_transport(
+            pool_connections,
+            pool_maxsize,
+            pool_block,
+            keep_alive,
+            idle_timeout,
+        )
+        self.cache = (
+            ResponseCache(cache_ttl, cache_maxsize) if cache_ttl else None
+        )
+        self.json_codec = get_codec(json_codec)
+        self.governor = (
+            RequestGovernor(
+                rate_limit,
+                endpoint_rate_limits,
+                retries,
+                retry_backoff,
+                retry_backoff_max,
+            )
+            if rate_limit or endpoint_rate_limits or retries
+            else None
+        )
+        self.endpoint_metrics = EndpointMetrics() if collect_metrics else None
         self.headers = {}
         # for API calls w/ just source as query param
         self.apiSrcId = "?source=menu_rest_apis_id"
@@ -1316,6 +2185,8 @@ class EdgeConnect(HttpCommon):
         # is set to True, warn user if logging to local file is also
         # enabled
         self.log_success = log_success
+        self.log_sample_rate = log_sample_rate
+        self.log_body_max = log_body_max
         if self.log_success and log_file:
             print(
                 """
@@ -1352,108 +2223,144 @@ class EdgeConnect(HttpCommon):
             self.logger.setLevel(logging.DEBUG)
             self.logger.addHandler(self.console_handler)
 
-    # Imported methods
-    from .ecos._alarm import (
-        acknowledge_appliance_alarms,
-        add_note_appliance_alarms,
-        clear_appliance_alarms,
-        delete_appliance_alarms,
-        get_appliance_alarm_descriptions,
-        get_appliance_alarms,
-    )
-    from .ecos._bonded_tunnel import (
-        configure_appliance_all_bonded_tunnels,
-        delete_appliance_multiple_bonded_tunnels,
-        delete_appliance_single_bonded_tunnel,
-        get_appliance_all_bonded_tunnel_ids,
-        get_appliance_bonded_tunnel_aliases,
-        get_appliance_bonded_tunnel_live_view_info,
-        get_appliance_bonded_tunnels_config,
-        get_appliance_bonded_tunnels_state,
-        get_appliance_multiple_bonded_tunnels_config,
-        get_appliance_multiple_bonded_tunnels_state,
-        get_appliance_single_bonded_tunnel_config,
-    )
-    from .ecos._cli import (
-        perform_appliance_cli_command,
-        perform_appliance_multiple_cli_command,
-    )
-    from .ecos._cpu import get_appliance_cpu
-    from .ecos._deployment import get_appliance_deployment
-    from .ecos._disk_usage import get_appliance_disk_usage
-    from .ecos._dns import get_appliance_dns_config, set_appliance_dns_config
-    from .ecos._gms import assign_orchestrator, get_orchestrator
-    from .ecos._interfaces import get_appliance_interfaces
-    from .ecos._license import is_reboot_required
-    from .ecos._local_subnets import (
-        add_appliance_locally_configured_routes,
-        appliance_find_preferred_route,
-        delete_appliance_locally_configured_routes,
-        get_appliance_locally_configured_subnets,
-        get_appliance_locally_configured_subnets_single_vrf,
-        get_appliance_routing_peers_info,
-        get_appliance_subnets,
-        get_appliance_subnets_all_vrfs,
-        get_appliance_subnets_single_vrf,
-        update_appliance_all_locally_configured_subnets,
-        update_appliance_all_locally_configured_subnets_single_vrf,
-    )
-    from .ecos._login import login, logout
-    from .ecos._memory import get_appliance_memory
-    from .ecos._network_interfaces import (
-        get_appliance_network_interfaces,
-        modify_network_interfaces,
-    )
-    from .ecos._peers import get_appliance_peers, get_appliance_peers_ec_only
-    from .ecos._reboot import request_reboot
-    from .ecos._save_changes import save_changes
-    from .ecos._security_maps import (
-        configure_appliance_security_policies,
-        delete_appliance_security_policy_rule,
-        delete_appliance_security_policy_zone_pair,
-        get_appliance_security_policies,
-        get_appliance_security_policy_map,
-        get_appliance_security_policy_settings,
-        get_appliance_security_policy_settings_by_map_name,
-        get_appliance_security_policy_zone_pair,
-        set_appliance_security_policy_settings,
-    )
-    from .ecos._sp_portal import register_sp_portal, register_sp_portal_status
-    from .ecos._statistics import (
-        get_appliance_realtime_stats,
-        get_appliance_stats_minute_file,
-        get_appliance_stats_minute_range,
-    )
-    from .ecos._system_info import get_appliance_system_info
-    from .ecos._third_party_tunnel import (
-        configure_appliance_multiple_3rdparty_tunnels,
-        delete_appliance_multiple_3rdparty_tunnels,
-        delete_appliance_single_3rdparty_tunnel,
-        get_appliance_3rdparty_tunnel_aliases,
-        get_appliance_3rdparty_tunnels_config,
-        get_appliance_3rdparty_tunnels_state,
-        get_appliance_all_3rdparty_tunnel_ids,
-        get_appliance_multiple_3rdparty_tunnels_config,
-        get_appliance_multiple_3rdparty_tunnels_state,
-        get_appliance_single_3rdparty_tunnel_config,
-    )
-    from .ecos._time import get_appliance_time
-    from .ecos._tunnel import (
-        apply_appliance_tunnel_template,
-        configure_appliance_all_tunnels,
-        configure_appliance_multiple_tunnels,
-        configure_appliance_single_tunnel,
-        delete_appliance_multiple_tunnels,
-        delete_appliance_single_tunnel,
-        get_appliance_all_tunnel_ids,
-        get_appliance_multiple_tunnels_config,
-        get_appliance_multiple_tunnels_state,
-        get_appliance_passthrough_tunnel_source_endpoints,
-        get_appliance_single_tunnel_config,
-        get_appliance_tunnel_aliases,
-        get_appliance_tunnel_source_endpoints,
-        get_appliance_tunnels_config,
-        get_appliance_tunnels_config_and_state,
-        set_appliance_tunnels_ipsec_psk,
-        start_appliance_tunnel_mtu_discovery,
-    )
+    # Methods are loaded from these modules on first use, see
+    # :class:`_LazyMethodLoader`
+    _method_modules = {
+        "ecos._alarm": (
+            "acknowledge_appliance_alarms",
+            "add_note_appliance_alarms",
+            "alarm_feed",
+            "clear_appliance_alarms",
+            "delete_appliance_alarms",
+            "get_appliance_alarm_descriptions",
+            "get_appliance_alarms",
+        ),
+        "ecos._bonded_tunnel": (
+            "configure_appliance_all_bonded_tunnels",
+            "delete_appliance_multiple_bonded_tunnels",
+            "delete_appliance_single_bonded_tunnel",
+            "get_appliance_all_bonded_tunnel_ids",
+            "get_appliance_bonded_tunnel_aliases",
+            "get_appliance_bonded_tunnel_live_view_info",
+            "get_appliance_bonded_tunnels_config",
+            "get_appliance_bonded_tunnels_state",
+            "get_appliance_multiple_bonded_tunnels_config",
+            "get_appliance_multiple_bonded_tunnels_state",
+            "get_appliance_single_bonded_tunnel_config",
+        ),
+        "ecos._cli": (
+            "perform_appliance_cli_command",
+            "perform_appliance_multiple_cli_command",
+        ),
+        "ecos._cpu": ("get_appliance_cpu",),
+        "ecos._deployment": ("get_appliance_deployment",),
+        "ecos._disk_usage": ("get_appliance_disk_usage",),
+        "ecos._dns": (
+            "get_appliance_dns_config",
+            "set_appliance_dns_config",
+        ),
+        "ecos._gms": (
+            "assign_orchestrator",
+            "get_orchestrator",
+        ),
+        "ecos._interfaces": ("get_appliance_interfaces",),
+        "ecos._license": ("is_reboot_required",),
+        "ecos._local_subnets": (
+            "add_appliance_locally_configured_routes",
+            "appliance_find_preferred_route",
+            "appliance_route_table",
+            "delete_appliance_locally_configured_routes",
+            "get_appliance_locally_configured_subnets",
+            "get_appliance_locally_configured_subnets_single_vrf",
+            "get_appliance_routing_peers_info",
+            "get_appliance_subnets",
+            "get_appliance_subnets_all_vrfs",
+            "get_appliance_subnets_single_vrf",
+            "update_appliance_all_locally_configured_subnets",
+            "update_appliance_all_locally_configured_subnets_single_vrf",
+        ),
+        "ecos._login": (
+            "login",
+            "logout",
+        ),
+        "ecos._memory": ("get_appliance_memory",),
+        "ecos._network_interfaces": (
+            "get_appliance_network_interfaces",
+            "modify_network_interfaces",
+        ),
+        "ecos._peers": (
+            "get_appliance_peers",
+            "get_appliance_peers_ec_only",
+        ),
+        "ecos._reboot": ("request_reboot",),
+        "ecos._save_changes": ("save_changes",),
+        "ecos._security_maps": (
+            "configure_appliance_security_policies",
+            "delete_appliance_security_policy_rule",
+            "delete_appliance_security_policy_zone_pair",
+            "get_appliance_security_policies",
+            "get_appliance_security_policy_map",
+            "get_appliance_security_policy_settings",
+            "get_appliance_security_policy_settings_by_map_name",
+            "get_appliance_security_policy_zone_pair",
+            "set_appliance_security_policy_settings",
+        ),
+        "ecos._sp_portal": (
+            "register_sp_portal",
+            "register_sp_portal_status",
+        ),
+        "ecos._statistics": (
+            "appliance_realtime_stats_scheduler",
+            "download_appliance_stats_minute_file",
+            "get_appliance_realtime_stats",
+            "get_appliance_stats_minute_file",
+            "get_appliance_stats_minute_range",
+            "iter_minute_stats",
+        ),
+        "ecos._system_info": ("get_appliance_system_info",),
+        "ecos._third_party_tunnel": (
+            "configure_appliance_multiple_3rdparty_tunnels",
+            "delete_appliance_multiple_3rdparty_tunnels",
+            "delete_appliance_single_3rdparty_tunnel",
+            "get_appliance_3rdparty_tunnel_aliases",
+            "get_appliance_3rdparty_tunnels_config",
+            "get_appliance_3rdparty_tunnels_state",
+            "get_appliance_all_3rdparty_tunnel_ids",
+            "get_appliance_multiple_3rdparty_tunnels_config",
+            "get_appliance_multiple_3rdparty_tunnels_state",
+            "get_appliance_single_3rdparty_tunnel_config",
+        ),
+        "ecos._time": ("get_appliance_time",),
+        "ecos._tunnel": (
+            "apply_appliance_tunnel_template",
+            "configure_appliance_all_tunnels",
+            "configure_appliance_multiple_tunnels",
+            "configure_appliance_single_tunnel",
+            "delete_appliance_multiple_tunnels",
+            "delete_appliance_single_tunnel",
+            "get_appliance_all_tunnel_ids",
+            "get_appliance_multiple_tunnels_config",
+            "get_appliance_multiple_tunnels_state",
+            "get_appliance_passthrough_tunnel_source_endpoints",
+            "get_appliance_single_tunnel_config",
+            "get_appliance_tunnel_aliases",
+            "get_appliance_tunnel_source_endpoints",
+            "get_appliance_tunnels_config",
+            "get_appliance_tunnels_config_and_state",
+            "set_appliance_tunnels_ipsec_psk",
+            "start_appliance_tunnel_mtu_discovery",
+        ),
+    }
+
+
+def __getattr__(name: str):
+    # asyncio classes and aiohttp are only imported when requested
+    if name in ["AsyncEdgeConnect", "AsyncOrchestrator"]:
+        from . import _async
+
+        return getattr(_async, name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + ["AsyncEdgeConnect", "AsyncOrchestrator"])
@@ -0,0 +1,293 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# alarm_feed : Incremental alarm polling with watermarks
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from ._results import request_failed
+
+
+def _count_signature(counts: dict) -> tuple:
+    """Alarm counts by severity as a comparable value"""
+    return tuple(sorted(counts.items()))
+
+
+class AlarmFeed(ABC):
+    """Track alarms between polls and report only what changed. Keeps
+    the last seen alarms of each source, such as an appliance, and the
+    time of the newest alarm seen as a watermark.
+
+    :meth:`poll` returns a dictionary of alarm lists \n
+        * keyword **new** (`list`): Alarms not seen before, every
+          active alarm on the first poll
+        * keyword **changed** (`list`): Alarms seen before with any
+          field changed, e.g. acknowledged or occurrence count
+        * keyword **cleared** (`list`): Alarms no longer active, as last
+          seen
+    """
+
+    def __init__(self):
+        """Setup empty alarm feed"""
+        # source -> alarm key -> alarm
+        self.seen = {}
+        # newest time an alarm occurred in epoch milliseconds
+        self.watermark = None
+        self.polls = 0
+
+    def _empty_delta(self) -> dict:
+        return {"new": [], "changed": [], "cleared": []}
+
+    def _diff(self, source, alarms: dict, delta: dict):
+        """Compare current alarms of a source to the last seen alarms
+
+        :param source: Source of alarms
+        :param alarms: Current active alarms of the source by key
+        :type alarms: dict
+        :param delta: Delta to add new, changed and cleared alarms to
+        :type delta: dict
+        """
+        previous = self.seen.get(source, {})
+        for key, alarm in alarms.items():
+            last = previous.get(key)
+            if last is None:
+                delta["new"].append(alarm)
+            elif last != alarm:
+                delta["changed"].append(alarm)
+            occurred = alarm.get("timeOccurredInMills", alarm.get("time"))
+            if isinstance(occurred, int) and (
+                self.watermark is None or occurred > self.watermark
+            ):
+                self.watermark = occurred
+        for key, alarm in previous.items():
+            if key not in alarms:
+                delta["cleared"].append(alarm)
+        if alarms:
+            self.seen[source] = alarms
+        else:
+            self.seen.pop(source, None)
+
+    def alarms(self) -> list:
+        """All alarms currently active as of the last poll
+
+        :return: List of alarms
+        :rtype: list
+        """
+        return [
+            alarm for alarms in self.seen.values() for alarm in alarms.values()
+        ]
+
+    @abstractmethod
+    def poll(self) -> dict:
+        """Request alarms and report changes since the last poll
+
+        :return: Dictionary of ``new``, ``changed`` and ``cleared``
+            alarm lists
+        :rtype: dict
+        """
+
+
+class OrchestratorAlarmFeed(AlarmFeed):
+    """Incremental feed of active appliance and Orchestrator alarms.
+
+    Each poll requests per-appliance alarm counts and the alarms that
+    occurred since the watermark, both small responses. Full active
+    alarms are only requested for appliances whose counts changed or
+    that raised new alarms, so a poll costs about as much as the
+    changes since the last poll. Every ``full_every`` polls all
+    sources are requested in full to pick up changes that leave counts
+    unchanged, such as acknowledgements or notes.
+    """
+
+    def __init__(
+        self,
+        orch,
+        ne_pk_list: list = None,
+        orchestrator_alarms: bool = True,
+        full_every: int = 10,
+        overlap: int = 60000,
+    ):
+        """Setup Orchestrator alarm feed
+
+        :param orch: Orchestrator instance
+        :type orch: Orchestrator
+        :param ne_pk_list: Appliances to track, defaults to None for all
+            appliances
+        :type ne_pk_list: list, optional
+        :param orchestrator_alarms: Also track alarms of Orchestrator
+            itself, defaults to True
+        :type orchestrator_alarms: bool, optional
+        :param full_every: Request all active alarms every this many
+            polls, None to never, defaults to 10
+        :type full_every: int, optional
+        :param overlap: Milliseconds before the watermark to request
+            alarms from, covering alarms recorded late, defaults to
+            60000
+        :type overlap: int, optional
+        """
+        super().__init__()
+        self.orch = orch
+        self.ne_pk_list = ne_pk_list
+        self.orchestrator_alarms = orchestrator_alarms
+        self.full_every = full_every
+        self.overlap = overlap
+        # appliance -> alarm count signature at last poll
+        self.counts = {}
+        self.orchestrator_counts = None
+
+    def _since(self):
+        """Start time of the new alarm query in epoch milliseconds"""
+        if self.watermark is None:
+            return None
+        return max(0, self.watermark - self.overlap)
+
+    def _poll_appliances(self, full: bool, delta: dict):
+        """Request alarms of appliances whose alarms changed"""
+        orch = self.orch
+        counts = orch.get_alarm_count_all_appliances()
+        if request_failed(counts):
+            orch.logger.warning("Alarm feed could not get appliance counts")
+            return
+        tracked = set(self.ne_pk_list) if self.ne_pk_list else None
+        signatures = {}
+        for entry in counts:
+            ne_pk = entry.get("applianceId")
+            if ne_pk is None or (tracked is not None and ne_pk not in tracked):
+                continue
+            signatures[ne_pk] = _count_signature(entry)
+
+        sources = set(self.seen) - {"gms"}
+        if full:
+            dirty = set(signatures) | sources
+        else:
+            dirty = {
+                ne_pk
+                for ne_pk, signature in signatures.items()
+                if self.counts.get(ne_pk) != signature
+            }
+            # appliances with alarms before that no longer report counts
+            dirty |= sources - set(signatures)
+            # a cleared and a new alarm of the same severity leave
+            # counts unchanged, new alarms reveal the swap
+            ne_pk_list = sorted(tracked or signatures)
+            if ne_pk_list:
+                recent = orch.get_alarms_from_appliances(
+                    ne_pk_list, view="active", start_time=self._since()
+                )
+                if request_failed(recent):
+                    orch.logger.warning(
+                        "Alarm feed could not get new appliance alarms"
+                    )
+                    return
+                for alarm in recent:
+                    ne_pk = alarm.get("applianceId")
+                    key = (ne_pk, alarm.get("sequenceId"))
+                    if self.seen.get(ne_pk, {}).get(key) != alarm:
+                        dirty.add(ne_pk)
+
+        if dirty:
+            active = orch.get_alarms_from_appliances(
+                sorted(dirty), view="active"
+            )
+            if request_failed(active):
+                orch.logger.warning(
+                    "Alarm feed could not get active appliance alarms"
+                )
+                return
+            by_source = {ne_pk: {} for ne_pk in dirty}
+            for alarm in active:
+                ne_pk = alarm.get("applianceId")
+                if ne_pk in by_source:
+                    key = (ne_pk, alarm.get("sequenceId"))
+                    by_source[ne_pk][key] = alarm
+            for ne_pk, alarms in by_source.items():
+                self._diff(ne_pk, alarms, delta)
+        self.counts = signatures
+
+    def _poll_orchestrator(self, full: bool, delta: dict):
+        """Request Orchestrator alarms if they changed"""
+        orch = self.orch
+        counts = orch.get_alarm_count_orchestrator_or_appliances("gms")
+        if request_failed(counts):
+            orch.logger.warning("Alarm feed could not get Orchestrator counts")
+            return
+        signature = _count_signature(counts)
+        dirty = full or self.orchestrator_counts != signature
+        if not dirty:
+            recent = orch.get_alarms_from_orchestrator(
+                view="active", start_time=self._since()
+            )
+            if request_failed(recent):
+                orch.logger.warning(
+                    "Alarm feed could not get new Orchestrator alarms"
+                )
+                return
+            seen = self.seen.get("gms", {})
+            dirty = any(seen.get(alarm.get("id")) != alarm for alarm in recent)
+        if dirty:
+            active = orch.get_alarms_from_orchestrator(view="active")
+            if request_failed(active):
+                orch.logger.warning(
+                    "Alarm feed could not get active Orchestrator alarms"
+                )
+                return
+            self._diff(
+                "gms", {alarm.get("id"): alarm for alarm in active}, delta
+            )
+        self.orchestrator_counts = signature
+
+    def poll(self) -> dict:
+        """Request alarms that changed since the last poll. Sources that
+        fail to respond are skipped and requested again next poll.
+
+        :return: Dictionary of ``new``, ``changed`` and ``cleared``
+            alarm lists
+        :rtype: dict
+        """
+        full = self.polls == 0 or (
+            bool(self.full_every) and self.polls % self.full_every == 0
+        )
+        self.polls += 1
+        delta = self._empty_delta()
+        self._poll_appliances(full, delta)
+        if self.orchestrator_alarms:
+            self._poll_orchestrator(full, delta)
+        return delta
+
+
+class ApplianceAlarmFeed(AlarmFeed):
+    """Incremental feed of active alarms of an EdgeConnect appliance.
+    The appliance alarm endpoint has no filters, so every poll requests
+    all outstanding alarms, but only changes are reported.
+    """
+
+    def __init__(self, ec):
+        """Setup appliance alarm feed
+
+        :param ec: EdgeConnect instance
+        :type ec: EdgeConnect
+        """
+        super().__init__()
+        self.ec = ec
+
+    def poll(self) -> dict:
+        """Request alarms and report changes since the last poll
+
+        :return: Dictionary of ``new``, ``changed`` and ``cleared``
+            alarm lists, empty if the request failed
+        :rtype: dict
+        """
+        self.polls += 1
+        delta = self._empty_delta()
+        response = self.ec.get_appliance_alarms()
+        if request_failed(response):
+            self.ec.logger.warning("Alarm feed could not get alarms")
+            return delta
+        alarms = {
+            alarm.get("sequenceId"): alarm
+            for alarm in response.get("outstanding", [])
+            if alarm.get("active", True)
+        }
+        self._diff("appliance", alarms, delta)
+        return delta
@@ -0,0 +1,866 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# asyncio variants of Orchestrator and EdgeConnect
+import asyncio
+import io
+import time
+import traceback
+
+import requests
+from requests.cookies import RequestsCookieJar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from . import EdgeConnect, HttpCommon, Orchestrator
+from ._download import AsyncDownload
+from ._flows import FlowListParser, FlowTable
+from ._minute_stats import MinuteStatsRecords, iter_minute_stats_archive
+from ._results import PageRequestError, request_failed
+from .ecos import _login as _ecos_login
+from .orch import _flow as _orch_flow
+from .orch import _login as _orch_login
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+if aiohttp is not None:
+    # aiohttp 3.10+ distinguishes connect from read timeouts
+    _ConnectTimeout = getattr(
+        aiohttp, "ConnectionTimeoutError", aiohttp.ServerTimeoutError
+    )
+
+
+class AsyncHttpCommon(HttpCommon):
+    """asyncio counterpart of :class:`HttpCommon`. The HTTP request
+    methods are coroutines backed by an ``aiohttp`` session, so every
+    API method inherited from :class:`Orchestrator` or
+    :class:`EdgeConnect` returns an awaitable. Responses are converted
+    to ``requests.Response`` objects and passed through the same
+    :meth:`HttpCommon._handle_response`, so return values and error
+    handling match the synchronous classes.
+    """  # noqa RST304
+
+    def _require_sync(self, name: str):
+        raise TypeError(
+            f"{name} is only supported by the synchronous classes, not "
+            f"{type(self).__name__}"
+        )
+
+    def _async_setup(
+        self,
+        max_connections: int,
+    ):
+        """Store settings for the ``aiohttp`` session, which is created
+        on first request inside the running event loop
+
+        :param max_connections: Maximum number of simultaneous
+            connections held by the session
+        :type max_connections: int
+        :raises ImportError: If ``aiohttp`` is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "{} requires aiohttp, install with "
+                "'pip install pyedgeconnect[async]'".format(
+                    type(self).__name__
+                )
+            )
+        self.max_connections = max_connections
+        self.async_session = None
+        self.async_stats = {
+            "in_use": 0,
+            "peak_in_use": 0,
+            "saturated": 0,
+            "requests": 0,
+        }
+
+    def _get_async_session(self):
+        """Return the ``aiohttp`` session, creating it if needed
+
+        :return: aiohttp session for this instance
+        :rtype: aiohttp.ClientSession
+        """
+        if self.async_session is None or self.async_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                ssl=None if self.verify else False,
+            )
+            self.async_session = aiohttp.ClientSession(
+                connector=connector,
+                # allow cookies from hosts addressed by IP
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.timeout[0],
+                    sock_read=self.timeout[1],
+                ),
+            )
+        return self.async_session
+
+    def pool_stats(self) -> dict:
+        """Report connection usage of the ``aiohttp`` session. A
+        growing ``saturated`` count means requests waited for a free
+        connection, consider raising ``max_connections``.
+
+        :return: Dictionary keyed by ``host:port`` \n
+            * keyword **maxsize** (`int`): ``max_connections`` limit
+            * keyword **in_use** (`int`): Requests currently in flight
+            * keyword **peak_in_use** (`int`): Highest ``in_use`` seen
+            * keyword **saturated** (`int`): Number of requests started
+              while ``max_connections`` requests were in flight
+            * keyword **requests** (`int`): Requests sent
+        :rtype: dict
+        """
+        host = self.url_prefix.split("/")[2]
+        return {host: dict(self.async_stats, maxsize=self.max_connections)}
+
+    async def close(self):
+        """Close the underlying ``aiohttp`` session"""
+        if self.async_session is not None:
+            await self.async_session.close()
+            self.async_session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # BASE HTTP REQUESTS
+
+    async def _req_async(
+        self,
+        method: str,
+        url: str,
+        data=None,
+        files=None,
+    ) -> requests.Response:
+        """Assemble and send aiohttp request for the given HTTP method
+
+        :param method: HTTP method, e.g. ``GET``
+        :type method: str
+        :param url: Full URL to use in HTTP request
+        :type url: str
+        :param data: Data to pass in request body
+        :type data: str, list, dict
+        :param files: Files to upload as multipart form data, in the
+            same ``{name: (filename, content, content_type)}`` form as
+            requests
+        :type files: dict
+        :return: Requests Response object
+        :rtype: requests.Response
+        """
+        apiSrcStr = self.apiSrcId if ("?" not in url) else self.apiSrcId2
+        full_url = self.url_prefix + url + apiSrcStr
+        kwargs = {"headers": self.headers}
+        if files:
+            form = aiohttp.FormData()
+            for name, value in files.items():
+                if isinstance(value, tuple):
+                    form.add_field(
+                        name,
+                        value[1],
+                        filename=value[0],
+                        content_type=value[2] if len(value) > 2 else None,
+                    )
+                else:
+                    form.add_field(name, value)
+            kwargs["data"] = form
+        elif method in ["POST", "PUT"]:
+            kwargs.update(self._json_body(data))
+
+        session = self._get_async_session()
+        stats = self.async_stats
+        if stats["in_use"] >= self.max_connections:
+            stats["saturated"] += 1
+        stats["in_use"] += 1
+        stats["requests"] += 1
+        stats["peak_in_use"] = max(stats["peak_in_use"], stats["in_use"])
+        try:
+            async with session.request(method, full_url, **kwargs) as resp:
+                body = await resp.read()
+                response = _build_response(method, full_url, resp, body)
+                data = kwargs.get("data")
+                if isinstance(data, bytes):
+                    response.request.body = data
+                return response
+        finally:
+            stats["in_use"] -= 1
+
+    async def _req_stream(self, url: str) -> requests.Response:
+        """Send aiohttp GET request without reading the response body,
+        the asynchronous counterpart of ``_req_get(url, stream=True)``
+
+        :param url: Full URL to use in HTTP request
+        :type url: str
+        :return: Requests Response object with the aiohttp response as
+            ``raw``, the body is read by :class:`AsyncDownload`
+        :rtype: requests.Response
+        """  # noqa RST304
+        apiSrcStr = self.apiSrcId if ("?" not in url) else self.apiSrcId2
+        full_url = self.url_prefix + url + apiSrcStr
+        session = self._get_async_session()
+        self.async_stats["requests"] += 1
+        resp = await session.get(full_url, headers=self.headers)
+        return _build_response("GET", full_url, resp, None)
+
+    async def _req_post(self, url: str, data, files) -> requests.Response:
+        return await self._req_async("POST", url, data, files)
+
+    async def _req_get(self, url: str) -> requests.Response:
+        return await self._req_async("GET", url)
+
+    async def _req_delete(self, url: str) -> requests.Response:
+        return await self._req_async("DELETE", url)
+
+    async def _req_put(self, url: str, data) -> requests.Response:
+        return await self._req_async("PUT", url, data)
+
+    # HTTP REQUESTS CALLED BY METHODS
+
+    async def _send_async(self, method: str, api_path: str, request, *args):
+        """Asynchronous variant of :meth:`HttpCommon._send`"""
+        governor = self.governor
+        metrics = self.endpoint_metrics
+        if governor is None and metrics is None:
+            return await request(api_path, *args)
+        attempt = 0
+        while True:
+            if governor is not None:
+                wait = governor.reserve(api_path)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            start = time.perf_counter()
+            try:
+                response = await request(api_path, *args)
+            except Exception as ex:
+                if metrics is not None:
+                    metrics.record(
+                        method,
+                        api_path,
+                        type(ex).__name__,
+                        time.perf_counter() - start,
+                    )
+                if governor is None or not isinstance(
+                    ex, (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+                ):
+                    raise
+                error = (
+                    "connect"
+                    if isinstance(
+                        ex, (_ConnectTimeout, aiohttp.ClientConnectorError)
+                    )
+                    else "read"
+                )
+                delay = governor.retry_delay(
+                    method, api_path, attempt, error=error
+                )
+                if delay is None:
+                    raise
+                reason = type(ex).__name__
+            else:
+                if metrics is not None:
+                    metrics.record_response(
+                        method, api_path, response, time.perf_counter() - start
+                    )
+                if governor is None:
+                    return response
+                delay = governor.retry_delay(
+                    method,
+                    api_path,
+                    attempt,
+                    status_code=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                reason = f"HTTP {response.status_code}"
+                response.close()
+            attempt += 1
+            self.logger.warning(
+                f"{method} {api_path} | {reason} | Retry {attempt} of "
+                f"{governor.retries} in {delay:.2f} seconds"
+            )
+            await asyncio.sleep(delay)
+
+    async def _request_async(
+        self,
+        method: str,
+        api_path: str,
+        request,
+        expected_status: list,
+        return_type: str,
+    ):
+        """Await request coroutine and send results to
+        _handle_response method. Catches Exceptions and logs to log file
+        the same way as the synchronous :class:`HttpCommon` methods
+
+        :param method: HTTP method, used in log messages
+        :type method: str
+        :param api_path: API path to append to url_prefix
+        :type api_path: str
+        :param request: Coroutine of :meth:`_send_async` to await
+        :type request: coroutine
+        :param expected_status: List of expected HTTP status codes of
+            response
+        :type expected_status: list
+        :param return_type: Filter for data to include in response to
+            function call, accepted values are "json" "text" "bool"
+            "full_response"
+        :type return_type: str
+        :return: Returns False on exceptions, otherwise passes return
+            through _handle_response method for processing Requests
+            response
+        :rtype: bool, _handle_response method
+        """
+        if return_type not in ["json", "text", "bool", "full_response"]:
+            self.logger.error(
+                "Called {} {} with unknown return type '{}'".format(
+                    method, api_path, return_type
+                )
+            )
+        if self.cache is not None:
+            generation = self.cache.generation
+        try:
+            response = await request
+            if self.cache is not None:
+                if method != "GET":
+                    self.cache.invalidate(api_path)
+                elif response.status_code in expected_status:
+                    self.cache.put(api_path, response, generation)
+            return self._handle_response(
+                api_path, response, expected_status, return_type
+            )
+        except _ConnectTimeout:
+            self.logger.error(
+                f"{method} {api_path} | Request Timed Out - "
+                f"Timeout values (connect/read): {self.timeout}"
+            )
+        except Exception as ex:
+            self.logger.error(
+                "Exception {} when calling {} {}. Traceback: {}".format(
+                    type(ex), method, api_path, traceback.format_exc()
+                )
+            )
+            return False
+
+    async def _download(
+        self,
+        api_path: str,
+        destination=None,
+        chunk_size: int = 65536,
+        expected_status: list = [200],
+    ):
+        """Asynchronous variant of :meth:`HttpCommon._download`,
+        returning an :class:`AsyncDownload` to iterate with
+        ``async for`` when no ``destination`` is provided
+
+        :param api_path: API path to append to url_prefix
+        :type api_path: str
+        :param destination: File path or binary file object to write the
+            response body to, defaults to None
+        :type destination: str, os.PathLike, or file object, optional
+        :param chunk_size: Number of bytes per chunk read from the
+            response, defaults to 65536
+        :type chunk_size: int, optional
+        :param expected_status: List of expected HTTP status codes of
+            response, defaults to [200]
+        :type expected_status: list, optional
+        :return: Returns False on exceptions or unexpected status.
+            Otherwise dictionary of transfer statistics if
+            ``destination`` was provided, or :class:`AsyncDownload`
+        :rtype: bool, dict, AsyncDownload
+        """  # noqa RST304
+        try:
+            response = await self._send_async(
+                "GET", api_path, self._req_stream
+            )
+            resp = response.raw
+            if response.status_code not in expected_status:
+                response._content = await resp.read()
+                response._content_consumed = True
+                resp.release()
+                return self._handle_response(
+                    api_path, response, expected_status, "bool"
+                )
+            self.logger.info(
+                f"[GET] {api_path} | Received HTTP "
+                f"{response.status_code} | Streaming response"
+            )
+            download = AsyncDownload(resp, chunk_size)
+            if destination is None:
+                return download
+            return await download.save(destination)
+        except _ConnectTimeout:
+            self.logger.error(
+                f"GET {api_path} | Request Timed Out - "
+                f"Timeout values (connect/read): {self.timeout}"
+            )
+        except Exception as ex:
+            self.logger.error(
+                "Exception {} when calling GET {}. Traceback: {}".format(
+                    type(ex), api_path, traceback.format_exc()
+                )
+            )
+            return False
+
+    async def _post(
+        self,
+        api_path: str,
+        data="",
+        files={},
+        expected_status: list = [200],
+        return_type: str = "json",
+    ):
+        return await self._request_async(
+            "POST",
+            api_path,
+            self._send_async("POST", api_path, self._req_post, data, files),
+            expected_status,
+            return_type,
+        )
+
+    async def _get(
+        self,
+        api_path: str,
+        expected_status: list = [200],
+        return_type: str = "json",
+    ):
+        if self.cache is not None:
+            response = self.cache.get(api_path)
+            if response is not None:
+                return self._handle_response(
+                    api_path, response, expected_status, return_type
+                )
+        return await self._request_async(
+            "GET",
+            api_path,
+            self._send_async("GET", api_path, self._req_get),
+            expected_status,
+            return_type,
+        )
+
+    async def _delete(
+        self,
+        api_path: str,
+        expected_status: list = [200],
+        return_type: str = "json",
+    ):
+        return await self._request_async(
+            "DELETE",
+            api_path,
+            self._send_async("DELETE", api_path, self._req_delete),
+            expected_status,
+            return_type,
+        )
+
+    async def _put(
+        self,
+        api_path: str,
+        data="",
+        expected_status: list = [200],
+        return_type: str = "json",
+    ):
+        return await self._request_async(
+            "PUT",
+            api_path,
+            self._send_async("PUT", api_path, self._req_put, data),
+            expected_status,
+            return_type,
+        )
+
+    async def _columnar(self, result):
+        return super()._columnar(await result)
+
+    async def _gather(self, calls, concurrency, combine):
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(call):
+            async with semaphore:
+                return await call()
+
+        results = await asyncio.gather(*(run(call) for call in calls))
+        return combine(list(results))
+
+    async def _paginate(self, fetch, cursor, advance, prefetch=False):
+        task = (
+            asyncio.ensure_future(fetch(cursor))
+            if cursor is not None
+            else None
+        )
+        try:
+            while task is not None:
+                page = await task
+                if request_failed(page):
+                    task = None
+                    raise PageRequestError(page)
+                items, cursor = advance(cursor, page)
+                if cursor is None:
+                    task = None
+                elif prefetch:
+                    task = asyncio.ensure_future(fetch(cursor))
+                else:
+                    # request next page once items are consumed
+                    task = None
+                for item in items:
+                    yield item
+                if task is None and cursor is not None:
+                    task = asyncio.ensure_future(fetch(cursor))
+        finally:
+            if task is not None:
+                task.cancel()
+
+
+def _build_response(
+    method: str,
+    url: str,
+    resp,
+    body: bytes,
+) -> requests.Response:
+    """Convert a completed aiohttp response into a
+    ``requests.Response`` so callers receive the same object type as
+    from the synchronous classes
+
+    :param method: HTTP method of the request
+    :type method: str
+    :param url: Full URL of the request
+    :type url: str
+    :param resp: aiohttp response object
+    :type resp: aiohttp.ClientResponse
+    :param body: Response body already read from ``resp``, None for a
+        streamed response keeping ``resp`` as ``raw``
+    :type body: bytes
+    :return: Requests Response object
+    :rtype: requests.Response
+    """
+    request = requests.PreparedRequest()
+    request.method = method
+    request.url = url
+
+    response = requests.Response()
+    response.status_code = resp.status
+    response.reason = resp.reason
+    response.url = url
+    response.request = request
+    response.headers = CaseInsensitiveDict(resp.headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    if body is None:
+        response.raw = resp
+        response._content = False
+        response._content_consumed = False
+    else:
+        response._content = body
+        response._content_consumed = True
+    cookies = RequestsCookieJar()
+    for name, morsel in resp.cookies.items():
+        cookies.set(name, morsel.value)
+    response.cookies = cookies
+    return response
+
+
+class AsyncOrchestrator(AsyncHttpCommon, Orchestrator):
+    """asyncio variant of :class:`Orchestrator`. Exposes the same
+    methods, each returning an awaitable, so many calls can run
+    concurrently in one event loop.
+
+    .. code:: python
+
+        import asyncio
+        from pyedgeconnect import AsyncOrchestrator
+
+        async def main():
+            async with AsyncOrchestrator(url, api_key=key) as orch:
+                ne_pks = ["3.NE", "4.NE", "5.NE"]
+                info = await asyncio.gather(
+                    *[orch.get_appliance_info(ne_pk) for ne_pk in ne_pks]
+                )
+
+        asyncio.run(main())
+
+    Helpers that block on requests in threads or while iterating,
+    such as :func:`Orchestrator.inventory`, are only supported by
+    :class:`Orchestrator` and raise ``AttributeError`` here.
+    """  # noqa RST304
+
+    # helpers of Orchestrator sending requests synchronously
+    _sync_only_methods = (
+        "alarm_feed",
+        "appliance_route_table",
+        "classification_sync",
+        "geo_locator",
+        "inventory",
+        "ip_intelligence_index",
+        "iter_appliance_flow_details",
+        "realtime_stats_scheduler",
+    )
+
+    def __init__(
+        self,
+        *args,
+        max_connections: int = 100,
+        **kwargs,
+    ):
+        """Setup AsyncOrchestrator instance, accepts all parameters of
+        :class:`Orchestrator` in addition to ``max_connections``
+
+        :param max_connections: Maximum number of simultaneous
+            connections to Orchestrator, defaults to 100
+        :type max_connections: int, optional
+        """  # noqa RST304
+        super().__init__(*args, **kwargs)
+        self._async_setup(max_connections)
+
+    async def login(
+        self,
+        user: str,
+        password: str,
+        mfacode: str = "",
+    ) -> bool:
+        """Asynchronous variant of :func:`Orchestrator.login`
+
+        :param user: Username to login
+        :type user: str
+        :param password: Password associated with the Username
+        :type password: str
+        :param mfacode: String numeric code as second factor for login,
+            provided by Orchestrator after calling :func:`~send_mfa`
+        :type mfacode: str, optional
+        :return: Returns True/False based on successful call.
+        :rtype: bool
+        """  # noqa RST304
+        if self.authMode not in self.supportedAuthModes:
+            print(
+                "{}: authentication mode not supported".format(self.authMode)
+            )
+            return False
+
+        response = await self._post(
+            "/authentication/login",
+            {
+                "user": user,
+                "password": password,
+                "token": mfacode,
+                "loginType": self.supportedAuthModes.index(self.authMode),
+            },
+            return_type="full_response",
+        )
+        return _orch_login._process_login_response(self, response)
+
+    async def for_each_appliance(
+        self,
+        method,
+        ne_pks,
+        concurrency: int = 10,
+        timeout: float = None,
+        **kwargs,
+    ):
+        """Asynchronous variant of
+        :func:`Orchestrator.for_each_appliance`, used as an async
+        generator yielding ``(ne_pk, result)`` pairs as calls complete
+
+        .. code:: python
+
+            async for ne_pk, info in orch.for_each_appliance(
+                "get_appliance_info", ne_pks, concurrency=200
+            ):
+                print(ne_pk, info)
+
+        :param method: Name of an Orchestrator method, or the bound
+            method itself, taking the appliance nePk as its first
+            argument, e.g. ``get_appliance_info``
+        :type method: str or Callable
+        :param ne_pks: Network Primary Keys (nePk) of appliances
+        :type ne_pks: Iterable[str]
+        :param concurrency: Maximum number of calls running at once,
+            defaults to 10
+        :type concurrency: int, optional
+        :param timeout: Seconds each call may run before it is
+            cancelled and yields ``None``, defaults to None
+        :type timeout: float, optional
+        :return: Async generator of tuples of appliance nePk and the
+            return value of ``method`` for that appliance
+        :rtype: AsyncIterator[tuple]
+        """  # noqa RST304
+        if isinstance(method, str):
+            method = getattr(self, method)
+        method_name = getattr(method, "__name__", str(method))
+        ne_pk_iter = iter(ne_pks)
+        pending = {}
+
+        def submit_next() -> bool:
+            for ne_pk in ne_pk_iter:
+                task = asyncio.ensure_future(
+                    asyncio.wait_for(method(ne_pk, **kwargs), timeout)
+                )
+                pending[task] = ne_pk
+                return True
+            return False
+
+        try:
+            for _ in range(concurrency):
+                if not submit_next():
+                    break
+
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    ne_pk = pending.pop(task)
+                    try:
+                        result = task.result()
+                    except asyncio.TimeoutError:
+                        self.logger.error(
+                            f"{method_name} for {ne_pk} | Call Timed Out "
+                            f"after {timeout} seconds"
+                        )
+                        result = None
+                    except Exception as ex:
+                        self.logger.error(
+                            "Exception {} when calling {} for {}. "
+                            "Traceback: {}".format(
+                                type(ex),
+                                method_name,
+                                ne_pk,
+                                "".join(traceback.format_tb(ex.__traceback__)),
+                            )
+                        )
+                        result = False
+                    submit_next()
+                    yield ne_pk, result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def get_appliance_flow_table(
+        self,
+        ne_id: str,
+        chunk_size: int = 65536,
+        **query,
+    ):
+        """Asynchronous variant of
+        :func:`Orchestrator.get_appliance_flow_table`, parsing flows as
+        chunks of the response arrive
+
+        :param ne_id: Appliance id in the format of integer.NE e.g.
+            ``3.NE``
+        :type ne_id: str
+        :param chunk_size: Number of bytes per chunk read from the
+            response, defaults to 65536
+        :type chunk_size: int, optional
+        :param query: Query parameters of
+            :func:`Orchestrator.get_appliance_flows`
+        :return: Returns False on failure, otherwise table of flows
+        :rtype: bool, FlowTable
+        """  # noqa RST304
+        download = await self._download(
+            _orch_flow._flows_path(ne_id, **query), chunk_size=chunk_size
+        )
+        if not download:
+            return download
+        parser = FlowListParser(FlowTable(ne_id))
+        try:
+            async for chunk in download:
+                parser.feed(chunk)
+            return parser.close()
+        except ValueError as ex:
+            download.response.release()
+            self.logger.error(f"Could not parse flows of {ne_id}: {ex}")
+            return False
+
+
+class AsyncEdgeConnect(AsyncHttpCommon, EdgeConnect):
+    """asyncio variant of :class:`EdgeConnect`. Exposes the same
+    methods, each returning an awaitable, so many calls can run
+    concurrently in one event loop.
+
+    Helpers that block on requests in threads or while iterating,
+    such as :func:`EdgeConnect.alarm_feed`, are only supported by
+    :class:`EdgeConnect` and raise ``AttributeError`` here.
+    """  # noqa RST304
+
+    # helpers of EdgeConnect sending requests synchronously
+    _sync_only_methods = (
+        "alarm_feed",
+        "appliance_realtime_stats_scheduler",
+        "appliance_route_table",
+    )
+
+    def __init__(
+        self,
+        *args,
+        max_connections: int = 100,
+        **kwargs,
+    ):
+        """Setup AsyncEdgeConnect instance, accepts all parameters of
+        :class:`EdgeConnect` in addition to ``max_connections``
+
+        :param max_connections: Maximum number of simultaneous
+            connections to the appliance, defaults to 100
+        :type max_connections: int, optional
+        """  # noqa RST304
+        super().__init__(*args, **kwargs)
+        self._async_setup(max_connections)
+
+    async def login(
+        self,
+        user: str,
+        password: str,
+    ) -> bool:
+        """Asynchronous variant of :func:`EdgeConnect.login`
+
+        :param user: Username to login to appliance
+        :type user: str
+        :param password: Password to login to appliance
+        :type password: str
+        :return: Returns True/False based on successful call
+        :rtype: bool
+        """  # noqa RST304
+        try:
+            response = await self._post(
+                "/login",
+                {"user": user, "password": password},
+                return_type="full_response",
+            )
+            return _ecos_login._process_login_response(self, response)
+
+        except Exception as ex:
+            self.logger.error("login error: {}".format(ex))
+            return False
+
+    async def iter_minute_stats(
+        self,
+        minute: int,
+        tables: list = None,
+        numeric_columns: dict = None,
+    ):
+        """Asynchronous variant of :func:`EdgeConnect.iter_minute_stats`.
+        The compressed archive is downloaded into memory, then parsed
+        as it is iterated.
+
+        :param minute: Minute boundary of statistics to retrieve in
+            epoch seconds
+        :type minute: int
+        :param tables: Names of stats tables to parse, defaults to None
+            to parse all tables
+        :type tables: list, optional
+        :param numeric_columns: Dictionary of stats table name to column
+            names or positions to convert to numbers in addition to the
+            known numeric columns, defaults to None
+        :type numeric_columns: dict, optional
+        :return: Returns False on failure, otherwise iterator of tuples
+            of stats table name and record dictionary
+        :rtype: bool, MinuteStatsRecords
+        """  # noqa RST304
+        archive = io.BytesIO()
+        result = await self._download(
+            f"/stats/minuteStats/st2-{minute}.tgz", destination=archive
+        )
+        if not result:
+            return result
+        archive.seek(0)
+        return MinuteStatsRecords(
+            iter_minute_stats_archive(archive, tables, numeric_columns)
+        )
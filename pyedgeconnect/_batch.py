@@ -0,0 +1,92 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# batch : Split id lists of batch endpoints into concurrent requests
+from __future__ import annotations
+
+import math
+from functools import partial
+from typing import Callable
+
+from ._results import request_failed
+
+# ids per request of batch endpoints, keeps request bodies small
+# enough for appliances and Orchestrator proxying them
+DEFAULT_BATCH_SIZE = 500
+# batch requests sent at once, all batches of a call usually go to the
+# same appliance
+DEFAULT_BATCH_CONCURRENCY = 4
+
+
+def split_batches(ids: list, batch_size: int) -> list:
+    """Split ids into the fewest batches of at most ``batch_size``,
+    with sizes differing by at most one so no request trails with a
+    small remainder. Duplicate ids are requested once.
+
+    :param ids: Ids to request
+    :type ids: list
+    :param batch_size: Maximum number of ids per batch
+    :type batch_size: int
+    :return: List of id lists
+    :rtype: list
+    """
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        return []
+    count = math.ceil(len(ids) / max(1, batch_size))
+    size, extra = divmod(len(ids), count)
+    batches = []
+    start = 0
+    for index in range(count):
+        end = start + size + (index < extra)
+        batches.append(ids[start:end])
+        start = end
+    return batches
+
+
+def merge_batches(results: list):
+    """Merge dictionaries keyed by id returned for each batch
+
+    :param results: Response of each batch request
+    :type results: list
+    :return: Merged dictionary, or the first failed result if any batch
+        request failed
+    :rtype: dict
+    """
+    merged = {}
+    for result in results:
+        if not isinstance(result, dict) or request_failed(result):
+            return result
+        merged.update(result)
+    return merged
+
+
+def request_batches(
+    self,
+    method: Callable,
+    ids: list,
+    batch_size: int = None,
+    concurrency: int = None,
+):
+    """Request ids in batches concurrently with ``method`` and merge
+    the results into one dictionary
+
+    :param method: Batch method taking a list of ids
+    :type method: Callable
+    :param ids: Ids to request
+    :type ids: list
+    :param batch_size: Maximum number of ids per request, defaults to
+        None for :data:`DEFAULT_BATCH_SIZE`
+    :type batch_size: int, optional
+    :param concurrency: Maximum number of requests at once, defaults to
+        None for :data:`DEFAULT_BATCH_CONCURRENCY`
+    :type concurrency: int, optional
+    :return: Merged dictionary keyed by id, or the first failed result
+    :rtype: dict
+    """
+    batches = split_batches(ids, batch_size or DEFAULT_BATCH_SIZE)
+    return self._gather(
+        [partial(method, batch) for batch in batches],
+        concurrency or DEFAULT_BATCH_CONCURRENCY,
+        merge_batches,
+    )
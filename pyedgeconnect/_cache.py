@@ -0,0 +1,268 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# cache : TTL and LRU bounded cache of GET responses
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Union
+
+
+def _resource_path(api_path: str) -> str:
+    """Strip query parameters from API path
+
+    :param api_path: API path, e.g. ``/zones?allVRFZones=true``
+    :type api_path: str
+    :return: API path without query parameters, e.g. ``/zones``
+    :rtype: str
+    """
+    return api_path.split("?", 1)[0].rstrip("/")
+
+
+def _paths_overlap(path_a: str, path_b: str) -> bool:
+    """Check if one resource path is the same as, or nested under, the
+    other, comparing whole path segments
+
+    :param path_a: Resource path without query parameters
+    :type path_a: str
+    :param path_b: Resource path without query parameters
+    :type path_b: str
+    :return: True if either path contains the other
+    :rtype: bool
+    """
+    segments_a = path_a.split("/")
+    segments_b = path_b.split("/")
+    shortest = min(len(segments_a), len(segments_b))
+    return segments_a[:shortest] == segments_b[:shortest]
+
+
+def _match_path(patterns, api_path: str) -> str:
+    """Find the pattern matching an API path, a path without query
+    parameters matches itself, a pattern ending in ``*`` matches every
+    path starting with it and the longest matching pattern wins
+
+    :param patterns: API paths or wildcard patterns, e.g.
+        ``["/appliance", "/template/templateGroups*"]``
+    :type patterns: Iterable[str]
+    :param api_path: API path of request
+    :type api_path: str
+    :return: Matching pattern, None if no pattern matches
+    :rtype: str
+    """
+    path = _resource_path(api_path)
+    if path in patterns:
+        return path
+    match = None
+    for pattern in patterns:
+        if pattern.endswith("*") and path.startswith(pattern[:-1]):
+            if match is None or len(pattern) > len(match):
+                match = pattern
+    return match
+
+
+def _copy_response(response):
+    """Copy a response stored in or returned from the cache so callers
+    can modify headers, cookies or attributes without changing the
+    cached entry.
+    The body is immutable bytes and shared.
+
+    :param response: Cached response
+    :type response: requests.Response
+    :return: Copy of response
+    :rtype: requests.Response
+    """
+    copied = copy.copy(response)
+    copied.headers = response.headers.copy()
+    copied.cookies = response.cookies.copy()
+    copied.history = list(response.history)
+    return copied
+
+
+class ResponseCache:
+    """In-memory cache of successful GET responses keyed on API path,
+    with a time to live per entry and least recently used eviction once
+    ``maxsize`` entries are stored. Safe for use from multiple threads.
+
+    Every invalidation advances :attr:`generation`. A GET reads the
+    generation before sending and passes it to :meth:`put`, which skips
+    storing the response if an overlapping path was invalidated while
+    the GET was in flight, so a write racing a read cannot leave the
+    pre-write response cached.
+    """
+
+    def __init__(
+        self,
+        ttl: Union[float, dict] = 60,
+        maxsize: int = 1024,
+    ):
+        """Setup response cache
+
+        :param ttl: Seconds to keep responses for every GET, or
+            dictionary of API path to seconds to only cache matching
+            endpoints. Paths match without query parameters, a path
+            ending in ``*`` matches every path starting with it, e.g.
+            ``{"/appliance": 300, "/template/templateGroups*": 600}``,
+            defaults to 60
+        :type ttl: float or dict, optional
+        :param maxsize: Maximum number of responses to keep, least
+            recently used responses are evicted first, defaults to 1024
+        :type maxsize: int, optional
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.generation = 0
+        # (generation, resource path) of recent invalidations
+        self._invalidated = deque(maxlen=1024)
+
+    def ttl_for(self, api_path: str) -> float:
+        """Lookup time to live for an API path
+
+        :param api_path: API path of GET request
+        :type api_path: str
+        :return: Seconds to cache response, None if path is not cached
+        :rtype: float
+        """
+        if not isinstance(self.ttl, dict):
+            return self.ttl
+        pattern = _match_path(self.ttl, api_path)
+        return self.ttl[pattern] if pattern is not None else None
+
+    def get(self, api_path: str):
+        """Return cached response for an API path if not expired
+
+        :param api_path: API path of GET request
+        :type api_path: str
+        :return: Copy of cached response, None on cache miss or if path
+            is not cached
+        :rtype: requests.Response
+        """
+        if not self.ttl_for(api_path):
+            return None
+        with self._lock:
+            entry = self._entries.get(api_path)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(api_path)
+                self.hits += 1
+                response = entry[1]
+            else:
+                if entry is not None:
+                    del self._entries[api_path]
+                self.misses += 1
+                return None
+        return _copy_response(response)
+
+    def _invalidated_since(self, generation: int, path: str) -> bool:
+        """Check for invalidations overlapping a path after a
+        generation, must be called holding the lock
+
+        :param generation: Generation read before the request was sent
+        :type generation: int
+        :param path: Resource path without query parameters
+        :type path: str
+        :return: True if an overlapping path was invalidated, or too
+            many invalidations happened to tell
+        :rtype: bool
+        """
+        if generation == self.generation:
+            return False
+        if (
+            len(self._invalidated) == self._invalidated.maxlen
+            and self._invalidated[0][0] > generation + 1
+        ):
+            return True
+        return any(
+            _paths_overlap(path, invalidated)
+            for invalidated_generation, invalidated in self._invalidated
+            if invalidated_generation > generation
+        )
+
+    def put(self, api_path: str, response, generation: int = None):
+        """Store response for an API path if the path is cached
+
+        :param api_path: API path of GET request
+        :type api_path: str
+        :param response: Response to store
+        :type response: requests.Response
+        :param generation: Value of :attr:`generation` read before the
+            request was sent, the response is not stored if an
+            overlapping path was invalidated since. Defaults to None to
+            always store
+        :type generation: int, optional
+        """
+        ttl = self.ttl_for(api_path)
+        if not ttl:
+            return
+        # the caller keeps the original, store a copy
+        response = _copy_response(response)
+        with self._lock:
+            if generation is not None and self._invalidated_since(
+                generation, _resource_path(api_path)
+            ):
+                return
+            self._entries[api_path] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(api_path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, api_path: str) -> int:
+        """Remove cached responses for paths overlapping a modified
+        resource, e.g. a POST to ``/appliance/3.NE`` removes
+        ``/appliance`` and ``/appliance/3.NE/...`` entries
+
+        :param api_path: API path of POST, PUT or DELETE request
+        :type api_path: str
+        :return: Number of entries removed
+        :rtype: int
+        """
+        path = _resource_path(api_path)
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if _paths_overlap(path, _resource_path(key))
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            self.generation += 1
+            self._invalidated.append((self.generation, path))
+        return len(stale)
+
+    def clear(self):
+        """Remove all cached responses"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Report cache usage counters
+
+        :return: Dictionary of cache counters \n
+            * keyword **hits** (`int`): Lookups answered from cache
+            * keyword **misses** (`int`): Lookups sent to the server
+            * keyword **size** (`int`): Responses currently cached
+            * keyword **maxsize** (`int`): Maximum responses cached
+            * keyword **evictions** (`int`): Responses removed to stay
+              within ``maxsize``
+            * keyword **invalidations** (`int`): Responses removed by
+              POST, PUT or DELETE requests
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
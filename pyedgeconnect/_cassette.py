@@ -0,0 +1,427 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# cassette : Record and replay HTTP exchanges with injected latency
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+import io
+import json
+import random
+import threading
+import time
+from http.client import HTTPMessage
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.cookies import extract_cookies_to_jar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.response import HTTPResponse
+
+# response headers describing the stored body rather than the original
+# transfer, recreated on replay
+_DROP_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+# response headers whose values are replaced when redacting, cookies
+# keep their names and attributes
+_SECRET_HEADERS = (
+    "authorization",
+    "cookie",
+    "proxy-authorization",
+    "x-auth-token",
+    "x-xsrf-token",
+)
+# request body fields marking credentials, such as login requests,
+# whose body digests are not written when redacting
+_CREDENTIAL_FIELDS = (b"password", b"passwd", b"secret")
+REDACTED = "REDACTED"
+
+
+def _redact_cookie(set_cookie: str) -> str:
+    """Replace the value of a ``Set-Cookie`` header, keeping the cookie
+    name and attributes such as ``Path``
+    """
+    pair, _, attributes = set_cookie.partition(";")
+    name = pair.partition("=")[0]
+    return f"{name}={REDACTED}" + (";" + attributes if attributes else "")
+
+
+def _set_cookies(response: requests.Response) -> list:
+    """Every ``Set-Cookie`` header of a response, which requests folds
+    into one comma separated value in ``response.headers``
+    """
+    original = getattr(response.raw, "_original_response", None)
+    message = getattr(original, "msg", None)
+    if message is not None:
+        return message.get_all("Set-Cookie") or []
+    value = response.headers.get("Set-Cookie")
+    return [value] if value else []
+
+
+class _ReplayedMessage:
+    """Stand-in for the ``http.client`` response of a replayed
+    exchange, whose headers requests reads cookies from
+    """
+
+    def __init__(self, msg: HTTPMessage):
+        self.msg = msg
+
+    def isclosed(self) -> bool:
+        return True
+
+    def close(self):
+        pass
+
+
+def _host_only(set_cookie: str) -> str:
+    """Drop the ``Domain`` attribute of a recorded cookie, so it is
+    accepted for whichever host a cassette is replayed against
+    """
+    pair, *attributes = set_cookie.split(";")
+    attributes = [
+        attribute
+        for attribute in attributes
+        if attribute.strip().partition("=")[0].lower() != "domain"
+    ]
+    return ";".join([pair] + attributes)
+
+
+def _request_key(
+    request: requests.PreparedRequest,
+    redact: bool = False,
+) -> tuple:
+    """Key matching a request to recorded exchanges, independent of the
+    host so a cassette recorded against one server replays for any
+
+    :param request: Prepared request
+    :type request: requests.PreparedRequest
+    :param redact: Leave out the digest of bodies with credentials,
+        defaults to False
+    :type redact: bool, optional
+    :return: Tuple of method, path with query, and digest of the body
+    :rtype: tuple
+    """
+    url = urlsplit(request.url)
+    path = url.path + ("?" + url.query if url.query else "")
+    body = request.body
+    if body is None:
+        digest = ""
+    else:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        elif not isinstance(body, bytes):
+            # streamed or multipart file bodies are not matched on
+            body = b""
+        if redact and any(
+            field in body.lower() for field in _CREDENTIAL_FIELDS
+        ):
+            # matched on method and path only
+            body = b""
+        digest = hashlib.sha1(body).hexdigest()[:16] if body else ""
+    return request.method, path, digest
+
+
+class CassetteAdapter(BaseAdapter):
+    """Requests transport adapter that records request and response
+    pairs to a cassette file, or replays them without network access.
+
+    A cassette is a gzip compressed file of one JSON exchange per line.
+    Exchanges are matched on method, path with query string and request
+    body, falling back to method and path when no exchange has the same
+    body. Repeated requests replay the recorded responses of that
+    request in order, starting over once all were replayed, so a short
+    recording can drive a long load test.
+
+    Replays can wait the recorded response time or a fixed latency, and
+    fail a share of requests, with a seeded random generator so runs
+    are repeatable.
+
+    Recorded cookies are set on replayed responses and the session, so
+    a replayed login succeeds. By default cookie values, credential
+    headers, and the body digests of requests with credentials are
+    not written to the cassette.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        transport: BaseAdapter = None,
+        latency=None,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int = None,
+        redact: bool = True,
+    ):
+        """Setup cassette adapter
+
+        :param path: File path of the cassette
+        :type path: str
+        :param mode: ``record`` to send requests through ``transport``
+            and write exchanges to a new cassette, ``replay`` to answer
+            requests from the cassette, defaults to "replay"
+        :type mode: str, optional
+        :param transport: Adapter sending requests while recording
+        :type transport: requests.adapters.BaseAdapter, optional
+        :param latency: ``recorded`` to wait the recorded response time
+            of each exchange, or seconds to wait for every replayed
+            response, defaults to None for no delay
+        :type latency: str or float, optional
+        :param error_rate: Share of replayed requests to fail, from 0.0
+            to 1.0, defaults to 0.0
+        :type error_rate: float, optional
+        :param error_status: HTTP status of failed requests, or None to
+            raise ``requests.exceptions.ConnectionError`` instead,
+            defaults to 503
+        :type error_status: int, optional
+        :param seed: Seed of the random generator failing requests,
+            defaults to None
+        :type seed: int, optional
+        :param redact: Replace cookie values and credential headers,
+            and leave out body digests of requests with credentials,
+            when recording, defaults to True
+        :type redact: bool, optional
+        :raises ValueError: If ``mode`` is unknown, or if ``record``
+            mode has no ``transport``
+        """
+        super().__init__()
+        if mode not in ("record", "replay"):
+            raise ValueError(
+                f"Unknown cassette mode '{mode}', expected 'record' or "
+                "'replay'"
+            )
+        if mode == "record" and transport is None:
+            raise ValueError("Recording a cassette requires a transport")
+        self.path = path
+        self.mode = mode
+        self.transport = transport
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.redact = redact
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.recorded = 0
+        self.replayed = 0
+        self.missed = 0
+        self.injected_errors = 0
+        self._file = None
+        self._exchanges = {}
+        self._positions = {}
+        if mode == "record":
+            self._file = gzip.open(path, "wt", encoding="utf-8")
+        else:
+            self._load()
+
+    def _load(self):
+        """Read exchanges of the cassette, grouped by request key"""
+        with gzip.open(self.path, "rt", encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                exchange = json.loads(line)
+                key = (exchange["method"], exchange["path"])
+                self._exchanges.setdefault(
+                    key + (exchange.get("body_sha1", ""),), []
+                ).append(exchange)
+                self._exchanges.setdefault(key, []).append(exchange)
+
+    def send(self, request, stream=False, **kwargs):
+        if self.mode == "record":
+            return self._record(request, stream, **kwargs)
+        return self._replay(request)
+
+    def _record(self, request, stream, **kwargs):
+        """Send request through the transport and write the exchange"""
+        response = self.transport.send(request, stream=stream, **kwargs)
+        # reading the body ends streaming, recorded downloads are
+        # replayed from memory
+        content = response.content
+        method, path, digest = _request_key(request, self.redact)
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _DROP_HEADERS
+            and name.lower() != "set-cookie"
+        }
+        set_cookies = _set_cookies(response)
+        if self.redact:
+            headers = {
+                name: REDACTED if name.lower() in _SECRET_HEADERS else value
+                for name, value in headers.items()
+            }
+            set_cookies = [_redact_cookie(value) for value in set_cookies]
+        exchange = {
+            "method": method,
+            "path": path,
+            "body_sha1": digest,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": headers,
+            "set_cookies": set_cookies,
+            "elapsed": round(response.elapsed.total_seconds(), 6),
+        }
+        try:
+            exchange["text"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            exchange["base64"] = base64.b64encode(content).decode("ascii")
+        line = json.dumps(exchange, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self.recorded += 1
+        if stream:
+            # the body was read, stream it again from memory
+            return self._build_response(
+                request,
+                response.status_code,
+                response.reason,
+                exchange["headers"],
+                content,
+                _set_cookies(response),
+            )
+        return response
+
+    def _replay(self, request):
+        """Answer request from the cassette"""
+        method, path, digest = _request_key(request)
+        with self._lock:
+            exchanges = self._exchanges.get((method, path, digest))
+            key = (method, path, digest)
+            if exchanges is None:
+                exchanges = self._exchanges.get((method, path))
+                key = (method, path)
+            if exchanges is None:
+                self.missed += 1
+                exchange = None
+            else:
+                position = self._positions.get(key, 0)
+                self._positions[key] = position + 1
+                exchange = exchanges[position % len(exchanges)]
+                self.replayed += 1
+            inject_error = (
+                self.error_rate > 0 and self._random.random() < self.error_rate
+            )
+            if inject_error:
+                self.injected_errors += 1
+
+        if self.latency == "recorded":
+            delay = exchange["elapsed"] if exchange is not None else 0
+        else:
+            delay = self.latency or 0
+        if delay > 0:
+            time.sleep(delay)
+
+        if inject_error:
+            if self.error_status is None:
+                raise requests.exceptions.ConnectionError(
+                    "Injected connection error", request=request
+                )
+            return self._build_response(
+                request,
+                self.error_status,
+                "Injected Error",
+                {"Content-Type": "application/json"},
+                b'{"error": "Injected error"}',
+            )
+        if exchange is None:
+            return self._build_response(
+                request,
+                404,
+                "Not Recorded",
+                {"Content-Type": "application/json"},
+                json.dumps(
+                    {"error": f"No recorded response for {method} {path}"}
+                ).encode("utf-8"),
+            )
+        if "base64" in exchange:
+            content = base64.b64decode(exchange["base64"])
+        else:
+            content = exchange["text"].encode("utf-8")
+        headers = dict(exchange["headers"])
+        # cassettes without set_cookies kept the folded header
+        set_cookies = exchange.get("set_cookies")
+        if set_cookies is None:
+            set_cookie = headers.pop("Set-Cookie", None)
+            set_cookies = [set_cookie] if set_cookie else []
+        return self._build_response(
+            request,
+            exchange["status"],
+            exchange.get("reason"),
+            headers,
+            content,
+            [_host_only(value) for value in set_cookies],
+        )
+
+    def _build_response(
+        self,
+        request: requests.PreparedRequest,
+        status: int,
+        reason: str,
+        headers: dict,
+        content: bytes,
+        set_cookies: list = (),
+    ) -> requests.Response:
+        """Build a response streaming ``content`` like one received from
+        the network, so downloads can also read ``response.raw``, with
+        ``set_cookies`` in ``response.cookies``
+        """
+        headers = CaseInsensitiveDict(headers)
+        headers["Content-Length"] = str(len(content))
+        message = HTTPMessage()
+        for name, value in headers.items():
+            message[name] = value
+        for value in set_cookies:
+            message["Set-Cookie"] = value
+        if set_cookies:
+            headers["Set-Cookie"] = ", ".join(set_cookies)
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(headers)
+        response.raw = HTTPResponse(
+            body=io.BytesIO(content),
+            headers=dict(headers),
+            status=status,
+            reason=reason,
+            preload_content=False,
+            original_response=_ReplayedMessage(message),
+        )
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        # as HTTPAdapter.build_response, the session adds the cookies
+        # to its own jar from response.raw
+        extract_cookies_to_jar(response.cookies, request, response.raw)
+        return response
+
+    def stats(self) -> dict:
+        """Report cassette usage
+
+        :return: Dictionary of counters \n
+            * keyword **recorded** (`int`): Exchanges written
+            * keyword **replayed** (`int`): Requests answered from the
+              cassette
+            * keyword **missed** (`int`): Requests without a recorded
+              exchange, answered with HTTP 404
+            * keyword **injected_errors** (`int`): Requests failed on
+              purpose by ``error_rate``
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "recorded": self.recorded,
+                "replayed": self.replayed,
+                "missed": self.missed,
+                "injected_errors": self.injected_errors,
+            }
+
+    def close(self):
+        """Finish writing the cassette"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,220 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# classification : Hash-gated local copies of Cloud Portal datasets
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import threading
+import time
+
+from ._results import request_failed
+
+# dataset name -> (method returning dataset, method returning its hash)
+CLASSIFICATION_DATASETS = {
+    "app_groups": ("get_app_groups", "get_app_groups_hash"),
+    "compound": (
+        "get_compound_classification",
+        "get_compound_classification_hash",
+    ),
+    "dns": ("get_dns_classification", "get_dns_classification_hash"),
+    "flow": ("get_flow_classification", "get_flow_classification_hash"),
+    "port_protocol": (
+        "get_port_protocol_classification",
+        "get_port_protocol_classification_hash",
+    ),
+    "saas": ("get_saas_classification", "get_saas_classification_hash"),
+    "traffic_behavior": (
+        "get_traffic_behavior",
+        "get_traffic_behavior_hash",
+    ),
+}
+
+_INDEX_FILE = "index.json"
+
+
+def _write_atomic(path: str, data: bytes):
+    """Write file so readers never see a partially written file"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, path)
+
+
+class ClassificationSync:
+    """Local copies of Cloud Portal classification datasets, each
+    stored with the hash Cloud Portal reports for it.
+
+    :meth:`sync` requests the hash of each dataset, a few bytes, and
+    downloads a dataset only when its hash differs from the local copy.
+    :meth:`get` reads datasets from the local copy, loading each from
+    disk at most once. Datasets are stored as gzip compressed JSON
+    files next to an ``index.json`` of their hashes.
+    """
+
+    def __init__(self, orch, directory: str, datasets: list = None):
+        """Setup classification sync
+
+        :param orch: Orchestrator instance
+        :type orch: Orchestrator
+        :param directory: Directory of the local copies, created if it
+            does not exist
+        :type directory: str
+        :param datasets: Names of datasets to sync, keys of
+            :data:`CLASSIFICATION_DATASETS`, defaults to None for all
+        :type datasets: list, optional
+        :raises ValueError: If a dataset name is unknown
+        """
+        datasets = list(datasets or CLASSIFICATION_DATASETS)
+        unknown = set(datasets) - set(CLASSIFICATION_DATASETS)
+        if unknown:
+            raise ValueError(
+                "Unknown classification datasets {}, expected any of {}".format(
+                    sorted(unknown), sorted(CLASSIFICATION_DATASETS)
+                )
+            )
+        self.orch = orch
+        self.directory = directory
+        self.datasets = datasets
+        self._lock = threading.Lock()
+        self._loaded = {}
+        os.makedirs(directory, exist_ok=True)
+        self.index = self._read_index()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.json.gz")
+
+    def _read_index(self) -> dict:
+        """Hashes of local copies, empty if no valid index exists"""
+        try:
+            with open(
+                os.path.join(self.directory, _INDEX_FILE), encoding="utf-8"
+            ) as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return {
+            name: entry
+            for name, entry in index.items()
+            if isinstance(entry, dict) and os.path.exists(self._path(name))
+        }
+
+    def _write_index(self):
+        _write_atomic(
+            os.path.join(self.directory, _INDEX_FILE),
+            json.dumps(self.index, indent=2, sort_keys=True).encode("utf-8"),
+        )
+
+    def sync(
+        self,
+        datasets: list = None,
+        force: bool = False,
+        concurrency: int = 4,
+    ) -> dict:
+        """Download datasets whose Cloud Portal hash changed
+
+        :param datasets: Names of datasets to sync, defaults to None for
+            the datasets of this instance
+        :type datasets: list, optional
+        :param force: Download datasets even if hashes match, defaults
+            to False
+        :type force: bool, optional
+        :param concurrency: Maximum number of requests at once, defaults
+            to 4
+        :type concurrency: int, optional
+        :return: Dictionary of dataset name to ``unchanged``,
+            ``updated`` or ``failed``, a failed dataset keeps its
+            previous local copy
+        :rtype: dict
+        """
+        names = list(datasets or self.datasets)
+        orch = self.orch
+        hashes = orch._gather(
+            [
+                getattr(orch, CLASSIFICATION_DATASETS[name][1])
+                for name in names
+            ],
+            concurrency,
+            list,
+        )
+        result = dict.fromkeys(names)
+        stale = []
+        for name, response in zip(names, hashes):
+            if request_failed(response) or not isinstance(response, dict):
+                orch.logger.warning(
+                    f"Could not get hash of {name} classification"
+                )
+                result[name] = "failed"
+                continue
+            hash_value = response.get("hashVal")
+            local = self.index.get(name, {})
+            if not force and hash_value and local.get("hash") == hash_value:
+                result[name] = "unchanged"
+            else:
+                stale.append((name, hash_value))
+
+        downloads = orch._gather(
+            [
+                getattr(orch, CLASSIFICATION_DATASETS[name][0])
+                for name, _ in stale
+            ],
+            concurrency,
+            list,
+        )
+        for (name, hash_value), data in zip(stale, downloads):
+            if request_failed(data):
+                orch.logger.warning(
+                    f"Could not download {name} classification"
+                )
+                result[name] = "failed"
+                continue
+            # the hash was requested before the dataset, a change in
+            # between is downloaded again on the next sync
+            _write_atomic(
+                self._path(name),
+                gzip.compress(orch.json_codec.dumps(data), compresslevel=1),
+            )
+            with self._lock:
+                self._loaded[name] = data
+                self.index[name] = {"hash": hash_value, "updated": time.time()}
+            result[name] = "updated"
+        if stale:
+            self._write_index()
+        return result
+
+    def get(self, name: str):
+        """Dataset from the local copy, without requests
+
+        :param name: Name of dataset, e.g. ``dns``
+        :type name: str
+        :return: Dataset as returned by its ``get_`` method, None if
+            there is no local copy
+        """
+        with self._lock:
+            if name in self._loaded:
+                return self._loaded[name]
+        if name not in self.index:
+            return None
+        try:
+            with open(self._path(name), "rb") as file:
+                data = self.orch.json_codec.loads(gzip.decompress(file.read()))
+        except (OSError, ValueError):
+            self.orch.logger.warning(
+                f"Could not read local copy of {name} classification"
+            )
+            return None
+        with self._lock:
+            self._loaded[name] = data
+        return data
+
+    def hash(self, name: str) -> str:
+        """Cloud Portal hash of the local copy of a dataset
+
+        :param name: Name of dataset, e.g. ``dns``
+        :type name: str
+        :return: Hash value, None if there is no local copy
+        :rtype: str
+        """
+        return self.index.get(name, {}).get("hash")
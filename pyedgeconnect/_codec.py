@@ -0,0 +1,99 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# codec : JSON encoding of request bodies and decoding of responses
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class JsonCodec:
+    """JSON codec using the standard library ``json`` module. Custom
+    codecs implement the same ``dumps`` and ``loads`` methods and can
+    be passed as ``json_codec`` to Orchestrator or EdgeConnect.
+    """
+
+    name = "json"
+
+    def dumps(self, obj) -> bytes:
+        """Serialize object to UTF-8 encoded JSON
+
+        :param obj: Object to serialize
+        :return: JSON document
+        :rtype: bytes
+        """
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data):
+        """Deserialize JSON document
+
+        :param data: JSON document
+        :type data: bytes or str
+        :return: Deserialized object
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using ``orjson``, which encodes and decodes bytes
+    directly and several times faster than the standard library. Falls
+    back to ``json`` for values ``orjson`` cannot encode, such as
+    integers over 64 bits, and documents it cannot decode, such as
+    ``NaN`` literals. Integers over 64 bits in responses are decoded as
+    ``float``.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        """Setup orjson codec
+
+        :raises ImportError: If ``orjson`` is not installed
+        """
+        if orjson is None:
+            raise ImportError(
+                "OrjsonCodec requires orjson, install with "
+                "'pip install pyedgeconnect[orjson]'"
+            )
+
+    def dumps(self, obj) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return super().dumps(obj)
+
+    def loads(self, data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)
+
+
+def get_codec(codec=None) -> JsonCodec:
+    """Select JSON codec
+
+    :param codec: ``"orjson"``, ``"json"``, an object with ``dumps``
+        and ``loads`` methods, or None to use ``orjson`` if installed
+        and ``json`` otherwise, defaults to None
+    :type codec: str or object, optional
+    :raises ValueError: If ``codec`` is an unknown name
+    :return: JSON codec
+    :rtype: JsonCodec
+    """
+    if codec is None:
+        return OrjsonCodec() if orjson is not None else JsonCodec()
+    if codec == "orjson":
+        return OrjsonCodec()
+    if codec == "json":
+        return JsonCodec()
+    if hasattr(codec, "dumps") and hasattr(codec, "loads"):
+        return codec
+    raise ValueError(
+        "Unknown json_codec '{}', expected 'orjson', 'json' or an object "
+        "with dumps and loads methods".format(codec)
+    )
@@ -0,0 +1,110 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# columnar : Decode COLUMN_DEF and DATA responses into NumPy arrays
+from __future__ import annotations
+
+
+def _import_numpy():
+    """Import NumPy on first use so it stays an optional dependency
+
+    :raises ImportError: If ``numpy`` is not installed
+    :return: The ``numpy`` module
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "columnar decoding requires numpy, install with "
+            "'pip install pyedgeconnect[numpy]'"
+        ) from None
+    return numpy
+
+
+def _column_array(np, values):
+    """Convert the values of one column to an array, numbers with
+    missing values become ``float`` with ``nan`` and anything else is
+    kept as an ``object`` array
+
+    :param np: The ``numpy`` module
+    :param values: Values of a single column
+    :type values: Sequence
+    :return: One dimensional array of column values
+    :rtype: numpy.ndarray
+    """
+    array = np.array(values)
+    if array.dtype == object:
+        try:
+            array = np.array(values, dtype=float)
+        except (TypeError, ValueError):
+            pass
+    return array
+
+
+def _rows_to_columns(np, column_def: list, rows: list) -> dict:
+    """Transpose data rows into one array per column
+
+    :param np: The ``numpy`` module
+    :param column_def: Column names, in the order of each row
+    :type column_def: list
+    :param rows: Data rows, one value per column in each row
+    :type rows: list
+    :return: Dictionary of column name to array of column values
+    :rtype: dict
+    """
+    if not rows:
+        return {name: np.array([]) for name in column_def}
+    matrix = np.array(rows)
+    if matrix.ndim == 2 and matrix.dtype.kind in "biuf":
+        # all numeric, columns are views into one contiguous block
+        matrix = np.asfortranarray(matrix)
+        return {name: matrix[:, i] for i, name in enumerate(column_def)}
+    return {
+        name: _column_array(np, values)
+        for name, values in zip(column_def, zip(*rows))
+    }
+
+
+def decode_columnar(response):
+    """Decode a timeseries response of ``COLUMN_DEF`` and ``DATA`` into
+    one NumPy array per column. ``DATA`` nested in dictionaries, e.g.
+    keyed by appliance, keeps the same keys with a dictionary of
+    column arrays in place of each list of rows.
+
+    .. code:: python
+
+        {
+            "COLUMN_DEF": ["TIMESTAMP", "LAN_TX_BYTES"],
+            "DATA": {"3.NE": [[1650000000, 10], [1650000060, 12]]},
+        }
+        # decodes to
+        {
+            "3.NE": {
+                "TIMESTAMP": array([1650000000, 1650000060]),
+                "LAN_TX_BYTES": array([10, 12]),
+            }
+        }
+
+    :param response: Response of a timeseries stats method
+    :type response: dict
+    :raises ImportError: If ``numpy`` is not installed
+    :return: Dictionary of column arrays, nested as ``DATA`` was.
+        Responses without ``COLUMN_DEF`` and ``DATA``, such as failed
+        requests, are returned unchanged
+    :rtype: dict
+    """
+    if (
+        not isinstance(response, dict)
+        or "COLUMN_DEF" not in response
+        or "DATA" not in response
+    ):
+        return response
+    np = _import_numpy()
+    column_def = response["COLUMN_DEF"]
+
+    def decode(data):
+        if isinstance(data, dict):
+            return {key: decode(value) for key, value in data.items()}
+        return _rows_to_columns(np, column_def, data)
+
+    return decode(response["DATA"])
@@ -0,0 +1,121 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# download : Stream response bodies without buffering them in memory
+from __future__ import annotations
+
+import time
+
+
+class Download:
+    """Streamed response body, iterated as chunks of bytes or written
+    to a destination with :meth:`save`. Only one chunk is held in
+    memory at a time. Bytes transferred and throughput are reported by
+    :meth:`stats` while and after the body is consumed.
+    """
+
+    def __init__(
+        self,
+        response,
+        chunk_size: int,
+    ):
+        """Setup download of a streamed response
+
+        :param response: Response sent with ``stream=True``
+        :type response: requests.Response
+        :param chunk_size: Number of bytes per chunk
+        :type chunk_size: int
+        """
+        self.response = response
+        self.chunk_size = chunk_size
+        self.bytes = 0
+        self.start_time = None
+        self.end_time = None
+
+    def __iter__(self):
+        self.start_time = time.monotonic()
+        try:
+            for chunk in self.response.iter_content(self.chunk_size):
+                self.bytes += len(chunk)
+                yield chunk
+        finally:
+            self.end_time = time.monotonic()
+            self.response.close()
+
+    def save(self, destination) -> dict:
+        """Write the response body to a file path or file object
+
+        :param destination: File path, or binary file object with a
+            ``write`` method
+        :type destination: str, os.PathLike, or file object
+        :return: Transfer statistics, see :meth:`stats`
+        :rtype: dict
+        """
+        if hasattr(destination, "write"):
+            for chunk in self:
+                destination.write(chunk)
+        else:
+            with open(destination, "wb") as file:
+                for chunk in self:
+                    file.write(chunk)
+        return self.stats()
+
+    def stats(self) -> dict:
+        """Report transfer statistics of the download so far
+
+        :return: Dictionary of transfer statistics \n
+            * keyword **bytes** (`int`): Bytes of body received
+            * keyword **seconds** (`float`): Seconds spent receiving
+            * keyword **bytes_per_second** (`float`): Throughput
+        :rtype: dict
+        """
+        if self.start_time is None:
+            seconds = 0.0
+        else:
+            seconds = (self.end_time or time.monotonic()) - self.start_time
+        return {
+            "bytes": self.bytes,
+            "seconds": round(seconds, 6),
+            "bytes_per_second": (
+                round(self.bytes / seconds, 1) if seconds > 0 else 0.0
+            ),
+        }
+
+
+class AsyncDownload(Download):
+    """Streamed ``aiohttp`` response body for the asyncio classes,
+    iterated with ``async for`` or written with ``await save()``
+    """
+
+    def __iter__(self):
+        raise TypeError("use 'async for' to iterate an AsyncDownload")
+
+    async def __aiter__(self):
+        self.start_time = time.monotonic()
+        try:
+            async for chunk in self.response.content.iter_chunked(
+                self.chunk_size
+            ):
+                self.bytes += len(chunk)
+                yield chunk
+        finally:
+            self.end_time = time.monotonic()
+            self.response.release()
+
+    async def save(self, destination) -> dict:
+        """Write the response body to a file path or file object
+
+        :param destination: File path, or binary file object with a
+            ``write`` method
+        :type destination: str, os.PathLike, or file object
+        :return: Transfer statistics, see :meth:`Download.stats`
+        :rtype: dict
+        """
+        if hasattr(destination, "write"):
+            async for chunk in self:
+                destination.write(chunk)
+        else:
+            with open(destination, "wb") as file:
+                async for chunk in self:
+                    file.write(chunk)
+        return self.stats()
@@ -0,0 +1,186 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# geo : Geo-location lookups cached by returned address range
+from __future__ import annotations
+
+import threading
+from bisect import bisect_right, insort
+from collections import OrderedDict
+
+from ._batch import request_batches
+from ._ip_intelligence import ip_to_int
+from ._results import request_failed
+
+
+class GeoLocator:
+    """Geo-locate IPv4 addresses through Cloud Portal, caching each
+    result by the address range Cloud Portal returns with it.
+
+    Addresses inside a range already returned are answered from the
+    cache without a request. Remaining addresses are de-duplicated and
+    requested in concurrent batches of ``geo_locate_multiple_ips``.
+    Once ``max_ranges`` ranges are cached the least recently added
+    ranges are dropped.
+    """
+
+    def __init__(
+        self,
+        orch,
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        max_ranges: int = 100000,
+    ):
+        """Setup geo-locator
+
+        :param orch: Orchestrator instance
+        :type orch: Orchestrator
+        :param batch_size: Maximum number of addresses per request,
+            defaults to 1000
+        :type batch_size: int, optional
+        :param concurrency: Maximum number of requests at once, defaults
+            to 4
+        :type concurrency: int, optional
+        :param max_ranges: Maximum number of cached ranges, defaults to
+            100000
+        :type max_ranges: int, optional
+        :raises TypeError: If ``orch`` is an asyncio client
+        """
+        orch._require_sync("GeoLocator")
+        self.orch = orch
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_ranges = max_ranges
+        self._lock = threading.Lock()
+        # sorted range starts for bisect, and start -> (end, location)
+        self._starts = []
+        self._ranges = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.requests = 0
+
+    def _cached(self, ip: int) -> dict:
+        """Cached location of a range containing ``ip``, or None"""
+        index = bisect_right(self._starts, ip) - 1
+        if index < 0:
+            return None
+        end, location = self._ranges[self._starts[index]]
+        return location if ip <= end else None
+
+    def _add(self, location: dict):
+        """Cache location by its range, dropping the oldest ranges once
+        ``max_ranges`` are cached
+        """
+        start = location.get("rangeIpStart")
+        end = location.get("rangeIpEnd")
+        if not isinstance(start, int) or not isinstance(end, int):
+            return
+        if start not in self._ranges:
+            insort(self._starts, start)
+        self._ranges[start] = (end, location)
+        while len(self._ranges) > self.max_ranges:
+            oldest, _ = self._ranges.popitem(last=False)
+            del self._starts[bisect_right(self._starts, oldest) - 1]
+
+    def locate(self, ips) -> dict:
+        """Geo-location of each address
+
+        :param ips: IPv4 addresses as strings, e.g. ``10.1.1.1``, or
+            32-bit integers
+        :type ips: Iterable
+        :raises ValueError: If an address is not a valid IPv4 address
+        :return: Dictionary keyed by each address as passed in, of
+            location dictionaries as returned by
+            ``geo_locate_multiple_ips`` with ``ip`` set to the address,
+            or None for addresses that could not be located
+        :rtype: dict
+        """
+        addresses = {ip: ip_to_int(ip) for ip in ips}
+        found = {}
+        missing = set()
+        with self._lock:
+            for value in set(addresses.values()):
+                location = self._cached(value)
+                if location is None:
+                    missing.add(value)
+                else:
+                    found[value] = location
+            self.hits += len(found)
+            self.misses += len(missing)
+
+        # sorted so neighbouring addresses share a batch, requested in
+        # waves so ranges returned by one wave answer later addresses
+        pending = sorted(missing)
+        wave_size = self.batch_size * self.concurrency
+        while pending:
+            wave, pending = pending[:wave_size], pending[wave_size:]
+            response = request_batches(
+                self.orch,
+                self.orch.geo_locate_multiple_ips,
+                wave,
+                self.batch_size,
+                self.concurrency,
+            )
+            self.requests += -(-len(wave) // self.batch_size)
+            if not isinstance(response, dict) or request_failed(response):
+                self.orch.logger.warning(
+                    f"Could not geo-locate {len(wave) + len(pending)} "
+                    "addresses"
+                )
+                break
+            with self._lock:
+                for location in response.values():
+                    if isinstance(location, dict):
+                        self._add(location)
+                for value in wave:
+                    location = (
+                        response.get(str(value))
+                        or response.get(value)
+                        or self._cached(value)
+                    )
+                    if location is not None:
+                        found[value] = location
+                remaining = []
+                for value in pending:
+                    location = self._cached(value)
+                    if location is None:
+                        remaining.append(value)
+                    else:
+                        found[value] = location
+                self.hits += len(pending) - len(remaining)
+                self.misses -= len(pending) - len(remaining)
+                pending = remaining
+
+        result = {}
+        for ip, value in addresses.items():
+            location = found.get(value)
+            result[ip] = None if location is None else dict(location, ip=value)
+        return result
+
+    def locate_one(self, ip) -> dict:
+        """Geo-location of a single address
+
+        :param ip: IPv4 address, e.g. ``10.1.1.1`` or ``167837953``
+        :type ip: str or int
+        :raises ValueError: If ``ip`` is not a valid IPv4 address
+        :return: Location dictionary, None if it could not be located
+        :rtype: dict
+        """
+        return self.locate([ip])[ip]
+
+    def stats(self) -> dict:
+        """Report cache usage
+
+        :return: Dictionary of counters \n
+            * keyword **ranges** (`int`): Cached ranges
+            * keyword **hits** (`int`): Addresses answered from cache
+            * keyword **misses** (`int`): Addresses requested
+            * keyword **requests** (`int`): Batch requests sent
+        :rtype: dict
+        """
+        return {
+            "ranges": len(self._ranges),
+            "hits": self.hits,
+            "misses": self.misses,
+            "requests": self.requests,
+        }
@@ -0,0 +1,249 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# governor : Client-side rate limiting and retries of requests
+from __future__ import annotations
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from ._cache import _match_path
+
+# methods that can be sent again without changing the result
+IDEMPOTENT_METHODS = ("GET", "PUT", "DELETE")
+# status codes of an overloaded or restarting server
+RETRY_STATUS = (429, 502, 503, 504)
+
+
+def _parse_retry_after(value) -> float:
+    """Convert a ``Retry-After`` header to seconds
+
+    :param value: Header value, either seconds or an HTTP date
+    :type value: str
+    :return: Seconds to wait, None if header is missing or invalid
+    :rtype: float
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(0.0, retry_at - time.time())
+
+
+class TokenBucket:
+    """Token bucket allowing ``rate`` requests per second on average
+    with bursts of up to ``burst`` requests. Requests over the rate
+    reserve a future token and wait for it, so waiting requests are
+    released in order at the configured rate.
+    """
+
+    def __init__(self, rate: float, burst: float = None):
+        """Setup token bucket
+
+        :param rate: Requests per second
+        :type rate: float
+        :param burst: Requests allowed at once after being idle,
+            defaults to None for one second of requests
+        :type burst: float, optional
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, reserving a future one if none are left
+
+        :return: Seconds to wait before sending the request
+        :rtype: float
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class RequestGovernor:
+    """Rate limits requests with token buckets for the whole client and
+    for classes of endpoints, and decides when and how long to wait
+    before retrying failed requests. Retries use exponential backoff
+    with full jitter, or the server ``Retry-After`` delay, which also
+    holds back every other request of the client so callers do not
+    retry in lockstep.
+
+    ``GET``, ``PUT`` and ``DELETE`` are retried on connection errors,
+    timeouts and status codes 429, 502, 503 and 504. ``POST`` is only
+    retried when the request was not processed: on connect timeouts,
+    and on status 429.
+    """
+
+    def __init__(
+        self,
+        rate_limit: float = None,
+        endpoint_rate_limits: dict = None,
+        retries: int = 0,
+        backoff: float = 0.5,
+        backoff_max: float = 30.0,
+    ):
+        """Setup request governor
+
+        :param rate_limit: Requests per second for the whole client,
+            defaults to None for no limit
+        :type rate_limit: float, optional
+        :param endpoint_rate_limits: Dictionary of API path to requests
+            per second, each path or ``*`` wildcard pattern is a
+            separate class of endpoints with its own limit, e.g.
+            ``{"/stats*": 2, "/appliance*": 20}``, defaults to None
+        :type endpoint_rate_limits: dict, optional
+        :param retries: Maximum number of retries of a request,
+            defaults to 0
+        :type retries: int, optional
+        :param backoff: Seconds of the first retry backoff, doubling
+            with each further retry, defaults to 0.5
+        :type backoff: float, optional
+        :param backoff_max: Maximum seconds to wait before a retry,
+            also caps ``Retry-After``, defaults to 30.0
+        :type backoff_max: float, optional
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.client_bucket = TokenBucket(rate_limit) if rate_limit else None
+        self.endpoint_buckets = {
+            pattern: TokenBucket(rate)
+            for pattern, rate in (endpoint_rate_limits or {}).items()
+            if rate
+        }
+        self._lock = threading.Lock()
+        # monotonic time before which no request is sent, set by
+        # Retry-After, with or without rate limits
+        self.not_before = 0.0
+        self.throttled = 0
+        self.throttle_seconds = 0.0
+        self.retried = 0
+
+    def _buckets(self, api_path: str) -> list:
+        """Buckets limiting requests to an API path
+
+        :param api_path: API path of request
+        :type api_path: str
+        :return: Client bucket and matching endpoint class bucket
+        :rtype: list
+        """
+        buckets = []
+        if self.client_bucket is not None:
+            buckets.append(self.client_bucket)
+        if self.endpoint_buckets:
+            pattern = _match_path(self.endpoint_buckets, api_path)
+            if pattern is not None:
+                buckets.append(self.endpoint_buckets[pattern])
+        return buckets
+
+    def reserve(self, api_path: str) -> float:
+        """Take a token from each bucket limiting the API path and honor
+        any Retry-After pause of the client
+
+        :param api_path: API path of request
+        :type api_path: str
+        :return: Seconds to wait before sending the request
+        :rtype: float
+        """
+        wait = max(
+            (bucket.reserve() for bucket in self._buckets(api_path)),
+            default=0.0,
+        )
+        wait = max(wait, self.not_before - time.monotonic())
+        if wait > 0:
+            with self._lock:
+                self.throttled += 1
+                self.throttle_seconds += wait
+        return wait
+
+    def retry_delay(
+        self,
+        method: str,
+        api_path: str,
+        attempt: int,
+        status_code: int = None,
+        retry_after: str = None,
+        error: str = None,
+    ) -> float:
+        """Decide whether to retry a request and how long to wait first
+
+        :param method: HTTP method, e.g. ``GET``
+        :type method: str
+        :param api_path: API path of request
+        :type api_path: str
+        :param attempt: Number of retries already made
+        :type attempt: int
+        :param status_code: HTTP status code of the response, defaults
+            to None if no response was received
+        :type status_code: int, optional
+        :param retry_after: ``Retry-After`` header of the response,
+            defaults to None
+        :type retry_after: str, optional
+        :param error: ``connect`` if the connection could not be made,
+            ``read`` if the request failed after connecting, defaults to
+            None
+        :type error: str, optional
+        :return: Seconds to wait before retrying, None to not retry
+        :rtype: float
+        """
+        if attempt >= self.retries:
+            return None
+        idempotent = method in IDEMPOTENT_METHODS
+        if error is not None:
+            retry = error == "connect" or idempotent
+        else:
+            retry = status_code in RETRY_STATUS and (
+                idempotent or status_code == 429
+            )
+        if not retry:
+            return None
+
+        delay = _parse_retry_after(retry_after)
+        if delay is not None:
+            delay = min(delay, self.backoff_max)
+            # the server asked for a break, hold back other requests too
+            with self._lock:
+                self.not_before = max(
+                    self.not_before, time.monotonic() + delay
+                )
+        else:
+            delay = random.uniform(
+                0, min(self.backoff_max, self.backoff * 2**attempt)
+            )
+        with self._lock:
+            self.retried += 1
+        return delay
+
+    def stats(self) -> dict:
+        """Report rate limiting and retry counters
+
+        :return: Dictionary of counters \n
+            * keyword **throttled** (`int`): Requests delayed by the
+              rate limit
+            * keyword **throttle_seconds** (`float`): Total time
+              requests were delayed by the rate limit
+            * keyword **retried** (`int`): Requests sent again
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "throttled": self.throttled,
+                "throttle_seconds": round(self.throttle_seconds, 6),
+                "retried": self.retried,
+            }
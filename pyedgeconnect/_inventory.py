@@ -0,0 +1,196 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# inventory : Indexed snapshot of Orchestrator appliance inventory
+from __future__ import annotations
+
+import time
+
+
+def _append(index: dict, key, record: dict):
+    """Add record to the list of records sharing an index key"""
+    if key is None or key == "":
+        return
+    records = index.get(key)
+    if records is None:
+        index[key] = [record]
+    else:
+        records.append(record)
+
+
+class FleetInventory:
+    """Snapshot of every appliance in Orchestrator joined with its
+    Cloud Portal license, with hash indexes by nePk, hostname, serial,
+    management IP, site and group so lookups take constant time
+    regardless of fleet size. Also maps interface label ids and overlay
+    ids to their names.
+
+    Appliance records are the dictionaries returned by
+    :func:`~pyedgeconnect.Orchestrator.get_appliances` with an added
+    ``license`` key holding the matching entry of
+    :func:`~pyedgeconnect.Orchestrator.get_portal_licensed_appliances`,
+    or None if the appliance has no portal license.
+
+    Snapshots are not modified after creation, build a new one with
+    :meth:`refresh`.
+    """  # noqa RST304
+
+    def __init__(
+        self,
+        appliances: list,
+        licenses: list = None,
+        interface_labels: dict = None,
+        overlays: list = None,
+        orch=None,
+    ):
+        """Build indexes of inventory
+
+        :param appliances: Response of ``get_appliances``
+        :type appliances: list
+        :param licenses: Response of ``get_portal_licensed_appliances``,
+            defaults to None
+        :type licenses: list, optional
+        :param interface_labels: Response of
+            ``get_all_interface_labels``, defaults to None
+        :type interface_labels: dict, optional
+        :param overlays: Response of ``get_all_overlays_config``,
+            defaults to None
+        :type overlays: list, optional
+        :param orch: Orchestrator instance used by :meth:`refresh`,
+            defaults to None
+        :type orch: Orchestrator, optional
+        """
+        self.retrieved = time.time()
+        self.orch = orch
+        self._sources = (licenses or [], interface_labels or {}, overlays)
+
+        self.licenses = {
+            license_item.get("applianceId"): license_item
+            for license_item in licenses or []
+        }
+        self.interface_labels = {}
+        for label_type in ("wan", "lan"):
+            for label_id, label in (
+                (interface_labels or {}).get(label_type, {}).items()
+            ):
+                self.interface_labels[str(label_id)] = label.get("name")
+        self.overlays = {
+            str(overlay["id"]): overlay.get("name")
+            for overlay in overlays or []
+        }
+
+        self.appliances = []
+        self._by_ne_pk = {}
+        self._by_serial = {}
+        self._by_hostname = {}
+        self._by_ip = {}
+        self._by_site = {}
+        self._by_group = {}
+        for appliance in appliances:
+            ne_pk = appliance.get("nePk") or appliance.get("id")
+            record = dict(appliance, license=self.licenses.get(ne_pk))
+            self.appliances.append(record)
+            self._by_ne_pk[ne_pk] = record
+            serial = appliance.get("serial")
+            if serial:
+                self._by_serial[serial.upper()] = record
+            hostname = appliance.get("hostName")
+            if hostname:
+                _append(self._by_hostname, hostname.lower(), record)
+            _append(self._by_ip, appliance.get("IP"), record)
+            _append(self._by_site, appliance.get("site"), record)
+            _append(self._by_group, appliance.get("groupId"), record)
+
+    def __len__(self) -> int:
+        return len(self.appliances)
+
+    def __iter__(self):
+        return iter(self.appliances)
+
+    def __contains__(self, ne_pk: str) -> bool:
+        return ne_pk in self._by_ne_pk
+
+    def get(self, ne_pk: str) -> dict:
+        """Appliance by nePk
+
+        :param ne_pk: Network Primary Key (nePk) of appliance, e.g.
+            ``3.NE``
+        :type ne_pk: str
+        :return: Appliance record, None if not found
+        :rtype: dict
+        """
+        return self._by_ne_pk.get(ne_pk)
+
+    def by_hostname(self, hostname: str) -> dict:
+        """Appliance by hostname, ignoring case
+
+        :param hostname: Hostname of appliance
+        :type hostname: str
+        :return: Appliance record, the first in Orchestrator order if
+            hostnames are not unique, None if not found
+        :rtype: dict
+        """
+        records = self._by_hostname.get(hostname.lower())
+        return records[0] if records else None
+
+    def by_serial(self, serial: str) -> dict:
+        """Appliance by serial number, ignoring case
+
+        :param serial: Serial number of appliance
+        :type serial: str
+        :return: Appliance record, None if not found
+        :rtype: dict
+        """
+        return self._by_serial.get(serial.upper())
+
+    def by_ip(self, ip: str) -> list:
+        """Appliances by management IP address
+
+        :param ip: IP address of appliance, e.g. ``10.1.1.1``
+        :type ip: str
+        :return: List of appliance records, empty if none found
+        :rtype: list
+        """
+        return list(self._by_ip.get(ip, ()))
+
+    def in_site(self, site: str) -> list:
+        """Appliances in a site
+
+        :param site: Site name of appliances
+        :type site: str
+        :return: List of appliance records, empty if none found
+        :rtype: list
+        """
+        return list(self._by_site.get(site, ()))
+
+    def in_group(self, group_pk: str) -> list:
+        """Appliances in an appliance group, not including subgroups
+
+        :param group_pk: Appliance group identifier, e.g. ``3.Network``
+        :type group_pk: str
+        :return: List of appliance records, empty if none found
+        :rtype: list
+        """
+        return list(self._by_group.get(group_pk, ()))
+
+    def sites(self) -> list:
+        """Names of all sites with appliances
+
+        :return: List of site names
+        :rtype: list
+        """
+        return list(self._by_site)
+
+    def refresh(self, full: bool = False):
+        """Retrieve a new snapshot. By default only the appliance list
+        is requested again, reusing licenses, interface labels and
+        overlays of this snapshot.
+
+        :param full: Also request licenses, interface labels and
+            overlays again, defaults to False
+        :type full: bool, optional
+        :return: New inventory snapshot, or the failed appliance list
+            response
+        :rtype: FleetInventory
+        """
+        return self.orch.inventory(previous=None if full else self)
@@ -0,0 +1,192 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# ip_intelligence : Local interval index of Cloud Portal address map
+from __future__ import annotations
+
+import heapq
+import socket
+import time
+from array import array
+from bisect import bisect_right
+
+# attributes of an address map entry kept in the index
+IP_INTELLIGENCE_FIELDS = (
+    "name",
+    "description",
+    "org",
+    "country",
+    "country_code",
+    "priority",
+)
+
+
+def ip_to_int(ip) -> int:
+    """Convert an IPv4 address to a 32-bit integer
+
+    :param ip: IPv4 address, e.g. ``10.1.1.1``, integers are returned
+        unchanged
+    :type ip: str or int
+    :raises ValueError: If ``ip`` is not a valid IPv4 address
+    :return: IPv4 address as integer, e.g. ``167837953``
+    :rtype: int
+    """
+    if isinstance(ip, int):
+        return ip
+    try:
+        return int.from_bytes(socket.inet_aton(ip), "big")
+    except OSError:
+        raise ValueError(f"'{ip}' is not a valid IPv4 address") from None
+
+
+def _flatten(ranges: list) -> tuple:
+    """Split overlapping ranges into disjoint segments, each taking the
+    attributes of the narrowest range covering it, later entries
+    winning between ranges of equal width
+
+    :param ranges: Tuples of start, end and attribute index
+    :type ranges: list
+    :return: Tuple of lists of segment starts, ends and attribute
+        indexes, sorted by start
+    :rtype: tuple
+    """
+    boundaries = sorted(
+        {start for start, _, _ in ranges} | {end + 1 for _, end, _ in ranges}
+    )
+    ranges = sorted(
+        (start, end, order, attribute)
+        for order, (start, end, attribute) in enumerate(ranges)
+    )
+    starts, ends, attributes = [], [], []
+    # active ranges as (width, -order, end, attribute), narrowest first
+    active = []
+    position = 0
+    for index, boundary in enumerate(boundaries[:-1]):
+        while position < len(ranges) and ranges[position][0] == boundary:
+            start, end, order, attribute = ranges[position]
+            heapq.heappush(active, (end - start, -order, end, attribute))
+            position += 1
+        while active and active[0][2] < boundary:
+            heapq.heappop(active)
+        if not active:
+            continue
+        attribute = active[0][3]
+        segment_end = boundaries[index + 1] - 1
+        if (
+            attributes
+            and attributes[-1] == attribute
+            and ends[-1] + 1 == boundary
+        ):
+            ends[-1] = segment_end
+        else:
+            starts.append(boundary)
+            ends.append(segment_end)
+            attributes.append(attribute)
+    return starts, ends, attributes
+
+
+class IpIntelligenceIndex:
+    """Cloud Portal address map of IPv4 ranges to application,
+    organization and country, held in sorted arrays for lookups by
+    binary search without requests.
+
+    Overlapping ranges are split into disjoint segments when the index
+    is built, the narrowest range covering an address wins. Lookups
+    return one shared dictionary per distinct set of attributes, with
+    the keys of :data:`IP_INTELLIGENCE_FIELDS`, which must not be
+    modified.
+    """
+
+    def __init__(self, entries, update_time=None):
+        """Build index
+
+        :param entries: Address map entries as returned by
+            ``get_app_definition_data``, with ``ip_start`` and
+            ``ip_end`` as 32-bit integers
+        :type entries: Iterable[dict]
+        :param update_time: Cloud Portal update time of the address
+            map, see ``get_update_time_for_app_definitions``, defaults
+            to None
+        :type update_time: str, optional
+        """
+        self.update_time = update_time
+        self.built = time.time()
+        self.attributes = []
+        attribute_index = {}
+        ranges = []
+        for entry in entries:
+            start = entry.get("ip_start")
+            end = entry.get("ip_end")
+            if start is None or end is None:
+                continue
+            start, end = ip_to_int(start), ip_to_int(end)
+            if end < start:
+                continue
+            key = tuple(entry.get(field) for field in IP_INTELLIGENCE_FIELDS)
+            index = attribute_index.get(key)
+            if index is None:
+                index = attribute_index[key] = len(self.attributes)
+                self.attributes.append(dict(zip(IP_INTELLIGENCE_FIELDS, key)))
+            ranges.append((start, end, index))
+        self.entries = len(ranges)
+        starts, ends, attributes = _flatten(ranges)
+        self.starts = array("L", starts)
+        self.ends = array("L", ends)
+        self.attribute_ids = array("L", attributes)
+        self._numpy = None
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def lookup(self, ip) -> dict:
+        """Address map attributes of an IPv4 address
+
+        :param ip: IPv4 address, e.g. ``10.1.1.1`` or ``167837953``
+        :type ip: str or int
+        :raises ValueError: If ``ip`` is not a valid IPv4 address
+        :return: Dictionary of attributes, None if no range contains
+            the address
+        :rtype: dict
+        """
+        ip = ip_to_int(ip)
+        index = bisect_right(self.starts, ip) - 1
+        if index < 0 or self.ends[index] < ip:
+            return None
+        return self.attributes[self.attribute_ids[index]]
+
+    def lookup_many(self, ips) -> list:
+        """Address map attributes of many IPv4 addresses, searched
+        together with NumPy if it is installed
+
+        :param ips: IPv4 addresses as strings or integers
+        :type ips: Iterable
+        :raises ValueError: If an address is not a valid IPv4 address
+        :return: List of attribute dictionaries, or None for addresses
+            no range contains, in order of ``ips``
+        :rtype: list
+        """
+        ips = [ip_to_int(ip) for ip in ips]
+        if not self.starts:
+            return [None] * len(ips)
+        try:
+            import numpy as np
+        except ImportError:
+            lookup = self.lookup
+            return [lookup(ip) for ip in ips]
+        if self._numpy is None:
+            self._numpy = (
+                np.array(self.starts, dtype=np.uint32),
+                np.array(self.ends, dtype=np.uint32),
+                np.array(self.attribute_ids, dtype=np.int64),
+            )
+        starts, ends, attribute_ids = self._numpy
+        values = np.array(ips, dtype=np.uint32)
+        indexes = np.searchsorted(starts, values, side="right") - 1
+        found = (indexes >= 0) & (ends[indexes] >= values)
+        attributes = self.attributes
+        return [
+            attributes[attribute] if hit else None
+            for hit, attribute in zip(
+                found.tolist(), attribute_ids[indexes].tolist()
+            )
+        ]
@@ -0,0 +1,72 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# log : Lazy structured log records of API responses
+from __future__ import annotations
+
+import logging
+
+
+def request_label(response) -> str:
+    """Label of the request method as previously rendered from
+    ``str(response.request)``, e.g. ``[GET]``
+
+    :param response: Requests Response object
+    :type response: requests.Response
+    :return: HTTP method in square brackets
+    :rtype: str
+    """
+    request = response.request
+    if request is None:
+        return "None"
+    return f"[{request.method}]"
+
+
+def log_enabled(logger: logging.Logger, level: int) -> bool:
+    """Check if a record at ``level`` would reach any handler, so
+    records are only built when they are emitted
+
+    :param logger: Logger of the instance
+    :type logger: logging.Logger
+    :param level: Logging level, e.g. ``logging.INFO``
+    :type level: int
+    :return: ``True`` if the logger would emit the record
+    :rtype: bool
+    """
+    return logger.isEnabledFor(level) and logger.hasHandlers()
+
+
+class BodyPreview:
+    """Response body rendered only when a log record is formatted,
+    truncated to ``limit`` bytes so large responses are not decoded in
+    full for logging
+    """
+
+    __slots__ = ("response", "limit")
+
+    def __init__(self, response, limit: int = None):
+        """Setup body preview
+
+        :param response: Requests Response object
+        :type response: requests.Response
+        :param limit: Maximum number of bytes to render, defaults to
+            None for the whole body
+        :type limit: int, optional
+        """
+        self.response = response
+        self.limit = limit
+
+    def __str__(self) -> str:
+        response = self.response
+        if self.limit is None:
+            return response.text
+        content = response.content or b""
+        if len(content) <= self.limit:
+            return response.text
+        try:
+            text = content[: self.limit].decode(
+                response.encoding or "utf-8", errors="replace"
+            )
+        except LookupError:
+            text = content[: self.limit].decode("utf-8", errors="replace")
+        return f"{text}... [{len(content) - self.limit} bytes truncated]"
@@ -0,0 +1,310 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# metrics : Per-endpoint request latency and throughput metrics
+from __future__ import annotations
+
+import bisect
+import json
+import re
+import threading
+
+# upper bounds of latency histogram buckets in seconds
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# path segments identifying a single resource rather than an endpoint,
+# e.g. ``3.NE``, ``0.Network``, ``10.1.1.1``, ``tunnel_12`` or a uuid
+_ID_SEGMENT = re.compile(
+    r"^(?:"
+    r"\d+"
+    r"|\d+\.[A-Za-z]+"
+    r"|\d{1,3}(?:\.\d{1,3}){3}(?:/\d+)?"
+    r"|[0-9A-Fa-f]*:[0-9A-Fa-f:]+(?:/\d+)?"
+    r"|[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-"
+    r"[0-9A-Fa-f]{12}"
+    r"|[0-9A-Fa-f]{16,}"
+    r"|[A-Za-z]+_\d+"
+    r"|.*\d{6,}.*"
+    r")$"
+)
+
+
+def path_template(api_path: str) -> str:
+    """Replace ids in an API path so calls to the same endpoint share
+    one template, e.g. ``/appliance/3.NE/tunnels?limit=5`` becomes
+    ``/appliance/{id}/tunnels``
+
+    :param api_path: API path of request
+    :type api_path: str
+    :return: API path without query parameters and with ids replaced
+        by ``{id}``
+    :rtype: str
+    """
+    path = api_path.split("?", 1)[0]
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+class _EndpointStats:
+    """Counters and latency histogram of one method, path template and
+    status
+    """
+
+    __slots__ = (
+        "count",
+        "seconds",
+        "max_seconds",
+        "request_bytes",
+        "response_bytes",
+        "buckets",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        # one count per bucket plus the overflow bucket
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+
+# path template of requests beyond the maximum number of templates
+OTHER_PATHS = "{other}"
+
+
+class EndpointMetrics:
+    """In-process counters and latency histograms of requests, keyed by
+    HTTP method, path template and status. Safe for use from multiple
+    threads.
+
+    Ids that :func:`path_template` does not recognise, such as names,
+    leave a distinct template per resource. Once ``max_paths`` templates
+    are recorded, requests to new templates are counted under
+    ``{other}`` so the number of series stays bounded.
+    """
+
+    def __init__(self, max_paths: int = 500):
+        """Setup empty endpoint metrics
+
+        :param max_paths: Maximum number of path templates to record
+            separately, defaults to 500
+        :type max_paths: int, optional
+        """
+        self.max_paths = max_paths
+        self._stats = {}
+        self._paths = set()
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        method: str,
+        api_path: str,
+        status,
+        seconds: float,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ):
+        """Record one request
+
+        :param method: HTTP method, e.g. ``GET``
+        :type method: str
+        :param api_path: API path of request, ids are replaced, see
+            :func:`path_template`, counted under ``{other}`` beyond
+            ``max_paths`` templates
+        :type api_path: str
+        :param status: HTTP status code, or name of the exception if no
+            response was received
+        :type status: int or str
+        :param seconds: Time from sending the request until the response
+            was received
+        :type seconds: float
+        :param request_bytes: Size of request body, defaults to 0
+        :type request_bytes: int, optional
+        :param response_bytes: Size of response body, defaults to 0
+        :type response_bytes: int, optional
+        """
+        path = path_template(api_path)
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            if path not in self._paths:
+                if len(self._paths) >= self.max_paths:
+                    path = OTHER_PATHS
+                else:
+                    self._paths.add(path)
+            key = (method, path, str(status))
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _EndpointStats()
+            stats.count += 1
+            stats.seconds += seconds
+            if seconds > stats.max_seconds:
+                stats.max_seconds = seconds
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            stats.buckets[bucket] += 1
+
+    def record_response(
+        self,
+        method: str,
+        api_path: str,
+        response,
+        seconds: float,
+    ):
+        """Record one request from its response, without reading the
+        body of streamed responses
+
+        :param method: HTTP method, e.g. ``GET``
+        :type method: str
+        :param api_path: API path of request
+        :type api_path: str
+        :param response: Response to request
+        :type response: requests.Response
+        :param seconds: Time from sending the request until the response
+            was received
+        :type seconds: float
+        """
+        request = response.request
+        body = request.body if request is not None else None
+        content = response._content
+        if isinstance(content, bytes):
+            received = len(content)
+        else:
+            received = int(response.headers.get("Content-Length") or 0)
+        self.record(
+            method,
+            api_path,
+            response.status_code,
+            seconds,
+            len(body) if isinstance(body, (bytes, str)) else 0,
+            received,
+        )
+
+    def clear(self):
+        """Remove all recorded metrics"""
+        with self._lock:
+            self._stats.clear()
+            self._paths.clear()
+
+    def snapshot(self) -> list:
+        """Copy of recorded metrics, slowest endpoints by total time
+        first
+
+        :return: List of dictionaries, one per method, path template
+            and status \n
+            [`dict`]: Endpoint metrics \n
+                * keyword **method** (`str`): HTTP method
+                * keyword **path** (`str`): Path template
+                * keyword **status** (`str`): HTTP status code, or
+                  exception name if no response was received
+                * keyword **count** (`int`): Number of requests
+                * keyword **seconds** (`float`): Total latency
+                * keyword **mean_seconds** (`float`): Mean latency
+                * keyword **max_seconds** (`float`): Highest latency
+                * keyword **request_bytes** (`int`): Total bytes sent
+                * keyword **response_bytes** (`int`): Total bytes
+                  received
+                * keyword **buckets** (`dict`): Cumulative number of
+                  requests at or under each latency bound in seconds,
+                  ``+Inf`` counts all requests
+        :rtype: list
+        """
+        with self._lock:
+            items = [
+                (key, stats.count, stats.seconds, stats.max_seconds)
+                + (stats.request_bytes, stats.response_bytes)
+                + (list(stats.buckets),)
+                for key, stats in self._stats.items()
+            ]
+        snapshot = []
+        for key, count, seconds, max_seconds, sent, received, buckets in items:
+            cumulative = {}
+            total = 0
+            for bound, bucket_count in zip(
+                LATENCY_BUCKETS + ("+Inf",), buckets
+            ):
+                total += bucket_count
+                cumulative[str(bound)] = total
+            snapshot.append(
+                {
+                    "method": key[0],
+                    "path": key[1],
+                    "status": key[2],
+                    "count": count,
+                    "seconds": round(seconds, 6),
+                    "mean_seconds": round(seconds / count, 6),
+                    "max_seconds": round(max_seconds, 6),
+                    "request_bytes": sent,
+                    "response_bytes": received,
+                    "buckets": cumulative,
+                }
+            )
+        snapshot.sort(key=lambda entry: entry["seconds"], reverse=True)
+        return snapshot
+
+    def to_json(self) -> str:
+        """Dump recorded metrics as JSON, see :meth:`snapshot`
+
+        :return: JSON array of endpoint metrics
+        :rtype: str
+        """
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix: str = "pyedgeconnect") -> str:
+        """Dump recorded metrics in the Prometheus text exposition
+        format
+
+        :param prefix: Prefix of metric names, defaults to
+            "pyedgeconnect"
+        :type prefix: str, optional
+        :return: Prometheus text format metrics
+        :rtype: str
+        """
+        lines = [
+            f"# HELP {prefix}_request_seconds Request latency",
+            f"# TYPE {prefix}_request_seconds histogram",
+        ]
+        counters = []
+        for entry in self.snapshot():
+            labels = 'method="{}",path="{}",status="{}"'.format(
+                entry["method"],
+                entry["path"].replace("\\", "\\\\").replace('"', '\\"'),
+                entry["status"],
+            )
+            for bound, count in entry["buckets"].items():
+                lines.append(
+                    f'{prefix}_request_seconds_bucket{{{labels},le="{bound}"}}'
+                    f" {count}"
+                )
+            lines.append(
+                f"{prefix}_request_seconds_sum{{{labels}}} {entry['seconds']}"
+            )
+            lines.append(
+                f"{prefix}_request_seconds_count{{{labels}}} {entry['count']}"
+            )
+            counters.append((labels, entry))
+        for name, key, help_text in (
+            ("request_bytes", "request_bytes", "Request body bytes sent"),
+            ("response_bytes", "response_bytes", "Response bytes received"),
+        ):
+            lines.append(f"# HELP {prefix}_{name}_total {help_text}")
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for labels, entry in counters:
+                lines.append(f"{prefix}_{name}_total{{{labels}}} {entry[key]}")
+        return "\n".join(lines) + "\n"
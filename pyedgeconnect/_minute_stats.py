@@ -0,0 +1,163 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# minute_stats : Parse minute statistics archives in memory
+from __future__ import annotations
+
+import csv
+import itertools
+import math
+import os
+import re
+import tarfile
+
+# stats table -> positions of numeric columns of the headerless v2
+# files, as read by the telemetry demo. Other columns, such as names,
+# interface labels or traffic type codes, are kept as text
+MINUTE_STATS_NUMERIC_COLUMNS = {
+    "interface_v2": (*range(4, 18), 30),
+    "interface_overlay_v2": (*range(4, 15), 23),
+    "tunnel_v2": (*range(6, 35), 65, 66, 69, 71),
+    "flow_v2": (3, 4, 5, *range(9, 17), 25),
+    "boost_v2": (1, 2, 3, 5),
+    "drops_v2": (1, 2, 3),
+}
+
+_INTEGER = re.compile(r"-?\d+")
+_DECIMAL = re.compile(r"-?\d+\.\d+(?:[eE][-+]?\d+)?|-?\d+[eE][-+]?\d+")
+
+
+class MinuteStatsRecords:
+    """Records of a minute statistics archive, iterated once as tuples
+    of stats table name and record. The streamed response is released
+    when iteration ends, on :meth:`close`, when leaving a ``with``
+    block, or when the object is garbage collected, whichever is first,
+    so stopping early does not leave the connection open.
+    """
+
+    def __init__(self, records, close=None):
+        """Setup minute statistics records
+
+        :param records: Generator of tuples of stats table name and
+            record
+        :type records: Iterator[tuple]
+        :param close: Callable to release the stream, defaults to None
+        :type close: Callable, optional
+        """
+        self._records = records
+        self._close = close
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> tuple:
+        try:
+            return next(self._records)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Stop iterating and release the streamed response"""
+        self._records.close()
+        close, self._close = self._close, None
+        if close is not None:
+            close()
+
+
+def iter_minute_stats_archive(
+    fileobj,
+    tables: list = None,
+    numeric_columns: dict = None,
+):
+    """Iterate records of a minute statistics tgz archive, reading the
+    archive sequentially from ``fileobj``
+
+    :param fileobj: Readable binary stream of a tgz archive
+    :type fileobj: file object
+    :param tables: Names of stats tables to parse, defaults to None to
+        parse all tables
+    :type tables: list, optional
+    :param numeric_columns: Dictionary of stats table name to column
+        names or positions to convert to numbers, added to
+        :data:`MINUTE_STATS_NUMERIC_COLUMNS`, defaults to None
+    :type numeric_columns: dict, optional
+    :return: Generator of tuples of stats table name and record
+    :rtype: Iterator[tuple]
+    """
+    known = dict(MINUTE_STATS_NUMERIC_COLUMNS)
+    known.update(numeric_columns or {})
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as archive:
+        for member in archive:
+            if not member.isfile():
+                continue
+            table = os.path.splitext(os.path.basename(member.name))[0]
+            if tables is not None and table not in tables:
+                continue
+            # archive stream is not seekable, decode line by line
+            lines = (
+                line.decode("utf-8") for line in archive.extractfile(member)
+            )
+            for record in _parse_stats_csv(lines, known.get(table, ())):
+                yield table, record
+
+
+def _parse_stats_csv(text, numeric=()):
+    """Parse csv stats file into records keyed by header row column
+    names, or by column position if the first row is data
+
+    :param text: Lines of csv file
+    :type text: Iterable[str]
+    :param numeric: Column names or positions to convert to numbers,
+        other values are kept as text, defaults to ()
+    :type numeric: Iterable, optional
+    :return: Generator of record dictionaries
+    :rtype: Iterator[dict]
+    """
+    reader = csv.reader(text)
+    first = next(reader, None)
+    if first is None:
+        return
+    numeric = set(numeric)
+    # column names are never plain integers, the first row of the
+    # headerless v2 files always holds some
+    if any(_INTEGER.fullmatch(value) for value in first):
+        header = list(range(len(first)))
+        reader = itertools.chain([first], reader)
+    else:
+        header = [name.strip() for name in first]
+    convert = [column in numeric for column in header]
+    for row in reader:
+        if row:
+            yield {
+                column: _convert_stat(value) if numeric_column else value
+                for column, value, numeric_column in zip(header, row, convert)
+            }
+
+
+def _convert_stat(value: str):
+    """Convert csv value of a numeric column to int or float. Values
+    that are not plain decimal numbers, such as ``nan`` or ``inf``, are
+    kept as text
+
+    :param value: Value from csv file
+    :type value: str
+    :return: Value as int, float, or unchanged str
+    :rtype: int, float, str
+    """
+    if _INTEGER.fullmatch(value):
+        return int(value)
+    if _DECIMAL.fullmatch(value):
+        number = float(value)
+        if math.isfinite(number):
+            return number
+    return value
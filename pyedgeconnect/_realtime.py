@@ -0,0 +1,240 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# realtime : Deadline-driven polling of per second realtime stats
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable
+
+from ._results import request_failed
+
+# seconds of per second stats kept by appliances
+REALTIME_WINDOW = 3.0
+
+
+class RealtimeStatsScheduler:
+    """Poll realtime stats of many subscriptions concurrently, each
+    often enough that no second falls out of the 3 second window kept
+    by appliances.
+
+    Each subscription is polled again ``interval`` seconds after its
+    previous poll was sent, sooner when responses are slow so a poll
+    still completes within the window. When more polls are due than
+    workers are free, polls closest to their deadline are sent first.
+    Samples already delivered are dropped, so every second of a
+    subscription is delivered once and in order. Seconds lost despite
+    this, e.g. when an appliance does not respond, are counted as gaps
+    in :meth:`stats`.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable,
+        subscriptions: list,
+        interval: float = 2.0,
+        concurrency: int = 8,
+    ):
+        """Setup scheduler
+
+        :param fetch: Function taking a subscription and returning the
+            realtime stats response
+        :type fetch: Callable
+        :param subscriptions: Subscriptions to poll, passed to
+            ``fetch``, must be hashable
+        :type subscriptions: list
+        :param interval: Seconds between polls of a subscription, at
+            most the 3 second window, defaults to 2.0
+        :type interval: float, optional
+        :param concurrency: Maximum number of polls at once, defaults to
+            8
+        :type concurrency: int, optional
+        """
+        self.fetch = fetch
+        self.subscriptions = list(dict.fromkeys(subscriptions))
+        self.interval = min(interval, REALTIME_WINDOW)
+        self.concurrency = max(1, concurrency)
+        self._stop = threading.Event()
+        # subscription -> stat key -> timestamp of last delivered sample
+        self._last = {subscription: {} for subscription in self.subscriptions}
+        # smoothed response time of polls in seconds
+        self.latency = 0.0
+        self.polls = 0
+        self.failures = 0
+        self.late = 0
+        self.gaps = 0
+        self.samples = 0
+
+    def _next_due(self, sent: float) -> float:
+        """Time to poll a subscription again after a poll sent at
+        ``sent``, leaving room for the response time within the window
+        """
+        margin = REALTIME_WINDOW - 2 * self.latency
+        return sent + max(0.2, min(self.interval, margin))
+
+    def _new_samples(self, subscription, response: dict) -> dict:
+        """Drop samples delivered before and count skipped seconds
+
+        :param subscription: Polled subscription
+        :param response: Realtime stats response
+        :type response: dict
+        :return: Dictionary of stat key to list of new ``[timestamp,
+            value]`` samples, oldest first
+        :rtype: dict
+        """
+        last = self._last[subscription]
+        new = {}
+        for key, values in response.items():
+            if not isinstance(values, list):
+                continue
+            values = sorted(
+                (sample for sample in values if len(sample) >= 2),
+                key=lambda sample: sample[0],
+            )
+            previous = last.get(key)
+            fresh = [
+                sample
+                for sample in values
+                if previous is None or sample[0] > previous
+            ]
+            if not fresh:
+                continue
+            if previous is not None and len(values) > 1:
+                step = values[1][0] - values[0][0]
+                if step > 0:
+                    missing = round((fresh[0][0] - previous) / step) - 1
+                    self.gaps += max(0, missing)
+            last[key] = fresh[-1][0]
+            new[key] = fresh
+            self.samples += len(fresh)
+        return new
+
+    def stream(self, duration: float = None):
+        """Poll subscriptions and yield new samples as responses arrive
+
+        :param duration: Seconds to poll for, defaults to None to poll
+            until :meth:`stop` is called or the generator is closed
+        :type duration: float, optional
+        :return: Generator of tuples of subscription and dictionary of
+            stat key to list of new ``[timestamp, value]`` samples
+        :rtype: Iterator
+        """
+        self._stop.clear()
+        start = time.monotonic()
+        end = None if duration is None else start + duration
+        # (due time, order, subscription) of subscriptions not in flight
+        due = [
+            (start, order, subscription)
+            for order, subscription in enumerate(self.subscriptions)
+        ]
+        heapq.heapify(due)
+        # time of last successful response per subscription
+        received = {}
+        pending = {}
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            while due or pending:
+                now = time.monotonic()
+                stopping = self._stop.is_set() or (
+                    end is not None and now >= end
+                )
+                if stopping and not pending:
+                    return
+                # earliest deadline first while workers are free
+                while (
+                    not stopping
+                    and due
+                    and due[0][0] <= now
+                    and len(pending) < self.concurrency
+                ):
+                    _, order, subscription = heapq.heappop(due)
+                    future = executor.submit(self.fetch, subscription)
+                    pending[future] = (order, subscription, now)
+                timeout = None
+                if due and not stopping and len(pending) < self.concurrency:
+                    timeout = max(0.0, due[0][0] - time.monotonic())
+                if end is not None and not stopping:
+                    remaining = max(0.0, end - time.monotonic())
+                    timeout = (
+                        remaining
+                        if timeout is None
+                        else min(timeout, remaining)
+                    )
+                if not pending:
+                    if timeout:
+                        self._stop.wait(timeout)
+                    continue
+                done, _ = wait(pending, timeout, FIRST_COMPLETED)
+                for future in done:
+                    order, subscription, sent = pending.pop(future)
+                    finished = time.monotonic()
+                    self.polls += 1
+                    try:
+                        response = future.result()
+                    except Exception:
+                        response = None
+                    if request_failed(response) or not isinstance(
+                        response, dict
+                    ):
+                        self.failures += 1
+                        # retry soon, the window is still moving
+                        heapq.heappush(
+                            due,
+                            (
+                                finished + self.interval / 4,
+                                order,
+                                subscription,
+                            ),
+                        )
+                        continue
+                    self.latency = 0.8 * self.latency + 0.2 * (finished - sent)
+                    previous = received.get(subscription)
+                    if (
+                        previous is not None
+                        and finished - previous > REALTIME_WINDOW
+                    ):
+                        self.late += 1
+                    received[subscription] = finished
+                    heapq.heappush(
+                        due, (self._next_due(sent), order, subscription)
+                    )
+                    samples = self._new_samples(subscription, response)
+                    if samples:
+                        yield subscription, samples
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def stop(self):
+        """Stop polling, :meth:`stream` returns once polls in flight
+        complete
+        """
+        self._stop.set()
+
+    def stats(self) -> dict:
+        """Report polling statistics
+
+        :return: Dictionary of counters \n
+            * keyword **polls** (`int`): Responses received
+            * keyword **failures** (`int`): Polls that failed
+            * keyword **late** (`int`): Responses more than 3 seconds
+              after the previous response of the same subscription
+            * keyword **gaps** (`int`): Seconds missing between
+              delivered samples
+            * keyword **samples** (`int`): Samples delivered
+            * keyword **latency** (`float`): Smoothed response time in
+              seconds
+        :rtype: dict
+        """
+        return {
+            "polls": self.polls,
+            "failures": self.failures,
+            "late": self.late,
+            "gaps": self.gaps,
+            "samples": self.samples,
+            "latency": round(self.latency, 6),
+        }
@@ -0,0 +1,44 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# results : Detect failed results of request methods
+from __future__ import annotations
+
+# keys of the dictionary returned by HttpCommon._handle_response for
+# unexpected status codes
+ERROR_KEYS = frozenset(("request", "api_path", "status_code", "text"))
+
+
+def request_failed(result) -> bool:
+    """Check for a failed result of a request method: None or False
+    after an exception, or the error dictionary returned for an
+    unexpected HTTP status code
+
+    :param result: Return value of a request method
+    :return: ``True`` if the request failed
+    :rtype: bool
+    """
+    return (
+        result is None
+        or result is False
+        or (isinstance(result, dict) and result.keys() == ERROR_KEYS)
+    )
+
+
+class PageRequestError(Exception):
+    """Raised by ``iter_*`` generators when a page request fails, so an
+    iteration cut short is not mistaken for a complete one. ``result``
+    holds the failed result of the page request.
+    """
+
+    def __init__(self, result):
+        self.result = result
+        if isinstance(result, dict):
+            message = "Page request failed: {} {} | HTTP {}".format(
+                result.get("request"),
+                result.get("api_path"),
+                result.get("status_code"),
+            )
+        else:
+            message = f"Page request failed, returned {result!r}"
+        super().__init__(message)
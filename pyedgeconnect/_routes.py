@@ -0,0 +1,319 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# routes : Local longest prefix match over appliance route tables
+from __future__ import annotations
+
+import ipaddress
+import random
+import socket
+from typing import Callable
+
+from ._results import request_failed
+
+# route state values not used for forwarding
+_INACTIVE_STATES = ("DOWN",)
+
+
+def _address_to_int(ip_address: str) -> tuple:
+    """Convert an IPv4 or IPv6 address to IP version and integer
+
+    :param ip_address: IP address, e.g. ``10.1.1.1``
+    :type ip_address: str
+    :raises ValueError: If ``ip_address`` is not a valid IP address
+    :return: Tuple of IP version and address as integer
+    :rtype: tuple
+    """
+    try:
+        return 4, int.from_bytes(
+            socket.inet_pton(socket.AF_INET, ip_address), "big"
+        )
+    except OSError:
+        pass
+    try:
+        return 6, int.from_bytes(
+            socket.inet_pton(socket.AF_INET6, ip_address), "big"
+        )
+    except OSError:
+        raise ValueError(f"'{ip_address}' is not a valid IP address") from None
+
+
+def _preference(route: dict) -> tuple:
+    """Sort key of routes to the same prefix, preferred first: active
+    routes, then lowest admin distance, then lowest metric
+    """
+    return (
+        route.get("state") in _INACTIVE_STATES,
+        route.get("adminDistance") or 0,
+        route.get("metric") or 0,
+    )
+
+
+def _route_key(result: dict) -> tuple:
+    """Comparable summary of a preferred route result"""
+    if result.get("swdwan"):
+        return "swdwan", str(result["swdwan"].get("peerID"))
+    if result.get("passthrough"):
+        passthrough = result["passthrough"]
+        return (
+            "passthrough",
+            passthrough.get("interfaceName"),
+            passthrough.get("nexthop"),
+        )
+    return (None,)
+
+
+class _PrefixTable:
+    """Routes of one IP version in one segment, stored as one hash
+    table per prefix length and searched from the longest length, so a
+    lookup takes at most one dictionary lookup per distinct length
+    """
+
+    def __init__(self, bits: int):
+        self.bits = bits
+        # prefix length -> network address as integer -> route
+        self.by_length = {}
+        self.lengths = []
+
+    def add(self, network: int, length: int, route: dict):
+        table = self.by_length.setdefault(length, {})
+        current = table.get(network)
+        if current is None or _preference(route) < _preference(current):
+            table[network] = route
+
+    def freeze(self):
+        """Order prefix lengths longest first after adding routes"""
+        self.lengths = [
+            (length, ((1 << length) - 1) << (self.bits - length), table)
+            for length, table in sorted(self.by_length.items(), reverse=True)
+        ]
+
+    def match(self, address: int) -> dict:
+        for _, mask, table in self.lengths:
+            route = table.get(address & mask)
+            if route is not None:
+                return route
+        return None
+
+
+class RouteTable:
+    """Local copy of an appliance route table answering preferred route
+    queries by longest prefix match, without a request per address.
+
+    Results have the fields of ``appliance_find_preferred_route``.
+    Routes learned from another appliance over SD-WAN fill ``swdwan``,
+    every other route fills ``passthrough`` with its resolved interface
+    and next hop. Details the route table does not hold, MAC addresses
+    and VLAN, are None. Results also include the matched ``route``
+    entry. Between routes to the same prefix, active routes with the
+    lowest admin distance, then lowest metric, are preferred.
+
+    Overlays, traffic direction and policies are not considered, check
+    agreement with the appliance using :meth:`verify`.
+    """
+
+    def __init__(self, subnets: dict, find: Callable = None):
+        """Build route table
+
+        :param subnets: Response of ``get_appliance_subnets_all_vrfs``,
+            or of a single segment route table such as
+            ``get_appliance_subnets``
+        :type subnets: dict
+        :param find: Method of the appliance answering preferred route
+            queries, used by :meth:`verify`, defaults to None
+        :type find: Callable, optional
+        """
+        self.find = find
+        segments = subnets.get("subnets") or {}
+        # ECOS nests peers and module details in subnets next to the
+        # segments, Orchestrator returns them at the top level
+        module_info = (
+            segments.get("moduleInfo") or subnets.get("moduleInfo") or {}
+        )
+        self.system_id = str(module_info.get("my system id", ""))
+        self.peer_names = {
+            str(peer.get("peerid")): peer.get("peerName")
+            or peer.get("peername")
+            for peer in segments.get("peers") or subnets.get("peers") or []
+        }
+        if "entries" in segments:
+            # single segment response
+            segments = {"0": segments}
+        self.segments = {}
+        self.prefixes = []
+        for segment_id, segment in segments.items():
+            if not isinstance(segment, dict) or "entries" not in segment:
+                continue
+            tables = {4: _PrefixTable(32), 6: _PrefixTable(128)}
+            for entry in segment.get("entries") or []:
+                route = entry.get("state", entry)
+                try:
+                    network = ipaddress.ip_network(
+                        route.get("prefix"), strict=False
+                    )
+                except (TypeError, ValueError):
+                    continue
+                tables[network.version].add(
+                    int(network.network_address), network.prefixlen, route
+                )
+                self.prefixes.append((str(segment_id), network))
+            for table in tables.values():
+                table.freeze()
+            self.segments[str(segment_id)] = tables
+
+    def _result(self, route: dict) -> dict:
+        """Preferred route result for a matched route"""
+        peer_id = str(route.get("peerid") or "")
+        if peer_id and peer_id != "0" and peer_id != self.system_id:
+            return {
+                "passthrough": None,
+                "swdwan": {
+                    "peerID": peer_id,
+                    "peerName": self.peer_names.get(peer_id)
+                    or route.get("peername"),
+                },
+                "route": route,
+            }
+        return {
+            "passthrough": {
+                "srcMAC": None,
+                "destMAC": None,
+                "interfaceName": route.get("resolvedInterface")
+                or route.get("ifName"),
+                "nexthop": route.get("resolvedNexthop")
+                or route.get("nextHop"),
+                "vlan": None,
+                "isApplianceIP": None,
+            },
+            "swdwan": None,
+            "route": route,
+        }
+
+    def find_preferred_route(self, ip_address: str, segment="0") -> dict:
+        """Preferred route of an address
+
+        :param ip_address: IPv4 or IPv6 address, e.g. ``10.1.1.1``
+        :type ip_address: str
+        :param segment: Segment/VRF id, defaults to "0"
+        :type segment: str or int, optional
+        :raises ValueError: If ``ip_address`` is not a valid IP address
+        :return: Dictionary with ``passthrough``, ``swdwan`` and
+            ``route``, all None if no route matches, empty if the
+            segment does not exist
+        :rtype: dict
+        """
+        tables = self.segments.get(str(segment))
+        if tables is None:
+            return {}
+        version, address = _address_to_int(ip_address)
+        route = tables[version].match(address)
+        if route is None:
+            return {"passthrough": None, "swdwan": None, "route": None}
+        return self._result(route)
+
+    def find_preferred_routes(self, ip_addresses, segment="0") -> dict:
+        """Preferred routes of many addresses
+
+        :param ip_addresses: IPv4 or IPv6 addresses
+        :type ip_addresses: Iterable[str]
+        :param segment: Segment/VRF id, defaults to "0"
+        :type segment: str or int, optional
+        :raises ValueError: If an address is not a valid IP address
+        :return: Dictionary of address to result of
+            :meth:`find_preferred_route`
+        :rtype: dict
+        """
+        return {
+            ip_address: self.find_preferred_route(ip_address, segment)
+            for ip_address in ip_addresses
+        }
+
+    def verify(
+        self,
+        ip_addresses: list = None,
+        samples: int = 50,
+        segment="0",
+        segment_name: str = "",
+        in_port: str = "l2w",
+        overlay_id: int = 0,
+        find: Callable = None,
+        seed: int = None,
+    ) -> dict:
+        """Compare local results of sampled addresses to the appliance
+
+        A result agrees when both choose SD-WAN with the same peer, or
+        both choose passthrough with the same interface and next hop.
+
+        :param ip_addresses: Addresses to sample from, defaults to None
+            for one address in each of a sample of prefixes
+        :type ip_addresses: list, optional
+        :param samples: Number of addresses to check, defaults to 50
+        :type samples: int, optional
+        :param segment: Segment/VRF id for local lookups, defaults to
+            "0"
+        :type segment: str or int, optional
+        :param segment_name: Segment name for the appliance, defaults
+            to "" for the default segment
+        :type segment_name: str, optional
+        :param in_port: Incoming traffic direction, ``l2w``, ``w2l`` or
+            ``self``, defaults to "l2w"
+        :type in_port: str, optional
+        :param overlay_id: Overlay ID, defaults to 0 for any overlay
+        :type overlay_id: int, optional
+        :param find: ``appliance_find_preferred_route`` of an
+            EdgeConnect instance, defaults to None for the method the
+            table was built with
+        :type find: Callable, optional
+        :param seed: Seed of the random sample, defaults to None
+        :type seed: int, optional
+        :raises ValueError: If there is no method to query the appliance
+        :return: Dictionary of results \n
+            * keyword **checked** (`int`): Addresses compared
+            * keyword **failed** (`int`): Appliance queries that failed
+            * keyword **mismatches** (`list`): Dictionaries of
+              ``ip_address``, ``local`` and ``appliance`` results that
+              disagree
+        :rtype: dict
+        """
+        find = find or self.find
+        if find is None:
+            raise ValueError(
+                "Verifying a route table requires appliance_find_preferred_"
+                "route of an EdgeConnect instance"
+            )
+        generator = random.Random(seed)
+        if ip_addresses is None:
+            candidates = [
+                network
+                for segment_id, network in self.prefixes
+                if segment_id == str(segment)
+            ]
+            candidates = generator.sample(
+                candidates, min(samples, len(candidates))
+            )
+            ip_addresses = [
+                str(network[min(1, network.num_addresses - 1)])
+                for network in candidates
+            ]
+        else:
+            ip_addresses = generator.sample(
+                list(ip_addresses), min(samples, len(ip_addresses))
+            )
+
+        report = {"checked": 0, "failed": 0, "mismatches": []}
+        for ip_address in ip_addresses:
+            appliance = find(ip_address, in_port, overlay_id, segment_name)
+            if not isinstance(appliance, dict) or request_failed(appliance):
+                report["failed"] += 1
+                continue
+            local = self.find_preferred_route(ip_address, segment)
+            report["checked"] += 1
+            if _route_key(local) != _route_key(appliance):
+                report["mismatches"].append(
+                    {
+                        "ip_address": ip_address,
+                        "local": local,
+                        "appliance": appliance,
+                    }
+                )
+        return report
@@ -0,0 +1,205 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# transport : Connection pooling and keep-alive for requests sessions
+import socket
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class _TrackedPoolMixin:
+    """Connection pool mixin that counts connection usage for
+    :meth:`TransportAdapter.pool_stats` and closes connections that
+    have been idle in the pool longer than ``idle_timeout``
+    """
+
+    idle_timeout = None
+
+    def _init_tracking(self):
+        self._stats_lock = threading.Lock()
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.saturated = 0
+        self.idle_closed = 0
+        self.wait_seconds = 0.0
+
+    def _get_conn(self, timeout=None):
+        with self._stats_lock:
+            if self.pool is not None and self.in_use >= self.pool.maxsize:
+                self.saturated += 1
+        start = time.monotonic()
+        conn = super()._get_conn(timeout=timeout)
+        waited = time.monotonic() - start
+
+        last_used = getattr(conn, "last_used", None)
+        idle_closed = (
+            self.idle_timeout is not None
+            and last_used is not None
+            and time.monotonic() - last_used > self.idle_timeout
+        )
+        if idle_closed:
+            # connection is reopened on next use
+            conn.close()
+
+        with self._stats_lock:
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            self.wait_seconds += waited
+            self.idle_closed += idle_closed
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn.last_used = time.monotonic()
+        with self._stats_lock:
+            self.in_use = max(0, self.in_use - 1)
+        super()._put_conn(conn)
+
+
+class _TrackedHTTPConnectionPool(_TrackedPoolMixin, HTTPConnectionPool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._init_tracking()
+
+
+class _TrackedHTTPSConnectionPool(_TrackedPoolMixin, HTTPSConnectionPool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._init_tracking()
+
+
+def _keep_alive_socket_options(keep_alive: float) -> list:
+    """Build socket options enabling TCP keep-alive probes
+
+    :param keep_alive: Seconds a connection is idle before the first
+        keep-alive probe is sent
+    :type keep_alive: float
+    :return: List of socket option tuples for urllib3 connections
+    :rtype: list
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    idle = max(1, int(keep_alive))
+    # option names vary by platform, TCP_KEEPALIVE is macOS
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, "TCP_KEEPALIVE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, idle))
+    return options
+
+
+class TransportAdapter(HTTPAdapter):
+    """Requests transport adapter with configurable connection pool
+    size, blocking policy, TCP keep-alive and idle connection timeout.
+    Tracks pool usage so saturation can be reported through
+    :meth:`pool_stats`.
+    """
+
+    # attributes kept when pickling, requests rebuilds the pool manager
+    __attrs__ = HTTPAdapter.__attrs__ + ["keep_alive", "idle_timeout"]
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: float = None,
+        idle_timeout: float = None,
+    ):
+        """Setup transport adapter
+
+        :param pool_connections: Number of host connection pools to
+            cache, defaults to 10
+        :type pool_connections: int, optional
+        :param pool_maxsize: Maximum number of connections kept per
+            host, defaults to 10
+        :type pool_maxsize: int, optional
+        :param pool_block: Wait for a free connection when all
+            ``pool_maxsize`` connections are in use instead of opening
+            an extra, non-pooled connection, defaults to False
+        :type pool_block: bool, optional
+        :param keep_alive: Enable TCP keep-alive probes after this many
+            seconds idle, defaults to None for operating system default
+        :type keep_alive: float, optional
+        :param idle_timeout: Close pooled connections that have been
+            idle longer than this many seconds instead of reusing them,
+            defaults to None to always reuse
+        :type idle_timeout: float, optional
+        """
+        self.keep_alive = keep_alive
+        self.idle_timeout = idle_timeout
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **kwargs):
+        if self.keep_alive is not None:
+            kwargs["socket_options"] = _keep_alive_socket_options(
+                self.keep_alive
+            )
+        super().init_poolmanager(connections, maxsize, block, **kwargs)
+        idle_timeout = self.idle_timeout
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type(
+                "HTTPConnectionPool",
+                (_TrackedHTTPConnectionPool,),
+                {"idle_timeout": idle_timeout},
+            ),
+            "https": type(
+                "HTTPSConnectionPool",
+                (_TrackedHTTPSConnectionPool,),
+                {"idle_timeout": idle_timeout},
+            ),
+        }
+
+    def pool_stats(self) -> dict:
+        """Report usage of each host connection pool
+
+        :return: Dictionary keyed by ``host:port`` \n
+            * keyword **maxsize** (`int`): Connections kept in the pool
+            * keyword **in_use** (`int`): Connections currently checked
+              out for requests
+            * keyword **idle** (`int`): Open connections waiting in the
+              pool for reuse
+            * keyword **peak_in_use** (`int`): Highest ``in_use`` seen
+            * keyword **saturated** (`int`): Number of requests that
+              found every pooled connection in use, these either waited
+              or opened an extra connection
+            * keyword **wait_seconds** (`float`): Total time requests
+              spent waiting for a connection
+            * keyword **connections_opened** (`int`): Connections opened
+            * keyword **idle_closed** (`int`): Connections closed for
+              exceeding ``idle_timeout``
+            * keyword **requests** (`int`): Requests sent through pool
+        :rtype: dict
+        """
+        stats = {}
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None or not hasattr(pool, "in_use"):
+                continue
+            queued = list(pool.pool.queue) if pool.pool is not None else []
+            with pool._stats_lock:
+                stats[f"{pool.host}:{pool.port}"] = {
+                    "maxsize": (
+                        pool.pool.maxsize if pool.pool is not None else 0
+                    ),
+                    "in_use": pool.in_use,
+                    "idle": sum(1 for conn in queued if conn is not None),
+                    "peak_in_use": pool.peak_in_use,
+                    "saturated": pool.saturated,
+                    "wait_seconds": round(pool.wait_seconds, 6),
+                    "connections_opened": pool.num_connections,
+                    "idle_closed": pool.idle_closed,
+                    "requests": pool.num_requests,
+                }
+        return stats
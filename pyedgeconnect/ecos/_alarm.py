@@ -4,6 +4,8 @@
 # alarm : Alarms
 from __future__ import annotations
 
+from .._alarm_feed import ApplianceAlarmFeed
+
 
 def get_appliance_alarms(
     self,
@@ -86,6 +88,41 @@ def get_appliance_alarms(
     return self._get("/alarm")
 
 
+def alarm_feed(self) -> ApplianceAlarmFeed:
+    """Create an incremental feed of active alarms. Each
+    :meth:`~pyedgeconnect._alarm_feed.ApplianceAlarmFeed.poll`
+    returns only alarms that are new, changed, or cleared since the
+    previous poll.
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - alarm
+          - GET
+          - /alarm
+
+    .. code:: python
+
+        feed = ec.alarm_feed()
+        delta = feed.poll()
+        for alarm in delta["cleared"]:
+            resolve(alarm)
+
+    .. note::
+        The appliance alarm endpoint has no filters, every poll requests
+        all outstanding alarms. Only supported by the synchronous
+        classes.
+
+    :return: Alarm feed, the first poll reports all active alarms as
+        new
+    :rtype: ApplianceAlarmFeed
+    """  # noqa RST304
+    return ApplianceAlarmFeed(self)
+
+
 def acknowledge_appliance_alarms(
     self,
     alarm_seq_ids: list[int],
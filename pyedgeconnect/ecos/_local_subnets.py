@@ -4,6 +4,9 @@
 # localSubnets : Local subnets
 from __future__ import annotations
 
+from .._results import request_failed
+from .._routes import RouteTable
+
 
 def get_appliance_subnets(self) -> dict:
     """Gets all configured, learned subnets from remote Silverpeak
@@ -962,6 +965,42 @@ def appliance_find_preferred_route(
     )
 
 
+def appliance_route_table(self) -> RouteTable:
+    """Retrieve the route table of all segments once and answer
+    preferred route queries locally by longest prefix match, instead
+    of a request per address with
+    :func:`appliance_find_preferred_route`.
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - localSubnets
+          - GET
+          - /subnets3/all/vrfs
+
+    .. code:: python
+
+        routes = ec.appliance_route_table()
+        results = routes.find_preferred_routes(destinations)
+        # compare a sample to the appliance
+        routes.verify(samples=20)["mismatches"]
+
+    .. note::
+        Only supported by the synchronous classes.
+
+    :return: Route table, see :class:`pyedgeconnect._routes.RouteTable`,
+        or the failed response
+    :rtype: RouteTable
+    """  # noqa RST304
+    subnets = self.get_appliance_subnets_all_vrfs()
+    if not isinstance(subnets, dict) or request_failed(subnets):
+        return subnets
+    return RouteTable(subnets, find=self.appliance_find_preferred_route)
+
+
 def get_appliance_routing_peers_info(self) -> list:
     """Get appliance routing peers information
 
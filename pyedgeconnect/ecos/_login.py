@@ -34,35 +34,41 @@ def login(
             {"user": user, "password": password},
             return_type="full_response",
         )
-
-        if response is not None and response.status_code == 200:
-            # get and set X-XSRF-TOKEN
-            for cookie in response.cookies:
-                if cookie.name == "edgeosCsrfToken":
-                    self.headers["X-XSRF-TOKEN"] = cookie.value
-                    return True
-                elif cookie.name == "vxoaSessionID":
-                    self.headers["vxoaSessionID"] = cookie.value
-                    return True
-                else:
-                    pass
-            # HTTP/200 without a cookie
-            self.logger.error(
-                "Login failed: HTTP 200 but no CSRF Token cookie"
-            )
-            self.logger.error(response.cookies)
-            return False
-        else:
-            self.logger.error(
-                "Login failed: see above response text for details"
-            )
-            return False
+        return _process_login_response(self, response)
 
     except Exception as ex:
         self.logger.error("login error: {}".format(ex))
         return False
 
 
+def _process_login_response(self, response) -> bool:
+    """Set session headers from the cookies of a login response
+
+    :param response: Full response of login call
+    :type response: requests.Response
+    :return: Returns True/False based on successful login
+    :rtype: bool
+    """
+    if response is not None and response.status_code == 200:
+        # get and set X-XSRF-TOKEN
+        for cookie in response.cookies:
+            if cookie.name == "edgeosCsrfToken":
+                self.headers["X-XSRF-TOKEN"] = cookie.value
+                return True
+            elif cookie.name == "vxoaSessionID":
+                self.headers["vxoaSessionID"] = cookie.value
+                return True
+            else:
+                pass
+        # HTTP/200 without a cookie
+        self.logger.error("Login failed: HTTP 200 but no CSRF Token cookie")
+        self.logger.error(response.cookies)
+        return False
+    else:
+        self.logger.error("Login failed: see above response text for details")
+        return False
+
+
 def logout(self) -> bool:
     """Logout to Edge Connect appliance
 
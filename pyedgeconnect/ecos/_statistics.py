@@ -4,6 +4,9 @@
 # statistics : Get statistics related information
 import requests
 
+from .._minute_stats import MinuteStatsRecords, iter_minute_stats_archive
+from .._realtime import RealtimeStatsScheduler
+
 
 def get_appliance_stats_minute_range(self) -> dict:
     """Get the oldest minute and latest minute for which per minute
@@ -75,6 +78,11 @@ def get_appliance_stats_minute_file(
         tar = tarfile.open("stats.tgz")
         tar.extractall()
 
+    .. note::
+        This method reads the whole file into memory before returning,
+        use :func:`~download_appliance_stats_minute_file` to stream
+        large files.
+
     :param file: Filename of statistics file to download from applinace
     :type file: str
     :return: Download tgz file as part of full response data \n
@@ -86,6 +94,203 @@ def get_appliance_stats_minute_file(
     )
 
 
+def download_appliance_stats_minute_file(
+    self,
+    file: str,
+    destination=None,
+    chunk_size: int = 65536,
+):
+    """Download specific minute statistics file, streaming the file
+    in chunks rather than holding the whole file in memory
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - statistics
+          - GET
+          - /stats/minuteStats/{file}
+
+    Writes the tgz file to ``destination`` when provided, otherwise
+    returns an iterable of chunks of the file. Both report bytes
+    transferred and throughput.
+
+    .. code-block:: python
+
+        from pyedgeconnect import EdgeConnect
+        ec = EdgeConnect(ec_ip)
+        ec.login(ec_user,ec_pw)
+        # write file to disk
+        stats = ec.download_appliance_stats_minute_file(
+            "st2-1428356220.tgz", destination="stats.tgz"
+        )
+        print(stats["bytes"], stats["bytes_per_second"])
+        # or process chunks as they arrive
+        download = ec.download_appliance_stats_minute_file(
+            "st2-1428356220.tgz", chunk_size=16384
+        )
+        for chunk in download:
+            ...
+        print(download.stats())
+        ec.logout()
+
+    :param file: Filename of statistics file to download from appliance,
+        e.g. ``st2-1428356220.tgz``
+    :type file: str
+    :param destination: File path or binary file object to write the
+        file to, defaults to None to return an iterable of chunks
+    :type destination: str, os.PathLike, or file object, optional
+    :param chunk_size: Number of bytes per chunk, defaults to 65536
+    :type chunk_size: int, optional
+    :return: Returns False on failure. Otherwise dictionary of transfer
+        statistics if ``destination`` was provided, or an iterable of
+        `bytes` chunks with a ``stats()`` method \n
+        * keyword **bytes** (`int`): Bytes downloaded
+        * keyword **seconds** (`float`): Seconds spent downloading
+        * keyword **bytes_per_second** (`float`): Download throughput
+    :rtype: bool, dict, Download
+    """
+    return self._download(
+        f"/stats/minuteStats/{file}",
+        destination=destination,
+        chunk_size=chunk_size,
+    )
+
+
+def iter_minute_stats(
+    self,
+    minute: int,
+    tables: list = None,
+    numeric_columns: dict = None,
+):
+    """Download a minute statistics file and iterate its records in
+    memory. The tgz archive is decompressed as it streams from the
+    appliance, and each csv file in it is parsed by its header row, so
+    no files are written to disk.
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - statistics
+          - GET
+          - /stats/minuteStats/{file}
+
+    Each record is a dictionary of column name to value. Records are
+    yielded with the name of the stats table they belong to, which is
+    the csv filename without extension, e.g. ``tunnel_v2``. If the first
+    row of a file contains integers it is treated as data rather than a
+    header and records are keyed by column position instead, as in the
+    headerless v2 tables. Values of the known numeric columns of these
+    tables, see
+    :data:`~pyedgeconnect._minute_stats.MINUTE_STATS_NUMERIC_COLUMNS`,
+    and of ``numeric_columns`` are converted to `int` or `float`, all
+    other values are kept as `str`.
+
+    The download is released once all records are read. Use a ``with``
+    block or call ``close()`` to release it when stopping early.
+
+    .. code-block:: python
+
+        minute_range = ec.get_appliance_stats_minute_range()
+        with ec.iter_minute_stats(
+            minute_range["newest"], tables=["tunnel_v2", "interface_v2"]
+        ) as records:
+            for table, record in records:
+                ...
+
+    :param minute: Minute boundary of statistics to retrieve in epoch
+        seconds, as returned by
+        :func:`~get_appliance_stats_minute_range`
+    :type minute: int
+    :param tables: Names of stats tables to parse, other files in the
+        archive are skipped, defaults to None to parse all tables
+    :type tables: list, optional
+    :param numeric_columns: Dictionary of stats table name to column
+        names or positions to convert to numbers in addition to the
+        known numeric columns, e.g. ``{"qos_v2": [3, 4]}``, defaults to
+        None
+    :type numeric_columns: dict, optional
+    :return: Returns False on failure, otherwise iterator of tuples
+        of stats table name and record dictionary
+    :rtype: bool, MinuteStatsRecords
+    """  # noqa RST304
+    download = self._download(f"/stats/minuteStats/st2-{minute}.tgz")
+    if not download:
+        return download
+    raw = download.response.raw
+    raw.decode_content = True
+    return MinuteStatsRecords(
+        iter_minute_stats_archive(raw, tables, numeric_columns),
+        download.response.close,
+    )
+
+
+def appliance_realtime_stats_scheduler(
+    self,
+    subscriptions: list,
+    interval: float = 2.0,
+    concurrency: int = 8,
+) -> RealtimeStatsScheduler:
+    """Poll many realtime stats concurrently, each often enough to not
+    miss any second, and stream the new samples of each subscription.
+    Overlapping samples of consecutive polls are delivered once. See
+    :func:`get_appliance_realtime_stats` for accepted stat types, names
+    and filters.
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - statistics
+          - POST
+          - /stats/realtimeStats
+
+    .. code:: python
+
+        scheduler = ec.appliance_realtime_stats_scheduler(
+            [("tunnel", "tunnel_1"), ("app", "ssh", "3")]
+        )
+        for subscription, samples in scheduler.stream(duration=60):
+            print(subscription, samples)
+
+    .. note::
+        Polls run in threads with the methods of this instance, only
+        supported by the synchronous classes.
+
+    :param subscriptions: Tuples of ``(stat_type, stat_name)`` or
+        ``(stat_type, stat_name, stat_filter)``
+    :type subscriptions: list
+    :param interval: Seconds between polls of a subscription, shortened
+        automatically when responses are slow, defaults to 2.0
+    :type interval: float, optional
+    :param concurrency: Maximum number of requests at once, defaults
+        to 8
+    :type concurrency: int, optional
+    :return: Scheduler, iterate
+        :meth:`~pyedgeconnect._realtime.RealtimeStatsScheduler.stream`
+        for tuples of subscription and dictionary of stat key to new
+        ``[timestamp, value]`` samples
+    :rtype: RealtimeStatsScheduler
+    """  # noqa RST304
+    subscriptions = [
+        tuple(subscription) + ("",) * (3 - len(subscription))
+        for subscription in subscriptions
+    ]
+    return RealtimeStatsScheduler(
+        lambda subscription: self.get_appliance_realtime_stats(*subscription),
+        subscriptions,
+        interval=interval,
+        concurrency=concurrency,
+    )
+
+
 def get_appliance_realtime_stats(
     self,
     stat_type: str,
@@ -4,6 +4,10 @@
 # tunnel : Underlay SDWAN Tunnels
 from __future__ import annotations
 
+from functools import partial
+
+from .._batch import DEFAULT_BATCH_SIZE, request_batches
+
 
 def get_appliance_tunnels_config_and_state(
     self,
@@ -621,6 +625,8 @@ def get_appliance_tunnel_aliases(
 def get_appliance_multiple_tunnels_config(
     self,
     tunnel_list: list[str],
+    batch_size: int = None,
+    concurrency: int = None,
 ) -> dict:
     """Get the configuration of multiple tunnels from appliance
 
@@ -634,8 +640,16 @@ def get_appliance_multiple_tunnels_config(
           - POST
           - /getMultipleTunnels
 
-    :param tunnel_list: List of tunnel id's to query for
+    :param tunnel_list: List of tunnel id's to query for, lists longer
+        than ``batch_size`` are split into batches requested
+        concurrently and merged into one dictionary
     :type tunnel_list: list[str]
+    :param batch_size: Maximum number of tunnel ids per request,
+        defaults to None for 500
+    :type batch_size: int, optional
+    :param concurrency: Maximum number of batches requested at once,
+        defaults to None for 4
+    :type concurrency: int, optional
     :return: Returns dictionary of specified tunnels queried \n
         * keyword **<tunnel_id>** (`dict`): Tunnel id and object \n
             * keyword **admin** (`str`): Admin state of the tunnel -
@@ -751,6 +765,16 @@ def get_appliance_multiple_tunnels_config(
               tunnel
     :rtype: dict
     """
+    if len(tunnel_list) > (batch_size or DEFAULT_BATCH_SIZE):
+        # each batch is sent as a single request
+        return request_batches(
+            self,
+            partial(self._post, "/getMultipleTunnels"),
+            tunnel_list,
+            batch_size,
+            concurrency,
+        )
+
     return self._post(
         "/getMultipleTunnels",
         data=tunnel_list,
@@ -760,6 +784,8 @@ def get_appliance_multiple_tunnels_config(
 def get_appliance_multiple_tunnels_state(
     self,
     tunnel_list: list[str],
+    batch_size: int = None,
+    concurrency: int = None,
 ) -> dict:
     """Get the state of multiple tunnels from appliance
 
@@ -773,8 +799,16 @@ def get_appliance_multiple_tunnels_state(
           - POST
           - /getStateMultipleTunnels
 
-    :param tunnel_list: List of tunnel id's to query for
+    :param tunnel_list: List of tunnel id's to query for, lists longer
+        than ``batch_size`` are split into batches requested
+        concurrently and merged into one dictionary
     :type tunnel_list: list[str]
+    :param batch_size: Maximum number of tunnel ids per request,
+        defaults to None for 500
+    :type batch_size: int, optional
+    :param concurrency: Maximum number of batches requested at once,
+        defaults to None for 4
+    :type concurrency: int, optional
     :return: Returns dictionary of specified tunnels queried \n
         * keyword **<tunnel_id>** (`dict`): Tunnel id and object \n
             * keyword **self** (`str`): Tunnel id, e.g. ``tunnel_385``
@@ -796,8 +830,18 @@ def get_appliance_multiple_tunnels_state(
                 * keyword **ipsec_nat_port** (`str`): Remote NAT port
     :rtype: dict
     """
+    if len(tunnel_list) > (batch_size or DEFAULT_BATCH_SIZE):
+        # each batch is sent as a single request
+        return request_batches(
+            self,
+            partial(self._post, "/getStateMultipleTunnels"),
+            tunnel_list,
+            batch_size,
+            concurrency,
+        )
+
     return self._post(
-        "/getMultipleTunnels",
+        "/getStateMultipleTunnels",
         data=tunnel_list,
     )
 
@@ -4,6 +4,343 @@
 # aggregateStats : ECOS aggregate statistics
 from __future__ import annotations
 
+import math
+import re
+from functools import partial
+from typing import Callable
+
+from .._results import request_failed
+
+_GRANULARITY_SECONDS = {"minute": 60, "hour": 3600, "day": 86400}
+
+# merge function of numeric stats by the words of their name, first
+# listed match wins, matched as whole words so e.g. ADMIN_DOWN_COUNT is
+# not a minimum. Means are weighted by a counter of the same entry, so
+# a percentage weighted by its denominator equals the ratio of summed
+# numerator and denominator, rates are weighted by sub-window duration.
+# Only known counters are summed, other numbers keep the latest value.
+_MERGE_RULES = {
+    "MAX": "max",
+    "PEAK": "max",
+    "MIN": "min",
+    "AVG": "mean",
+    "AVERAGE": "mean",
+    "MEAN": "mean",
+    "PCT": "mean",
+    "PERCENT": "mean",
+    "PERCENTAGE": "mean",
+    "RATIO": "mean",
+    "LATENCY": "mean",
+    "JITTER": "mean",
+    "MOS": "mean",
+    "BPS": "rate",
+    "PPS": "rate",
+    "RATE": "rate",
+    "THROUGHPUT": "rate",
+    "BANDWIDTH": "rate",
+}
+# counters of packets, flows and bytes, in order of preference as the
+# weight of means, then other counters
+_COUNTER_WORDS = (
+    ("PKTS", "PKT", "PACKETS", "PACKET"),
+    ("FLOWS", "FLOW"),
+    ("BYTES", "BYTE", "OCTETS"),
+    (
+        "COUNT",
+        "CNT",
+        "TOTAL",
+        "CREATED",
+        "DELETED",
+        "TERMINATED",
+        "SESSIONS",
+        "LOSS",
+        "LOST",
+        "DROPS",
+        "DROPPED",
+        "ERRORS",
+        "ERRS",
+    ),
+)
+# counters of part of the traffic, not used as weight of means
+_PARTIAL_COUNTER_WORDS = {
+    "LOSS",
+    "LOST",
+    "DROPS",
+    "DROPPED",
+    "ERRORS",
+    "ERRS",
+}
+# words of a name before a capital letter of camelCase, or "_" and " "
+_WORD_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|[_\s]+")
+
+
+def _split_time_windows(
+    start_time: int,
+    end_time: int,
+    granularity: str,
+    windows: int,
+) -> list:
+    """Split a time range into consecutive sub-windows with boundaries
+    aligned to the data granularity
+
+    :param start_time: Seconds since EPOCH of start of time range
+    :type start_time: int
+    :param end_time: Seconds since EPOCH of end of time range
+    :type end_time: int
+    :param granularity: ``minute``, ``hour``, or ``day``
+    :type granularity: str
+    :param windows: Number of sub-windows to split into, fewer are
+        returned if the range spans fewer granularity intervals
+    :type windows: int
+    :return: List of ``(start_time, end_time)`` tuples, each ending one
+        second before the next starts so no interval is counted twice
+    :rtype: list
+    """
+    interval = _GRANULARITY_SECONDS.get(granularity, 60)
+    aligned_start = (start_time // interval) * interval
+    span = end_time - aligned_start
+    step = max(1, math.ceil(span / windows / interval)) * interval
+    bounds = []
+    window_start = start_time
+    boundary = aligned_start + step
+    while boundary < end_time:
+        bounds.append((window_start, boundary - 1))
+        window_start = boundary
+        boundary += step
+    bounds.append((window_start, end_time))
+    return bounds
+
+
+def _words(key) -> list:
+    """Upper case words of a stat name, e.g. ``["MAX", "LATENCY"]``"""
+    return [word.upper() for word in _WORD_BOUNDARY.split(str(key)) if word]
+
+
+def _counter_class(words: list) -> int:
+    """Index of the first group of :data:`_COUNTER_WORDS` matching a
+    name, None if the name is not a counter
+    """
+    for index, counter_words in enumerate(_COUNTER_WORDS):
+        if any(word in counter_words for word in words):
+            return index
+    return None
+
+
+def _merge_rule(key) -> str:
+    """Lookup how values of a numeric stat combine across sub-windows
+
+    :param key: Name of stat, e.g. ``MAX_LATENCY`` or ``maxLatency``
+    :return: ``sum``, ``max``, ``min``, ``mean``, ``rate``, ``first``,
+        or ``latest``
+    :rtype: str
+    """
+    words = _words(key)
+    if not words:
+        return "latest"
+    if words[-1] in ("ID", "IDS"):
+        return "first"
+    for match, rule in _MERGE_RULES.items():
+        if match in words:
+            return rule
+    if _counter_class(words) is not None:
+        return "sum"
+    return "latest"
+
+
+def _mean_weight_key(key, keys) -> str:
+    """Counter weighting a mean stat across sub-windows, packets over
+    flows over bytes over other counters, then the counter sharing
+    most words with the stat, e.g. ``WAN_RX_PKTS`` for
+    ``WAN_RX_AVG_LATENCY``
+
+    :param key: Name of mean stat
+    :param keys: Names of the other stats of the same entry
+    :type keys: list
+    :return: Name of counter, None if the entry has no counter
+    :rtype: str
+    """
+    words = set(_words(key))
+    candidates = []
+    for position, candidate in enumerate(keys):
+        candidate_words = _words(candidate)
+        if _merge_rule(candidate) != "sum" or _PARTIAL_COUNTER_WORDS & set(
+            candidate_words
+        ):
+            continue
+        candidates.append(
+            (
+                _counter_class(candidate_words),
+                -len(words & set(candidate_words)),
+                position,
+                candidate,
+            )
+        )
+    return min(candidates)[-1] if candidates else None
+
+
+def _mean_weights(key, values: list, weights: list) -> list:
+    """Weights of a mean stat in each sub-window, the value of its
+    counter in the same entry, or sub-window durations if the entries
+    have no counter
+
+    :param key: Name of mean stat
+    :param values: Entry holding the stat in each sub-window, None
+        where missing
+    :type values: list
+    :param weights: Share of the time range of each sub-window
+    :type weights: list
+    :return: Weight of each sub-window
+    :rtype: list
+    """
+    keys = dict.fromkeys(
+        k for value in values if isinstance(value, dict) for k in value
+    )
+    weight_key = _mean_weight_key(key, keys)
+    if weight_key is None:
+        return weights
+    counts = []
+    for value in values:
+        count = value.get(weight_key) if isinstance(value, dict) else None
+        valid = isinstance(count, (int, float)) and not isinstance(count, bool)
+        counts.append(count if valid else 0)
+    return counts
+
+
+def _merge_values(values: list, weights: list, key=None):
+    """Merge the value of one key across sub-window responses
+
+    :param values: Value from each sub-window, None where missing
+    :type values: list
+    :param weights: Share of the time range of each sub-window, or the
+        counter weighting the sub-windows of a mean stat
+    :type weights: list
+    :param key: Key of values in their parent dictionary
+    :return: Merged value
+    """
+    present = [
+        (value, weight)
+        for value, weight in zip(values, weights)
+        if value is not None
+    ]
+    if not present:
+        return None
+    first = present[0][0]
+
+    if isinstance(first, dict):
+        keys = dict.fromkeys(
+            k for value, _ in present if isinstance(value, dict) for k in value
+        )
+        return {
+            k: _merge_values(
+                [
+                    value.get(k) if isinstance(value, dict) else None
+                    for value in values
+                ],
+                (
+                    _mean_weights(k, values, weights)
+                    if _merge_rule(k) == "mean"
+                    else weights
+                ),
+                k,
+            )
+            for k in keys
+        }
+
+    if all(isinstance(value, list) for value, _ in present):
+        if all(value == first for value, _ in present):
+            return first
+        # rows of each sub-window, keep all of them in time order
+        return [item for value, _ in present for item in value]
+
+    numbers = [
+        (value, weight)
+        for value, weight in present
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    ]
+    if len(numbers) != len(present):
+        # text describes the entry, keep the latest
+        return present[-1][0]
+
+    rule = _merge_rule(key)
+    if rule == "max":
+        return max(value for value, _ in numbers)
+    if rule == "min":
+        return min(value for value, _ in numbers)
+    if rule in ("mean", "rate"):
+        total_weight = sum(weight for _, weight in numbers)
+        if not total_weight:
+            return numbers[-1][0]
+        return sum(value * weight for value, weight in numbers) / total_weight
+    if rule == "sum":
+        return sum(value for value, _ in numbers)
+    if rule == "first":
+        return first
+    return numbers[-1][0]
+
+
+def _merge_aggregate_stats(results: list, bounds: list):
+    """Merge aggregate stats of consecutive sub-windows into the shape
+    of a single response over the whole time range
+
+    :param results: Response of each sub-window
+    :type results: list
+    :param bounds: ``(start_time, end_time)`` of each sub-window
+    :type bounds: list
+    :return: Merged aggregate stats, or the first failed result if any
+        sub-window request failed, a partial result is never merged
+    :rtype: dict
+    """
+    for result in results:
+        if request_failed(result):
+            return result
+    span = sum(end - start + 1 for start, end in bounds)
+    weights = [(end - start + 1) / span for start, end in bounds]
+    return _merge_values(results, weights)
+
+
+def _split_aggregate_stats(
+    self,
+    method: Callable,
+    start_time: int,
+    end_time: int,
+    align: str,
+    windows: int,
+    concurrency: int,
+    **kwargs,
+) -> dict:
+    """Run an aggregate stats method over granularity aligned
+    sub-windows concurrently and merge the results
+
+    :param method: Aggregate stats method accepting ``start_time`` and
+        ``end_time`` keyword arguments
+    :type method: Callable
+    :param start_time: Seconds since EPOCH of start of time range
+    :type start_time: int
+    :param end_time: Seconds since EPOCH of end of time range
+    :type end_time: int
+    :param align: ``minute``, ``hour``, or ``day`` to align
+        sub-windows to
+    :type align: str
+    :param windows: Number of sub-windows to split into
+    :type windows: int
+    :param concurrency: Maximum number of sub-windows requested at once,
+        None for all at once
+    :type concurrency: int
+    :param kwargs: Additional keyword arguments for ``method``
+    :return: Merged aggregate stats
+    :rtype: dict
+    """
+    bounds = _split_time_windows(start_time, end_time, align, windows)
+    calls = [
+        partial(method, start_time=start, end_time=end, **kwargs)
+        for start, end in bounds
+    ]
+    return self._gather(
+        calls,
+        concurrency or len(calls),
+        partial(_merge_aggregate_stats, bounds=bounds),
+    )
+
 
 def get_aggregate_stats_tunnels(
     self,
@@ -17,6 +354,8 @@ def get_aggregate_stats_tunnels(
     overlay: str = None,
     data_format: str = None,
     group_by_ne: bool = None,
+    windows: int = None,
+    concurrency: int = None,
 ) -> dict:
     """Get aggregate tunnel stats data filter by query parameters.
 
@@ -71,10 +410,42 @@ def get_aggregate_stats_tunnels(
         object indicating what appliance the inner stats object belongs
         to. When not specified, behaves as ``True``, defaults to None
     :type group_by_ne: bool, optional
+    :param windows: Split the time range into this many sub-windows
+        aligned to ``granularity``, requested concurrently and merged
+        into a single response. Counters are summed, maximums and
+        minimums kept, averages and percentages weighted by a counter
+        of the same entry and rates by sub-window duration.
+        Not used with ``top`` or ``data_format``, defaults to None
+    :type windows: int, optional
+    :param concurrency: Maximum number of sub-windows requested at
+        once, defaults to None to request all ``windows`` at once
+    :type concurrency: int, optional
     :return: Returns dictionary of aggregate stats filtered by query
         parameters
     :rtype: dict
     """
+    if (
+        windows is not None
+        and windows > 1
+        and top is None
+        and data_format is None
+    ):
+        return _split_aggregate_stats(
+            self,
+            self.get_aggregate_stats_tunnels,
+            start_time,
+            end_time,
+            granularity,
+            windows,
+            concurrency,
+            granularity=granularity,
+            group_pk=group_pk,
+            ip=ip,
+            metric=metric,
+            overlay=overlay,
+            group_by_ne=group_by_ne,
+        )
+
     path = (
         "/stats/aggregate/tunnel?"
         + "startTime={}&endTime={}&granularity={}".format(
@@ -602,6 +973,8 @@ def get_aggregate_stats_applications(
     top: int = None,
     data_format: str = None,
     group_by_ne: bool = None,
+    windows: int = None,
+    concurrency: int = None,
 ) -> dict:
     """Get aggregate application stats data filter by query parameters
 
@@ -641,10 +1014,39 @@ def get_aggregate_stats_applications(
         object indicating what appliance the inner stats object belongs
         to. When not specified, behaves as ``True``, defaults to None
     :type group_by_ne: bool, optional
+    :param windows: Split the time range into this many sub-windows
+        aligned to the hour, requested concurrently and merged into a
+        single response. Counters are summed, maximums and minimums
+        kept, averages and percentages weighted by a counter of the
+        same entry and rates by sub-window duration.
+        Not used with ``top`` or ``data_format``, defaults to None
+    :type windows: int, optional
+    :param concurrency: Maximum number of sub-windows requested at
+        once, defaults to None to request all ``windows`` at once
+    :type concurrency: int, optional
     :return: Returns dictionary of aggregate stats filtered by query
         parameters
     :rtype: dict
     """
+    if (
+        windows is not None
+        and windows > 1
+        and top is None
+        and data_format is None
+    ):
+        return _split_aggregate_stats(
+            self,
+            self.get_aggregate_stats_applications,
+            start_time,
+            end_time,
+            "hour",
+            windows,
+            concurrency,
+            group_pk=group_pk,
+            application=application,
+            group_by_ne=group_by_ne,
+        )
+
     path = "/stats/aggregate/application2?" + "startTime={}&endTime={}".format(
         start_time,
         end_time,
@@ -1106,6 +1508,8 @@ def get_aggregate_stats_flows(
     ip: bool = None,
     data_format: str = None,
     group_by_ne: bool = None,
+    windows: int = None,
+    concurrency: int = None,
 ) -> dict:
     """Get aggregate flow stats data filter by query parameters
 
@@ -1155,10 +1559,37 @@ def get_aggregate_stats_flows(
         object indicating what appliance the inner stats object belongs
         to. When not specified, behaves as ``True``, defaults to None
     :type group_by_ne: bool, optional
+    :param windows: Split the time range into this many sub-windows
+        aligned to ``granularity``, requested concurrently and merged
+        into a single response. Counters are summed, maximums and
+        minimums kept, averages and percentages weighted by a counter
+        of the same entry and rates by sub-window duration.
+        Not used with ``data_format``, defaults to None
+    :type windows: int, optional
+    :param concurrency: Maximum number of sub-windows requested at
+        once, defaults to None to request all ``windows`` at once
+    :type concurrency: int, optional
     :return: Returns dictionary of aggregate stats filtered by query
         parameters
     :rtype: dict
     """
+    if windows is not None and windows > 1 and data_format is None:
+        return _split_aggregate_stats(
+            self,
+            self.get_aggregate_stats_flows,
+            start_time,
+            end_time,
+            granularity,
+            windows,
+            concurrency,
+            granularity=granularity,
+            group_pk=group_pk,
+            flow=flow,
+            traffic_type=traffic_type,
+            ip=ip,
+            group_by_ne=group_by_ne,
+        )
+
     path = (
         "/stats/aggregate/flow?startTime="
         + "{}&endTime={}&granularity={}".format(
@@ -4,6 +4,8 @@
 # alarm : Alarms
 from __future__ import annotations
 
+from .._alarm_feed import OrchestratorAlarmFeed
+
 
 def get_alarms_from_appliances(
     self,
@@ -100,6 +102,74 @@ def get_alarms_from_appliances(
     return self._post(path, data=data)
 
 
+def alarm_feed(
+    self,
+    ne_pk_list: list[str] = None,
+    orchestrator_alarms: bool = True,
+    full_every: int = 10,
+) -> OrchestratorAlarmFeed:
+    """Create an incremental feed of active alarms. Each
+    :meth:`~pyedgeconnect._alarm_feed.OrchestratorAlarmFeed.poll`
+    returns only alarms that are new, changed, or cleared since the
+    previous poll. Alarm counts and alarms newer than the last seen
+    alarm are requested on every poll, full active alarms only for
+    appliances whose alarms changed.
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - alarm
+          - GET
+          - /alarm/count/appliance
+        * - alarm
+          - POST
+          - /alarm/appliance
+        * - alarm
+          - GET
+          - /alarm/summary/{type}
+        * - alarm
+          - GET
+          - /alarm/gms
+
+    .. code:: python
+
+        feed = orch.alarm_feed()
+        while True:
+            delta = feed.poll()
+            for alarm in delta["new"]:
+                notify(alarm)
+            time.sleep(30)
+
+    .. note::
+        The feed sends requests with the methods of this instance and
+        is only supported by the synchronous classes.
+
+    :param ne_pk_list: Appliances to track alarms of, e.g.
+        ``["3.NE","5.NE"]``, defaults to None for all appliances
+    :type ne_pk_list: list[str], optional
+    :param orchestrator_alarms: Also track alarms of Orchestrator
+        itself, defaults to True
+    :type orchestrator_alarms: bool, optional
+    :param full_every: Request all active alarms every this many polls
+        to pick up changes that leave alarm counts unchanged, such as
+        acknowledgements, None to only do so on the first poll, defaults
+        to 10
+    :type full_every: int, optional
+    :return: Alarm feed, the first poll reports all active alarms as
+        new
+    :rtype: OrchestratorAlarmFeed
+    """  # noqa RST304
+    return OrchestratorAlarmFeed(
+        self,
+        ne_pk_list=ne_pk_list,
+        orchestrator_alarms=orchestrator_alarms,
+        full_every=full_every,
+    )
+
+
 def acknolwedge_alarms_from_appliance(
     self,
     ne_id: str,
@@ -0,0 +1,152 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# fleet : Run per-appliance methods across many appliances
+from __future__ import annotations
+
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, Union
+
+
+def _timed_call(start: list, method: Callable, ne_pk: str, kwargs: dict):
+    """Record the start time of a call, then run it
+
+    :param start: Empty list the start time is appended to
+    :type start: list
+    :param method: Method to call with ``ne_pk``
+    :type method: Callable
+    :param ne_pk: Network Primary Key (nePk) of appliance
+    :type ne_pk: str
+    :param kwargs: Additional keyword arguments for ``method``
+    :type kwargs: dict
+    :return: Return value of ``method``
+    """
+    start.append(time.monotonic())
+    return method(ne_pk, **kwargs)
+
+
+def for_each_appliance(
+    self,
+    method: Union[str, Callable],
+    ne_pks: Iterable[str],
+    concurrency: int = 10,
+    timeout: float = None,
+    **kwargs,
+) -> Iterator[tuple]:
+    """Run a per-appliance method for many appliances on a bounded
+    worker pool, yielding ``(ne_pk, result)`` pairs as each call
+    completes. Results are yielded in order of completion, not in the
+    order of ``ne_pks``.
+
+    Each call is isolated from the others. A call that raises an
+    exception is logged and yields ``False`` as the result, and a call
+    that runs longer than ``timeout`` is logged and yields ``None``,
+    matching the return values of a failed or timed out request. A
+    timed out call cannot be interrupted and keeps its worker busy
+    until the underlying request returns.
+
+    .. code:: python
+
+        for ne_pk, info in orch.for_each_appliance(
+            "get_appliance_info", ne_pks, concurrency=50
+        ):
+            print(ne_pk, info)
+
+        # additional keyword arguments are passed to every call
+        for ne_pk, result in orch.for_each_appliance(
+            orch.appliance_get_api, ne_pks, url="memory"
+        ):
+            print(ne_pk, result)
+
+    :param method: Name of an Orchestrator method, or the bound method
+        itself, taking the appliance nePk as its first argument, e.g.
+        ``get_appliance_info``
+    :type method: str or Callable
+    :param ne_pks: Network Primary Keys (nePk) of appliances, e.g.
+        ``["3.NE", "5.NE"]``
+    :type ne_pks: Iterable[str]
+    :param concurrency: Maximum number of calls running at once,
+        defaults to 10
+    :type concurrency: int, optional
+    :param timeout: Seconds each call may run before it is abandoned,
+        defaults to None for no limit beyond the request timeout
+    :type timeout: float, optional
+    :return: Generator of tuples of appliance nePk and the return value
+        of ``method`` for that appliance
+    :rtype: Iterator[tuple]
+    """
+    if isinstance(method, str):
+        method = getattr(self, method)
+    method_name = getattr(method, "__name__", str(method))
+    ne_pk_iter = iter(ne_pks)
+    pending = {}
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def submit_next() -> bool:
+        for ne_pk in ne_pk_iter:
+            start = []
+            future = executor.submit(_timed_call, start, method, ne_pk, kwargs)
+            pending[future] = (ne_pk, start)
+            return True
+        return False
+
+    try:
+        for _ in range(concurrency):
+            if not submit_next():
+                break
+
+        while pending:
+            wait_timeout = None
+            if timeout is not None:
+                # wake up for the earliest deadline of a running call,
+                # calls still queued behind abandoned ones have none
+                deadlines = [
+                    start[0] + timeout
+                    for _, start in pending.values()
+                    if start
+                ]
+                wait_timeout = (
+                    max(0, min(deadlines) - time.monotonic())
+                    if deadlines
+                    else timeout
+                )
+            done, _ = wait(
+                pending, timeout=wait_timeout, return_when=FIRST_COMPLETED
+            )
+
+            for future in done:
+                ne_pk, _ = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as ex:
+                    self.logger.error(
+                        "Exception {} when calling {} for {}. "
+                        "Traceback: {}".format(
+                            type(ex),
+                            method_name,
+                            ne_pk,
+                            "".join(traceback.format_tb(ex.__traceback__)),
+                        )
+                    )
+                    result = False
+                submit_next()
+                yield ne_pk, result
+
+            if timeout is not None:
+                now = time.monotonic()
+                for future, (ne_pk, start) in list(pending.items()):
+                    if start and now - start[0] >= timeout:
+                        pending.pop(future)
+                        self.logger.error(
+                            f"{method_name} for {ne_pk} | Call Timed Out "
+                            f"after {timeout} seconds"
+                        )
+                        submit_next()
+                        yield ne_pk, None
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
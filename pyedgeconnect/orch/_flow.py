@@ -2,6 +2,119 @@
 # (C) Copyright 2021 Hewlett Packard Enterprise Development LP.
 #
 # flow : ECOS current flows
+from __future__ import annotations
+
+from functools import partial
+
+from .._flows import FlowListParser, FlowTable
+
+
+def _flows_path(  # noqa: C901, silences flake8 complexity
+    ne_id: str,
+    ip1: str = None,
+    mask1: str = None,
+    port1: int = None,
+    ip2: str = None,
+    mask2: str = None,
+    port2: int = None,
+    ip_either_flag: bool = True,
+    port_either_flag: bool = True,
+    vrf1: str = None,
+    vrf2: str = None,
+    vrf_either: str = None,
+    application: str = None,
+    application_group: str = None,
+    protocol: str = None,
+    vlan: int = None,
+    dscp: str = None,
+    overlays: str = None,
+    transport: str = None,
+    services: str = None,
+    zone1: str = None,
+    zone2: str = None,
+    zone_either: str = None,
+    flow_category: str = "all",
+    edge_ha: bool = False,
+    built_in: bool = False,
+    uptime: str = None,
+    active_uptime_start: int = None,
+    active_uptime_end: int = None,
+    term_uptime_start: int = None,
+    term_uptime_end: int = None,
+    bytes_transferred: str = "total",
+    duration: str = None,
+    anytime_slow_flows: str = None,
+) -> str:
+    """API path of ``get_appliance_flows`` for query parameters"""
+    path = "/flow/{}/q?".format(ne_id)
+
+    if ip1 is not None:
+        path = path + "&ip1={}".format(ip1)
+    if mask1 is not None:
+        path = path + "&mask1={}".format(mask1)
+    if port1 is not None:
+        path = path + "&port1={}".format(port1)
+    if ip2 is not None:
+        path = path + "&ip2={}".format(ip2)
+    if mask2 is not None:
+        path = path + "&mask2={}".format(mask2)
+    if port2 is not None:
+        path = path + "&port2={}".format(port2)
+
+    path = path + "&ipEitherFlag={}".format(ip_either_flag)
+    path = path + "&portEitherFlag={}".format(port_either_flag)
+
+    if vrf1 is not None:
+        path = path + "&vrf1={}".format(vrf1)
+    if vrf2 is not None:
+        path = path + "&vrf2={}".format(vrf2)
+    if vrf_either is not None:
+        path = path + "&vrfEither={}".format(vrf_either)
+    if application is not None:
+        path = path + "&application={}".format(application)
+    if application_group is not None:
+        path = path + "&applicationGroup={}".format(application_group)
+    if protocol is not None:
+        path = path + "&protocol={}".format(protocol)
+    if vlan is not None:
+        path = path + "&vlan={}".format(vlan)
+    if dscp is not None:
+        path = path + "&dscp={}".format(dscp)
+    if overlays is not None:
+        path = path + "&overlays={}".format(overlays)
+    if transport is not None:
+        path = path + "&transport={}".format(transport)
+    if services is not None:
+        path = path + "&services={}".format(services)
+    if zone1 is not None:
+        path = path + "&zone1={}".format(zone1)
+    if zone2 is not None:
+        path = path + "&zone2={}".format(zone2)
+    if zone_either is not None:
+        path = path + "&zoneEither={}".format(zone_either)
+
+    path = path + "&filter={}".format(flow_category)
+    path = path + "&edgeHa={}".format(edge_ha)
+    path = path + "&builtIn={}".format(built_in)
+
+    if uptime is not None:
+        path = path + "&uptime={}".format(uptime)
+    if active_uptime_start is not None and active_uptime_end is not None:
+        path += f"&anyStartTime={active_uptime_start}&anyEndTime={active_uptime_end}"
+    if term_uptime_start is not None and term_uptime_end is not None:
+        path += (
+            f"&termStartTime={term_uptime_start}&termEndTime={term_uptime_end}"
+        )
+
+    path = path + "&bytes={}".format(bytes_transferred)
+    path = path + "&duration={}".format(duration)
+
+    if duration is not None:
+        path = path + "&duration={}".format(duration)
+    if anytime_slow_flows is not None:
+        path = path + "&anytimeSlowFlows={}".format(anytime_slow_flows)
+
+    return path
 
 
 def get_appliance_flows(  # noqa: C901, silences flake8 complexity
@@ -315,75 +428,44 @@ def get_appliance_flows(  # noqa: C901, silences flake8 complexity
             * [62] (`int`): Destination VRF ID
     :rtype: dict
     """
-    path = "/flow/{}/q?".format(ne_id)
-
-    if ip1 is not None:
-        path = path + "&ip1={}".format(ip1)
-    if mask1 is not None:
-        path = path + "&mask1={}".format(mask1)
-    if port1 is not None:
-        path = path + "&port1={}".format(port1)
-    if ip2 is not None:
-        path = path + "&ip2={}".format(ip2)
-    if mask2 is not None:
-        path = path + "&mask2={}".format(mask2)
-    if port2 is not None:
-        path = path + "&port2={}".format(port2)
-
-    path = path + "&ipEitherFlag={}".format(ip_either_flag)
-    path = path + "&portEitherFlag={}".format(port_either_flag)
-
-    if vrf1 is not None:
-        path = path + "&vrf1={}".format(vrf1)
-    if vrf2 is not None:
-        path = path + "&vrf2={}".format(vrf2)
-    if vrf_either is not None:
-        path = path + "&vrfEither={}".format(vrf_either)
-    if application is not None:
-        path = path + "&application={}".format(application)
-    if application_group is not None:
-        path = path + "&applicationGroup={}".format(application_group)
-    if protocol is not None:
-        path = path + "&protocol={}".format(protocol)
-    if vlan is not None:
-        path = path + "&vlan={}".format(vlan)
-    if dscp is not None:
-        path = path + "&dscp={}".format(dscp)
-    if overlays is not None:
-        path = path + "&overlays={}".format(overlays)
-    if transport is not None:
-        path = path + "&transport={}".format(transport)
-    if services is not None:
-        path = path + "&services={}".format(services)
-    if zone1 is not None:
-        path = path + "&zone1={}".format(zone1)
-    if zone2 is not None:
-        path = path + "&zone2={}".format(zone2)
-    if zone_either is not None:
-        path = path + "&zoneEither={}".format(zone_either)
-
-    path = path + "&filter={}".format(flow_category)
-    path = path + "&edgeHa={}".format(edge_ha)
-    path = path + "&builtIn={}".format(built_in)
-
-    if uptime is not None:
-        path = path + "&uptime={}".format(uptime)
-    if active_uptime_start is not None and active_uptime_end is not None:
-        path += f"&anyStartTime={active_uptime_start}&anyEndTime={active_uptime_end}"
-    if term_uptime_start is not None and term_uptime_end is not None:
-        path += (
-            f"&termStartTime={term_uptime_start}&termEndTime={term_uptime_end}"
+    return self._get(
+        _flows_path(
+            ne_id,
+            ip1=ip1,
+            mask1=mask1,
+            port1=port1,
+            ip2=ip2,
+            mask2=mask2,
+            port2=port2,
+            ip_either_flag=ip_either_flag,
+            port_either_flag=port_either_flag,
+            vrf1=vrf1,
+            vrf2=vrf2,
+            vrf_either=vrf_either,
+            application=application,
+            application_group=application_group,
+            protocol=protocol,
+            vlan=vlan,
+            dscp=dscp,
+            overlays=overlays,
+            transport=transport,
+            services=services,
+            zone1=zone1,
+            zone2=zone2,
+            zone_either=zone_either,
+            flow_category=flow_category,
+            edge_ha=edge_ha,
+            built_in=built_in,
+            uptime=uptime,
+            active_uptime_start=active_uptime_start,
+            active_uptime_end=active_uptime_end,
+            term_uptime_start=term_uptime_start,
+            term_uptime_end=term_uptime_end,
+            bytes_transferred=bytes_transferred,
+            duration=duration,
+            anytime_slow_flows=anytime_slow_flows,
         )
-
-    path = path + "&bytes={}".format(bytes_transferred)
-    path = path + "&duration={}".format(duration)
-
-    if duration is not None:
-        path = path + "&duration={}".format(duration)
-    if anytime_slow_flows is not None:
-        path = path + "&anytimeSlowFlows={}".format(anytime_slow_flows)
-
-    return self._get(path)
+    )
 
 
 def reset_flows(
@@ -584,3 +666,161 @@ def get_appliance_flow_details_verbose(
             ne_id, flow_id, flow_seq_num
         )
     )
+
+
+def get_appliance_flow_table(
+    self,
+    ne_id: str,
+    chunk_size: int = 65536,
+    **query,
+) -> FlowTable:
+    """Get flows from an appliance as a columnar :class:`FlowTable`.
+    The response body is parsed as it is received, one flow row at a
+    time, so memory stays flat even for appliances with 100,000+
+    flows.
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - flow
+          - GET
+          - /flow/{neId}/q
+
+    .. code:: python
+
+        table = orch.get_appliance_flow_table("3.NE", application="https")
+        for row in table.select(port2=443):
+            print(table.row(row)["ip2"])
+
+    :param ne_id: Appliance id in the format of integer.NE e.g. ``3.NE``
+    :type ne_id: str
+    :param chunk_size: Number of bytes per chunk read from the
+        response, defaults to 65536
+    :type chunk_size: int, optional
+    :param query: Query parameters of :func:`get_appliance_flows`,
+        e.g. ``application="https"`` or ``flow_category="active"``
+    :return: Returns False on failure, otherwise table of flows with
+        the flow counts of the response in ``summary``
+    :rtype: bool, FlowTable
+    """  # noqa RST304
+    download = self._download(
+        _flows_path(ne_id, **query), chunk_size=chunk_size
+    )
+    if not download:
+        return download
+    parser = FlowListParser(FlowTable(ne_id))
+    try:
+        for chunk in download:
+            parser.feed(chunk)
+        return parser.close()
+    except ValueError as ex:
+        download.response.close()
+        self.logger.error(f"Could not parse flows of {ne_id}: {ex}")
+        return False
+
+
+def iter_appliance_flow_details(
+    self,
+    ne_id: str,
+    flows,
+    rows: list = None,
+    verbose: bool = False,
+    concurrency: int = 8,
+    batch_size: int = 64,
+):
+    """Get details of many flows concurrently, yielding flows in
+    batches enriched with their details. At most ``batch_size`` flows
+    and their details are held in memory at a time.
+
+    .. note::
+        Only supported by the synchronous classes.
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - flow
+          - GET
+          - /flow/flowDetails/{neId}/q
+        * - flow
+          - GET
+          - /flow/flowDetails2/{neId}/q
+
+    .. code:: python
+
+        table = orch.get_appliance_flow_table("3.NE")
+        rows = table.select(application="https")
+        for batch in orch.iter_appliance_flow_details("3.NE", table, rows):
+            for flow in batch:
+                print(flow["flow_id"], flow["details"])
+
+    :param ne_id: Appliance id in the format of integer.NE e.g. ``3.NE``
+    :type ne_id: str
+    :param flows: Table from :func:`get_appliance_flow_table`, or
+        flow dictionaries with ``flow_id`` and ``flow_seq``, or tuples
+        of flow id and sequence number
+    :type flows: FlowTable or Iterable
+    :param rows: Row numbers of the table to get details of, defaults
+        to None for all rows, ignored unless ``flows`` is a table
+    :type rows: list, optional
+    :param verbose: Get verbose details, see
+        :func:`get_appliance_flow_details_verbose`, defaults to False
+    :type verbose: bool, optional
+    :param concurrency: Maximum number of requests at once, defaults
+        to 8
+    :type concurrency: int, optional
+    :param batch_size: Number of flows per yielded batch, defaults to
+        64
+    :type batch_size: int, optional
+    :return: Generator of lists of flow dictionaries, each with the
+        response of :func:`get_appliance_flow_details` in ``details``,
+        False if that request failed
+    :rtype: Iterator[list]
+    """  # noqa RST304
+    if isinstance(flows, FlowTable):
+        table = flows
+        flows = (
+            table.row(row)
+            for row in (range(len(table)) if rows is None else rows)
+        )
+    details = (
+        self.get_appliance_flow_details_verbose
+        if verbose
+        else self.get_appliance_flow_details
+    )
+    batch = []
+    for flow in flows:
+        if not isinstance(flow, dict):
+            flow_id, flow_seq = flow
+            flow = {"flow_id": flow_id, "flow_seq": flow_seq}
+        batch.append(flow)
+        if len(batch) == batch_size:
+            yield _flow_details_batch(self, details, ne_id, batch, concurrency)
+            batch = []
+    if batch:
+        yield _flow_details_batch(self, details, ne_id, batch, concurrency)
+
+
+def _flow_details_batch(
+    self,
+    details,
+    ne_id: str,
+    batch: list,
+    concurrency: int,
+) -> list:
+    """Add details to a batch of flows, requested concurrently"""
+    return self._gather(
+        [
+            partial(details, ne_id, flow["flow_id"], flow["flow_seq"])
+            for flow in batch
+        ],
+        concurrency,
+        lambda results: [
+            dict(flow, details=result) for flow, result in zip(batch, results)
+        ],
+    )
@@ -0,0 +1,119 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# inventory : Indexed snapshot of fleet-wide appliance inventory
+from __future__ import annotations
+
+from functools import partial
+
+from .._inventory import FleetInventory
+from .._results import request_failed
+
+
+def _build_inventory(
+    self,
+    results: list,
+    previous: FleetInventory = None,
+):
+    """Join responses of fleet-wide endpoints into an inventory
+
+    :param results: Responses of ``get_appliances`` and, without a
+        previous snapshot, of ``get_portal_licensed_appliances``,
+        ``get_all_interface_labels`` and ``get_all_overlays_config``
+    :type results: list
+    :param previous: Snapshot to reuse licenses, interface labels and
+        overlays from, defaults to None
+    :type previous: FleetInventory, optional
+    :return: Inventory snapshot, or the failed appliance list response
+    :rtype: FleetInventory
+    """
+    appliances = results[0]
+    if request_failed(appliances):
+        return appliances
+    if previous is not None:
+        licenses, interface_labels, overlays = previous._sources
+    else:
+        sources = []
+        names = ("licenses", "interface labels", "overlays")
+        for name, result in zip(names, results[1:]):
+            if request_failed(result):
+                # inventory is still useful without optional details
+                self.logger.warning(
+                    f"Inventory built without {name}, request failed"
+                )
+                result = None
+            sources.append(result)
+        licenses, interface_labels, overlays = sources
+    return FleetInventory(
+        appliances,
+        licenses,
+        interface_labels,
+        overlays,
+        orch=self,
+    )
+
+
+def inventory(
+    self,
+    previous: FleetInventory = None,
+    concurrency: int = 4,
+) -> FleetInventory:
+    """Retrieve appliances, Cloud Portal licenses, interface labels and
+    overlays concurrently and join them into an indexed snapshot of the
+    fleet. Lookups by nePk, hostname, serial, IP, site and group take
+    constant time regardless of the number of appliances.
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - appliance
+          - GET
+          - /appliance
+        * - license
+          - GET
+          - /license/portal/appliance
+        * - interfaceLabels
+          - GET
+          - /gms/interfaceLabels
+        * - overlays
+          - GET
+          - /gms/overlays/config
+
+    .. code:: python
+
+        fleet = orch.inventory()
+        appliance = fleet.by_hostname("branch-01")
+        for appliance in fleet.in_site("London"):
+            print(appliance["nePk"], appliance["license"])
+
+        # later, only request the appliance list again
+        fleet = fleet.refresh()
+
+    :param previous: Snapshot to reuse licenses, interface labels and
+        overlays from, so only the appliance list is requested, defaults
+        to None to request everything
+    :type previous: FleetInventory, optional
+    :param concurrency: Maximum number of requests at once, defaults
+        to 4
+    :type concurrency: int, optional
+    :return: Inventory snapshot, see
+        :class:`pyedgeconnect._inventory.FleetInventory`, or the failed
+        response of the appliance list. Licenses, interface labels and
+        overlays that fail to be retrieved are left empty.
+    :rtype: FleetInventory
+    """  # noqa RST304
+    calls = [self.get_appliances]
+    if previous is None:
+        calls += [
+            self.get_portal_licensed_appliances,
+            self.get_all_interface_labels,
+            self.get_all_overlays_config,
+        ]
+    return self._gather(
+        calls,
+        concurrency,
+        partial(_build_inventory, self, previous=previous),
+    )
@@ -69,6 +69,17 @@ def login(
         return_type="full_response",
     )
 
+    return _process_login_response(self, response)
+
+
+def _process_login_response(self, response) -> bool:
+    """Set CSRF token header from the cookies of a login response
+
+    :param response: Full response of login call
+    :type response: requests.Response
+    :return: Returns True/False based on successful login
+    :rtype: bool
+    """
     if response is not None and response.status_code == 200:
         # get and set X-XSRF-TOKEN
         for cookie in response.cookies:
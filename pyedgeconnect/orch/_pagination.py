@@ -0,0 +1,391 @@
+# MIT License
+# (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
+#
+# pagination : Iterate limit-capped endpoints page by page
+from __future__ import annotations
+
+from typing import Callable, Iterator, Union
+
+from .._columnar import decode_columnar
+
+
+def _audit_log_time(entry: dict) -> int:
+    """Time of an audit log entry in seconds since epoch
+
+    :param entry: Audit log entry
+    :type entry: dict
+    :return: Start time, or queued time if not started, in seconds
+    :rtype: int
+    """
+    return (entry.get("startTime") or entry.get("queuedTime") or 0) // 1000
+
+
+def _tunnel_count(response, ne_pk: str) -> int:
+    """Count tunnels in a tunnel details response
+
+    :param response: Tunnel details of a single appliance, either keyed
+        by tunnel or nested under the appliance nePk
+    :type response: dict or list
+    :param ne_pk: Network Primary Key (nePk) of appliance
+    :type ne_pk: str
+    :return: Number of tunnels in response
+    :rtype: int
+    """
+    if isinstance(response, dict) and list(response) == [ne_pk]:
+        response = response[ne_pk]
+    return len(response) if isinstance(response, (dict, list)) else 0
+
+
+def iter_timeseries_stats(
+    self,
+    method: Union[str, Callable],
+    start_time: int,
+    end_time: int,
+    page_size: int = 10000,
+    prefetch: bool = False,
+    timestamp_column: str = "TIMESTAMP",
+    columnar: bool = False,
+    **kwargs,
+) -> Iterator[dict]:
+    """Page through a timeseries stats method beyond its 10,000 row
+    ``limit``, yielding one response per page. Each page starts at the
+    latest timestamp of the previous page, and rows of that timestamp
+    are only yielded once complete, so every row is yielded once.
+
+    .. code:: python
+
+        for page in orch.iter_timeseries_stats(
+            "get_timeseries_stats_appliances",
+            start_time,
+            end_time,
+            granularity="minute",
+        ):
+            for ne_pk, rows in page["DATA"].items():
+                print(ne_pk, len(rows))
+
+    :param method: Name of an Orchestrator timeseries stats method, or
+        the bound method itself, accepting ``start_time``, ``end_time``
+        and ``limit``, e.g. ``get_timeseries_stats_appliances``
+    :type method: str or Callable
+    :param start_time: Long(Signed 64 bits) value of seconds since EPOCH
+        time indicating the starting time boundary of data time range
+    :type start_time: int
+    :param end_time: Long(Signed 64 bits) value of seconds since EPOCH
+        time indicating the ending time boundary of data time range
+    :type end_time: int
+    :param page_size: Rows requested per page, maximum is 10,000,
+        defaults to 10000
+    :type page_size: int, optional
+    :param prefetch: Request the next page while the current page is
+        consumed, defaults to False
+    :type prefetch: bool, optional
+    :param timestamp_column: Name of timestamp column in
+        ``COLUMN_DEF``, defaults to "TIMESTAMP"
+    :type timestamp_column: str, optional
+    :param columnar: ``True`` to decode ``DATA`` of each page into one
+        NumPy array per column, see ``columnar`` of the timeseries stats
+        methods, defaults to False
+    :type columnar: bool, optional
+    :param kwargs: Additional keyword arguments for ``method``, e.g.
+        ``ne_pk`` and ``granularity``, ``latest`` is not supported
+    :raises PageRequestError: If a page request fails, items of
+        earlier pages have been yielded
+    :return: Generator of responses with ``COLUMN_DEF`` and ``DATA``,
+        one per page
+    :rtype: Iterator[dict]
+    """
+    if isinstance(method, str):
+        method = getattr(self, method)
+
+    def fetch(window_start: int):
+        return method(
+            start_time=window_start,
+            end_time=end_time,
+            limit=page_size,
+            **kwargs,
+        )
+
+    def page_result(page: dict) -> dict:
+        return decode_columnar(page) if columnar else page
+
+    def advance(window_start: int, page: dict) -> tuple:
+        column_def = page.get("COLUMN_DEF") or []
+        data = page.get("DATA") or {}
+        if timestamp_column not in column_def:
+            return [page_result(page)], None
+        index = column_def.index(timestamp_column)
+        groups = data if isinstance(data, dict) else {None: data}
+        if sum(len(rows) for rows in groups.values()) < page_size:
+            return [page_result(page)], None
+
+        # rows are cut off within the earliest final timestamp of any
+        # appliance, rows from it onwards are requested again
+        cutoff = min(
+            max(row[index] for row in rows) for rows in groups.values() if rows
+        )
+        if cutoff <= window_start:
+            self.logger.warning(
+                "More than {} rows at timestamp {}, remaining rows of this "
+                "timestamp are skipped".format(page_size, cutoff)
+            )
+            next_start = cutoff + 1
+        else:
+            groups = {
+                key: [row for row in rows if row[index] < cutoff]
+                for key, rows in groups.items()
+            }
+            next_start = cutoff
+        page = {
+            "COLUMN_DEF": column_def,
+            "DATA": groups if isinstance(data, dict) else groups[None],
+        }
+        return [page_result(page)], (
+            next_start if next_start <= end_time else None
+        )
+
+    return self._paginate(fetch, start_time, advance, prefetch)
+
+
+def iter_app_definition_data(
+    self,
+    start: int = 0,
+    page_size: int = 10000,
+    prefetch: bool = False,
+) -> Iterator[dict]:
+    """Page through all application definition data for Address Map
+    from Cloud Portal, yielding one definition at a time
+
+    .. code:: python
+
+        for definition in orch.iter_app_definition_data(prefetch=True):
+            print(definition)
+
+    :param start: Offset of first definition, defaults to 0
+    :type start: int, optional
+    :param page_size: Definitions requested per page, maximum is
+        10,000, defaults to 10000
+    :type page_size: int, optional
+    :param prefetch: Request the next page while the current page is
+        consumed, defaults to False
+    :type prefetch: bool, optional
+    :raises PageRequestError: If a page request fails, items of
+        earlier pages have been yielded
+    :return: Generator of IP intelligence data dictionaries, see
+        :func:`get_app_definition_data`
+    :rtype: Iterator[dict]
+    """
+
+    def fetch(offset: int):
+        return self.get_app_definition_data(offset, page_size)
+
+    def advance(offset: int, page: list) -> tuple:
+        if len(page) < page_size:
+            return page, None
+        return page, offset + len(page)
+
+    return self._paginate(fetch, start, advance, prefetch)
+
+
+def iter_audit_log(
+    self,
+    start_time: int,
+    end_time: int,
+    page_size: int = 1000,
+    log_level: int = 1,
+    ne_pk: str = None,
+    username: str = None,
+    prefetch: bool = False,
+) -> Iterator[dict]:
+    """Page through all audit log entries in a time range, newest
+    first, yielding one entry at a time. Each page ends at the oldest
+    second of the previous page, entries already yielded from that
+    second are skipped.
+
+    .. code:: python
+
+        for entry in orch.iter_audit_log(start_time, end_time):
+            print(entry["name"], entry["user"])
+
+    :param start_time: Long(Signed 64 bits) value of seconds since EPOCH
+        time indicating the starting time boundary of data time range
+    :type start_time: int
+    :param end_time: Long(Signed 64 bits) value of seconds since EPOCH
+        time indicating the ending time boundary of data time range
+    :type end_time: int
+    :param page_size: Entries requested per page, defaults to 1000
+    :type page_size: int, optional
+    :param log_level: ``0`` for Debug, ``1`` for Info, ``2`` for Error.
+        Defaults to 1
+    :type log_level: int, optional
+    :param ne_pk: Filter for specific appliance with Network Primary Key
+        (nePk) of appliance, e.g. ``3.NE``
+    :type ne_pk: str, optional
+    :param username: Filter for specific user
+    :type username: str, optional
+    :param prefetch: Request the next page while the current page is
+        consumed, defaults to False
+    :type prefetch: bool, optional
+    :raises PageRequestError: If a page request fails, items of
+        earlier pages have been yielded
+    :return: Generator of audit log entries, see :func:`get_audit_log`
+    :rtype: Iterator[dict]
+    """
+
+    def fetch(cursor: tuple):
+        return self.get_audit_log(
+            start_time, cursor[0], page_size, log_level, ne_pk, username
+        )
+
+    def advance(cursor: tuple, page: list) -> tuple:
+        window_end, seen = cursor
+        entries = [entry for entry in page if entry.get("id") not in seen]
+        if len(page) < page_size:
+            return entries, None
+
+        oldest = min(_audit_log_time(entry) for entry in page)
+        if not entries:
+            self.logger.warning(
+                "More than {} audit log entries at {}, remaining entries "
+                "of this second are skipped".format(page_size, oldest)
+            )
+            next_cursor = (oldest - 1, frozenset())
+        else:
+            boundary = frozenset(
+                entry.get("id")
+                for entry in page
+                if _audit_log_time(entry) == oldest
+            )
+            if oldest == window_end:
+                boundary = boundary | seen
+            next_cursor = (oldest, boundary)
+        if next_cursor[0] < start_time:
+            next_cursor = None
+        return entries, next_cursor
+
+    return self._paginate(fetch, (end_time, frozenset()), advance, prefetch)
+
+
+def iter_physical_tunnel_details(
+    self,
+    ne_pk_list: list[str],
+    page_size: int = 1000,
+    prefetch: bool = False,
+    **kwargs,
+) -> Iterator[tuple]:
+    """Retrieve physical tunnel details one appliance at a time,
+    yielding ``(ne_pk, tunnels)`` pairs. ``/tunnels2/physical`` has no
+    offset to page with, so each request covers a single appliance and
+    an appliance with ``page_size`` or more tunnels is requested again
+    with double the limit until its response is complete.
+
+    .. code:: python
+
+        ne_pks = [device["nePk"] for device in orch.get_appliances()]
+        for ne_pk, tunnels in orch.iter_physical_tunnel_details(ne_pks):
+            print(ne_pk, tunnels)
+
+    :param ne_pk_list: List of one or more appliance Network Primary
+        Keys (nePk), e.g. ``["3.NE","5.NE"]``
+    :type ne_pk_list: list[str]
+    :param page_size: Tunnels first requested per appliance, defaults
+        to 1000
+    :type page_size: int, optional
+    :param prefetch: Request the next appliance while the current one
+        is consumed, defaults to False
+    :type prefetch: bool, optional
+    :param kwargs: Additional keyword arguments for
+        :func:`get_physical_tunnel_details_for_appliance`, e.g.
+        ``state`` or ``operational_status``
+    :raises PageRequestError: If a page request fails, items of
+        earlier pages have been yielded
+    :return: Generator of tuples of appliance nePk and dictionary of
+        tunnel details for that appliance
+    :rtype: Iterator[tuple]
+    """
+
+    def fetch(cursor: tuple):
+        return self.get_physical_tunnel_details_for_appliance(
+            ne_pk_list[cursor[0]], cursor[1], **kwargs
+        )
+
+    def advance(cursor: tuple, page: dict) -> tuple:
+        index, limit = cursor
+        ne_pk = ne_pk_list[index]
+        if _tunnel_count(page, ne_pk) >= limit:
+            return [], (index, limit * 2)
+        if index + 1 < len(ne_pk_list):
+            return [(ne_pk, page)], (index + 1, page_size)
+        return [(ne_pk, page)], None
+
+    first = (0, page_size) if ne_pk_list else None
+    return self._paginate(fetch, first, advance, prefetch)
+
+
+def iter_tunnels_between_appliances(
+    self,
+    ne_pk_list: list[str],
+    page_size: int = 1000,
+    matching_alias: str = None,
+    overlay_id: str = None,
+    state: str = None,
+    prefetch: bool = False,
+) -> Iterator[dict]:
+    """Retrieve tunnels of each appliance in ``ne_pk_list`` one
+    appliance at a time, yielding one tunnel at a time.
+    ``/tunnels2/getTunnelsBetweenAppliances`` has no offset to page
+    with, so each request covers a single appliance and an appliance
+    with ``page_size`` or more tunnels is requested again with double
+    the limit until its response is complete.
+
+    .. code:: python
+
+        for tunnel in orch.iter_tunnels_between_appliances(
+            ["3.NE", "5.NE"], state="Down"
+        ):
+            print(tunnel)
+
+    :param ne_pk_list: List of one or more appliance Network Primary
+        Keys (nePk), e.g. ``["3.NE","5.NE"]``
+    :type ne_pk_list: list[str]
+    :param page_size: Tunnels first requested per appliance, defaults
+        to 1000
+    :type page_size: int, optional
+    :param matching_alias: Match tunnel alias on text string provided,
+        defaults to None
+    :type matching_alias: str, optional
+    :param overlay_id: The overlay ID to match tunnels on. Value of
+        ``0`` for all physical tunnels, "all" for all bonded tunnels,
+        defaults to None
+    :type overlay_id: str, optional
+    :param state: Regular expression to match tunnel state,
+        e.g. ``Up`` ``Down``, defaults to None
+    :type state: str, optional
+    :param prefetch: Request the next appliance while the current one
+        is consumed, defaults to False
+    :type prefetch: bool, optional
+    :raises PageRequestError: If a page request fails, items of
+        earlier pages have been yielded
+    :return: Generator of tunnel details, see
+        :func:`get_tunnels_between_appliances`
+    :rtype: Iterator[dict]
+    """
+
+    def fetch(cursor: tuple):
+        return self.get_tunnels_between_appliances(
+            [ne_pk_list[cursor[0]]],
+            cursor[1],
+            matching_alias,
+            overlay_id,
+            state,
+        )
+
+    def advance(cursor: tuple, page: list) -> tuple:
+        index, limit = cursor
+        if len(page) >= limit:
+            return [], (index, limit * 2)
+        if index + 1 < len(ne_pk_list):
+            return page, (index + 1, page_size)
+        return page, None
+
+    first = (0, page_size) if ne_pk_list else None
+    return self._paginate(fetch, first, advance, prefetch)
@@ -2,6 +2,9 @@
 # (C) Copyright 2021 Hewlett Packard Enterprise Development LP.
 #
 # realtimeStats : ECOS per second statistics
+from __future__ import annotations
+
+from .._realtime import RealtimeStatsScheduler
 
 
 def get_realtime_stats(
@@ -112,3 +115,68 @@ def get_realtime_stats(
     data = {"type": stat_type, "name": stat_name, "filter": stat_filter}
 
     return self._post("/realtimeStats/{}".format(ne_pk), data=data)
+
+
+def realtime_stats_scheduler(
+    self,
+    subscriptions: list,
+    interval: float = 2.0,
+    concurrency: int = 8,
+) -> RealtimeStatsScheduler:
+    """Poll realtime stats of many appliances and stats concurrently,
+    each often enough to not miss any second, and stream the new
+    samples of each subscription. Overlapping samples of consecutive
+    polls are delivered once. See :func:`get_realtime_stats` for
+    accepted stat types, names and filters.
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - realtimeStats
+          - POST
+          - /realtimeStats/{nePk}
+
+    .. code:: python
+
+        scheduler = orch.realtime_stats_scheduler(
+            [
+                ("3.NE", "tunnel", "tunnel_1"),
+                ("5.NE", "interface", "wan0", "3"),
+            ]
+        )
+        for subscription, samples in scheduler.stream(duration=60):
+            for key, values in samples.items():
+                print(subscription[0], key, values)
+
+    .. note::
+        Polls run in threads with the methods of this instance, only
+        supported by the synchronous classes.
+
+    :param subscriptions: Tuples of ``(ne_pk, stat_type, stat_name)``
+        or ``(ne_pk, stat_type, stat_name, stat_filter)``
+    :type subscriptions: list
+    :param interval: Seconds between polls of a subscription, shortened
+        automatically when responses are slow, defaults to 2.0
+    :type interval: float, optional
+    :param concurrency: Maximum number of requests at once, defaults
+        to 8
+    :type concurrency: int, optional
+    :return: Scheduler, iterate
+        :meth:`~pyedgeconnect._realtime.RealtimeStatsScheduler.stream`
+        for tuples of subscription and dictionary of stat key to new
+        ``[timestamp, value]`` samples
+    :rtype: RealtimeStatsScheduler
+    """  # noqa RST304
+    subscriptions = [
+        tuple(subscription) + ("",) * (4 - len(subscription))
+        for subscription in subscriptions
+    ]
+    return RealtimeStatsScheduler(
+        lambda subscription: self.get_realtime_stats(*subscription),
+        subscriptions,
+        interval=interval,
+        concurrency=concurrency,
+    )
@@ -2,6 +2,14 @@
 # (C) Copyright 2021 Hewlett Packard Enterprise Development LP.
 #
 # spPortal : Silver Peak Portal related apis
+from __future__ import annotations
+
+import os
+
+from .._classification import ClassificationSync
+from .._geo import GeoLocator
+from .._ip_intelligence import IpIntelligenceIndex
+from .._results import PageRequestError
 
 
 def get_orchestrator_to_cloud_portal_status(
@@ -302,6 +310,57 @@ def geo_locate_multiple_ips(
     return self._post("/spPortal/internetDb/geoLocateIp", data=data)
 
 
+def geo_locator(
+    self,
+    batch_size: int = 1000,
+    concurrency: int = 4,
+    max_ranges: int = 100000,
+) -> GeoLocator:
+    """Create a geo-locator that caches results by the address range
+    Cloud Portal returns, so later addresses inside a known range are
+    answered without a request. Addresses not cached are de-duplicated
+    and requested in concurrent batches.
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - spPortal
+          - POST
+          - /spPortal/internetDb/geoLocateIp
+
+    .. code:: python
+
+        geo = orch.geo_locator()
+        locations = geo.locate(["8.8.8.8", "8.8.4.4", "1.1.1.1"])
+        locations["8.8.8.8"]["country"]
+
+    .. note::
+        Only supported by the synchronous classes.
+
+    :param batch_size: Maximum number of addresses per request,
+        defaults to 1000
+    :type batch_size: int, optional
+    :param concurrency: Maximum number of requests at once, defaults
+        to 4
+    :type concurrency: int, optional
+    :param max_ranges: Maximum number of cached ranges, defaults to
+        100000
+    :type max_ranges: int, optional
+    :return: Geo-locator, see
+        :class:`pyedgeconnect._geo.GeoLocator`
+    :rtype: GeoLocator
+    """  # noqa RST304
+    return GeoLocator(
+        self,
+        batch_size=batch_size,
+        concurrency=concurrency,
+        max_ranges=max_ranges,
+    )
+
+
 def get_update_time_for_app_definitions(self) -> dict:
     """Get last update time for application definition data for Address
     Map from Cloud Portal
@@ -722,6 +781,138 @@ def get_traffic_behavior_hash(self) -> dict:
     return self._get("/spPortal/trafficBehavior/info")
 
 
+def classification_sync(
+    self,
+    directory: str,
+    datasets: list = None,
+) -> ClassificationSync:
+    """Keep local copies of Cloud Portal classification datasets that
+    are only downloaded again when their hash changes. Reads are served
+    from the local copy, so most runs only request the hashes.
+
+    Datasets are ``app_groups``, ``compound``, ``dns``, ``flow``,
+    ``port_protocol``, ``saas`` and ``traffic_behavior``, as returned
+    by the matching ``get_`` methods, e.g.
+    :func:`get_dns_classification`.
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - spPortal
+          - GET
+          - /spPortal/{classification}/info
+        * - spPortal
+          - GET
+          - /spPortal/{classification}
+
+    .. code:: python
+
+        classification = orch.classification_sync("~/.cache/ec")
+        classification.sync()
+        dns = classification.get("dns")
+
+    .. note::
+        Only supported by the synchronous classes.
+
+    :param directory: Directory of the local copies, created if it does
+        not exist
+    :type directory: str
+    :param datasets: Names of datasets to sync, defaults to None for
+        all
+    :type datasets: list, optional
+    :return: Classification sync manager, call
+        :meth:`~pyedgeconnect._classification.ClassificationSync.sync`
+        to download changed datasets
+    :rtype: ClassificationSync
+    """  # noqa RST304
+    return ClassificationSync(
+        self, os.path.expanduser(directory), datasets=datasets
+    )
+
+
+def ip_intelligence_index(
+    self,
+    previous: IpIntelligenceIndex = None,
+    page_size: int = 10000,
+) -> IpIntelligenceIndex:
+    """Download the Cloud Portal address map and build a local index
+    of IPv4 ranges to application, organization and country. Lookups
+    are answered locally by binary search, unlike
+    :func:`search_app_definition_data` which takes a request per
+    address.
+
+    With a ``previous`` index only the address map update time is
+    requested, and the map is downloaded again only if it changed.
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - spPortal
+          - GET
+          - /spPortal/internetDb/ipIntelligence/info
+        * - spPortal
+          - GET
+          - /spPortal/internetDb/ipIntelligence
+
+    .. code:: python
+
+        address_map = orch.ip_intelligence_index()
+        address_map.lookup("8.8.8.8")["name"]
+
+        # later, downloads again only if Cloud Portal data changed
+        address_map = orch.ip_intelligence_index(previous=address_map)
+
+    .. note::
+        Only supported by the synchronous classes.
+
+    :param previous: Index to keep if the address map did not change,
+        defaults to None
+    :type previous: IpIntelligenceIndex, optional
+    :param page_size: Entries requested per page, maximum is 10,000,
+        defaults to 10000
+    :type page_size: int, optional
+    :return: Address map index, see
+        :class:`pyedgeconnect._ip_intelligence.IpIntelligenceIndex`,
+        ``previous`` if unchanged or if the download failed, None if
+        the download failed without a previous index
+    :rtype: IpIntelligenceIndex
+    :raises TypeError: If called with an asyncio client
+    """  # noqa RST304
+    self._require_sync("ip_intelligence_index")
+    info = self.get_update_time_for_app_definitions()
+    if isinstance(info, dict) and "lastUpdateTime" in info:
+        update_time = info["lastUpdateTime"]
+    else:
+        self.logger.warning("Could not get address map update time")
+        update_time = None
+    if (
+        previous is not None
+        and update_time is not None
+        and previous.update_time == update_time
+    ):
+        return previous
+
+    # keep the index complete or not at all, a failed page raises
+    # instead of ending the download early
+    try:
+        entries = list(
+            self.iter_app_definition_data(page_size=page_size, prefetch=True)
+        )
+    except PageRequestError as ex:
+        self.logger.warning(f"Could not download address map: {ex}")
+        return previous
+    if not entries:
+        self.logger.warning("Could not download address map, no entries")
+        return previous
+    return IpIntelligenceIndex(entries, update_time=update_time)
+
+
 def get_portal_registration_status(self) -> dict:
     """Get current Orchestrator Cloud Portal registration status
 
@@ -2,6 +2,10 @@
 # (C) Copyright 2022 Hewlett Packard Enterprise Development LP.
 #
 # subnets : ECOS subnet sharing
+from __future__ import annotations
+
+from .._results import request_failed
+from .._routes import RouteTable
 
 # Though not marked as deprecated in Swagger
 # /subnets/configured/{neId} only applies to appliances running ECOS
@@ -188,6 +192,47 @@ def get_appliance_subnets(
     return self._get(path)
 
 
+def appliance_route_table(
+    self,
+    ne_id: str,
+    cached: bool = True,
+) -> RouteTable:
+    """Retrieve an appliance's route table once and answer preferred
+    route queries locally by longest prefix match. Results have the
+    fields of ``appliance_find_preferred_route`` of the EdgeConnect
+    class, pass that method to ``verify`` to compare a sample.
+
+    .. list-table::
+        :header-rows: 1
+
+        * - Swagger Section
+          - Method
+          - Endpoint
+        * - subnets
+          - GET
+          - /subnets/{getCachedData}/{neId}
+
+    .. code:: python
+
+        routes = orch.appliance_route_table("3.NE")
+        routes.find_preferred_route("10.1.1.1")
+
+    :param ne_id: Appliance id in the format of integer.NE e.g. ``3.NE``
+    :type ne_id: str
+    :param cached: ``True`` uses the last known routes of Orchestrator,
+        ``False`` retrieves them from the appliance, defaults to True
+    :type cached: bool, optional
+    :return: Route table of the default segment, see
+        :class:`pyedgeconnect._routes.RouteTable`, or the failed
+        response
+    :rtype: RouteTable
+    """  # noqa RST304
+    subnets = self.get_appliance_subnets(ne_id, cached)
+    if not isinstance(subnets, dict) or request_failed(subnets):
+        return subnets
+    return RouteTable(subnets)
+
+
 def get_discovered_appliance_subnets(
     self,
     discovered_id: str,
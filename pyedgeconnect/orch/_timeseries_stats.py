@@ -82,6 +82,7 @@ def get_timeseries_stats_tunnel_single_appliance(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series tunnel statistics for single appliance
 
@@ -133,6 +134,10 @@ def get_timeseries_stats_tunnel_single_appliance(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -152,6 +157,8 @@ def get_timeseries_stats_tunnel_single_appliance(
     if latest is not None:
         path = path + "&latest={}".format(latest)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -166,6 +173,7 @@ def get_timeseries_stats_appliances(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series appliance statistics
 
@@ -223,6 +231,10 @@ def get_timeseries_stats_appliances(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -247,6 +259,8 @@ def get_timeseries_stats_appliances(
     if latest is not None:
         path = path + "&latest={}".format(latest)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -261,6 +275,7 @@ def get_timeseries_stats_appliances_ne_pk_list(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series appliance statistics for list of appliances
 
@@ -314,6 +329,10 @@ def get_timeseries_stats_appliances_ne_pk_list(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -337,6 +356,8 @@ def get_timeseries_stats_appliances_ne_pk_list(
 
     data = {"ids": ne_pk_list}
 
+    if columnar:
+        return self._columnar(self._post(path, data=data))
     return self._post(path, data=data)
 
 
@@ -351,6 +372,7 @@ def get_timeseries_stats_appliances_single_appliance(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """
     Get time series appliance statistics for single appliance
@@ -405,6 +427,10 @@ def get_timeseries_stats_appliances_single_appliance(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -426,6 +452,8 @@ def get_timeseries_stats_appliances_single_appliance(
     if latest is not None:
         path = path + "&latest={}".format(latest)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -441,6 +469,7 @@ def get_timeseries_stats_traffic_class(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series traffic class statistics
 
@@ -501,6 +530,10 @@ def get_timeseries_stats_traffic_class(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -526,6 +559,8 @@ def get_timeseries_stats_traffic_class(
     if latest is not None:
         path = path + "&latest={}".format(latest)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -541,6 +576,7 @@ def get_timeseries_stats_traffic_class_ne_pk_list(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series traffic class statistics for list of appliances
 
@@ -599,6 +635,10 @@ def get_timeseries_stats_traffic_class_ne_pk_list(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -623,6 +663,8 @@ def get_timeseries_stats_traffic_class_ne_pk_list(
 
     data = {"ids": ne_pk_list}
 
+    if columnar:
+        return self._columnar(self._post(path, data=data))
     return self._post(path, data=data)
 
 
@@ -638,6 +680,7 @@ def get_timeseries_stats_traffic_class_single_appliance(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series traffic class statistics for a single appliance
 
@@ -695,6 +738,10 @@ def get_timeseries_stats_traffic_class_single_appliance(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -717,6 +764,8 @@ def get_timeseries_stats_traffic_class_single_appliance(
     if latest is not None:
         path = path + "&latest={}".format(latest)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -732,6 +781,7 @@ def get_timeseries_stats_flow(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series flow statistics
 
@@ -794,6 +844,10 @@ def get_timeseries_stats_flow(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -820,6 +874,8 @@ def get_timeseries_stats_flow(
     if latest is not None:
         path = path + "&latest={}".format(latest)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -835,6 +891,7 @@ def get_timeseries_stats_flow_ne_pk_list(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series flow statistics for list of appliances
 
@@ -895,6 +952,10 @@ def get_timeseries_stats_flow_ne_pk_list(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -920,6 +981,8 @@ def get_timeseries_stats_flow_ne_pk_list(
 
     data = {"ids": ne_pk_list}
 
+    if columnar:
+        return self._columnar(self._post(path, data=data))
     return self._post(path, data=data)
 
 
@@ -935,6 +998,7 @@ def get_timeseries_stats_flow_single_appliance(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series flow statistics for single appliance
 
@@ -994,6 +1058,10 @@ def get_timeseries_stats_flow_single_appliance(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -1017,6 +1085,8 @@ def get_timeseries_stats_flow_single_appliance(
     if latest is not None:
         path = path + "&latest={}".format(latest)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -1032,6 +1102,7 @@ def get_timeseries_stats_dscp(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series dscp statistics
 
@@ -1092,6 +1163,10 @@ def get_timeseries_stats_dscp(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -1118,6 +1193,8 @@ def get_timeseries_stats_dscp(
     if latest is not None:
         path = path + "&latest={}".format(latest)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -1133,6 +1210,7 @@ def get_timeseries_stats_dscp_ne_pk_list(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series dscp statistics for list of appliances
 
@@ -1191,6 +1269,10 @@ def get_timeseries_stats_dscp_ne_pk_list(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -1216,6 +1298,8 @@ def get_timeseries_stats_dscp_ne_pk_list(
 
     data = {"ids": ne_pk_list}
 
+    if columnar:
+        return self._columnar(self._post(path, data=data))
     return self._post(path, data=data)
 
 
@@ -1231,6 +1315,7 @@ def get_timeseries_stats_dscp_single_appliance(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series dscp statistics for single appliance
 
@@ -1288,6 +1373,10 @@ def get_timeseries_stats_dscp_single_appliance(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -1311,6 +1400,8 @@ def get_timeseries_stats_dscp_single_appliance(
     if latest is not None:
         path = path + "&latest={}".format(latest)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -1324,6 +1415,7 @@ def get_timeseries_stats_shaper(
     group_pk: str = None,
     data_format: str = None,
     ip: bool = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series shaper statistics
 
@@ -1372,6 +1464,10 @@ def get_timeseries_stats_shaper(
         ``False`` or ``None`` to sort by appliance ID,
         defaults to None
     :type ip: bool, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -1394,6 +1490,8 @@ def get_timeseries_stats_shaper(
     if ip is not None:
         path = path + "&ip={}".format(ip)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -1407,6 +1505,7 @@ def get_timeseries_stats_shaper_ne_pk_list(
     direction: int,
     data_format: str = None,
     ip: bool = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series shaper statistics for list of appliances
 
@@ -1453,6 +1552,10 @@ def get_timeseries_stats_shaper_ne_pk_list(
         ``False`` or ``None`` to sort by appliance ID,
         defaults to None
     :type ip: bool, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -1474,6 +1577,8 @@ def get_timeseries_stats_shaper_ne_pk_list(
 
     data = {"ids": ne_pk_list}
 
+    if columnar:
+        return self._columnar(self._post(path, data=data))
     return self._post(path, data=data)
 
 
@@ -1483,6 +1588,7 @@ def get_timeseries_stats_internal_drops_single_appliance(
     start_time: int,
     end_time: int,
     granularity: str,
+    columnar: bool = False,
 ) -> dict:
     """Get time series internal drops statistics for single appliance
 
@@ -1516,6 +1622,10 @@ def get_timeseries_stats_internal_drops_single_appliance(
         minutely data, hourly data or daily data. Accepted values are
         ``minute``, ``hour``, and ``day``
     :type granularity: str
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -1526,6 +1636,8 @@ def get_timeseries_stats_internal_drops_single_appliance(
         )
     )
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -1539,6 +1651,7 @@ def get_timeseries_stats_drc(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series drc statistics
 
@@ -1591,6 +1704,10 @@ def get_timeseries_stats_drc(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -1612,6 +1729,8 @@ def get_timeseries_stats_drc(
     if latest is not None:
         path = path + "&latest={}".format(latest)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -1625,6 +1744,7 @@ def get_timeseries_stats_drc_ne_pk_list(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series drc statistics for list of appliances
 
@@ -1675,6 +1795,10 @@ def get_timeseries_stats_drc_ne_pk_list(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -1696,6 +1820,8 @@ def get_timeseries_stats_drc_ne_pk_list(
 
     data = {"ids": ne_pk_list}
 
+    if columnar:
+        return self._columnar(self._post(path, data=data))
     return self._post(path, data=data)
 
 
@@ -1710,6 +1836,7 @@ def get_timeseries_stats_drc_single_appliance(
     data_format: str = None,
     ip: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series drc statistics for single appliance
 
@@ -1762,6 +1889,10 @@ def get_timeseries_stats_drc_single_appliance(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -1783,6 +1914,8 @@ def get_timeseries_stats_drc_single_appliance(
     if latest is not None:
         path = path + "&latest={}".format(latest)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -1795,6 +1928,7 @@ def get_timeseries_stats_interface_single_appliance(
     traffic_type: str = "all_traffic",
     interface_name: str = None,
     limit: int = None,
+    columnar: bool = False,
 ) -> list:
     """Get time series interface statistics for single appliance
 
@@ -1840,6 +1974,10 @@ def get_timeseries_stats_interface_single_appliance(
         unspecified, defaults to 10,000 which is also the maximum
         allowed value, defaults to None
     :type limit: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns list of dictionaries
     :rtype: list
     """
@@ -1857,6 +1995,8 @@ def get_timeseries_stats_interface_single_appliance(
     if limit is not None:
         path = path + "&limit={}".format(limit)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -1872,6 +2012,7 @@ def get_timeseries_stats_interface_overlay_single_appliance(
     is_wan_side: bool = None,
     interface_name: str = None,
     limit: int = None,
+    columnar: bool = False,
 ) -> list:
     """Get time series interface overlay statistics for single appliance
 
@@ -1928,6 +2069,10 @@ def get_timeseries_stats_interface_overlay_single_appliance(
         unspecified, defaults to 10,000 which is also the maximum
         allowed value, defaults to None
     :type limit: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns list of dictionaries
     :rtype: list
     """
@@ -1951,6 +2096,8 @@ def get_timeseries_stats_interface_overlay_single_appliance(
     if limit is not None:
         path = path + "&limit={}".format(limit)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -1962,6 +2109,7 @@ def get_timeseries_stats_mos_single_appliance(
     granularity: str,
     tunnel_name: str,
     limit: int = None,
+    columnar: bool = False,
 ) -> list:
     """Get time series MOS statistics for single appliance
 
@@ -2002,6 +2150,10 @@ def get_timeseries_stats_mos_single_appliance(
         unspecified, defaults to 10,000 which is also the maximum
         allowed value, defaults to None
     :type limit: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns list of dictionaries
     :rtype: list
     """
@@ -2017,6 +2169,8 @@ def get_timeseries_stats_mos_single_appliance(
     if limit is not None:
         path = path + "&limit={}".format(limit)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -2029,6 +2183,7 @@ def get_timeseries_stats_application(
     data_format: str = None,
     total: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series application statistics
 
@@ -2075,6 +2230,10 @@ def get_timeseries_stats_application(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -2094,6 +2253,8 @@ def get_timeseries_stats_application(
     if latest is not None:
         path = path + "&latest={}".format(latest)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -2106,6 +2267,7 @@ def get_timeseries_stats_application_ne_pk_list(
     data_format: str = None,
     total: bool = None,
     latest: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series application statistics for list of appliances
 
@@ -2150,6 +2312,10 @@ def get_timeseries_stats_application_ne_pk_list(
         ``end_time`` but if ``latest`` is not ``None`` then it takes
         priority, defaults to None
     :type latest: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -2169,6 +2335,8 @@ def get_timeseries_stats_application_ne_pk_list(
 
     data = {"ids": ne_pk_list}
 
+    if columnar:
+        return self._columnar(self._post(path, data=data))
     return self._post(path, data=data)
 
 
@@ -2180,6 +2348,7 @@ def get_timeseries_stats_application_single_appliance(
     application: str,
     total: bool = None,
     data_format: str = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series application statistics for single appliance
 
@@ -2218,6 +2387,10 @@ def get_timeseries_stats_application_single_appliance(
     :param data_format: The only format other than JSON currently
         supported is CSV, accepted value is ``csv``, defaults to None
     :type data_format: str, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -2233,6 +2406,8 @@ def get_timeseries_stats_application_single_appliance(
     if data_format is not None:
         path = path + "&format={}".format(data_format)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -2243,6 +2418,7 @@ def get_timeseries_stats_boost_single_appliance(
     end_time: int,
     granularity: str,
     limit: int = None,
+    columnar: bool = False,
 ) -> list:
     """Get time series boost statistics for single appliance
 
@@ -2280,6 +2456,10 @@ def get_timeseries_stats_boost_single_appliance(
         unspecified, defaults to 10,000 which is also the maximum
         allowed value, defaults to None
     :type limit: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns list of dictionaries
     :rtype: list
     """
@@ -2293,6 +2473,8 @@ def get_timeseries_stats_boost_single_appliance(
     if limit is not None:
         path = path + "&limit={}".format(limit)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -2304,6 +2486,7 @@ def get_timeseries_stats_security_policy_single_appliance(
     granularity: str,
     from_zone: str,
     to_zone: str,
+    columnar: bool = False,
 ) -> dict:
     """Get time series security policy statistics for single appliance
 
@@ -2343,6 +2526,10 @@ def get_timeseries_stats_security_policy_single_appliance(
     :param to_zone:	Filter for data which go to the zone indicated by
         this zone internal ID
     :type to_zone: str
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -2353,6 +2540,8 @@ def get_timeseries_stats_security_policy_single_appliance(
             granularity, from_zone, to_zone
         )
     )
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
 
 
@@ -2365,6 +2554,7 @@ def get_timeseries_stats_jitter_single_appliance(
     tunnel_name: str,
     data_format: str = None,
     limit: int = None,
+    columnar: bool = False,
 ) -> dict:
     """Get time series security policy statistics for single appliance
 
@@ -2408,6 +2598,10 @@ def get_timeseries_stats_jitter_single_appliance(
         unspecified, defaults to 10,000 which is also the maximum
         allowed value, defaults to None
     :type limit: int, optional
+    :param columnar: ``True`` to decode ``DATA`` into one NumPy array
+        per column, keyed by column name, in place of lists of rows.
+        Requires ``numpy``, defaults to False
+    :type columnar: bool, optional
     :return: Returns nested dictionary
     :rtype: dict
     """
@@ -2423,4 +2617,6 @@ def get_timeseries_stats_jitter_single_appliance(
     if limit is not None:
         path = path + "&limit={}".format(limit)
 
+    if columnar:
+        return self._columnar(self._get(path))
     return self._get(path)
@@ -4,6 +4,10 @@
 # tunnelsConfiguration : ECOS tunnel configuration
 from __future__ import annotations
 
+from functools import partial
+
+from .._batch import DEFAULT_BATCH_SIZE, request_batches
+
 
 def get_total_tunnel_count(
     self,
@@ -513,7 +517,9 @@ def get_batch_appliance_tunnels_config(
     self,
     ne_pk: str,
     tunnel_id_list: list,
-) -> bool:
+    batch_size: int = None,
+    concurrency: int = None,
+) -> dict:
     """Get appliance tunnel configuration for specified tunnels
 
     .. note::
@@ -532,25 +538,42 @@ def get_batch_appliance_tunnels_config(
     :param ne_pk: Network Primary Key (nePk) of appliance, e.g. ``3.NE``
     :type ne_pk: str
     :param tunnel_id_list: List of tunnel ids to retrieive config
-        details for, e.g. ``["tunnel_12", "tunnel_13"]``
+        details for, e.g. ``["tunnel_12", "tunnel_13"]``, lists longer
+        than ``batch_size`` are split into batches requested
+        concurrently and merged into one dictionary
     :type tunnel_id: list
+    :param batch_size: Maximum number of tunnel ids per request,
+        defaults to None for 500
+    :type batch_size: int, optional
+    :param concurrency: Maximum number of batches requested at once,
+        defaults to None for 4
+    :type concurrency: int, optional
     :return: Returns dictionary of tunnel configuration details from
         specified tunnels
     :rtype: dict
     """
-    data = tunnel_id_list
+    path = "/tunnels/physical/config/getBatch/{}".format(ne_pk)
+
+    if len(tunnel_id_list) > (batch_size or DEFAULT_BATCH_SIZE):
+        # each batch is sent as a single request
+        return request_batches(
+            self,
+            partial(self._post, path),
+            tunnel_id_list,
+            batch_size,
+            concurrency,
+        )
 
-    return self._post(
-        "/tunnels/physical/config/getBatch/{}".format(ne_pk),
-        data=data,
-    )
+    return self._post(path, data=tunnel_id_list)
 
 
 def get_batch_appliance_tunnels_state(
     self,
     ne_pk: str,
     tunnel_id_list: list,
-) -> bool:
+    batch_size: int = None,
+    concurrency: int = None,
+) -> dict:
     """Get appliance tunnel state for specified tunnels
 
     .. note::
@@ -569,15 +592,30 @@ def get_batch_appliance_tunnels_state(
     :param ne_pk: Network Primary Key (nePk) of appliance, e.g. ``3.NE``
     :type ne_pk: str
     :param tunnel_id_list: List of tunnel ids to retrieive config
-        details for, e.g. ``["tunnel_12", "tunnel_13"]``
+        details for, e.g. ``["tunnel_12", "tunnel_13"]``, lists longer
+        than ``batch_size`` are split into batches requested
+        concurrently and merged into one dictionary
     :type tunnel_id: list
+    :param batch_size: Maximum number of tunnel ids per request,
+        defaults to None for 500
+    :type batch_size: int, optional
+    :param concurrency: Maximum number of batches requested at once,
+        defaults to None for 4
+    :type concurrency: int, optional
     :return: Returns dictionary of tunnel state details from specified
         tunnels
     :rtype: dict
     """
-    data = tunnel_id_list
+    path = "/tunnels/physical/state/getBatch/{}".format(ne_pk)
+
+    if len(tunnel_id_list) > (batch_size or DEFAULT_BATCH_SIZE):
+        # each batch is sent as a single request
+        return request_batches(
+            self,
+            partial(self._post, path),
+            tunnel_id_list,
+            batch_size,
+            concurrency,
+        )
 
-    return self._post(
-        "/tunnels/physical/state/getBatch/{}".format(ne_pk),
-        data=data,
-    )
+    return self._post(path, data=tunnel_id_list)
@@ -46,6 +46,9 @@ setup(
     zip_safe=False,
     install_requires=["requests"],
     extras_require={
+        "async": ["aiohttp"],
+        "numpy": ["numpy"],
+        "orjson": ["orjson"],
         "dev": [
             "black",
             "flake8",
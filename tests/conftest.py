@@ -0,0 +1,48 @@
+import pytest
+
+from pyedgeconnect import Orchestrator
+
+# Error dictionary returned by request methods for an unexpected HTTP
+# status code
+ERROR = {
+    "request": "GET",
+    "api_path": "/gms/rest/test",
+    "status_code": 500,
+    "text": "error",
+}
+
+
+def stub(*responses):
+    """Fake request method answering each call with the next of
+    ``responses``, repeating the last one; a callable response is called
+    with the arguments instead. The arguments of each call are recorded
+    in ``calls``
+    """
+    calls = []
+
+    def method(*args, **kwargs):
+        calls.append(args)
+        response = responses[min(len(calls), len(responses)) - 1]
+        return response(*args, **kwargs) if callable(response) else response
+
+    method.calls = calls
+    return method
+
+
+@pytest.fixture
+def stub_orchestrator():
+    """Build an Orchestrator with the named methods replaced, each
+    keyword gives a :func:`stub` or the response of a new one
+    """
+
+    def build(**methods):
+        orch = Orchestrator("127.0.0.1")
+        for name, method in methods.items():
+            setattr(
+                orch,
+                name,
+                method if hasattr(method, "calls") else stub(method),
+            )
+        return orch
+
+    return build
@@ -0,0 +1,167 @@
+import re
+
+import pytest
+
+from pyedgeconnect.orch._aggregate_stats import (
+    _merge_aggregate_stats,
+    _merge_rule,
+    _split_time_windows,
+)
+
+from .conftest import ERROR
+
+
+def test_split_time_windows_aligned_and_contiguous():
+    bounds = _split_time_windows(90, 4 * 3600, "hour", 4)
+    assert bounds[0][0] == 90
+    assert bounds[-1][1] == 4 * 3600
+    for (_, end), (start, _) in zip(bounds, bounds[1:]):
+        assert start == end + 1
+        assert start % 3600 == 0
+
+
+def test_split_time_windows_short_range():
+    assert _split_time_windows(0, 59, "minute", 10) == [(0, 59)]
+
+
+@pytest.mark.parametrize(
+    "key, rule",
+    [
+        ("MAX_LATENCY", "max"),
+        ("maxLatency", "max"),
+        ("LATENCY_MAX", "max"),
+        ("PEAK_BW", "max"),
+        ("MIN_LATENCY", "min"),
+        ("AVG_JITTER", "mean"),
+        ("LOSS_PCT_PRE_FEC", "mean"),
+        ("MOS", "mean"),
+        ("THROUGHPUT_BPS", "rate"),
+        ("tunnelId", "first"),
+        ("TOTAL_TX_BYTES", "sum"),
+        ("FLOWS_TERMINATED", "sum"),
+        ("ADMIN_DOWN_COUNT", "sum"),
+        ("PACKETS_MOSTLY", "sum"),
+        ("INVALID_PACKETS", "sum"),
+        ("PRE_LOSS", "sum"),
+        ("TIMESTAMP", "latest"),
+        ("STATE", "latest"),
+        ("OVERLAY", "latest"),
+    ],
+)
+def test_merge_rule(key, rule):
+    assert _merge_rule(key) == rule
+
+
+def test_merge_combines_by_rule():
+    results = [
+        {
+            "3.NE": {
+                "TOTAL_TX_BYTES": 100,
+                "MAX_LATENCY": 10,
+                "MIN_LATENCY": 4,
+                "AVG_LATENCY": 6,
+                "name": "old",
+            }
+        },
+        {
+            "3.NE": {
+                "TOTAL_TX_BYTES": 50,
+                "MAX_LATENCY": 20,
+                "MIN_LATENCY": 2,
+                "AVG_LATENCY": 12,
+                "name": "new",
+            }
+        },
+    ]
+    merged = _merge_aggregate_stats(results, [(0, 29), (30, 89)])
+    assert merged == {
+        "3.NE": {
+            "TOTAL_TX_BYTES": 150,
+            "MAX_LATENCY": 20,
+            "MIN_LATENCY": 2,
+            # weighted by bytes, the only counter
+            "AVG_LATENCY": 8,
+            "name": "new",
+        }
+    }
+
+
+def test_merge_recomputes_derived_from_counters():
+    results = [
+        {
+            "TIMESTAMP": 100,
+            "STATE": 2,
+            "RX_PKTS": 10,
+            "PRE_LOSS": 5,
+            "LOSS_PCT": 50.0,
+            "AVG_LATENCY": 100,
+            "THROUGHPUT_BPS": 1000,
+        },
+        {
+            "TIMESTAMP": 200,
+            "STATE": 1,
+            "RX_PKTS": 990,
+            "PRE_LOSS": 0,
+            "LOSS_PCT": 0.0,
+            "AVG_LATENCY": 10,
+            "THROUGHPUT_BPS": 4000,
+        },
+    ]
+    merged = _merge_aggregate_stats(results, [(0, 59), (60, 239)])
+    assert merged["RX_PKTS"] == 1000
+    assert merged["PRE_LOSS"] == 5
+    # 5 of 1000 packets lost, not the mean of 50% and 0%
+    assert merged["LOSS_PCT"] == pytest.approx(0.5)
+    assert merged["AVG_LATENCY"] == pytest.approx(10.9)
+    # rates weighted by duration of each sub-window
+    assert merged["THROUGHPUT_BPS"] == pytest.approx(3250)
+    assert merged["TIMESTAMP"] == 200
+    assert merged["STATE"] == 1
+
+
+def test_merge_mean_prefers_matching_packet_counter():
+    results = [
+        {"WAN_RX_PKTS": 1, "LAN_RX_PKTS": 9, "WAN_AVG_JITTER": 10},
+        {"WAN_RX_PKTS": 3, "LAN_RX_PKTS": 0, "WAN_AVG_JITTER": 2},
+    ]
+    merged = _merge_aggregate_stats(results, [(0, 9), (10, 19)])
+    assert merged["WAN_AVG_JITTER"] == pytest.approx(4)
+
+
+def test_merge_mean_without_counters_weighted_by_duration():
+    results = [{"AVG_LATENCY": 10}, {"AVG_LATENCY": 40}]
+    merged = _merge_aggregate_stats(results, [(0, 59), (60, 119)])
+    assert merged["AVG_LATENCY"] == pytest.approx(25)
+
+
+def test_merge_keeps_rows_of_every_window():
+    results = [{"rows": [1, 2], "ids": ["a"]}, {"rows": [3], "ids": ["a"]}]
+    merged = _merge_aggregate_stats(results, [(0, 9), (10, 19)])
+    assert merged == {"rows": [1, 2, 3], "ids": ["a"]}
+
+
+@pytest.mark.parametrize("failed", [ERROR, None, False])
+def test_merge_returns_failed_window(failed):
+    results = [{"3.NE": {"TOTAL_TX_BYTES": 1}}, failed]
+    assert _merge_aggregate_stats(results, [(0, 9), (10, 19)]) is failed
+
+
+def test_windows_requested_and_failure_not_merged(stub_orchestrator):
+    def get(path, **kwargs):
+        start = int(re.search(r"startTime=(\d+)", path).group(1))
+        if start >= 7200:
+            return ERROR
+        return {"tunnel_1": {"TOTAL_TX_BYTES": 1}}
+
+    orch = stub_orchestrator(_get=get)
+    result = orch.get_aggregate_stats_tunnels(
+        0, 4 * 3600 - 1, "hour", windows=4
+    )
+    assert len(orch._get.calls) == 4
+    assert result is ERROR
+
+
+def test_windows_merged_over_whole_range(stub_orchestrator):
+    orch = stub_orchestrator(_get={"tunnel_1": {"TOTAL_TX_BYTES": 1}})
+    result = orch.get_aggregate_stats_flows(0, 4 * 3600 - 1, "hour", windows=4)
+    assert result == {"tunnel_1": {"TOTAL_TX_BYTES": 4}}
@@ -0,0 +1,85 @@
+import pytest
+
+from pyedgeconnect import EdgeConnect
+from pyedgeconnect._alarm_feed import AlarmFeed
+
+from .conftest import ERROR, stub
+
+
+def alarm(sequence_id, **fields):
+    return {"sequenceId": sequence_id, "active": True, **fields}
+
+
+def appliance_alarm(ne_pk):
+    return {"applianceId": ne_pk, "sequenceId": 1, "timeOccurredInMills": 1000}
+
+
+def test_alarm_feed_is_abstract():
+    with pytest.raises(TypeError):
+        AlarmFeed()
+
+
+def test_appliance_feed_reports_changes():
+    ec = EdgeConnect("127.0.0.1")
+    ec.get_appliance_alarms = stub(
+        {"outstanding": [alarm(1), alarm(2)]},
+        {"outstanding": [alarm(1, acknowledged=True), alarm(3)]},
+        ERROR,
+        {"outstanding": [alarm(1, acknowledged=True), alarm(3)]},
+    )
+    feed = ec.alarm_feed()
+
+    delta = feed.poll()
+    assert delta["new"] == [alarm(1), alarm(2)]
+
+    delta = feed.poll()
+    assert delta == {
+        "new": [alarm(3)],
+        "changed": [alarm(1, acknowledged=True)],
+        "cleared": [alarm(2)],
+    }
+
+    # a failed request reports nothing and keeps the seen alarms
+    assert feed.poll() == {"new": [], "changed": [], "cleared": []}
+    assert feed.poll() == {"new": [], "changed": [], "cleared": []}
+    assert len(feed.alarms()) == 2
+
+
+def test_orchestrator_feed_requests_only_changed_appliances(
+    stub_orchestrator,
+):
+    counts = [
+        {"applianceId": "1.NE", "MAJOR": 1},
+        {"applianceId": "2.NE", "MAJOR": 1},
+    ]
+    active = {
+        "1.NE": [appliance_alarm("1.NE")],
+        "2.NE": [appliance_alarm("2.NE")],
+    }
+    requested = []
+
+    def get_alarms(ne_pk_list, view, start_time=None):
+        if start_time is None:
+            requested.append(ne_pk_list)
+        else:
+            assert start_time == 0
+        return [a for ne_pk in ne_pk_list for a in active[ne_pk]]
+
+    orch = stub_orchestrator(
+        get_alarm_count_all_appliances=counts,
+        get_alarms_from_appliances=get_alarms,
+    )
+    feed = orch.alarm_feed(orchestrator_alarms=False)
+
+    assert len(feed.poll()["new"]) == 2
+    assert requested == [["1.NE", "2.NE"]]
+
+    # unchanged counts and no new alarms, nothing requested in full
+    assert feed.poll() == {"new": [], "changed": [], "cleared": []}
+    assert requested == [["1.NE", "2.NE"]]
+
+    counts[1] = {"applianceId": "2.NE"}
+    active["2.NE"] = []
+    delta = feed.poll()
+    assert delta["cleared"] == [appliance_alarm("2.NE")]
+    assert requested[-1] == ["2.NE"]
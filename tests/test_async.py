@@ -0,0 +1,146 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pyedgeconnect import (
+    AsyncEdgeConnect,
+    AsyncOrchestrator,
+    EdgeConnect,
+    Orchestrator,
+)
+
+pytest.importorskip("aiohttp")
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def reply(self, status, document, cookie=None):
+        body = json.dumps(document).encode()
+        self.send_response(status)
+        if cookie is not None:
+            self.send_header("Set-Cookie", cookie)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if "/missing" in self.path:
+            self.reply(404, {"error": "missing"})
+            return
+        if "/slow" in self.path:
+            time.sleep(0.05)
+        self.reply(200, {"method": "GET", "path": self.path})
+
+    def do_POST(self):
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        cookie = None
+        if "/authentication/login" in self.path:
+            cookie = "orchCsrfToken=csrf-token; Path=/"
+        self.reply(
+            200,
+            {"method": "POST", "path": self.path, "data": json.loads(data)},
+            cookie,
+        )
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/gms/rest"
+    server.shutdown()
+    server.server_close()
+
+
+def run(server, coroutine_function, **kwargs):
+    async def main():
+        async with AsyncOrchestrator("127.0.0.1", **kwargs) as orch:
+            orch.url_prefix = server
+            return await coroutine_function(orch)
+
+    return asyncio.run(main())
+
+
+def test_methods_return_same_results_as_sync(server):
+    orch = Orchestrator("127.0.0.1")
+    orch.url_prefix = server
+
+    async def calls(async_orch):
+        return (
+            await async_orch.get_appliances(),
+            await async_orch._post("/appliance/3.NE", {"a": [1, 2]}),
+            await async_orch._get("/missing"),
+        )
+
+    results = run(server, calls)
+    assert results == (
+        orch.get_appliances(),
+        orch._post("/appliance/3.NE", {"a": [1, 2]}),
+        orch._get("/missing"),
+    )
+    assert results[1]["data"] == {"a": [1, 2]}
+    assert results[2]["status_code"] == 404
+
+
+def test_login_sets_csrf_header(server):
+    async def login(orch):
+        assert await orch.login("admin", "hunter2")
+        return orch.headers
+
+    assert run(server, login)["X-XSRF-TOKEN"] == "csrf-token"
+
+
+def test_concurrent_requests_report_saturation(server):
+    async def gather(orch):
+        results = await asyncio.gather(
+            *(orch._get(f"/slow/{number}") for number in range(20))
+        )
+        return results, orch.pool_stats()
+
+    results, stats = run(server, gather, max_connections=5)
+    assert [result["path"].split("?")[0] for result in results] == [
+        f"/gms/rest/slow/{number}" for number in range(20)
+    ]
+    (host_stats,) = stats.values()
+    assert host_stats["requests"] == 20
+    # 20 requests in flight at once wait for 5 connections
+    assert host_stats["peak_in_use"] > 5
+    assert host_stats["saturated"] >= 15
+    assert host_stats["maxsize"] == 5
+    assert host_stats["in_use"] == 0
+
+
+def test_connection_error_returns_false():
+    unreachable = "http://127.0.0.1:9/gms/rest"
+    assert run(unreachable, lambda orch: orch._get("/appliance")) is False
+
+
+@pytest.mark.parametrize(
+    "cls, sync_cls",
+    [(AsyncOrchestrator, Orchestrator), (AsyncEdgeConnect, EdgeConnect)],
+)
+def test_sync_only_helpers_hidden(cls, sync_cls):
+    client = cls("127.0.0.1")
+    assert cls._sync_only_methods
+    for name in cls._sync_only_methods:
+        assert callable(getattr(sync_cls("127.0.0.1"), name))
+        assert not hasattr(client, name)
+        with pytest.raises(AttributeError, match="synchronous classes"):
+            getattr(client, name)
+        with pytest.raises(AttributeError):
+            getattr(cls, name)
+        assert name not in dir(client)
+        assert name not in dir(cls)
+    # other methods of the same modules are still inherited
+    assert "get_appliance_alarm_descriptions" in dir(AsyncEdgeConnect)
+    with pytest.raises(TypeError, match="synchronous classes"):
+        client._require_sync("helper")
+    assert sync_cls("127.0.0.1")._require_sync("helper") is None
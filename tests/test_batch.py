@@ -0,0 +1,84 @@
+import threading
+
+import pytest
+
+from pyedgeconnect import EdgeConnect
+from pyedgeconnect._batch import merge_batches, split_batches
+
+from .conftest import ERROR
+
+
+def recording_post(fail_on=None):
+    """Fake _post recording each request and answering with ids"""
+    lock = threading.Lock()
+    calls = []
+
+    def post(api_path, data="", **kwargs):
+        with lock:
+            calls.append((api_path, list(data)))
+        if fail_on is not None and fail_on in data:
+            return ERROR
+        return {tunnel_id: {"id": tunnel_id} for tunnel_id in data}
+
+    post.calls = calls
+    return post
+
+
+def test_split_batches_even_sizes():
+    batches = split_batches(list(range(1001)), 500)
+    assert [len(batch) for batch in batches] == [334, 334, 333]
+    assert [item for batch in batches for item in batch] == list(range(1001))
+
+
+def test_split_batches_removes_duplicates():
+    assert split_batches([1, 2, 1, 3, 2], 2) == [[1, 2], [3]]
+    assert split_batches([], 10) == []
+
+
+def test_merge_batches():
+    assert merge_batches([{"a": 1}, {"b": 2}]) == {"a": 1, "b": 2}
+    assert merge_batches([{"a": 1}, ERROR, None]) is ERROR
+    assert merge_batches([{"a": 1}, None]) is None
+
+
+@pytest.mark.parametrize(
+    "batch_size, requests", [(None, 4), (1000, 2), (2000, 1)]
+)
+def test_orchestrator_batches_sent_once_each(
+    stub_orchestrator, batch_size, requests
+):
+    orch = stub_orchestrator(_post=recording_post())
+    ids = [f"tunnel_{number}" for number in range(2000)]
+    result = orch.get_batch_appliance_tunnels_state(
+        "3.NE", ids, batch_size=batch_size
+    )
+    assert len(orch._post.calls) == requests
+    assert all(
+        path == "/tunnels/physical/state/getBatch/3.NE"
+        for path, _ in orch._post.calls
+    )
+    assert sorted(result) == sorted(ids)
+
+
+def test_orchestrator_failed_batch_returned(stub_orchestrator):
+    orch = stub_orchestrator(_post=recording_post(fail_on="tunnel_1500"))
+    ids = [f"tunnel_{number}" for number in range(2000)]
+    result = orch.get_batch_appliance_tunnels_config("3.NE", ids)
+    assert result is ERROR
+
+
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        ("get_appliance_multiple_tunnels_config", "/getMultipleTunnels"),
+        ("get_appliance_multiple_tunnels_state", "/getStateMultipleTunnels"),
+    ],
+)
+def test_edgeconnect_batches_sent_once_each(method, path):
+    ec = EdgeConnect("127.0.0.1")
+    ec._post = recording_post()
+    ids = [f"tunnel_{number}" for number in range(2000)]
+    result = getattr(ec, method)(ids, batch_size=1000, concurrency=2)
+    assert [len(data) for _, data in ec._post.calls] == [1000, 1000]
+    assert {api_path for api_path, _ in ec._post.calls} == {path}
+    assert sorted(result) == sorted(ids)
@@ -0,0 +1,142 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from pyedgeconnect import Orchestrator
+from pyedgeconnect._cache import ResponseCache
+
+
+def response(body=b"{}"):
+    result = requests.Response()
+    result.status_code = 200
+    result._content = body
+    result.headers["Content-Type"] = "application/json"
+    return result
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("pyedgeconnect._cache.time.monotonic", lambda: now[0])
+    return now
+
+
+def test_expired_entry_is_a_miss(clock):
+    cache = ResponseCache(ttl=10)
+    cache.put("/appliance", response())
+    assert cache.get("/appliance") is not None
+    clock[0] += 11
+    assert cache.get("/appliance") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_ttl_by_path_pattern():
+    cache = ResponseCache(ttl={"/appliance": 300, "/template/groups*": 5})
+    assert cache.ttl_for("/appliance?nePk=3.NE") == 300
+    assert cache.ttl_for("/template/groups/default") == 5
+    assert cache.ttl_for("/alarm") is None
+    cache.put("/alarm", response())
+    assert cache.get("/alarm") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_evicted():
+    cache = ResponseCache(ttl=60, maxsize=2)
+    cache.put("/a", response())
+    cache.put("/b", response())
+    cache.get("/a")
+    cache.put("/c", response())
+    assert cache.get("/b") is None
+    assert cache.get("/a") is not None
+    assert cache.get("/c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_overlapping_paths():
+    cache = ResponseCache(ttl=60)
+    for path in ["/appliance", "/appliance/3.NE/info", "/appliances", "/z"]:
+        cache.put(path, response())
+    assert cache.invalidate("/appliance/3.NE?force=true") == 2
+    assert cache.get("/appliances") is not None
+    assert cache.get("/z") is not None
+    assert cache.get("/appliance") is None
+
+
+def test_put_skipped_after_overlapping_invalidation():
+    cache = ResponseCache(ttl=60)
+    generation = cache.generation
+    cache.invalidate("/other")
+    cache.put("/appliance", response(), generation)
+    assert cache.get("/appliance") is not None
+
+    generation = cache.generation
+    cache.invalidate("/appliance/3.NE")
+    cache.put("/appliance", response(), generation)
+    assert cache.get("/appliance") is None
+
+
+def test_hit_returns_copy():
+    cache = ResponseCache(ttl=60)
+    cache.put("/appliance", response(b'{"a": 1}'))
+    first = cache.get("/appliance")
+    first.headers["X-Changed"] = "1"
+    first.status_code = 500
+    second = cache.get("/appliance")
+    assert second is not first
+    assert "X-Changed" not in second.headers
+    assert second.status_code == 200
+    assert second.json() == {"a": 1}
+
+
+class Handler(BaseHTTPRequestHandler):
+    gets = 0
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self):
+        body = json.dumps({"path": self.path, "count": Handler.gets})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def do_GET(self):
+        Handler.gets += 1
+        self.reply()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.reply()
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/gms/rest"
+    server.shutdown()
+    server.server_close()
+
+
+def test_orchestrator_get_cached_until_write(server):
+    orch = Orchestrator("127.0.0.1", cache_ttl=60)
+    orch.url_prefix = server
+    first = orch._get("/appliance")
+    assert orch._get("/appliance") == first
+    full = orch._get("/appliance", return_type="full_response")
+    full.headers["X-Changed"] = "1"
+    again = orch._get("/appliance", return_type="full_response")
+    assert again is not full
+    assert "X-Changed" not in again.headers
+
+    orch._post("/appliance/3.NE", data={})
+    assert orch._get("/appliance")["count"] > first["count"]
+    assert orch.cache.stats()["invalidations"] == 1
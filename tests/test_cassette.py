@@ -0,0 +1,110 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pyedgeconnect import Orchestrator
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Set-Cookie", "JSESSIONID=session-secret; Path=/")
+        self.send_header(
+            "Set-Cookie", "orchCsrfToken=csrf-secret; Path=/; Secure"
+        )
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/gms/rest"
+    server.shutdown()
+    server.server_close()
+
+
+def orchestrator(url_prefix):
+    orch = Orchestrator("127.0.0.1")
+    orch.url_prefix = url_prefix
+    return orch
+
+
+def record(url_prefix, path, **kwargs):
+    orch = orchestrator(url_prefix)
+    orch.use_cassette(str(path), mode="record", **kwargs)
+    assert orch.login("admin", "hunter2")
+    assert orch._get("/gmsserver/hello") == {
+        "path": "/gms/rest/gmsserver/hello?source=menu_rest_apis_id"
+    }
+    orch.eject_cassette()
+
+
+def test_replayed_login_sets_csrf_header(server, tmp_path):
+    path = tmp_path / "login.jsonl.gz"
+    record(server, path)
+
+    # nothing listens on this address, every answer is replayed
+    replay = orchestrator("http://127.0.0.1:9/gms/rest")
+    cassette = replay.use_cassette(str(path))
+    assert replay.login("admin", "hunter2")
+    assert replay.headers["X-XSRF-TOKEN"] == "REDACTED"
+    assert replay.session.cookies.get("JSESSIONID") == "REDACTED"
+    assert replay._get("/gmsserver/hello")["path"].startswith("/gms/rest")
+    assert cassette.stats()["replayed"] == 2
+    assert cassette.stats()["missed"] == 0
+
+
+def test_recording_redacts_secrets(server, tmp_path):
+    path = tmp_path / "login.jsonl.gz"
+    record(server, path)
+    with gzip.open(path, "rt") as file:
+        text = file.read()
+    assert "session-secret" not in text
+    assert "csrf-secret" not in text
+    login = json.loads(text.splitlines()[0])
+    assert login["body_sha1"] == ""
+    assert login["set_cookies"] == [
+        "JSESSIONID=REDACTED; Path=/",
+        "orchCsrfToken=REDACTED; Path=/; Secure",
+    ]
+
+
+def test_recording_without_redaction(server, tmp_path):
+    path = tmp_path / "login.jsonl.gz"
+    record(server, path, redact=False)
+    replay = orchestrator("http://127.0.0.1:9/gms/rest")
+    replay.use_cassette(str(path))
+    assert replay.login("admin", "hunter2")
+    assert replay.headers["X-XSRF-TOKEN"] == "csrf-secret"
+
+
+def test_unrecorded_request_and_injected_errors(server, tmp_path):
+    path = tmp_path / "login.jsonl.gz"
+    record(server, path)
+    replay = orchestrator("http://127.0.0.1:9/gms/rest")
+    cassette = replay.use_cassette(str(path), error_rate=1.0, seed=1)
+    assert replay._get("/gmsserver/hello")["status_code"] == 503
+    cassette.error_rate = 0.0
+    assert replay._get("/not/recorded")["status_code"] == 404
+    assert cassette.stats()["injected_errors"] == 1
+    assert cassette.stats()["missed"] == 1
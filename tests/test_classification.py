@@ -0,0 +1,117 @@
+import pytest
+
+from pyedgeconnect import Orchestrator
+from pyedgeconnect._classification import ClassificationSync
+
+from .conftest import ERROR
+
+
+@pytest.fixture
+def fake_orchestrator(stub_orchestrator):
+    """Orchestrator answering with the current ``hashes`` and ``data``
+    of each dataset
+    """
+
+    def build(hashes, data):
+        def get_hash(name):
+            value = hashes[name]
+            return value if value is ERROR else {"hashVal": value}
+
+        return stub_orchestrator(
+            get_dns_classification_hash=lambda: get_hash("dns"),
+            get_dns_classification=lambda: data["dns"],
+            get_saas_classification_hash=lambda: get_hash("saas"),
+            get_saas_classification=lambda: data["saas"],
+        )
+
+    return build
+
+
+def calls(orch):
+    """Number of requests per stubbed method since the last ``clear``"""
+    return {
+        name: len(getattr(orch, name).calls)
+        for name in (
+            "get_dns_classification_hash",
+            "get_dns_classification",
+            "get_saas_classification_hash",
+            "get_saas_classification",
+        )
+    }
+
+
+def clear(orch):
+    for name in calls(orch):
+        getattr(orch, name).calls.clear()
+
+
+def test_downloads_only_changed_datasets(tmp_path, fake_orchestrator):
+    hashes = {"dns": "a1", "saas": "b1"}
+    data = {"dns": [{"domain": "*.example.com"}], "saas": {"1": "ünïcode"}}
+    orch = fake_orchestrator(hashes, data)
+    sync = orch.classification_sync(str(tmp_path), ["dns", "saas"])
+    assert sync.get("dns") is None
+
+    assert sync.sync() == {"dns": "updated", "saas": "updated"}
+    assert sync.hash("dns") == "a1"
+    assert sync.get("saas") == {"1": "ünïcode"}
+
+    clear(orch)
+    hashes["saas"] = "b2"
+    data["saas"] = {"2": "new"}
+    assert sync.sync() == {"dns": "unchanged", "saas": "updated"}
+    assert calls(orch) == {
+        "get_dns_classification_hash": 1,
+        "get_dns_classification": 0,
+        "get_saas_classification_hash": 1,
+        "get_saas_classification": 1,
+    }
+    assert sync.get("saas") == {"2": "new"}
+
+    clear(orch)
+    assert sync.sync(["dns"], force=True) == {"dns": "updated"}
+    assert sum(calls(orch).values()) == 2
+    assert orch.get_dns_classification.calls == [()]
+
+
+def test_local_copy_survives_restart(tmp_path, fake_orchestrator):
+    hashes = {"dns": "a1", "saas": "b1"}
+    data = {"dns": [1, 2, 3], "saas": {}}
+    orch = fake_orchestrator(hashes, data)
+    ClassificationSync(orch, str(tmp_path), ["dns"]).sync()
+
+    clear(orch)
+    sync = ClassificationSync(orch, str(tmp_path), ["dns"])
+    assert sync.get("dns") == [1, 2, 3]
+    assert sum(calls(orch).values()) == 0
+    assert sync.sync() == {"dns": "unchanged"}
+    assert sum(calls(orch).values()) == 1
+    assert orch.get_dns_classification_hash.calls == [()]
+
+
+def test_failed_requests_keep_local_copy(tmp_path, fake_orchestrator):
+    hashes = {"dns": "a1", "saas": ERROR}
+    data = {"dns": [1], "saas": {}}
+    orch = fake_orchestrator(hashes, data)
+    sync = ClassificationSync(orch, str(tmp_path), ["dns", "saas"])
+    assert sync.sync() == {"dns": "updated", "saas": "failed"}
+
+    hashes["dns"] = "a2"
+    data["dns"] = False
+    assert sync.sync(["dns"]) == {"dns": "failed"}
+    assert sync.get("dns") == [1]
+    assert sync.hash("dns") == "a1"
+
+
+def test_corrupt_files_ignored(tmp_path, fake_orchestrator):
+    orch = fake_orchestrator({"dns": "a1"}, {"dns": [1]})
+    ClassificationSync(orch, str(tmp_path), ["dns"]).sync()
+    (tmp_path / "dns.json.gz").write_bytes(b"not gzip")
+    assert ClassificationSync(orch, str(tmp_path), ["dns"]).get("dns") is None
+    (tmp_path / "index.json").write_text("{not json")
+    assert ClassificationSync(orch, str(tmp_path)).index == {}
+
+
+def test_unknown_dataset(tmp_path):
+    with pytest.raises(ValueError):
+        ClassificationSync(Orchestrator("127.0.0.1"), str(tmp_path), ["x"])
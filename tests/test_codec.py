@@ -0,0 +1,138 @@
+import asyncio
+import json
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pyedgeconnect import EdgeConnect, Orchestrator
+from pyedgeconnect._codec import JsonCodec, OrjsonCodec, get_codec
+
+DOCUMENT = {"name": "ünïcode ✓", "ids": [1, 2.5, None, True], "nested": {}}
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        # echo request body and content type back as the response
+        body = json.dumps(
+            {
+                "body": json.loads(data) if data else None,
+                "raw": data.decode(),
+                "type": self.headers.get("Content-Type"),
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_PUT = do_POST
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/gms/rest"
+    server.shutdown()
+    server.server_close()
+
+
+class RecordingCodec(JsonCodec):
+    name = "recording"
+
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append("dumps")
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.calls.append(("loads", type(data)))
+        return super().loads(data)
+
+
+def test_json_codec_round_trip():
+    codec = JsonCodec()
+    data = codec.dumps(DOCUMENT)
+    assert isinstance(data, bytes)
+    assert codec.loads(data) == DOCUMENT
+    assert codec.loads(data.decode()) == DOCUMENT
+
+
+def test_orjson_codec_matches_json():
+    pytest.importorskip("orjson")
+    codec = OrjsonCodec()
+    assert codec.loads(codec.dumps(DOCUMENT)) == DOCUMENT
+    assert codec.loads(JsonCodec().dumps(DOCUMENT)) == DOCUMENT
+    assert codec.loads(codec.dumps({1: "a"})) == {"1": "a"}
+
+
+def test_orjson_codec_falls_back_to_json():
+    pytest.importorskip("orjson")
+    codec = OrjsonCodec()
+    assert codec.loads(codec.dumps({"big": 2**70})) == {"big": 2**70}
+    assert math.isnan(codec.loads(b'{"value": NaN}')["value"])
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_get_codec():
+    assert isinstance(get_codec("json"), JsonCodec)
+    assert not isinstance(get_codec("json"), OrjsonCodec)
+    custom = RecordingCodec()
+    assert get_codec(custom) is custom
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        assert get_codec().name == "json"
+        with pytest.raises(ImportError):
+            get_codec("orjson")
+    else:
+        assert get_codec().name == "orjson"
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+@pytest.mark.parametrize("cls", [Orchestrator, EdgeConnect])
+def test_client_uses_codec(server, cls):
+    codec = RecordingCodec()
+    client = cls("127.0.0.1", json_codec=codec)
+    client.url_prefix = server
+    result = client._post("/echo", DOCUMENT)
+    assert result["body"] == DOCUMENT
+    assert result["type"] == "application/json"
+    # response bytes are decoded directly
+    assert codec.calls == ["dumps", ("loads", bytes)]
+
+
+@pytest.mark.parametrize("cls", [Orchestrator, EdgeConnect])
+def test_empty_bodies_match_requests(server, cls):
+    client = cls("127.0.0.1")
+    client.url_prefix = server
+    # same bodies as requests sends for json="" and json=None
+    for send in (client._post, client._put):
+        assert send("/echo")["raw"] == '""'
+        assert send("/echo", None) == {"body": None, "raw": "", "type": None}
+
+
+def test_async_empty_bodies_match_requests(server):
+    pytest.importorskip("aiohttp")
+    from pyedgeconnect import AsyncOrchestrator
+
+    async def main():
+        async with AsyncOrchestrator("127.0.0.1") as orch:
+            orch.url_prefix = server
+            return await orch._post("/echo"), await orch._put("/echo", None)
+
+    default, empty = asyncio.run(main())
+    assert default["raw"] == '""'
+    assert empty["raw"] == ""
@@ -0,0 +1,54 @@
+import pytest
+
+from pyedgeconnect._columnar import decode_columnar
+
+from .conftest import ERROR
+
+np = pytest.importorskip("numpy")
+
+
+def test_numeric_columns_share_one_block():
+    result = decode_columnar(
+        {
+            "COLUMN_DEF": ["TIMESTAMP", "LAN_TX_BYTES"],
+            "DATA": {"3.NE": [[1650000000, 10], [1650000060, 12]]},
+        }
+    )
+    columns = result["3.NE"]
+    assert columns["TIMESTAMP"].tolist() == [1650000000, 1650000060]
+    assert columns["LAN_TX_BYTES"].tolist() == [10, 12]
+    assert columns["TIMESTAMP"].base is columns["LAN_TX_BYTES"].base
+
+
+def test_mixed_and_missing_values():
+    result = decode_columnar(
+        {
+            "COLUMN_DEF": ["TIMESTAMP", "NAME", "LATENCY"],
+            "DATA": [[1, "wan0", 5], [2, "wan1", None]],
+        }
+    )
+    assert result["NAME"].tolist() == ["wan0", "wan1"]
+    assert result["TIMESTAMP"].tolist() == [1, 2]
+    assert result["LATENCY"][0] == 5
+    assert np.isnan(result["LATENCY"][1])
+
+
+def test_empty_rows_and_other_responses():
+    result = decode_columnar({"COLUMN_DEF": ["A", "B"], "DATA": {"1.NE": []}})
+    assert result["1.NE"]["A"].size == 0
+    assert decode_columnar(ERROR) is ERROR
+    assert decode_columnar(False) is False
+
+
+def test_orchestrator_columnar_timeseries(stub_orchestrator):
+    orch = stub_orchestrator(
+        _get={
+            "COLUMN_DEF": ["TIMESTAMP", "WAN_TX_BYTES"],
+            "DATA": {"3.NE": [[0, 1], [60, 2]], "4.NE": [[0, 3]]},
+        }
+    )
+    result = orch.get_timeseries_stats_appliances(
+        0, 3600, "minute", columnar=True
+    )
+    assert result["3.NE"]["WAN_TX_BYTES"].sum() == 3
+    assert result["4.NE"]["TIMESTAMP"].tolist() == [0]
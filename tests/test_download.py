@@ -0,0 +1,96 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pyedgeconnect import Orchestrator
+
+BODY = bytes(range(256)) * 1000
+
+
+class Handler(BaseHTTPRequestHandler):
+    # requests per path, the first request of each path is refused
+    seen = {}
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        with Handler.lock:
+            count = Handler.seen[self.path] = (
+                Handler.seen.get(self.path, 0) + 1
+            )
+        if count == 1:
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "4")
+            self.end_headers()
+            self.wfile.write(b"busy")
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/gms/rest"
+    server.shutdown()
+    server.server_close()
+
+
+def check_metrics(orch, api_path):
+    statuses = {
+        entry["status"]: entry
+        for entry in orch.metrics()
+        if entry["path"] == api_path
+    }
+    assert statuses["503"]["count"] == 1
+    assert statuses["200"]["count"] == 1
+    assert statuses["200"]["response_bytes"] == len(BODY)
+
+
+def test_download_retried_and_recorded(server, tmp_path):
+    orch = Orchestrator("127.0.0.1", retries=2, collect_metrics=True)
+    orch.url_prefix = server
+    stats = orch._download("/debugFiles/sync", tmp_path / "file")
+    assert stats["bytes"] == len(BODY)
+    assert (tmp_path / "file").read_bytes() == BODY
+    check_metrics(orch, "/debugFiles/sync")
+
+
+def test_async_download_retried_and_recorded(server):
+    asyncio = pytest.importorskip("asyncio")
+    pytest.importorskip("aiohttp")
+    from pyedgeconnect import AsyncOrchestrator
+
+    async def run():
+        async with AsyncOrchestrator(
+            "127.0.0.1", retries=2, collect_metrics=True
+        ) as orch:
+            orch.url_prefix = server
+            download = await orch._download("/debugFiles/async")
+            chunks = [chunk async for chunk in download]
+            check_metrics(orch, "/debugFiles/async")
+            return b"".join(chunks)
+
+    assert asyncio.run(run()) == BODY
+
+
+def test_async_download_unexpected_status(server):
+    asyncio = pytest.importorskip("asyncio")
+    pytest.importorskip("aiohttp")
+    from pyedgeconnect import AsyncOrchestrator
+
+    async def run():
+        async with AsyncOrchestrator("127.0.0.1") as orch:
+            orch.url_prefix = server
+            return await orch._download("/debugFiles/refused")
+
+    assert asyncio.run(run()) is False
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pyedgeconnect import Orchestrator
+
+
+def tracking(delays=None, fail=()):
+    """Fake per-appliance method recording how many calls overlap"""
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0, "kwargs": []}
+
+    def call(ne_pk, **kwargs):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            state["kwargs"].append(kwargs)
+        try:
+            time.sleep((delays or {}).get(ne_pk, 0.01))
+            if ne_pk in fail:
+                raise RuntimeError(ne_pk)
+            return f"info of {ne_pk}"
+        finally:
+            with lock:
+                state["running"] -= 1
+
+    call.state = state
+    return call
+
+
+def test_results_for_every_appliance_within_concurrency():
+    orch = Orchestrator("127.0.0.1")
+    method = tracking()
+    ne_pks = [f"{number}.NE" for number in range(30)]
+    results = dict(
+        orch.for_each_appliance(method, ne_pks, concurrency=4, url="memory")
+    )
+    assert results == {ne_pk: f"info of {ne_pk}" for ne_pk in ne_pks}
+    assert method.state["peak"] <= 4
+    assert method.state["kwargs"] == [{"url": "memory"}] * 30
+
+
+def test_method_by_name():
+    orch = Orchestrator("127.0.0.1")
+    orch.get_appliance_info = lambda ne_pk: {"id": ne_pk}
+    results = dict(orch.for_each_appliance("get_appliance_info", ["3.NE"]))
+    assert results == {"3.NE": {"id": "3.NE"}}
+
+
+def test_failed_and_timed_out_calls_isolated():
+    orch = Orchestrator("127.0.0.1")
+    method = tracking(delays={"2.NE": 1.0}, fail={"1.NE"})
+    start = time.monotonic()
+    results = list(
+        orch.for_each_appliance(
+            method, ["1.NE", "2.NE", "3.NE"], concurrency=3, timeout=0.2
+        )
+    )
+    assert time.monotonic() - start < 0.9
+    assert dict(results) == {
+        "1.NE": False,
+        "2.NE": None,
+        "3.NE": "info of 3.NE",
+    }
+    # completed calls are yielded before the timed out one
+    assert results[-1] == ("2.NE", None)
+
+
+def test_async_for_each_appliance():
+    pytest.importorskip("aiohttp")
+    from pyedgeconnect import AsyncOrchestrator
+
+    running = {"now": 0, "peak": 0}
+
+    async def call(ne_pk):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        try:
+            await asyncio.sleep(1.0 if ne_pk == "0.NE" else 0.01)
+            return ne_pk
+        finally:
+            running["now"] -= 1
+
+    async def main():
+        async with AsyncOrchestrator("127.0.0.1") as orch:
+            return [
+                pair
+                async for pair in orch.for_each_appliance(
+                    call,
+                    [f"{number}.NE" for number in range(10)],
+                    concurrency=3,
+                    timeout=0.2,
+                )
+            ]
+
+    results = dict(asyncio.run(main()))
+    assert results["0.NE"] is None
+    assert results["9.NE"] == "9.NE"
+    assert len(results) == 10
+    assert running["peak"] <= 3
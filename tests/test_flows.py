@@ -0,0 +1,131 @@
+import json
+
+import pytest
+
+from pyedgeconnect import Orchestrator
+from pyedgeconnect._flows import FLOW_COLUMNS, FlowListParser, FlowTable
+
+
+def flow(number, application="https"):
+    row = [0] * 61
+    row[0] = number
+    row[1] = number * 10
+    row[3] = application
+    row[9] = f"10.0.0.{number % 250}"
+    row[10] = 40000 + number
+    row[16] = "192.0.2.1"
+    row[17] = 443
+    row[20] = number * 100
+    row[23] = number * 7
+    row[25] = 1500
+    row[26] = "TCP"
+    row[38] = 1672531200000
+    row[39] = 0
+    row[60] = "RealTime"
+    return row
+
+
+def body(flows):
+    document = {
+        "active": {"total_flows": len(flows)},
+        "flows": flows,
+        "inconsistent": {"total_flows": 0},
+        "note": "ünïcode ✓",
+    }
+    return json.dumps(document, ensure_ascii=False).encode("utf-8")
+
+
+def parse(data, chunk_size):
+    parser = FlowListParser(FlowTable("3.NE"))
+    for start in range(0, len(data), chunk_size):
+        parser.feed(data[start : start + chunk_size])
+    return parser.close()
+
+
+FLOWS = [flow(1), flow(2, "ünïcode ✓"), flow(3, "dns"), flow(4)]
+BODY = body(FLOWS)
+EXPECTED = parse(BODY, len(BODY))
+
+
+def test_whole_body():
+    assert len(EXPECTED) == 4
+    assert EXPECTED.summary == {
+        "active": {"total_flows": 4},
+        "inconsistent": {"total_flows": 0},
+        "note": "ünïcode ✓",
+    }
+    assert EXPECTED.row(1)["application"] == "ünïcode ✓"
+    assert EXPECTED.column("port1").tolist() == [40001, 40002, 40003, 40004]
+    assert EXPECTED.select(application="https") == [0, 3]
+    assert EXPECTED.select(application="ftp") == []
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 40))
+def test_every_chunk_boundary(chunk_size):
+    # small chunks split the flows key, numbers, strings and multi-byte
+    # characters at every position
+    table = parse(BODY, chunk_size)
+    assert list(table) == list(EXPECTED)
+    assert table.summary == EXPECTED.summary
+
+
+def test_whitespace_and_empty_chunks():
+    data = b'{ "flows" :\n [ \n' + b" ,\n".join(
+        json.dumps(row).encode() for row in FLOWS[:2]
+    )
+    data += b'\n ] , "active": {"total_flows": 2} }'
+    parser = FlowListParser(FlowTable())
+    for start in range(0, len(data), 3):
+        parser.feed(b"")
+        parser.feed(data[start : start + 3])
+    table = parser.close()
+    assert [row["flow_id"] for row in table] == [1, 2]
+    assert table.summary == {"active": {"total_flows": 2}}
+
+
+@pytest.mark.parametrize(
+    "data, flows",
+    [
+        (b'{"flows": null, "active": {}}', 0),
+        (b'{"active": {}}', 0),
+        (b'{"flows": []}', 0),
+    ],
+)
+def test_bodies_without_flow_rows(data, flows):
+    table = parse(data, 2)
+    assert len(table) == flows
+
+
+def test_truncated_body_raises():
+    with pytest.raises(ValueError):
+        parse(BODY[: len(BODY) // 2], 7)
+
+
+def test_short_and_invalid_rows_stored_as_defaults():
+    table = FlowTable()
+    table.append([5, "not a number"])
+    row = table.row(0)
+    assert row["flow_id"] == 5
+    assert row["flow_seq"] == 0
+    assert row["application"] is None
+    assert set(row) == set(FLOW_COLUMNS)
+
+
+def test_orchestrator_flow_table():
+    class Download:
+        def __init__(self, chunks):
+            self.chunks = chunks
+
+        def __iter__(self):
+            return iter(self.chunks)
+
+    orch = Orchestrator("127.0.0.1")
+    paths = []
+    chunks = [BODY[start : start + 5] for start in range(0, len(BODY), 5)]
+    orch._download = lambda path, chunk_size: (
+        paths.append(path) or Download(chunks)
+    )
+    table = orch.get_appliance_flow_table("3.NE", chunk_size=5)
+    assert paths[0].startswith("/flow/3.NE/q")
+    assert list(table) == list(EXPECTED)
+    assert table.ne_id == "3.NE"
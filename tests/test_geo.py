@@ -0,0 +1,103 @@
+import pytest
+
+from pyedgeconnect._geo import GeoLocator
+from pyedgeconnect._ip_intelligence import ip_to_int
+
+
+def locate(ips):
+    """Locate every address to its /24 range"""
+    return {
+        str(ip): {
+            "rangeIpStart": ip & ~0xFF,
+            "rangeIpEnd": ip | 0xFF,
+            "country": f"country {ip >> 8}",
+        }
+        for ip in ips
+    }
+
+
+@pytest.fixture
+def fake_orchestrator(stub_orchestrator):
+    def build(fail=False):
+        return stub_orchestrator(
+            geo_locate_multiple_ips=False if fail else locate
+        )
+
+    return build
+
+
+def batches(orch):
+    return [list(ips) for ips, in orch.geo_locate_multiple_ips.calls]
+
+
+def test_duplicates_and_known_ranges_not_requested(fake_orchestrator):
+    orch = fake_orchestrator()
+    geo = orch.geo_locator()
+    locations = geo.locate(["8.8.8.8", "8.8.8.8", ip_to_int("8.8.8.8")])
+    assert batches(orch) == [[ip_to_int("8.8.8.8")]]
+    assert set(locations) == {"8.8.8.8", ip_to_int("8.8.8.8")}
+    assert locations["8.8.8.8"]["ip"] == ip_to_int("8.8.8.8")
+
+    location = geo.locate_one("8.8.8.200")
+    assert len(batches(orch)) == 1
+    assert location["country"] == locations["8.8.8.8"]["country"]
+    assert location["ip"] == ip_to_int("8.8.8.200")
+    assert geo.stats() == {"ranges": 1, "hits": 1, "misses": 1, "requests": 1}
+
+
+def test_batches_and_waves(fake_orchestrator):
+    orch = fake_orchestrator()
+    geo = orch.geo_locator(batch_size=100, concurrency=2)
+    ips = [f"10.{number // 256}.{number % 256}.1" for number in range(450)]
+    locations = geo.locate(ips)
+    assert all(locations[ip] is not None for ip in ips)
+    assert sorted(len(batch) for batch in batches(orch)) == [
+        50,
+        100,
+        100,
+        100,
+        100,
+    ]
+    assert geo.stats()["requests"] == 5
+
+
+def test_later_waves_answered_by_earlier_ranges(fake_orchestrator):
+    orch = fake_orchestrator()
+    geo = orch.geo_locator(batch_size=1, concurrency=1)
+    geo.locate(["10.0.0.1", "10.0.0.2", "10.0.1.1"])
+    assert batches(orch) == [[ip_to_int("10.0.0.1")], [ip_to_int("10.0.1.1")]]
+    assert geo.stats()["hits"] == 1
+
+
+def test_failed_requests_return_none(fake_orchestrator):
+    orch = fake_orchestrator(fail=True)
+    geo = orch.geo_locator()
+    assert geo.locate(["8.8.8.8"]) == {"8.8.8.8": None}
+    assert geo.stats()["ranges"] == 0
+
+
+def test_oldest_ranges_dropped(fake_orchestrator):
+    orch = fake_orchestrator()
+    geo = orch.geo_locator(max_ranges=2)
+    geo.locate(["10.0.1.1"])
+    geo.locate(["10.0.2.1"])
+    geo.locate(["10.0.3.1"])
+    assert geo.stats()["ranges"] == 2
+    geo.locate(["10.0.1.2", "10.0.3.2"])
+    assert batches(orch)[-1] == [ip_to_int("10.0.1.2")]
+
+
+def test_invalid_address(fake_orchestrator):
+    geo = fake_orchestrator().geo_locator()
+    with pytest.raises(ValueError):
+        geo.locate(["10.0.0.256"])
+
+
+def test_async_orchestrator_rejected():
+    pytest.importorskip("aiohttp")
+    from pyedgeconnect import AsyncOrchestrator
+
+    orch = AsyncOrchestrator("127.0.0.1")
+    assert not hasattr(orch, "geo_locator")
+    with pytest.raises(TypeError, match="synchronous"):
+        GeoLocator(orch)
@@ -0,0 +1,188 @@
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from pyedgeconnect import Orchestrator
+from pyedgeconnect._governor import (
+    RequestGovernor,
+    TokenBucket,
+    _parse_retry_after,
+)
+
+
+def response(status_code, retry_after=None):
+    result = requests.Response()
+    result.status_code = status_code
+    result._content = b"{}"
+    result._content_consumed = True
+    result.url = "https://127.0.0.1/gms/rest/appliance"
+    if retry_after is not None:
+        result.headers["Retry-After"] = retry_after
+    return result
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock advanced by ``time.sleep``, returning the
+    list of sleeps
+    """
+    now = [100.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(
+        "pyedgeconnect._governor.time.monotonic", lambda: now[0]
+    )
+    monkeypatch.setattr("pyedgeconnect.time.sleep", sleep)
+    return sleeps
+
+
+def test_parse_retry_after():
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("2.5") == 2.5
+    assert _parse_retry_after("-1") == 0.0
+    assert _parse_retry_after("soon") is None
+    now = formatdate(usegmt=True)
+    assert 0.0 <= _parse_retry_after(now) <= 1.0
+
+
+@pytest.mark.parametrize(
+    "method, status_code, error, retried",
+    [
+        ("GET", 503, None, True),
+        ("GET", 429, None, True),
+        ("GET", 500, None, False),
+        ("GET", None, "read", True),
+        ("DELETE", 504, None, True),
+        ("POST", 503, None, False),
+        ("POST", 429, None, True),
+        ("POST", None, "connect", True),
+        ("POST", None, "read", False),
+    ],
+)
+def test_retry_rules(method, status_code, error, retried):
+    governor = RequestGovernor(retries=1)
+    delay = governor.retry_delay(
+        method, "/appliance", 0, status_code=status_code, error=error
+    )
+    assert (delay is not None) == retried
+
+
+def test_retries_exhausted():
+    governor = RequestGovernor(retries=2)
+    assert governor.retry_delay("GET", "/a", 1, status_code=503) is not None
+    assert governor.retry_delay("GET", "/a", 2, status_code=503) is None
+    assert governor.stats()["retried"] == 1
+
+
+def test_backoff_jitter_bounded(monkeypatch):
+    bounds = []
+    monkeypatch.setattr(
+        "pyedgeconnect._governor.random.uniform",
+        lambda low, high: bounds.append((low, high)) or high,
+    )
+    governor = RequestGovernor(retries=10, backoff=0.5, backoff_max=3)
+    for attempt in range(4):
+        governor.retry_delay("GET", "/a", attempt, status_code=503)
+    assert bounds == [(0, 0.5), (0, 1.0), (0, 2.0), (0, 3)]
+
+
+def test_retry_after_capped_and_pauses_client(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(
+        "pyedgeconnect._governor.time.monotonic", lambda: now[0]
+    )
+    governor = RequestGovernor(rate_limit=100, retries=1, backoff_max=10)
+    delay = governor.retry_delay(
+        "GET", "/a", 0, status_code=429, retry_after="60"
+    )
+    assert delay == 10
+    # every other request waits for the pause as well
+    assert governor.reserve("/b") == pytest.approx(10)
+    now[0] = 105.0
+    assert governor.reserve("/b") == pytest.approx(5)
+
+
+def test_retry_after_pauses_client_without_rate_limit(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(
+        "pyedgeconnect._governor.time.monotonic", lambda: now[0]
+    )
+    governor = RequestGovernor(retries=1)
+    assert governor.reserve("/a") == 0.0
+    governor.retry_delay("GET", "/a", 0, status_code=429, retry_after="3")
+    assert governor.reserve("/b") == pytest.approx(3)
+    assert governor.stats()["throttled"] == 1
+    now[0] = 103.0
+    assert governor.reserve("/b") == 0.0
+
+
+def test_orchestrator_retry_after_holds_other_requests(clock):
+    orch = Orchestrator("127.0.0.1", retries=1)
+    orch._req_get = lambda api_path, stream=False: response(200)
+    # a request sent while another one backs off after a 429 waits too
+    orch.governor.retry_delay(
+        "GET", "/appliance", 0, status_code=429, retry_after="2"
+    )
+    assert orch._get("/appliance/2") == {}
+    assert clock == [2.0]
+
+
+def test_token_bucket_rate(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(
+        "pyedgeconnect._governor.time.monotonic", lambda: now[0]
+    )
+    bucket = TokenBucket(rate=2, burst=2)
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    now[0] = 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_endpoint_rate_limits_by_pattern(monkeypatch):
+    monkeypatch.setattr("pyedgeconnect._governor.time.monotonic", lambda: 0)
+    governor = RequestGovernor(endpoint_rate_limits={"/stats*": 1})
+    assert governor.reserve("/stats/aggregate") == 0.0
+    assert governor.reserve("/stats/timeseries") == 1.0
+    assert governor.reserve("/appliance") == 0.0
+    assert governor.stats()["throttled"] == 1
+
+
+def test_orchestrator_retries_with_retry_after(clock):
+    sleeps = clock
+    orch = Orchestrator("127.0.0.1", retries=3)
+    responses = iter([response(503, "2"), response(429), response(200)])
+    orch._req_get = lambda api_path, stream=False: next(responses)
+    assert orch._get("/appliance") == {}
+    assert sleeps[0] == 2.0
+    assert len(sleeps) == 2
+    assert orch.governor.stats()["retried"] == 2
+
+
+def test_orchestrator_post_not_retried_on_503(monkeypatch):
+    monkeypatch.setattr("pyedgeconnect.time.sleep", pytest.fail)
+    orch = Orchestrator("127.0.0.1", retries=3)
+    calls = []
+    orch._req_post = lambda *args: calls.append(args) or response(503)
+    assert orch._post("/appliance", {})["status_code"] == 503
+    assert len(calls) == 1
+
+
+def test_orchestrator_retries_connect_timeout(monkeypatch):
+    monkeypatch.setattr("pyedgeconnect.time.sleep", lambda seconds: None)
+    orch = Orchestrator("127.0.0.1", retries=1)
+    attempts = []
+
+    def request(*args):
+        attempts.append(args)
+        if len(attempts) == 1:
+            raise requests.exceptions.ConnectTimeout()
+        return response(200)
+
+    orch._req_post = request
+    assert orch._post("/appliance", {}) == {}
+    assert len(attempts) == 2
@@ -0,0 +1,99 @@
+import pytest
+
+from pyedgeconnect._inventory import FleetInventory
+
+from .conftest import ERROR
+
+APPLIANCES = [
+    {
+        "nePk": "1.NE",
+        "hostName": "Branch-01",
+        "serial": "001bbc000001",
+        "IP": "10.0.0.1",
+        "site": "London",
+        "groupId": "3.Network",
+    },
+    {
+        "nePk": "2.NE",
+        "hostName": "branch-02",
+        "serial": "001BBC000002",
+        "IP": "10.0.0.2",
+        "site": "London",
+        "groupId": "4.Network",
+    },
+    {"nePk": "3.NE", "hostName": "hub", "IP": "10.0.0.1", "site": ""},
+]
+LICENSES = [{"applianceId": "1.NE", "license": "EC-BASE"}]
+LABELS = {"wan": {"1": {"name": "MPLS"}}, "lan": {"8": {"name": "Data"}}}
+OVERLAYS = [{"id": 1, "name": "RealTime"}]
+METHODS = (
+    "get_appliances",
+    "get_portal_licensed_appliances",
+    "get_all_interface_labels",
+    "get_all_overlays_config",
+)
+
+
+@pytest.fixture
+def fake_orchestrator(stub_orchestrator):
+    def build(overlays=OVERLAYS):
+        return stub_orchestrator(
+            get_appliances=APPLIANCES,
+            get_portal_licensed_appliances=LICENSES,
+            get_all_interface_labels=LABELS,
+            get_all_overlays_config=overlays,
+        )
+
+    return build
+
+
+def calls(orch):
+    """Number of requests per inventory method"""
+    return [len(getattr(orch, name).calls) for name in METHODS]
+
+
+def test_indexes():
+    fleet = FleetInventory(APPLIANCES, LICENSES, LABELS, OVERLAYS)
+    assert len(fleet) == 3
+    assert "2.NE" in fleet and "9.NE" not in fleet
+    assert fleet.get("1.NE")["license"] == LICENSES[0]
+    assert fleet.get("2.NE")["license"] is None
+    assert fleet.get("9.NE") is None
+    assert fleet.by_hostname("BRANCH-01")["nePk"] == "1.NE"
+    assert fleet.by_serial("001BBC000001")["nePk"] == "1.NE"
+    assert fleet.by_serial("001bbc000002")["nePk"] == "2.NE"
+    assert [a["nePk"] for a in fleet.by_ip("10.0.0.1")] == ["1.NE", "3.NE"]
+    assert [a["nePk"] for a in fleet.in_site("London")] == ["1.NE", "2.NE"]
+    assert fleet.in_group("4.Network") == [fleet.get("2.NE")]
+    assert fleet.in_site("Paris") == []
+    assert fleet.sites() == ["London"]
+    assert fleet.interface_labels == {"1": "MPLS", "8": "Data"}
+    assert fleet.overlays == {"1": "RealTime"}
+    # source responses are not modified
+    assert "license" not in APPLIANCES[0]
+
+
+def test_orchestrator_inventory_and_refresh(fake_orchestrator):
+    orch = fake_orchestrator()
+    fleet = orch.inventory()
+    assert calls(orch) == [1, 1, 1, 1]
+    assert fleet.by_hostname("hub")["nePk"] == "3.NE"
+
+    refreshed = fleet.refresh()
+    assert calls(orch) == [2, 1, 1, 1]
+    assert refreshed is not fleet
+    assert refreshed.get("1.NE")["license"] == LICENSES[0]
+    assert refreshed.overlays == fleet.overlays
+
+    fleet.refresh(full=True)
+    assert calls(orch) == [3, 2, 2, 2]
+
+
+def test_failed_requests(fake_orchestrator):
+    orch = fake_orchestrator(overlays=ERROR)
+    fleet = orch.inventory()
+    assert fleet.overlays == {}
+    assert fleet.get("1.NE")["license"] == LICENSES[0]
+
+    orch.get_appliances = lambda: False
+    assert orch.inventory() is False
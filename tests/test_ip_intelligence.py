@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from pyedgeconnect import Orchestrator
+from pyedgeconnect._ip_intelligence import IpIntelligenceIndex, ip_to_int
+
+from .conftest import ERROR, stub
+
+
+def entry(start, end, name):
+    return {"ip_start": start, "ip_end": end, "name": name}
+
+
+def test_ip_to_int():
+    assert ip_to_int("10.1.1.1") == 167837953
+    assert ip_to_int(167837953) == 167837953
+    with pytest.raises(ValueError):
+        ip_to_int("not an address")
+
+
+def test_narrowest_range_wins():
+    index = IpIntelligenceIndex(
+        [entry(0, 1000, "wide"), entry(100, 200, "narrow")]
+    )
+    assert index.lookup(50)["name"] == "wide"
+    assert index.lookup(150)["name"] == "narrow"
+    assert index.lookup(201)["name"] == "wide"
+    assert index.lookup(1001) is None
+
+
+def test_lookup_matches_brute_force():
+    generator = random.Random(7)
+    entries = []
+    for number in range(300):
+        start = generator.randrange(0, 2**32 - 10**6)
+        entries.append(
+            entry(start, start + generator.randrange(1, 10**6), str(number))
+        )
+    index = IpIntelligenceIndex(entries)
+    ips = [generator.randrange(0, 2**32) for _ in range(2000)]
+    ips += [value["ip_start"] for value in entries]
+    for ip, found in zip(ips, index.lookup_many(ips)):
+        covering = [
+            (value["ip_end"] - value["ip_start"], -number, value["name"])
+            for number, value in enumerate(entries)
+            if value["ip_start"] <= ip <= value["ip_end"]
+        ]
+        expected = min(covering)[2] if covering else None
+        assert (found or {}).get("name") == expected
+        assert index.lookup(ip) == found
+
+
+def test_index_unchanged_update_time_keeps_previous(stub_orchestrator):
+    previous = IpIntelligenceIndex([entry(0, 10, "a")], update_time=5)
+    orch = stub_orchestrator(
+        get_update_time_for_app_definitions={"lastUpdateTime": 5},
+        get_app_definition_data=pytest.fail,
+    )
+    assert orch.ip_intelligence_index(previous=previous) is previous
+    assert orch.get_app_definition_data.calls == []
+
+
+@pytest.mark.parametrize("failed", [ERROR, None, False])
+def test_index_failed_page_keeps_previous(stub_orchestrator, failed):
+    previous = IpIntelligenceIndex([entry(0, 10, "a")], update_time=5)
+    orch = stub_orchestrator(
+        get_update_time_for_app_definitions={"lastUpdateTime": 6},
+        get_app_definition_data=stub(
+            [entry(0, 10, "b"), entry(20, 30, "c")], failed
+        ),
+    )
+    assert orch.ip_intelligence_index(previous, page_size=2) is previous
+
+
+def test_index_failed_page_without_previous(stub_orchestrator):
+    orch = stub_orchestrator(
+        get_update_time_for_app_definitions={"lastUpdateTime": 6},
+        get_app_definition_data=stub(
+            [entry(0, 10, "b"), entry(20, 30, "c")], None
+        ),
+    )
+    assert orch.ip_intelligence_index(page_size=2) is None
+
+
+def test_index_downloaded_when_changed(stub_orchestrator):
+    orch = stub_orchestrator(
+        get_update_time_for_app_definitions={"lastUpdateTime": 6},
+        get_app_definition_data=stub(
+            [entry(0, 10, "b"), entry(20, 30, "c")], [entry(40, 50, "d")]
+        ),
+    )
+    index = orch.ip_intelligence_index(page_size=2)
+    assert index.update_time == 6
+    assert index.entries == 3
+    assert index.lookup(45)["name"] == "d"
+
+
+def test_async_orchestrator_rejected():
+    pytest.importorskip("aiohttp")
+    from pyedgeconnect import AsyncOrchestrator
+
+    orch = AsyncOrchestrator("127.0.0.1")
+    assert not hasattr(orch, "ip_intelligence_index")
+    with pytest.raises(TypeError, match="synchronous"):
+        Orchestrator.ip_intelligence_index(orch)
@@ -0,0 +1,80 @@
+import importlib
+import inspect
+import subprocess
+import sys
+
+import pytest
+
+import pyedgeconnect
+from pyedgeconnect import EdgeConnect, Orchestrator
+
+
+def run_python(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout.split()
+
+
+def test_import_loads_no_method_modules():
+    loaded = run_python(
+        "import sys, pyedgeconnect\n"
+        "print(*[name for name in sys.modules"
+        " if name.startswith(('pyedgeconnect.orch.', 'pyedgeconnect.ecos.'))"
+        " or name == 'aiohttp'])"
+    )
+    assert loaded == []
+
+
+def test_first_use_loads_module_methods():
+    loaded = run_python(
+        "import sys\n"
+        "from pyedgeconnect import Orchestrator\n"
+        "orch = Orchestrator('127.0.0.1')\n"
+        "assert callable(orch.get_appliance_acls)\n"
+        "print(*sorted(name for name in sys.modules"
+        " if name.startswith('pyedgeconnect.orch.')))"
+    )
+    assert loaded == ["pyedgeconnect.orch._acls"]
+
+
+@pytest.mark.parametrize("cls", [Orchestrator, EdgeConnect])
+def test_every_listed_method_exists(cls):
+    for module_name, methods in cls._method_modules.items():
+        module = importlib.import_module(f"pyedgeconnect.{module_name}")
+        for method in methods:
+            assert inspect.isfunction(getattr(module, method)), method
+            assert getattr(cls, method) is getattr(module, method)
+
+
+@pytest.mark.parametrize("cls", [Orchestrator, EdgeConnect])
+def test_dir_lists_full_api(cls):
+    names = set(dir(cls))
+    instance_names = set(dir(cls("127.0.0.1")))
+    for methods in cls._method_modules.values():
+        assert names.issuperset(methods)
+        assert instance_names.issuperset(methods)
+
+
+def test_methods_bind_to_instance():
+    orch = Orchestrator("127.0.0.1")
+    orch._get = lambda path: path
+    assert orch.get_appliance_acls("3.NE", True) == "/acls/3.NE?cached=True"
+
+
+def test_unknown_attributes_raise():
+    orch = Orchestrator("127.0.0.1")
+    with pytest.raises(AttributeError, match="no attribute 'not_a_method'"):
+        orch.not_a_method
+    with pytest.raises(AttributeError):
+        Orchestrator.not_a_method
+    assert not hasattr(EdgeConnect, "get_appliance_acls")
+    with pytest.raises(AttributeError):
+        pyedgeconnect.NotAClass
+
+
+def test_async_classes_in_module_dir():
+    assert {"AsyncEdgeConnect", "AsyncOrchestrator"} <= set(dir(pyedgeconnect))
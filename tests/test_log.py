@@ -0,0 +1,47 @@
+import logging
+
+import requests
+
+from pyedgeconnect import Orchestrator
+from pyedgeconnect._log import BodyPreview
+
+
+def response(body, status_code=500):
+    result = requests.Response()
+    result.status_code = status_code
+    result._content = body
+    result.encoding = "utf-8"
+    result.url = "https://127.0.0.1/gms/rest/appliance"
+    return result
+
+
+def test_body_preview_truncates_only_with_limit():
+    body = b"x" * 100
+    assert str(BodyPreview(response(body))) == "x" * 100
+    assert str(BodyPreview(response(body), 100)) == "x" * 100
+    assert str(BodyPreview(response(body), 10)) == (
+        "x" * 10 + "... [90 bytes truncated]"
+    )
+
+
+def test_error_log_holds_whole_body_by_default(caplog):
+    orch = Orchestrator("127.0.0.1")
+    body = b"e" * 10000
+    with caplog.at_level(logging.ERROR, logger=orch.logger.name):
+        result = orch._handle_response(
+            "/appliance", response(body), [200], "json"
+        )
+    assert result["text"] == body.decode()
+    assert body.decode() in caplog.text
+    assert "truncated" not in caplog.text
+
+
+def test_error_log_truncated_when_set(caplog):
+    orch = Orchestrator("127.0.0.1", log_body_max=16)
+    body = b"e" * 10000
+    with caplog.at_level(logging.ERROR, logger=orch.logger.name):
+        result = orch._handle_response(
+            "/appliance", response(body), [200], "json"
+        )
+    assert result["text"] == body.decode()
+    assert "[9984 bytes truncated]" in caplog.text
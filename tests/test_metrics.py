@@ -0,0 +1,70 @@
+import pytest
+
+from pyedgeconnect import EdgeConnect, Orchestrator
+from pyedgeconnect._metrics import OTHER_PATHS, EndpointMetrics, path_template
+
+
+@pytest.mark.parametrize(
+    "api_path, template",
+    [
+        ("/appliance/3.NE/tunnels?limit=5", "/appliance/{id}/tunnels"),
+        ("/zones/0.Network", "/zones/{id}"),
+        ("/subnets/10.1.1.0/24", "/subnets/{id}/{id}"),
+        ("/tunnels/tunnel_12", "/tunnels/{id}"),
+        ("/appliance", "/appliance"),
+    ],
+)
+def test_path_template(api_path, template):
+    assert path_template(api_path) == template
+
+
+def test_metrics_off_by_default():
+    assert Orchestrator("127.0.0.1").endpoint_metrics is None
+    assert EdgeConnect("127.0.0.1").endpoint_metrics is None
+    assert Orchestrator("127.0.0.1").metrics() == []
+    orch = Orchestrator("127.0.0.1", collect_metrics=True)
+    assert isinstance(orch.endpoint_metrics, EndpointMetrics)
+
+
+def test_record_histogram_and_bytes():
+    metrics = EndpointMetrics()
+    metrics.record("GET", "/appliance/1.NE", 200, 0.02, 0, 100)
+    metrics.record("GET", "/appliance/2.NE", 200, 0.2, 0, 50)
+    metrics.record("GET", "/appliance/2.NE", "ConnectTimeout", 3.0)
+    ok, failed = sorted(metrics.snapshot(), key=lambda entry: entry["status"])
+    assert ok["path"] == "/appliance/{id}"
+    assert ok["count"] == 2
+    assert ok["response_bytes"] == 150
+    assert ok["max_seconds"] == 0.2
+    assert ok["buckets"]["0.025"] == 1
+    assert ok["buckets"]["0.25"] == 2
+    assert ok["buckets"]["+Inf"] == 2
+    assert failed["status"] == "ConnectTimeout"
+
+
+def test_path_templates_bounded():
+    metrics = EndpointMetrics(max_paths=3)
+    for name in ["alpha", "beta", "gamma", "delta", "epsilon"]:
+        metrics.record("GET", f"/hostname/{name}", 200, 0.01)
+    metrics.record("GET", "/hostname/alpha", 200, 0.01)
+    paths = {entry["path"]: entry["count"] for entry in metrics.snapshot()}
+    assert len(paths) == 4
+    assert paths["/hostname/alpha"] == 2
+    assert paths[OTHER_PATHS] == 2
+    metrics.clear()
+    metrics.record("GET", "/hostname/delta", 200, 0.01)
+    assert metrics.snapshot()[0]["path"] == "/hostname/delta"
+
+
+def test_prometheus_format():
+    metrics = EndpointMetrics()
+    metrics.record("POST", "/alarm", 200, 0.01, 10, 20)
+    text = metrics.to_prometheus(prefix="test")
+    assert (
+        'test_request_seconds_count{method="POST",path="/alarm",'
+        'status="200"} 1' in text
+    )
+    assert (
+        'test_request_bytes_total{method="POST",path="/alarm",'
+        'status="200"} 10' in text
+    )
@@ -0,0 +1,154 @@
+import io
+import tarfile
+
+import pytest
+
+from pyedgeconnect import EdgeConnect
+from pyedgeconnect._minute_stats import (
+    MinuteStatsRecords,
+    _convert_stat,
+    iter_minute_stats_archive,
+)
+
+
+def archive(files):
+    data = io.BytesIO()
+    with tarfile.open(fileobj=data, mode="w:gz") as tar:
+        for name, text in files.items():
+            content = text.encode("utf-8")
+            member = tarfile.TarInfo(name)
+            member.size = len(content)
+            tar.addfile(member, io.BytesIO(content))
+    data.seek(0)
+    return data
+
+
+@pytest.mark.parametrize(
+    "value, converted",
+    [
+        ("42", 42),
+        ("-3", -3),
+        ("0.25", 0.25),
+        ("1e3", 1000.0),
+        ("18446744073709551615", 18446744073709551615),
+        ("nan", "nan"),
+        ("inf", "inf"),
+        ("Infinity", "Infinity"),
+        ("1_000", "1_000"),
+        (" 7", " 7"),
+    ],
+)
+def test_convert_stat(value, converted):
+    result = _convert_stat(value)
+    assert result == converted
+    assert type(result) is type(converted)
+
+
+def test_only_known_numeric_columns_converted():
+    fields = ["7", "inf", "007", "nan"] + [str(n) for n in range(1, 4)]
+    fields += ["9", "1672531200"]
+    files = {
+        "st2/boost_v2.txt": "0,100,200,300,1,1672531200\n",
+        "st2/drops_v2.txt": "0,8,12,1672531200\n",
+        "st2/custom.txt": ",".join(fields) + "\n",
+    }
+    records = dict(iter_minute_stats_archive(archive(files)))
+    assert records["boost_v2"] == {
+        0: "0",
+        1: 100,
+        2: 200,
+        3: 300,
+        4: "1",
+        5: 1672531200,
+    }
+    assert records["drops_v2"] == {0: "0", 1: 8, 2: 12, 3: 1672531200}
+    # tables without known columns are kept as text
+    assert list(records["custom"].values()) == fields
+
+
+def test_numeric_columns_by_name_and_position():
+    files = {
+        "a/named.csv": "name,bytes,code\nwan0,12,007\nwan1,nan,010\n",
+        "a/custom.txt": "1,inf,2.5\n",
+    }
+    records = list(
+        iter_minute_stats_archive(
+            archive(files),
+            numeric_columns={"named": ["bytes"], "custom": [1, 2]},
+        )
+    )
+    assert records == [
+        ("named", {"name": "wan0", "bytes": 12, "code": "007"}),
+        ("named", {"name": "wan1", "bytes": "nan", "code": "010"}),
+        ("custom", {0: "1", 1: "inf", 2: 2.5}),
+    ]
+
+
+def test_tables_filter():
+    files = {"a/boost_v2.txt": "0,1,2,3,4,5\n", "a/drops_v2.txt": "0,1,2,3\n"}
+    records = list(iter_minute_stats_archive(archive(files), ["drops_v2"]))
+    assert [table for table, _ in records] == ["drops_v2"]
+
+
+class Closed:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self):
+        self.count += 1
+
+
+def records(close):
+    files = {"a/drops_v2.txt": "0,1,2,3\n0,4,5,6\n"}
+    return MinuteStatsRecords(iter_minute_stats_archive(archive(files)), close)
+
+
+def test_records_closed_when_exhausted():
+    close = Closed()
+    assert len(list(records(close))) == 2
+    assert close.count == 1
+
+
+def test_records_closed_when_stopped_early():
+    close = Closed()
+    with records(close) as stats:
+        next(stats)
+    assert close.count == 1
+
+
+def test_records_closed_when_never_iterated():
+    close = Closed()
+    stats = records(close)
+    stats.close()
+    stats.close()
+    assert close.count == 1
+
+    close = Closed()
+    stats = records(close)
+    del stats
+    assert close.count == 1
+
+
+def test_edgeconnect_iter_minute_stats_closes_response():
+    class Response:
+        closed = False
+
+        def __init__(self):
+            self.raw = archive({"a/drops_v2.txt": "0,1,2,3\n"})
+
+        def close(self):
+            self.closed = True
+
+    class Download:
+        response = Response()
+
+    ec = EdgeConnect("127.0.0.1")
+    paths = []
+    ec._download = lambda path: paths.append(path) or Download
+    with ec.iter_minute_stats(1672531200) as stats:
+        assert next(stats) == ("drops_v2", {0: "0", 1: 1, 2: 2, 3: 3})
+    assert paths == ["/stats/minuteStats/st2-1672531200.tgz"]
+    assert Download.response.closed
+
+    ec._download = lambda path: False
+    assert ec.iter_minute_stats(1672531200) is False
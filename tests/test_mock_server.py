@@ -0,0 +1,34 @@
+import importlib.util
+import io
+from pathlib import Path
+
+import pytest
+
+from pyedgeconnect._minute_stats import iter_minute_stats_archive
+
+path = Path(__file__).parent.parent / "benchmarks" / "mock_server.py"
+spec = importlib.util.spec_from_file_location("mock_server", path)
+mock_server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mock_server)
+
+
+def test_timeseries_decodes_to_arrays():
+    np = pytest.importorskip("numpy")
+    from pyedgeconnect._columnar import decode_columnar
+
+    result = decode_columnar(mock_server.timeseries(1000))
+    assert set(result) == {"0.NE", "1.NE"}
+    for columns in result.values():
+        assert isinstance(columns["TIMESTAMP"], np.ndarray)
+        assert len(columns["TIMESTAMP"]) == 500
+
+
+def test_minute_stats_archive_typed():
+    archive = io.BytesIO(mock_server.minute_stats_tgz(5))
+    records = list(iter_minute_stats_archive(archive))
+    assert len(records) == 10
+    table, record = records[0]
+    assert table == "tunnel_v2"
+    assert record[1] == "tunnel_v2_0"
+    assert isinstance(record[6], int)
+    assert record[71] == mock_server.EPOCH
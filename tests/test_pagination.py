@@ -0,0 +1,108 @@
+import pytest
+
+from pyedgeconnect._results import PageRequestError
+
+from .conftest import ERROR, stub
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_app_definition_data_stops_after_short_page(
+    stub_orchestrator, prefetch
+):
+    orch = stub_orchestrator(get_app_definition_data=stub([1, 2], [3, 4], [5]))
+    items = list(orch.iter_app_definition_data(page_size=2, prefetch=prefetch))
+    assert items == [1, 2, 3, 4, 5]
+    assert orch.get_app_definition_data.calls == [(0, 2), (2, 2), (4, 2)]
+
+
+@pytest.mark.parametrize("failed", [ERROR, None, False])
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_app_definition_data_failed_page_raises(
+    stub_orchestrator, failed, prefetch
+):
+    orch = stub_orchestrator(get_app_definition_data=stub([1, 2], failed))
+    items = []
+    with pytest.raises(PageRequestError) as error:
+        for item in orch.iter_app_definition_data(
+            page_size=2, prefetch=prefetch
+        ):
+            items.append(item)
+    assert items == [1, 2]
+    assert error.value.result is failed
+
+
+def test_audit_log_failed_page_raises(stub_orchestrator):
+    orch = stub_orchestrator(get_audit_log=ERROR)
+    with pytest.raises(PageRequestError):
+        list(orch.iter_audit_log(0, 100))
+
+
+def test_audit_log_skips_entries_of_boundary_second(stub_orchestrator):
+    first = [
+        {"id": 1, "startTime": 90000},
+        {"id": 2, "startTime": 50000},
+    ]
+    second = [{"id": 2, "startTime": 50000}, {"id": 3, "startTime": 40000}]
+    orch = stub_orchestrator(get_audit_log=stub(first, second, []))
+    entries = list(orch.iter_audit_log(0, 100, page_size=2))
+    assert [entry["id"] for entry in entries] == [1, 2, 3]
+
+
+def test_tunnels_between_appliances_failed_page_raises(stub_orchestrator):
+    orch = stub_orchestrator(
+        get_tunnels_between_appliances=stub([{"id": 1}], ERROR)
+    )
+    with pytest.raises(PageRequestError):
+        list(
+            orch.iter_tunnels_between_appliances(["1.NE", "2.NE"], page_size=5)
+        )
+
+
+def test_tunnels_between_appliances_doubles_limit(stub_orchestrator):
+    orch = stub_orchestrator(
+        get_tunnels_between_appliances=stub(
+            [{"id": 1}, {"id": 2}], [{"id": 1}, {"id": 2}], [{"id": 3}]
+        )
+    )
+    tunnels = list(
+        orch.iter_tunnels_between_appliances(["1.NE", "2.NE"], page_size=2)
+    )
+    assert tunnels == [{"id": 1}, {"id": 2}, {"id": 3}]
+    limits = [call[1] for call in orch.get_tunnels_between_appliances.calls]
+    assert limits == [2, 4, 2]
+
+
+def test_timeseries_stats_pages_by_timestamp(stub_orchestrator):
+    column_def = ["TIMESTAMP", "VALUE"]
+    first = {"COLUMN_DEF": column_def, "DATA": [[1, "a"], [2, "b"], [2, "c"]]}
+    second = {"COLUMN_DEF": column_def, "DATA": [[2, "b"], [2, "c"]]}
+    orch = stub_orchestrator()
+    method = stub(first, second)
+    result = list(orch.iter_timeseries_stats(method, 0, 10, page_size=3))
+    rows = [row for page in result for row in page["DATA"]]
+    assert rows == [[1, "a"], [2, "b"], [2, "c"]]
+
+
+def test_async_failed_page_raises():
+    asyncio = pytest.importorskip("asyncio")
+    pytest.importorskip("aiohttp")
+    from pyedgeconnect import AsyncOrchestrator
+
+    async def run():
+        orch = AsyncOrchestrator("127.0.0.1")
+        responses = iter([[1, 2], ERROR])
+
+        async def fetch(*args):
+            return next(responses)
+
+        orch.get_app_definition_data = fetch
+        items = []
+        try:
+            with pytest.raises(PageRequestError):
+                async for item in orch.iter_app_definition_data(page_size=2):
+                    items.append(item)
+        finally:
+            await orch.close()
+        return items
+
+    assert asyncio.run(run()) == [1, 2]
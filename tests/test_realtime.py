@@ -0,0 +1,125 @@
+import threading
+import time
+
+from pyedgeconnect import EdgeConnect, Orchestrator
+from pyedgeconnect._realtime import RealtimeStatsScheduler
+
+
+class Appliance:
+    """Fake realtime stats keeping the last 3 seconds, advancing
+    ``step`` seconds per poll of each subscription
+    """
+
+    def __init__(self, step=1, delay=0.0, fail=()):
+        self.step = step
+        self.delay = delay
+        self.fail = set(fail)
+        self.clock = {}
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def fetch(self, subscription):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            polls = self.clock.get(subscription, 0)
+            self.clock[subscription] = polls + 1
+        try:
+            time.sleep(self.delay)
+            if (subscription, polls) in self.fail:
+                return False
+            now = 1000 + polls * self.step
+            return {
+                "bytes": [
+                    [second, second * 10] for second in range(now - 2, now + 1)
+                ],
+                "name": "ignored",
+            }
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def timestamps(deliveries, subscription):
+    return [
+        sample[0]
+        for delivered, samples in deliveries
+        if delivered == subscription
+        for sample in samples["bytes"]
+    ]
+
+
+def test_samples_delivered_once_without_gaps():
+    appliance = Appliance()
+    scheduler = RealtimeStatsScheduler(
+        appliance.fetch, ["a", "b", "a"], interval=0.05
+    )
+    assert scheduler.subscriptions == ["a", "b"]
+    deliveries = list(scheduler.stream(duration=0.7))
+    for subscription in ("a", "b"):
+        seconds = timestamps(deliveries, subscription)
+        assert seconds[:3] == [998, 999, 1000]
+        assert seconds == list(range(998, seconds[-1] + 1))
+        assert len(seconds) >= 4
+    stats = scheduler.stats()
+    assert stats["gaps"] == 0
+    assert stats["failures"] == 0
+    assert stats["samples"] == len(timestamps(deliveries, "a")) + len(
+        timestamps(deliveries, "b")
+    )
+
+
+def test_gaps_and_failures_counted():
+    appliance = Appliance(step=5, fail={("a", 1)})
+    scheduler = RealtimeStatsScheduler(appliance.fetch, ["a"], interval=0.05)
+    deliveries = list(scheduler.stream(duration=0.5))
+    seconds = timestamps(deliveries, "a")
+    assert seconds == sorted(set(seconds))
+    stats = scheduler.stats()
+    assert stats["failures"] == 1
+    # polls 5 seconds apart each miss 2 of the 3 second window
+    assert stats["gaps"] >= 2
+    assert stats["polls"] == len(deliveries) + 1
+
+
+def test_concurrency_limit_and_stop():
+    appliance = Appliance(delay=0.05)
+    scheduler = RealtimeStatsScheduler(
+        appliance.fetch, list(range(10)), interval=0.05, concurrency=3
+    )
+    stream = scheduler.stream()
+    delivered = set()
+    for subscription, _ in stream:
+        delivered.add(subscription)
+        if len(delivered) == 10:
+            scheduler.stop()
+    assert delivered == set(range(10))
+    assert appliance.peak <= 3
+
+
+def test_orchestrator_and_edgeconnect_schedulers():
+    calls = []
+
+    def fake(*args):
+        calls.append(args)
+        return {"bytes": [[1, 10]]}
+
+    orch = Orchestrator("127.0.0.1")
+    orch.get_realtime_stats = fake
+    scheduler = orch.realtime_stats_scheduler(
+        [("3.NE", "tunnel", "tunnel_1")], interval=0.05
+    )
+    assert list(scheduler.stream(duration=0.1)) == [
+        (("3.NE", "tunnel", "tunnel_1", ""), {"bytes": [[1, 10]]})
+    ]
+    assert calls[0] == ("3.NE", "tunnel", "tunnel_1", "")
+
+    calls.clear()
+    ec = EdgeConnect("127.0.0.1")
+    ec.get_appliance_realtime_stats = fake
+    scheduler = ec.appliance_realtime_stats_scheduler(
+        [("app", "ssh", "3")], interval=0.05
+    )
+    list(scheduler.stream(duration=0.1))
+    assert calls[0] == ("app", "ssh", "3")
@@ -0,0 +1,145 @@
+import pytest
+
+from pyedgeconnect import EdgeConnect, Orchestrator
+from pyedgeconnect._routes import RouteTable
+
+
+def route(prefix, peer_id=0, interface="wan0", **kwargs):
+    return {
+        "prefix": prefix,
+        "peerid": peer_id,
+        "resolvedInterface": interface,
+        "resolvedNexthop": f"nexthop {prefix}",
+        **kwargs,
+    }
+
+
+PEERS = [{"peerid": 7, "peerName": "hub"}]
+SUBNETS = {
+    "subnets": {
+        "moduleInfo": {"my system id": "1"},
+        "peers": PEERS,
+        "0": {
+            "entries": [
+                {"state": route("0.0.0.0/0")},
+                {"state": route("10.0.0.0/8", peer_id=7)},
+                {"state": route("10.1.0.0/16", interface="lan0")},
+                {"state": route("10.1.2.0/24", state="DOWN", peer_id=7)},
+                {"state": route("10.1.2.0/24", interface="lan1")},
+                {"state": route("2001:db8::/32", interface="wan1")},
+                {"state": route("not a prefix")},
+            ]
+        },
+        "5": {"entries": [{"state": route("192.168.0.0/16", peer_id=7)}]},
+    },
+}
+
+
+def test_longest_prefix_match():
+    table = RouteTable(SUBNETS)
+    results = table.find_preferred_routes(
+        ["10.1.2.3", "10.1.9.9", "10.9.9.9", "8.8.8.8", "2001:db8::1"]
+    )
+    assert results["10.1.2.3"]["passthrough"]["interfaceName"] == "lan1"
+    assert results["10.1.9.9"]["passthrough"] == {
+        "srcMAC": None,
+        "destMAC": None,
+        "interfaceName": "lan0",
+        "nexthop": "nexthop 10.1.0.0/16",
+        "vlan": None,
+        "isApplianceIP": None,
+    }
+    assert results["10.9.9.9"]["swdwan"] == {"peerID": "7", "peerName": "hub"}
+    assert results["10.9.9.9"]["passthrough"] is None
+    assert results["8.8.8.8"]["route"]["prefix"] == "0.0.0.0/0"
+    assert results["2001:db8::1"]["passthrough"]["interfaceName"] == "wan1"
+
+
+def test_segments_and_missing_routes():
+    table = RouteTable(SUBNETS)
+    assert table.find_preferred_route("192.168.1.1", segment=5)["swdwan"]
+    assert table.find_preferred_route("10.1.1.1", segment="5") == {
+        "passthrough": None,
+        "swdwan": None,
+        "route": None,
+    }
+    assert table.find_preferred_route("10.1.1.1", segment="9") == {}
+    with pytest.raises(ValueError):
+        table.find_preferred_route("10.1.1")
+
+
+def test_single_segment_response():
+    table = RouteTable(
+        {"subnets": {**SUBNETS["subnets"]["5"], "peers": PEERS}}
+    )
+    assert table.find_preferred_route("192.168.0.1")["swdwan"] == {
+        "peerID": "7",
+        "peerName": "hub",
+    }
+
+
+def test_local_routes_of_own_system_id():
+    table = RouteTable(
+        {
+            "subnets": {
+                "moduleInfo": {"my system id": "7"},
+                "entries": [{"state": route("10.0.0.0/8", peer_id=7)}],
+            }
+        }
+    )
+    result = table.find_preferred_route("10.1.1.1")
+    assert result["swdwan"] is None
+    assert result["passthrough"]["interfaceName"] == "wan0"
+
+
+def test_verify_against_appliance():
+    table = RouteTable(SUBNETS)
+    queried = []
+
+    def find(ip_address, in_port, overlay_id, segment_name):
+        queried.append(ip_address)
+        if ip_address.startswith("8."):
+            return False
+        result = dict(table.find_preferred_route(ip_address))
+        if ip_address == "10.1.2.3":
+            result = {"passthrough": None, "swdwan": {"peerID": "7"}}
+        return result
+
+    report = table.verify(
+        ["10.1.2.3", "10.1.9.9", "8.8.8.8"], find=find, seed=1
+    )
+    assert sorted(queried) == ["10.1.2.3", "10.1.9.9", "8.8.8.8"]
+    assert report["checked"] == 2
+    assert report["failed"] == 1
+    assert [m["ip_address"] for m in report["mismatches"]] == ["10.1.2.3"]
+
+    queried.clear()
+    report = table.verify(samples=3, find=find, seed=1)
+    assert len(queried) == 3
+    with pytest.raises(ValueError):
+        table.verify(["10.1.1.1"])
+
+
+def test_route_table_methods():
+    ec = EdgeConnect("127.0.0.1")
+    ec.get_appliance_subnets_all_vrfs = lambda: SUBNETS
+    ec.appliance_find_preferred_route = lambda *args: {}
+    table = ec.appliance_route_table()
+    assert table.find is ec.appliance_find_preferred_route
+    assert table.find_preferred_route("10.1.9.9")["route"]["prefix"] == (
+        "10.1.0.0/16"
+    )
+
+    orch = Orchestrator("127.0.0.1")
+    # Orchestrator returns peers next to subnets
+    orch.get_appliance_subnets = lambda ne_id, cached: {
+        "subnets": SUBNETS["subnets"]["0"],
+        "peers": PEERS,
+    }
+    table = orch.appliance_route_table("3.NE")
+    result = table.find_preferred_route("10.1.2.3")
+    assert result["passthrough"]["interfaceName"] == "lan1"
+    result = table.find_preferred_route("10.9.9.9")
+    assert result["swdwan"]["peerName"] == "hub"
+    orch.get_appliance_subnets = lambda ne_id, cached: False
+    assert orch.appliance_route_table("3.NE") is False
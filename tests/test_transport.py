@@ -0,0 +1,92 @@
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pyedgeconnect import Orchestrator
+from pyedgeconnect._transport import _keep_alive_socket_options
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if "/slow" in self.path:
+            time.sleep(0.1)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def orchestrator(server, **kwargs):
+    orch = Orchestrator("127.0.0.1", **kwargs)
+    orch.url_prefix = f"http://127.0.0.1:{server.server_port}/gms/rest"
+    return orch
+
+
+def stats(orch):
+    (host_stats,) = orch.pool_stats().values()
+    return host_stats
+
+
+def test_connections_reused(server):
+    orch = orchestrator(server)
+    for _ in range(5):
+        assert orch._get("/appliance") == {}
+    host_stats = stats(orch)
+    assert host_stats["requests"] == 5
+    assert host_stats["connections_opened"] == 1
+    assert host_stats["in_use"] == 0
+    assert host_stats["idle"] == 1
+
+
+def test_blocking_pool_waits_for_connection(server):
+    orch = orchestrator(server, pool_maxsize=2, pool_block=True)
+    with ThreadPoolExecutor(6) as executor:
+        results = list(executor.map(orch._get, ["/slow"] * 6))
+    assert results == [{}] * 6
+    host_stats = stats(orch)
+    assert host_stats["maxsize"] == 2
+    assert host_stats["peak_in_use"] == 2
+    assert host_stats["connections_opened"] == 2
+    assert host_stats["saturated"] >= 1
+    assert host_stats["wait_seconds"] > 0
+
+
+def test_idle_connections_closed(server):
+    orch = orchestrator(server, idle_timeout=0.05)
+    orch._get("/appliance")
+    time.sleep(0.1)
+    orch._get("/appliance")
+    assert stats(orch)["idle_closed"] == 1
+
+
+def test_keep_alive_socket_options():
+    options = _keep_alive_socket_options(30)
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30) in options
+
+
+def test_keep_alive_requests(server):
+    orch = orchestrator(server, keep_alive=30)
+    assert orch._get("/appliance") == {}